@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark roiInfo expansion in the batch neuron fetch.
+
+Compares the previous per-row expansion (iterrows + json.loads + one dict
+per (body, ROI) pair) with NeuPrintConnector._expand_roi_info on a synthetic
+CNS-sized batch. No NeuPrint connection is needed.
+
+Usage:
+    python performance/scripts/benchmark_roi_info_expansion.py [--bodies N] [--rois N]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import pandas as pd
+
+# Add the neuview module to the path
+sys.path.insert(0, "src")
+
+from neuview.neuprint_connector import NeuPrintConnector
+
+
+def make_roi_info_df(n_bodies: int, rois_per_body: int) -> pd.DataFrame:
+    """Create a roiInfo query result resembling a CNS batch."""
+    rng = random.Random(0)
+    roi_pool = [f"ME_R_col_{h1:02d}_{h2:02d}" for h1 in range(40) for h2 in range(40)]
+    roi_pool += [f"ME_R_layer_{layer:02d}" for layer in range(1, 11)]
+    roi_pool += ["ME(R)", "LO(R)", "LOP(R)", "AME(R)", "CentralBrain", "OL(R)"]
+
+    rows = []
+    for body_id in range(1_000_000, 1_000_000 + n_bodies):
+        roi_info = {}
+        for roi in rng.sample(roi_pool, rois_per_body):
+            roi_info[roi] = {
+                "pre": rng.randint(0, 200),
+                "post": rng.randint(0, 800),
+                "downstream": rng.randint(0, 2000),
+                "upstream": rng.randint(0, 800),
+            }
+        rows.append({"bodyId": body_id, "roiInfo": json.dumps(roi_info)})
+    return pd.DataFrame(rows)
+
+
+def legacy_expand(roi_info_df: pd.DataFrame) -> pd.DataFrame:
+    """The previous row-by-row expansion, kept for comparison."""
+    roi_records = []
+    for _, row in roi_info_df.iterrows():
+        body_id = row["bodyId"]
+        roi_info = json.loads(row["roiInfo"])
+        for roi_name, roi_data in roi_info.items():
+            if isinstance(roi_data, dict):
+                roi_records.append(
+                    {
+                        "bodyId": body_id,
+                        "roi": roi_name,
+                        "pre": roi_data.get("pre", 0),
+                        "post": roi_data.get("post", 0),
+                        "downstream": roi_data.get("downstream", 0),
+                        "upstream": roi_data.get("upstream", 0),
+                    }
+                )
+    roi_df = pd.DataFrame(roi_records)
+    roi_df["total_synapses"] = roi_df["pre"] + roi_df["post"]
+    roi_df = roi_df.sort_values(["bodyId", "total_synapses"], ascending=[True, False])
+    return roi_df.drop("total_synapses", axis=1)
+
+
+def time_it(func, *args, repeat: int = 3):
+    """Return the best wall time and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bodies", type=int, default=20000)
+    parser.add_argument("--rois", type=int, default=40)
+    args = parser.parse_args()
+
+    roi_info_df = make_roi_info_df(args.bodies, args.rois)
+    # _expand_roi_info does not touch connector state, so skip the connection
+    connector = NeuPrintConnector.__new__(NeuPrintConnector)
+
+    legacy_time, legacy_df = time_it(legacy_expand, roi_info_df)
+    fast_time, fast_df = time_it(
+        connector._expand_roi_info, roi_info_df["bodyId"], roi_info_df["roiInfo"]
+    )
+
+    pd.testing.assert_frame_equal(
+        legacy_df.reset_index(drop=True)[["bodyId", "pre", "post"]]
+        .sort_values(["bodyId", "pre", "post"])
+        .reset_index(drop=True),
+        fast_df[["bodyId", "pre", "post"]]
+        .sort_values(["bodyId", "pre", "post"])
+        .reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    print(f"Bodies: {args.bodies:,}  ROI rows: {len(fast_df):,}")
+    print(f"Legacy iterrows expansion: {legacy_time:.3f}s")
+    print(f"Bulk columnar expansion:   {fast_time:.3f}s")
+    print(f"Speedup:                   {legacy_time / fast_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
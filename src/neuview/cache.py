@@ -6,13 +6,21 @@ page generation and reuse it during index creation, avoiding expensive
 database re-queries.
 """
 
+import io
 import json
+import os
 import time
+import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 import logging
 
+import pandas as pd
+
+from .roi_hierarchy_index import RoiHierarchyIndex, share_roi_hierarchy_index
+from .services.output_writer_service import atomic_write
+
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +184,12 @@ class NeuronTypeCacheManager:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._roi_hierarchy_cache_path = self.cache_dir / "roi_hierarchy.json"
+        self._dataset_layers_cache_path = self.cache_dir / "dataset_layers.json"
+        self._thresholds_cache_dir = self.cache_dir / "thresholds"
+        self._partner_metadata_cache_dir = self.cache_dir / "partner_metadata"
+        self._thresholds_pruned = False
+        # Last loaded hierarchy and the cache file mtime it was loaded from
+        self._loaded_roi_hierarchy = None
         logger.debug(f"Initialized cache manager with directory: {self.cache_dir}")
 
         # Cache expiry time (24 hours)
@@ -199,8 +213,10 @@ class NeuronTypeCacheManager:
         try:
             cache_file = self._get_cache_file_path(cache_data.neuron_type)
 
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data.to_dict(), f, indent=2, ensure_ascii=False)
+            atomic_write(
+                cache_file,
+                json.dumps(cache_data.to_dict(), indent=2, ensure_ascii=False),
+            )
 
             logger.debug(
                 f"Saved cache for neuron type {cache_data.neuron_type} to {cache_file}"
@@ -214,6 +230,8 @@ class NeuronTypeCacheManager:
     def save_roi_hierarchy(self, hierarchy_data: dict) -> bool:
         """Save ROI hierarchy data to persistent cache.
 
+        The flattened RoiHierarchyIndex of the hierarchy is stored with it.
+
         Args:
             hierarchy_data: ROI hierarchy dictionary
 
@@ -225,12 +243,15 @@ class NeuronTypeCacheManager:
 
             cache_data = {
                 "hierarchy": hierarchy_data,
+                "index": RoiHierarchyIndex.from_hierarchy(hierarchy_data).to_dict(),
                 "timestamp": time.time(),
-                "cache_version": "1.0",
+                "cache_version": "1.1",
             }
 
-            with open(self._roi_hierarchy_cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            atomic_write(
+                self._roi_hierarchy_cache_path,
+                json.dumps(cache_data, indent=2, ensure_ascii=False),
+            )
 
             logger.debug(
                 f"Saved ROI hierarchy to cache: {self._roi_hierarchy_cache_path}"
@@ -244,6 +265,10 @@ class NeuronTypeCacheManager:
     def load_roi_hierarchy(self) -> Optional[dict]:
         """Load ROI hierarchy data from persistent cache.
 
+        The stored index is shared for the returned hierarchy, so
+        get_roi_hierarchy_index() does not rebuild it. Repeated loads of an
+        unchanged cache file return the same hierarchy.
+
         Returns:
             ROI hierarchy dictionary if available and valid, None otherwise
         """
@@ -251,13 +276,20 @@ class NeuronTypeCacheManager:
             if not self._roi_hierarchy_cache_path.exists():
                 return None
 
+            mtime = self._roi_hierarchy_cache_path.stat().st_mtime_ns
+            if (
+                self._loaded_roi_hierarchy is not None
+                and self._loaded_roi_hierarchy[0] == mtime
+                and time.time() - self._loaded_roi_hierarchy[1]
+                <= self.cache_expiry_seconds
+            ):
+                return self._loaded_roi_hierarchy[2]
+
             with open(self._roi_hierarchy_cache_path, "r", encoding="utf-8") as f:
                 cache_data = json.load(f)
 
             # Check cache validity (24 hours)
             if "timestamp" in cache_data:
-                import time
-
                 cache_age = time.time() - cache_data["timestamp"]
                 if cache_age > self.cache_expiry_seconds:
                     logger.debug(f"ROI hierarchy cache expired (age: {cache_age:.1f}s)")
@@ -265,6 +297,14 @@ class NeuronTypeCacheManager:
 
             hierarchy = cache_data.get("hierarchy")
             if hierarchy:
+                index = RoiHierarchyIndex.from_dict(cache_data.get("index"))
+                if index is not None:
+                    share_roi_hierarchy_index(hierarchy, index)
+                self._loaded_roi_hierarchy = (
+                    mtime,
+                    cache_data.get("timestamp", time.time()),
+                    hierarchy,
+                )
                 logger.debug(
                     f"Loaded ROI hierarchy from cache: {self._roi_hierarchy_cache_path}"
                 )
@@ -275,6 +315,225 @@ class NeuronTypeCacheManager:
 
         return None
 
+    def save_dataset_layers(
+        self, dataset_uuid: str, layers: List[Tuple[str, str, int]]
+    ) -> bool:
+        """Save the layer ROIs of a dataset beside the ROI hierarchy cache.
+
+        Layers of several datasets can share the file; a dataset UUID
+        identifies an immutable dataset version, so entries do not expire.
+
+        Args:
+            dataset_uuid: UUID of the dataset version
+            layers: (region, side, layer) tuples of all layer ROIs
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            datasets = self._load_dataset_layers_file()
+            datasets[dataset_uuid] = [list(layer) for layer in layers]
+            atomic_write(
+                self._dataset_layers_cache_path,
+                json.dumps({"datasets": datasets}, ensure_ascii=False),
+            )
+            logger.debug(f"Saved dataset layers of {dataset_uuid} to cache")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to save dataset layers to cache: {e}")
+            return False
+
+    def load_dataset_layers(
+        self, dataset_uuid: str
+    ) -> Optional[List[Tuple[str, str, int]]]:
+        """Load the layer ROIs of a dataset from the cache.
+
+        Args:
+            dataset_uuid: UUID of the dataset version
+
+        Returns:
+            (region, side, layer) tuples if cached, None otherwise
+        """
+        layers = self._load_dataset_layers_file().get(dataset_uuid)
+        if layers is None:
+            return None
+        return [tuple(layer) for layer in layers]
+
+    def _load_dataset_layers_file(self) -> Dict[str, Any]:
+        """Load the dataset layers of all cached datasets."""
+        try:
+            if self._dataset_layers_cache_path.exists():
+                with open(self._dataset_layers_cache_path, "r", encoding="utf-8") as f:
+                    return json.load(f).get("datasets", {})
+        except Exception as e:
+            logger.debug(f"Failed to load dataset layers from cache: {e}")
+        return {}
+
+    def save_thresholds(self, cache_key: str, thresholds: Dict[str, Any]) -> bool:
+        """Save computed colorscale thresholds under their content key.
+
+        The key fingerprints the data the thresholds were computed from, so
+        entries never go stale, but changed column data leaves the entry of
+        the old data behind. The first save of a manager therefore prunes
+        entries that were not used within the cache expiry time.
+
+        Args:
+            cache_key: Content-addressed key from ThresholdService
+            thresholds: Serialized threshold dictionary
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        try:
+            self._thresholds_cache_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write(
+                self._thresholds_cache_dir / f"{cache_key}.json",
+                json.dumps(thresholds),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save thresholds to cache: {e}")
+            return False
+
+        if not self._thresholds_pruned:
+            self._thresholds_pruned = True
+            self.prune_thresholds()
+        return True
+
+    def load_thresholds(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Load colorscale thresholds saved under a content key.
+
+        Args:
+            cache_key: Content-addressed key from ThresholdService
+
+        Returns:
+            Serialized threshold dictionary if cached, None otherwise
+        """
+        cache_file = self._thresholds_cache_dir / f"{cache_key}.json"
+        try:
+            if cache_file.exists():
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    thresholds = json.load(f)
+                # The modification time records the last use for pruning
+                os.utime(cache_file)
+                return thresholds
+        except Exception as e:
+            logger.debug(f"Failed to load thresholds from cache: {e}")
+        return None
+
+    def prune_thresholds(self, max_age_seconds: Optional[float] = None) -> int:
+        """Remove threshold entries that were not used recently.
+
+        Args:
+            max_age_seconds: Maximum time since an entry was saved or last
+                loaded; defaults to the cache expiry time
+
+        Returns:
+            Number of removed entries
+        """
+        if max_age_seconds is None:
+            max_age_seconds = self.cache_expiry_seconds
+        cutoff = time.time() - max_age_seconds
+
+        removed = 0
+        try:
+            for cache_file in self._thresholds_cache_dir.glob("*.json"):
+                try:
+                    if cache_file.stat().st_mtime < cutoff:
+                        cache_file.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+        except OSError as e:
+            logger.debug(f"Failed to prune threshold cache: {e}")
+
+        if removed:
+            logger.debug(f"Pruned {removed} unused threshold cache entries")
+        return removed
+
+    def save_partner_metadata(self, dataset_uuid: str, metadata: pd.DataFrame) -> bool:
+        """Append partner metadata rows to the cache of a dataset version.
+
+        The rows are written as a new segment file next to the existing ones,
+        so saving the bodies fetched for each type does not rewrite the whole
+        table. A dataset UUID identifies an immutable dataset version, so
+        entries do not expire.
+
+        Args:
+            dataset_uuid: UUID of the dataset version
+            metadata: Partner metadata frame, one row per body
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if metadata.empty:
+            return True
+        try:
+            self._write_partner_metadata_segment(dataset_uuid, metadata)
+            logger.debug(
+                f"Saved partner metadata of {len(metadata)} bodies of {dataset_uuid}"
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to save partner metadata to cache: {e}")
+            return False
+
+    def load_partner_metadata(self, dataset_uuid: str) -> Optional[pd.DataFrame]:
+        """Load the partner metadata table of a dataset version.
+
+        Segment files are merged into a single segment, so each run starts
+        from one file. Only the segments that were read are removed; segments
+        written meanwhile by another process are kept for the next load.
+
+        Args:
+            dataset_uuid: UUID of the dataset version
+
+        Returns:
+            Partner metadata frame if cached, None otherwise
+        """
+        segment_dir = self._get_partner_metadata_dir(dataset_uuid)
+        frames, read = [], []
+        for segment in sorted(segment_dir.glob("*.parquet")):
+            try:
+                frames.append(pd.read_parquet(segment))
+                read.append(segment)
+            except Exception as e:
+                # Removed by a concurrent load, or unreadable
+                logger.debug(f"Failed to load partner metadata segment {segment}: {e}")
+        if not frames:
+            return None
+
+        metadata = (
+            pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        )
+        if len(read) > 1:
+            metadata = metadata.drop_duplicates("bodyId", keep="last")
+            try:
+                self._write_partner_metadata_segment(dataset_uuid, metadata)
+                for segment in read:
+                    segment.unlink(missing_ok=True)
+            except Exception as e:
+                logger.debug(f"Failed to compact partner metadata cache: {e}")
+        return metadata
+
+    def _write_partner_metadata_segment(
+        self, dataset_uuid: str, metadata: pd.DataFrame
+    ) -> None:
+        """Write partner metadata rows as a new segment of a dataset version."""
+        segment_dir = self._get_partner_metadata_dir(dataset_uuid)
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        metadata.to_parquet(buffer, index=False)
+        # Unique names, so concurrent runs never overwrite each other's rows
+        name = f"{time.time_ns():020d}-{uuid.uuid4().hex}.parquet"
+        atomic_write(segment_dir / name, buffer.getvalue())
+
+    def _get_partner_metadata_dir(self, dataset_uuid: str) -> Path:
+        """Get the partner metadata segment directory of a dataset version."""
+        safe_name = "".join(c for c in dataset_uuid if c.isalnum() or c in "._-")
+        return self._partner_metadata_cache_dir / safe_name
+
     def load_neuron_type_cache(self, neuron_type: str) -> Optional[NeuronTypeCacheData]:
         """Load neuron type cache data from disk.
 
@@ -347,8 +606,9 @@ class NeuronTypeCacheManager:
                 if cache_file.name == "roi_hierarchy.json":
                     continue
 
-                # Skip cache manifest file - it's not a neuron type cache
-                if cache_file.name == "manifest.json":
+                # Skip cache manifest and dataset layers files - they're not
+                # neuron type caches
+                if cache_file.name in ("manifest.json", "dataset_layers.json"):
                     continue
 
                 # Skip auxiliary cache files (columns, etc.) - they're not neuron type caches
@@ -8,6 +8,7 @@ architecture that maintains the same functionality and output.
 import asyncio
 import click
 import sys
+from contextlib import contextmanager
 from typing import Optional
 import logging
 
@@ -17,11 +18,16 @@ from .commands import (
     FillQueueCommand,
     PopCommand,
     CreateListCommand,
+    PrefetchCommand,
+    BuildConnectomeIndexCommand,
 )
 from .services import ServiceContainer
 from .services.neuron_discovery_service import InspectNeuronTypeCommand
+from .services.output_writer_service import buffered_output_writes
 from .models import NeuronTypeName
+from .tracing import TRACE_FORMATS, start_tracing, stop_tracing
 from .utils import get_git_version
+from .utils.html_minifier import minification_workers
 
 
 # Configure logging
@@ -49,6 +55,39 @@ def setup_services(
     return ServiceContainer(config, copy_mode)
 
 
+@contextmanager
+def traced_run(trace_path: Optional[str], trace_format: str):
+    """Record a performance trace of the enclosed run when a trace path is given."""
+    if not trace_path:
+        yield
+        return
+
+    start_tracing()
+    try:
+        yield
+    finally:
+        tracer = stop_tracing()
+        path = tracer.write(trace_path, trace_format)
+        click.echo(tracer.format_summary())
+        click.echo(f"📈 Trace written to {path} ({trace_format} format)")
+
+
+def trace_options(command):
+    """Add the --trace and --trace-format options to a command."""
+    command = click.option(
+        "--trace-format",
+        type=click.Choice(TRACE_FORMATS),
+        default="chrome",
+        help="Trace file format: Chrome trace events or speedscope (default: chrome)",
+    )(command)
+    return click.option(
+        "--trace",
+        "trace_path",
+        type=click.Path(dir_okay=False),
+        help="Write a performance trace of this run to a JSON file",
+    )(command)
+
+
 @click.group(invoke_without_command=True)
 @click.option("-c", "--config", help="Configuration file path")
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose output")
@@ -91,6 +130,13 @@ def main(ctx, config: Optional[str], verbose: bool, version: bool):
     default=True,
     help="Enable/disable HTML minification (default: enabled)",
 )
+@click.option(
+    "--minify-workers",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Minify pages in this many worker processes (default: 0, in-line)",
+)
+@trace_options
 @click.pass_context
 def generate(
     ctx,
@@ -99,6 +145,9 @@ def generate(
     image_format: str,
     embed: bool,
     minify: bool,
+    minify_workers: int,
+    trace_path: Optional[str],
+    trace_format: str,
 ):
     """Generate HTML pages for neuron types."""
     services = setup_services(ctx.obj["config_path"], ctx.obj["verbose"], "force_all")
@@ -138,6 +187,9 @@ def generate(
                 sys.exit(1)
             click.echo(f"Found {len(type_names)} neuron types. Generating pages...")
 
+            # Query the column layer data of all types in batches up front
+            services.page_service.warm_column_layer_cache(type_names)
+
             # Generate pages with controlled concurrency
             max_concurrent = 3  # Default concurrency limit
             semaphore = asyncio.Semaphore(max_concurrent)
@@ -164,7 +216,12 @@ def generate(
 
             click.echo(f"🎉 Completed bulk generation for {len(type_names)} types.")
 
-    asyncio.run(run_generate())
+    with (
+        traced_run(trace_path, trace_format),
+        buffered_output_writes(),
+        minification_workers(minify_workers if minify else 0),
+    ):
+        asyncio.run(run_generate())
 
 
 @main.command("inspect")
@@ -318,8 +375,22 @@ def fill_queue(
     default=True,
     help="Enable/disable HTML minification (default: enabled)",
 )
+@click.option(
+    "--minify-workers",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Minify pages in this many worker processes (default: 0, in-line)",
+)
+@trace_options
 @click.pass_context
-def pop(ctx, output_dir: Optional[str], minify: bool):
+def pop(
+    ctx,
+    output_dir: Optional[str],
+    minify: bool,
+    minify_workers: int,
+    trace_path: Optional[str],
+    trace_format: str,
+):
     """Pop and process a queue file."""
     services = setup_services(ctx.obj["config_path"], ctx.obj["verbose"])
 
@@ -334,7 +405,75 @@ def pop(ctx, output_dir: Optional[str], minify: bool):
             click.echo(f"❌ Error: {result.unwrap_err()}", err=True)
             sys.exit(1)
 
-    asyncio.run(run_pop())
+    with (
+        traced_run(trace_path, trace_format),
+        buffered_output_writes(),
+        minification_workers(minify_workers if minify else 0),
+    ):
+        asyncio.run(run_pop())
+
+
+@main.command("prefetch")
+@click.option(
+    "--snapshot-dir",
+    help="Snapshot directory (default: <output>/.cache/snapshot)",
+)
+@click.option(
+    "--page-size",
+    type=int,
+    default=5000,
+    help="Number of neurons fetched per bulk query (default: 5000)",
+)
+@click.pass_context
+def prefetch(ctx, snapshot_dir: Optional[str], page_size: int):
+    """Export the whole dataset into a local snapshot for offline page generation.
+
+    Set neuprint.snapshot_dir in the configuration to serve generate and pop
+    from the snapshot.
+    """
+    services = setup_services(ctx.obj["config_path"], ctx.obj["verbose"])
+
+    async def run_prefetch():
+        command = PrefetchCommand(snapshot_dir=snapshot_dir, page_size=page_size)
+
+        result = await services.prefetch_service.prefetch(command)
+
+        if result.is_ok():
+            click.echo(f"✅ {result.unwrap()}")
+        else:
+            click.echo(f"❌ Error: {result.unwrap_err()}", err=True)
+            sys.exit(1)
+
+    asyncio.run(run_prefetch())
+
+
+@main.command("build-connectome-index")
+@click.option(
+    "--index-dir",
+    help="Index directory (default: neuprint.connectome_index_dir or "
+    "<output>/.cache/connectome_index)",
+)
+@click.pass_context
+def build_connectome_index(ctx, index_dir: Optional[str]):
+    """Precompute the partner connectivity of all neuron types.
+
+    Set neuprint.connectome_index_dir in the configuration to build the
+    connectivity tables of generate and pop from the index.
+    """
+    services = setup_services(ctx.obj["config_path"], ctx.obj["verbose"])
+
+    async def run_build_connectome_index():
+        command = BuildConnectomeIndexCommand(index_dir=index_dir)
+
+        result = await services.connectome_index_service.build_connectome_index(command)
+
+        if result.is_ok():
+            click.echo(f"✅ {result.unwrap()}")
+        else:
+            click.echo(f"❌ Error: {result.unwrap_err()}", err=True)
+            sys.exit(1)
+
+    asyncio.run(run_build_connectome_index())
 
 
 @main.command("create-list")
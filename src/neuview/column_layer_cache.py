@@ -0,0 +1,166 @@
+"""
+Binary storage of the per-type column layer values.
+
+The column layer values of a neuron type hold, for every column of the
+type, its synapse and neuron counts per layer. They are stored as fixed-width
+arrays: one row per column, with the counts zero-padded to the widest layer
+count of the type. The arrays are written as uncompressed ``.npy`` members of
+a ZIP archive (the ``.npz`` layout of NumPy), next to a ``meta.json`` member
+with the thresholds and min/max data. Because the members are stored
+uncompressed, loading memory-maps the arrays directly from the archive
+instead of parsing and rebuilding per-layer lists.
+"""
+
+import io
+import json
+import math
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Bump when the layout of the cached arrays changes
+COLUMN_LAYER_CACHE_VERSION = 1
+
+_META_MEMBER = "meta.json"
+
+# Offset of the file name and extra field lengths in a ZIP local file header
+_LOCAL_HEADER_LENGTHS_OFFSET = 26
+_LOCAL_HEADER_SIZE = 30
+
+_ARRAY_HEADER_READERS = {
+    (1, 0): np.lib.format.read_array_header_1_0,
+    (2, 0): np.lib.format.read_array_header_2_0,
+}
+
+
+def column_layer_frame(arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Build the column layer values frame from the cached arrays.
+
+    Args:
+        arrays: 'hex1', 'hex2', 'region', 'side' and 'layer_count' per column,
+            and the padded 'synapses' and 'neurons' counts per column and layer
+
+    Returns:
+        One row per column; 'synapses_list' and 'neurons_list' are array views
+        with one count per layer of the column's region and side
+    """
+    layer_counts = arrays["layer_count"]
+    synapses = arrays["synapses"]
+    neurons = arrays["neurons"]
+    return pd.DataFrame(
+        {
+            "hex1": arrays["hex1"],
+            "hex2": arrays["hex2"],
+            "region": arrays["region"],
+            "side": arrays["side"],
+            "synapses_list": pd.Series(
+                [synapses[i, :count] for i, count in enumerate(layer_counts)],
+                dtype=object,
+            ),
+            "neurons_list": pd.Series(
+                [neurons[i, :count] for i, count in enumerate(layer_counts)],
+                dtype=object,
+            ),
+        }
+    )
+
+
+def pack_column_layer_cache(
+    arrays: Dict[str, np.ndarray], thresholds: Dict, min_max_data: Dict
+) -> bytes:
+    """
+    Serialize column layer arrays and their metadata into an archive.
+
+    Args:
+        arrays: Arrays as described in column_layer_frame()
+        thresholds: Colorscale thresholds of the type
+        min_max_data: Per-region minimum and maximum values
+
+    Returns:
+        Content of the cache file
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr(
+            _META_MEMBER,
+            json.dumps(
+                {
+                    "version": COLUMN_LAYER_CACHE_VERSION,
+                    "thresholds": thresholds,
+                    "min_max_data": min_max_data,
+                },
+                default=_json_value,
+            ),
+        )
+        for name, array in arrays.items():
+            with archive.open(f"{name}.npy", "w") as member:
+                np.lib.format.write_array(
+                    member, np.ascontiguousarray(array), allow_pickle=False
+                )
+    return buffer.getvalue()
+
+
+def load_column_layer_cache(
+    path: Union[str, Path],
+) -> Tuple[Dict[str, np.ndarray], Dict, Dict]:
+    """
+    Load column layer arrays and their metadata, memory-mapping the arrays.
+
+    Args:
+        path: Cache file written from pack_column_layer_cache()
+
+    Returns:
+        Tuple of (arrays, thresholds, min_max_data)
+
+    Raises:
+        ValueError: If the file was written by another cache version or has
+            compressed members
+    """
+    arrays = {}
+    with open(path, "rb") as f, zipfile.ZipFile(f) as archive:
+        metadata = json.loads(archive.read(_META_MEMBER))
+        if metadata.get("version") != COLUMN_LAYER_CACHE_VERSION:
+            raise ValueError(f"Unsupported column layer cache version in {path}")
+
+        for info in archive.infolist():
+            if not info.filename.endswith(".npy"):
+                continue
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Compressed member {info.filename} in {path}")
+
+            # Array data follows the local header and the .npy header
+            f.seek(info.header_offset + _LOCAL_HEADER_LENGTHS_OFFSET)
+            name_length, extra_length = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            shape, fortran_order, dtype = _ARRAY_HEADER_READERS[version](f)
+
+            name = info.filename[: -len(".npy")]
+            if math.prod(shape) == 0:
+                # Zero-length regions cannot be memory-mapped
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+
+    return arrays, metadata["thresholds"], metadata["min_max_data"]
+
+
+def _json_value(value: Any) -> Any:
+    """Convert NumPy scalars and arrays for JSON serialization."""
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
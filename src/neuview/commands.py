@@ -94,6 +94,31 @@ class CreateListCommand:
             self.requested_at = datetime.now()
 
 
+@dataclass
+class PrefetchCommand:
+    """Command to export the whole dataset into a local snapshot."""
+
+    snapshot_dir: Optional[str] = None
+    page_size: int = 5000
+    requested_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.requested_at is None:
+            self.requested_at = datetime.now()
+
+
+@dataclass
+class BuildConnectomeIndexCommand:
+    """Command to precompute the partner connectivity of all neuron types."""
+
+    index_dir: Optional[str] = None
+    requested_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.requested_at is None:
+            self.requested_at = datetime.now()
+
+
 @dataclass
 class DatasetInfo:
     """Information about the dataset."""
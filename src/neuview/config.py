@@ -17,6 +17,9 @@ class NeuPrintConfig:
     server: str
     dataset: str
     token: Optional[str] = None
+    snapshot_dir: Optional[str] = None
+    cache_memory_mb: Optional[float] = 1024
+    connectome_index_dir: Optional[str] = None
 
 
 @dataclass
@@ -24,6 +27,8 @@ class OutputConfig:
     """Output configuration."""
 
     directory: str
+    shard_eyemaps: bool = False
+    lazy_tables: bool = False
 
 
 @dataclass
@@ -0,0 +1,339 @@
+"""
+Precomputed partner connectivity of every neuron type in a dataset.
+
+The upstream and downstream partner tables of a page aggregate the
+body-level connections of the page's neurons by partner type and soma side.
+A ConnectomeIndex stores these connections once for the whole dataset as
+sparse matrices in CSR layout: one row per (neuron type, soma side), one
+column per partner body, holding the summed connection weight. A partner
+table is then the sum of a type's rows grouped by the partner columns' type
+and soma side; the per-body weights are kept so the coefficient of variation
+and the partner neuron counts come out exactly as from the live query.
+
+The index is written by ``neuview build-connectome-index`` as NumPy arrays
+next to a JSON manifest.
+"""
+
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .config import Config
+from .partner_metadata import PartnerMetadataTable
+from .services.output_writer_service import atomic_write
+
+# Bump when the layout of the index arrays changes
+CONNECTOME_INDEX_VERSION = 1
+
+DIRECTIONS = ("upstream", "downstream")
+
+MANIFEST_FILE = "manifest.json"
+ARRAYS_FILE = "index.npz"
+
+
+def default_connectome_index_dir(config: Config) -> Path:
+    """Default connectome index location inside the output cache directory."""
+    return Path(config.output.directory) / ".cache" / "connectome_index"
+
+
+class ConnectomeIndex:
+    """Partner connectivity of every (neuron type, soma side) as sparse rows."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], manifest: Dict[str, Any]):
+        """
+        Initialize the index.
+
+        Args:
+            arrays: Row keys, partner attributes and the CSR arrays of each
+                direction, as written by ConnectomeIndexBuilder
+            manifest: Version, dataset and size information
+        """
+        self.arrays = arrays
+        self.manifest = manifest
+        self._rows_by_type: Dict[str, Dict[str, int]] = {}
+        for row, (neuron_type, side) in enumerate(
+            zip(arrays["row_types"].tolist(), arrays["row_sides"].tolist())
+        ):
+            self._rows_by_type.setdefault(neuron_type, {})[side] = row
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "ConnectomeIndex":
+        """
+        Load an index written by save().
+
+        Raises:
+            FileNotFoundError: If the directory holds no index
+        """
+        directory = Path(directory)
+        manifest_path = directory / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No connectome index found in {directory}")
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        with np.load(directory / ARRAYS_FILE, allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+        return cls(arrays, manifest)
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Write the index arrays and the manifest to a directory."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        np.savez(buffer, **self.arrays)
+        atomic_write(directory / ARRAYS_FILE, buffer.getvalue())
+        atomic_write(directory / MANIFEST_FILE, json.dumps(self.manifest, indent=2))
+
+    def validate(self, server: str, dataset: str, uuid: Optional[str]):
+        """
+        Make sure the index belongs to the configured server and dataset version.
+
+        Args:
+            server: Configured NeuPrint server
+            dataset: Configured dataset name
+            uuid: UUID of the current dataset version, None if unknown
+
+        Raises:
+            ValueError: If the index was built for another dataset or dataset
+                version, or with an incompatible version
+        """
+        if self.manifest.get("version") != CONNECTOME_INDEX_VERSION:
+            raise ValueError(
+                f"Connectome index has version {self.manifest.get('version')}, "
+                f"expected {CONNECTOME_INDEX_VERSION}. "
+                "Run 'neuview build-connectome-index' again."
+            )
+        if (
+            self.manifest.get("server") != server
+            or self.manifest.get("dataset") != dataset
+        ):
+            raise ValueError(
+                f"Connectome index was built for {self.manifest.get('dataset')} "
+                f"on {self.manifest.get('server')}, not {dataset} on {server}"
+            )
+        # Partner tables of another dataset version would be stale
+        if uuid is None:
+            raise ValueError(
+                "The current dataset version is unknown, so the connectome "
+                "index cannot be checked against it"
+            )
+        if self.manifest.get("uuid") != uuid:
+            raise ValueError(
+                f"Connectome index was built for dataset version "
+                f"{self.manifest.get('uuid')}, the current version is {uuid}. "
+                "Run 'neuview build-connectome-index' again."
+            )
+
+    def has_type(self, neuron_type: str) -> bool:
+        """Whether the index holds rows for a neuron type."""
+        return neuron_type in self._rows_by_type
+
+    def partners(
+        self,
+        neuron_type: str,
+        side: Optional[str],
+        direction: str,
+        neuron_count: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate the partners of a neuron type by partner type and soma side.
+
+        Args:
+            neuron_type: Neuron type of the page
+            side: Soma side code of the page's neurons, or None for all
+            direction: 'upstream' for inputs, 'downstream' for outputs
+            neuron_count: Number of neurons the page summarizes
+
+        Returns:
+            Partner dictionaries as built from live partner records, sorted by
+            total weight descending
+        """
+        rows = self._rows_by_type.get(neuron_type, {})
+        selected = list(rows.values()) if side is None else [rows.get(side)]
+        selected = [row for row in selected if row is not None]
+
+        indptr = self.arrays[f"{direction}_indptr"]
+        columns = np.concatenate(
+            [
+                self.arrays[f"{direction}_indices"][indptr[r] : indptr[r + 1]]
+                for r in selected
+            ]
+            or [np.array([], dtype=np.int32)]
+        )
+        if columns.size == 0 or neuron_count <= 0:
+            return []
+        weights = np.concatenate(
+            [
+                self.arrays[f"{direction}_weights"][indptr[r] : indptr[r + 1]]
+                for r in selected
+            ]
+        )
+
+        # Per-body weights summed over the selected rows
+        partner_index, body_inverse = np.unique(columns, return_inverse=True)
+        body_weights = np.bincount(body_inverse, weights=weights)
+
+        group_codes, inverse = np.unique(
+            self.arrays["partner_groups"][partner_index], return_inverse=True
+        )
+        totals = np.bincount(inverse, weights=body_weights)
+        counts = np.bincount(inverse)
+
+        # Coefficient of variation of the connections per neuron of each body
+        per_neuron = body_weights / neuron_count
+        means = np.bincount(inverse, weights=per_neuron) / counts
+        deviations = np.bincount(inverse, weights=(per_neuron - means[inverse]) ** 2)
+        std_devs = np.sqrt(deviations / counts)
+        cvs = np.divide(
+            std_devs, means, out=np.zeros_like(means), where=(counts > 1) & (means > 0)
+        )
+
+        # Most common neurotransmitter of each group by weight
+        nt_count = len(self.arrays["neurotransmitters"])
+        nt_keys, nt_inverse = np.unique(
+            inverse * nt_count + self.arrays["partner_nts"][partner_index],
+            return_inverse=True,
+        )
+        nt_weights = np.bincount(nt_inverse, weights=body_weights)
+        order = np.lexsort((-nt_weights, nt_keys // nt_count))
+        first = np.r_[True, np.diff(nt_keys[order] // nt_count) != 0]
+        top_nts = nt_keys[order][first] % nt_count
+
+        group_types = self.arrays["group_types"]
+        group_sides = self.arrays["group_sides"]
+        neurotransmitters = self.arrays["neurotransmitters"]
+        total_weight = totals.sum()
+        partners = []
+        for position in np.argsort(-totals, kind="stable"):
+            code = group_codes[position]
+            weight = int(round(totals[position]))
+            partners.append(
+                {
+                    "type": str(group_types[code]),
+                    "soma_side": str(group_sides[code]),
+                    "neurotransmitter": str(neurotransmitters[top_nts[position]]),
+                    "weight": weight,
+                    "connections_per_neuron": weight / neuron_count,
+                    "coefficient_of_variation": round(float(cvs[position]), 3),
+                    "percentage": (weight / total_weight * 100)
+                    if total_weight > 0
+                    else 0,
+                    "partner_neuron_count": int(counts[position]),
+                }
+            )
+        return partners
+
+
+class ConnectomeIndexBuilder:
+    """Collect partner records row by row and build a ConnectomeIndex."""
+
+    def __init__(self):
+        self._row_types: List[str] = []
+        self._row_sides: List[str] = []
+        self._connections = {direction: [] for direction in DIRECTIONS}
+        self._partner_metadata = PartnerMetadataTable()
+
+    def add_row(
+        self, neuron_type: str, side: str, records: Dict[str, pd.DataFrame]
+    ) -> None:
+        """
+        Add the partners of the neurons of a type on one soma side.
+
+        Args:
+            neuron_type: Neuron type of the row
+            side: Soma side code of the row's neurons
+            records: Partner records of each direction, with the columns of
+                NeuPrintConnector._fetch_partner_records()
+        """
+        self._row_types.append(neuron_type)
+        self._row_sides.append(side)
+        for direction in DIRECTIONS:
+            direction_records = records[direction]
+            if direction_records is None or direction_records.empty:
+                self._connections[direction].append(
+                    (np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+                )
+                continue
+
+            partner_type = direction_records["partner_type"]
+            typed = direction_records[partner_type.notna() & (partner_type != "")]
+            self._partner_metadata.add(
+                typed.rename(
+                    columns={"partner_bodyId": "bodyId", "partner_type": "type"}
+                ).fillna({"soma_side": "", "neurotransmitter": "Unknown"})
+            )
+            body_ids, inverse = np.unique(
+                typed["partner_bodyId"].to_numpy(dtype=np.int64), return_inverse=True
+            )
+            weights = np.bincount(
+                inverse, weights=typed["weight"].to_numpy(dtype=np.float64)
+            )
+            self._connections[direction].append(
+                (body_ids, np.rint(weights).astype(np.int64))
+            )
+
+    def build(self, metadata: Dict[str, Any]) -> ConnectomeIndex:
+        """
+        Build the index from the added rows.
+
+        Args:
+            metadata: Server, dataset and dataset UUID for the manifest
+
+        Returns:
+            ConnectomeIndex over all added rows
+        """
+        partner_frame = self._partner_metadata.to_frame().sort_values("bodyId")
+        partner_body_ids = partner_frame["bodyId"].to_numpy(dtype=np.int64)
+        group_codes, groups = pd.factorize(
+            pd.MultiIndex.from_arrays(
+                [
+                    partner_frame["type"].astype(str),
+                    partner_frame["soma_side"].astype(str),
+                ]
+            )
+        )
+        nt_codes, neurotransmitters = pd.factorize(
+            partner_frame["neurotransmitter"].astype(str)
+        )
+
+        arrays = {
+            "row_types": np.array(self._row_types, dtype=str),
+            "row_sides": np.array(self._row_sides, dtype=str),
+            "partner_body_ids": partner_body_ids,
+            "partner_groups": group_codes.astype(np.int32),
+            "partner_nts": nt_codes.astype(np.int32),
+            "group_types": np.array(groups.get_level_values(0), dtype=str),
+            "group_sides": np.array(groups.get_level_values(1), dtype=str),
+            "neurotransmitters": np.array(neurotransmitters, dtype=str),
+        }
+        connection_count = 0
+        for direction in DIRECTIONS:
+            rows = self._connections[direction]
+            lengths = [len(body_ids) for body_ids, _ in rows]
+            arrays[f"{direction}_indptr"] = np.concatenate(
+                [[0], np.cumsum(lengths, dtype=np.int64)]
+            ).astype(np.int64)
+            arrays[f"{direction}_indices"] = np.searchsorted(
+                partner_body_ids,
+                np.concatenate([body_ids for body_ids, _ in rows] or [[]]).astype(
+                    np.int64
+                ),
+            ).astype(np.int32)
+            arrays[f"{direction}_weights"] = np.concatenate(
+                [weights for _, weights in rows] or [[]]
+            ).astype(np.int64)
+            connection_count += sum(lengths)
+
+        manifest = {
+            "version": CONNECTOME_INDEX_VERSION,
+            **metadata,
+            "created_at": time.time(),
+            "rows": len(self._row_types),
+            "partners": len(partner_body_ids),
+            "connections": connection_count,
+        }
+        return ConnectomeIndex(arrays, manifest)
@@ -49,10 +49,10 @@ class QueueService:
         self, command: FillQueueCommand, queue_manager
     ) -> Result[str, str]:
         """Create queue files for multiple neuron types."""
-        from .neuprint_connector import NeuPrintConnector
+        from .snapshot_connector import create_connector
 
         # Create connector for type discovery (optimized)
-        connector = NeuPrintConnector(self.config)
+        connector = create_connector(self.config)
 
         try:
             if command.all_types:
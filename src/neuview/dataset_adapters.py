@@ -323,8 +323,12 @@ class DatasetAdapter(ABC):
         """Get total pre and post synapse counts."""
         pass
 
-    def filter_by_soma_side(self, neurons_df: pd.DataFrame, soma_side) -> pd.DataFrame:
-        """Filter neurons by soma side."""
+    def resolve_soma_side(self, soma_side) -> Optional[str]:
+        """
+        Resolve a soma side argument to the 'somaSide' code it selects.
+
+        Returns None for 'combined'/'all', which select every neuron.
+        """
         # Handle both string and SomaSide enum inputs
 
         # Convert to string value for processing
@@ -336,28 +340,33 @@ class DatasetAdapter(ABC):
             soma_side_str = str(soma_side)
 
         if soma_side_str in ["combined", "all"]:
-            return neurons_df
-
-        # Ensure soma side is extracted
-        neurons_df = self.extract_soma_side(neurons_df)
-
-        if "somaSide" not in neurons_df.columns:
-            dataset_name = self.dataset_info.name if self.dataset_info else "unknown"
-            raise ValueError(f"Cannot filter by soma side for dataset {dataset_name}")
+            return None
 
         # Handle 'L'/'R' and 'left'/'right' formats
-        side_filter = None
         if soma_side_str.lower() in ["left", "l"]:
-            side_filter = "L"
+            return "L"
         elif soma_side_str.lower() in ["right", "r"]:
-            side_filter = "R"
+            return "R"
         elif soma_side_str.lower() in ["middle", "m"]:
-            side_filter = "M"
+            return "M"
         else:
             raise ValueError(
                 f"Invalid soma side: {soma_side_str}. Use 'L', 'R', 'M', 'left', 'right', 'middle', 'combined', or 'all'"
             )
 
+    def filter_by_soma_side(self, neurons_df: pd.DataFrame, soma_side) -> pd.DataFrame:
+        """Filter neurons by soma side."""
+        side_filter = self.resolve_soma_side(soma_side)
+        if side_filter is None:
+            return neurons_df
+
+        # Ensure soma side is extracted
+        neurons_df = self.extract_soma_side(neurons_df)
+
+        if "somaSide" not in neurons_df.columns:
+            dataset_name = self.dataset_info.name if self.dataset_info else "unknown"
+            raise ValueError(f"Cannot filter by soma side for dataset {dataset_name}")
+
         return neurons_df[neurons_df["somaSide"] == side_filter]
 
     def get_available_columns(self, neurons_df: pd.DataFrame) -> List[str]:
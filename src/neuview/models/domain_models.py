@@ -2,7 +2,8 @@
 Simplified domain models for neuView.
 
 This module consolidates the core entities and value objects into a single,
-maintainable file while preserving all functionality.
+maintainable file while preserving all functionality. Value objects and
+per-neuron entities use slotted dataclasses to keep instances small.
 """
 
 from dataclasses import dataclass, field
@@ -46,7 +47,7 @@ class SomaSide(Enum):
         raise ValueError(f"Invalid soma side: {value}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BodyId:
     """Value object representing a neuron body ID."""
 
@@ -63,7 +64,7 @@ class BodyId:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NeuronTypeName:
     """Value object representing a neuron type name."""
 
@@ -84,7 +85,7 @@ class NeuronTypeName:
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SynapseCount:
     """Value object representing synapse counts."""
 
@@ -104,7 +105,7 @@ class SynapseCount:
         return f"{self.pre}:{self.post}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoiName:
     """Value object representing a Region of Interest name."""
 
@@ -119,7 +120,7 @@ class RoiName:
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Neuron:
     """Entity representing a single neuron."""
 
@@ -282,7 +283,7 @@ class NeuronCollection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectivityPartner:
     """Represents a connectivity partner with connection strength."""
 
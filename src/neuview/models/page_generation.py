@@ -148,6 +148,8 @@ class URLCollection:
     neuprint_url: Optional[str] = None
     soma_side_links: Optional[Dict[str, str]] = None
     youtube_url: Optional[str] = None
+    # Template variables built together with the Neuroglancer URL
+    neuroglancer_vars: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for template context."""
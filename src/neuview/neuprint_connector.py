@@ -6,6 +6,7 @@ data from NeuPrint servers, including neuron data, connectivity information,
 and summary statistics.
 """
 
+import numpy as np
 import pandas as pd
 import re
 import json
@@ -13,12 +14,21 @@ from typing import Dict, List, Any, Optional
 from neuprint import Client, fetch_neurons, NeuronCriteria
 import os
 import random
+import threading
 import time
 import logging
 
 from .config import Config, DiscoveryConfig
 from .dataset_adapters import get_dataset_adapter
 from .cache import NeuronTypeCacheManager
+from .connectome_index import ConnectomeIndex
+from .partner_metadata import PARTNER_RECORD_COLUMNS, PartnerMetadataTable
+from .roi_attributes import intern_roi_names, roi_attributes
+from .soma_side_partition import SomaSidePartition
+from .soma_side_statistics import SomaSideStatistics
+from .strategies.cache import BoundedMemoryCacheStrategy
+from .tracing import normalize_query, trace_span, tracing_enabled
+from .type_bundle import TypeBundle
 
 # Set up logger for performance monitoring
 logger = logging.getLogger(__name__)
@@ -32,6 +42,13 @@ _GLOBAL_CACHE = {
     "cache_timestamp": None,
 }
 
+# Key prefixes of the raw neuron data and connectivity entries in the data cache
+_RAW_DATA_PREFIX = "raw:"
+_CONNECTIVITY_PREFIX = "connectivity:"
+
+# Number of partner bodies per partner metadata query
+PARTNER_METADATA_PAGE_SIZE = 5000
+
 
 class NeuPrintConnector:
     """
@@ -55,10 +72,21 @@ class NeuPrintConnector:
         self._soma_sides_cache = None
         # Connection reuse optimization
         self._connection_pool = None
-        # Cache for raw neuron data to avoid redundant queries across soma sides
-        self._raw_neuron_data_cache = {}
-        # Cache for connectivity data to avoid redundant queries
-        self._connectivity_cache = {}
+        # Memory-bounded cache for raw neuron data, shared across soma sides,
+        # and for connectivity summaries; least recently used entries are
+        # evicted once the configured memory budget is exceeded
+        self._data_cache = BoundedMemoryCacheStrategy(
+            max_memory_mb=config.neuprint.cache_memory_mb
+        )
+        # Type, soma side and neurotransmitter of partner bodies, shared by
+        # the connectivity of all types and persisted per dataset version
+        self._partner_metadata = None
+        self._partner_metadata_uuid = None
+        self._partner_metadata_lock = threading.Lock()
+        # Precomputed partner connectivity of all types, if configured
+        self._connectome_index = None
+        self._connectome_index_checked = False
+        self._connectome_index_lock = threading.Lock()
         # Cache for ROI hierarchy to avoid repeated fetches
         self._roi_hierarchy_cache = None
         # Cache for soma sides to avoid repeated queries
@@ -159,14 +187,28 @@ class NeuPrintConnector:
             # Cache miss - execute query
             self._cache_stats["meta_misses"] += 1
             logger.debug(f"Executing meta query: {normalized_query[:50]}...")
-            result = self._original_fetch_custom(query, **kwargs)
+            result = self._execute_custom(query, **kwargs)
 
             # Cache the result
             _GLOBAL_CACHE["dataset_info"][cache_key] = result
             return result
 
         # For non-meta queries, execute normally
-        return self._original_fetch_custom(query, **kwargs)
+        return self._execute_custom(query, **kwargs)
+
+    def _execute_custom(self, query, **kwargs):
+        """Run a Cypher query on the client, recording a span when tracing."""
+        if not tracing_enabled():
+            return self._original_fetch_custom(query, **kwargs)
+
+        with trace_span(normalize_query(query), "cypher") as span:
+            result = self._original_fetch_custom(query, **kwargs)
+            if isinstance(result, pd.DataFrame):
+                span.set(
+                    rows=len(result),
+                    bytes=int(result.memory_usage(deep=True).sum()),
+                )
+        return result
 
     def _cached_fetch_datasets(self):
         """Cached wrapper for the client's fetch_datasets method."""
@@ -208,6 +250,35 @@ class NeuPrintConnector:
         except Exception as e:
             raise ConnectionError(f"Connection test failed: {e}")
 
+    def get_dataset_uuid(self) -> Optional[str]:
+        """
+        Get the UUID of the configured dataset version.
+
+        Uses the cached dataset info, so repeated calls do not query the server.
+
+        Returns:
+            Dataset UUID, or None if it is not available
+        """
+        try:
+            datasets = self.client.fetch_datasets()
+            uuid = (datasets.get(self.config.neuprint.dataset) or {}).get("uuid")
+            return str(uuid) if uuid else None
+        except Exception as e:
+            logger.debug(f"Could not get dataset UUID: {e}")
+            return None
+
+    def get_type_bundle(self, neuron_type: str) -> TypeBundle:
+        """
+        Get a bundle that computes the neuron data of a type once per soma side.
+
+        Args:
+            neuron_type: Neuron type name
+
+        Returns:
+            TypeBundle to pass to every stage of the type's page generation
+        """
+        return TypeBundle(self, neuron_type)
+
     def get_neuron_data(
         self, neuron_type: str, soma_side: str = "combined"
     ) -> Dict[str, Any]:
@@ -225,21 +296,19 @@ class NeuPrintConnector:
             raise ConnectionError("Not connected to NeuPrint")
 
         try:
-            # Get cached raw data or fetch it
-            raw_neurons_df, raw_roi_df = self._get_or_fetch_raw_neuron_data(neuron_type)
-
-            # Filter by soma side using adapter
-            if not raw_neurons_df.empty:
-                neurons_df = self.dataset_adapter.filter_by_soma_side(
-                    raw_neurons_df, soma_side
-                )
-            else:
-                neurons_df = pd.DataFrame()
+            # Get cached raw data or fetch it, partitioned by soma side
+            partition = self._get_soma_side_partition(neuron_type)
+            statistics = self._get_soma_side_statistics(neuron_type)
+            side = self.dataset_adapter.resolve_soma_side(soma_side)
+            raw_neurons_df = partition.neurons_df
+            neurons_df = partition.neurons(side)
 
             if neurons_df.empty:
                 # Still calculate complete summary even if filtered neurons are empty
                 complete_summary = (
-                    self._calculate_summary(raw_neurons_df, neuron_type, "all")
+                    self._calculate_summary(
+                        raw_neurons_df, neuron_type, "all", statistics
+                    )
                     if not raw_neurons_df.empty
                     else {
                         "total_count": 0,
@@ -281,27 +350,17 @@ class NeuPrintConnector:
                     "soma_side": soma_side,
                 }
 
-            # Filter ROI data to match the filtered neurons
-            if not raw_roi_df.empty and not neurons_df.empty:
-                body_ids = (
-                    neurons_df["bodyId"].tolist()
-                    if "bodyId" in neurons_df.columns
-                    else []
-                )
-                roi_df = (
-                    raw_roi_df[raw_roi_df["bodyId"].isin(body_ids)]
-                    if body_ids
-                    else pd.DataFrame()
-                )
-            else:
-                roi_df = pd.DataFrame()
+            # ROI data of the filtered neurons
+            roi_df = partition.roi_counts(side)
 
             # Calculate summary statistics for filtered neurons
-            summary = self._calculate_summary(neurons_df, neuron_type, soma_side)
+            summary = self._calculate_summary(
+                neurons_df, neuron_type, soma_side, statistics, side
+            )
 
             # Calculate complete summary statistics for the entire neuron type
             complete_summary = self._calculate_summary(
-                raw_neurons_df, neuron_type, "all"
+                raw_neurons_df, neuron_type, "all", statistics
             )
 
             # Get connectivity data with caching
@@ -315,6 +374,8 @@ class NeuPrintConnector:
             return {
                 "neurons": neurons_df,
                 "roi_counts": roi_df,
+                # ROI rows of exactly these neurons, from the soma side partition
+                "roi_counts_matched": True,
                 "summary": summary,
                 "complete_summary": complete_summary,
                 "connectivity": connectivity,
@@ -335,46 +396,101 @@ class NeuPrintConnector:
         Returns:
             Tuple of (neurons_df, roi_df) - the raw unfiltered data
         """
+        cached_data = self._get_raw_neuron_data_entry(neuron_type)
+        return cached_data["neurons_df"], cached_data["roi_df"]
+
+    def _get_raw_neuron_data_entry(self, neuron_type: str) -> Dict[str, Any]:
+        """
+        Get the cache entry of a neuron type's raw data, fetching it on a miss.
+
+        Args:
+            neuron_type: The type of neuron to fetch
+
+        Returns:
+            Cache entry with the raw frames, their soma side partition and
+            their soma side statistics
+        """
         # Check cache first
-        if neuron_type in self._raw_neuron_data_cache:
-            cached_data = self._raw_neuron_data_cache[neuron_type]
+        cached_data = self._data_cache.get(_RAW_DATA_PREFIX + neuron_type)
+        if cached_data is not None:
             self._cache_stats["hits"] += 1
             self._cache_stats["total_queries_saved"] += 1
-            return cached_data["neurons_df"], cached_data["roi_df"]
+            return cached_data
 
         # Cache miss - fetch from database
         self._cache_stats["misses"] += 1
+        neurons_df, roi_df = self._fetch_raw_neuron_data(neuron_type)
+        return self._cache_raw_neuron_data(neuron_type, neurons_df, roi_df)
+
+    def _cache_raw_neuron_data(
+        self, neuron_type: str, neurons_df: pd.DataFrame, roi_df: pd.DataFrame
+    ) -> Dict[str, Any]:
+        """
+        Process freshly fetched raw neuron data and store it in the cache.
+
+        Soma sides are extracted once here and the data is partitioned by soma
+        side, so per-side requests only slice the cached frames. The soma side
+        statistics are computed here too, so they are part of the entry when
+        the cache sizes it.
+
+        Args:
+            neuron_type: The type of neuron the data belongs to
+            neurons_df: Raw neuron data
+            roi_df: Raw per-neuron ROI counts
+
+        Returns:
+            The cache entry of the neuron type
+        """
+        # Use dataset adapter to process the raw data
+        if not neurons_df.empty:
+            # Normalize columns and extract soma side using adapter
+            neurons_df = self.dataset_adapter.normalize_columns(neurons_df)
+            neurons_df = self.dataset_adapter.extract_soma_side(neurons_df)
+        roi_df = intern_roi_names(roi_df)
+        partition = SomaSidePartition(neurons_df, roi_df)
+
+        # Cache the raw data; ROI rows are stored grouped by soma side
+        cached_data = {
+            "neurons_df": neurons_df,
+            "roi_df": partition.roi_df,
+            "partition": partition,
+            "statistics": self._summarize_soma_sides(neurons_df),
+            "fetched_at": time.time(),
+        }
+        self._data_cache.put(_RAW_DATA_PREFIX + neuron_type, cached_data)
+
+        return cached_data
+
+    def _get_soma_side_partition(self, neuron_type: str) -> SomaSidePartition:
+        """
+        Get the soma side partition of a neuron type's raw data.
+
+        Args:
+            neuron_type: The type of neuron to fetch
+
+        Returns:
+            SomaSidePartition over the cached raw data
+        """
+        return self._get_raw_neuron_data_entry(neuron_type)["partition"]
+
+    def _fetch_raw_neuron_data(self, neuron_type: str) -> tuple:
+        """
+        Fetch raw neuron and ROI data for a neuron type from the database.
+
+        Args:
+            neuron_type: The type of neuron to fetch
+
+        Returns:
+            Tuple of (neurons_df, roi_df) before dataset adapter processing
+        """
         # Use exact matching without changing the search term
         criteria = NeuronCriteria(type=neuron_type, regex=False)
         neurons_df, roi_df = fetch_neurons(criteria)
 
         # Add neurotransmitter fields via separate query if neurons were found
         if not neurons_df.empty:
-            body_ids = neurons_df["bodyId"].tolist()
-            body_ids_str = "[" + ", ".join(str(bid) for bid in body_ids) + "]"
-
-            # Query for neurotransmitter and class fields
-            nt_query = f"""
-            UNWIND {body_ids_str} as target_body_id
-            MATCH (n:Neuron {{bodyId: target_body_id}})
-            RETURN
-                target_body_id as bodyId,
-                n.consensusNt as consensusNt,
-                n.celltypePredictedNt as celltypePredictedNt,
-                n.celltypePredictedNtConfidence as celltypePredictedNtConfidence,
-                n.celltypeTotalNtPredictions as celltypeTotalNtPredictions,
-                n.class as cellClass,
-                n.subclass as cellSubclass,
-                n.superclass as cellSuperclass,
-                n.dimorphism as dimorphism,
-                n.synonyms as synonyms,
-                n.flywireType as flywireType,
-                n.somaNeuromere as somaNeuromere,
-                n.trumanHl as trumanHl
-            """
-
             try:
-                nt_df = self.client.fetch_custom(nt_query)
+                nt_df = self._fetch_neurotransmitter_data(neurons_df["bodyId"].tolist())
                 if not nt_df.empty:
                     # Merge neurotransmitter data with neurons_df
                     neurons_df = neurons_df.merge(nt_df, on="bodyId", how="left")
@@ -384,20 +500,41 @@ class NeuPrintConnector:
                     f"Failed to fetch neurotransmitter data for {neuron_type}: {e}"
                 )
 
-        # Use dataset adapter to process the raw data
-        if not neurons_df.empty:
-            # Normalize columns and extract soma side using adapter
-            neurons_df = self.dataset_adapter.normalize_columns(neurons_df)
-            neurons_df = self.dataset_adapter.extract_soma_side(neurons_df)
+        return neurons_df, roi_df
 
-        # Cache the raw data
-        self._raw_neuron_data_cache[neuron_type] = {
-            "neurons_df": neurons_df,
-            "roi_df": roi_df,
-            "fetched_at": time.time(),
-        }
+    def _fetch_neurotransmitter_data(self, body_ids: List[int]) -> pd.DataFrame:
+        """
+        Fetch neurotransmitter and class fields that fetch_neurons does not return.
 
-        return neurons_df, roi_df
+        Args:
+            body_ids: Body IDs of the neurons to query
+
+        Returns:
+            DataFrame keyed by bodyId with neurotransmitter and class columns
+        """
+        body_ids_str = "[" + ", ".join(str(bid) for bid in body_ids) + "]"
+
+        # Query for neurotransmitter and class fields
+        nt_query = f"""
+        UNWIND {body_ids_str} as target_body_id
+        MATCH (n:Neuron {{bodyId: target_body_id}})
+        RETURN
+            target_body_id as bodyId,
+            n.consensusNt as consensusNt,
+            n.celltypePredictedNt as celltypePredictedNt,
+            n.celltypePredictedNtConfidence as celltypePredictedNtConfidence,
+            n.celltypeTotalNtPredictions as celltypeTotalNtPredictions,
+            n.class as cellClass,
+            n.subclass as cellSubclass,
+            n.superclass as cellSuperclass,
+            n.dimorphism as dimorphism,
+            n.synonyms as synonyms,
+            n.flywireType as flywireType,
+            n.somaNeuromere as somaNeuromere,
+            n.trumanHl as trumanHl
+        """
+
+        return self.client.fetch_custom(nt_query)
 
     def clear_neuron_data_cache(self, neuron_type: str = None):
         """
@@ -407,18 +544,17 @@ class NeuPrintConnector:
             neuron_type: Specific type to clear, or None to clear all
         """
         if neuron_type:
-            self._raw_neuron_data_cache.pop(neuron_type, None)
+            self._data_cache.delete(_RAW_DATA_PREFIX + neuron_type)
             # Also clear connectivity cache for this neuron type
             keys_to_remove = [
                 k
-                for k in self._connectivity_cache.keys()
-                if k.startswith(f"{neuron_type}_")
+                for k in self._data_cache.keys()
+                if k.startswith(f"{_CONNECTIVITY_PREFIX}{neuron_type}_")
             ]
             for key in keys_to_remove:
-                self._connectivity_cache.pop(key, None)
+                self._data_cache.delete(key)
         else:
-            self._raw_neuron_data_cache.clear()
-            self._connectivity_cache.clear()
+            self._data_cache.clear()
             # Also clear ROI hierarchy cache
             self._roi_hierarchy_cache = None
             # Also clear soma sides cache
@@ -575,19 +711,29 @@ class NeuPrintConnector:
             else 0
         )
 
+        data_cache_keys = self._data_cache.keys()
+        data_cache_stats = self._data_cache.stats()
+
         return {
             "cache_hits": self._cache_stats["hits"],
             "cache_misses": self._cache_stats["misses"],
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
             "database_queries_saved": self._cache_stats["total_queries_saved"],
-            "cached_neuron_types": len(self._raw_neuron_data_cache),
+            "cached_neuron_types": sum(
+                key.startswith(_RAW_DATA_PREFIX) for key in data_cache_keys
+            ),
             "connectivity_hits": self._cache_stats["connectivity_hits"],
             "connectivity_misses": self._cache_stats["connectivity_misses"],
             "connectivity_queries_saved": self._cache_stats[
                 "connectivity_queries_saved"
             ],
-            "cached_connectivity_entries": len(self._connectivity_cache),
+            "cached_connectivity_entries": sum(
+                key.startswith(_CONNECTIVITY_PREFIX) for key in data_cache_keys
+            ),
+            "data_cache_bytes": data_cache_stats["bytes"],
+            "data_cache_max_bytes": data_cache_stats["max_bytes"],
+            "data_cache_evictions": data_cache_stats["evictions"],
             "roi_hierarchy_hits": self._cache_stats["roi_hierarchy_hits"],
             "roi_hierarchy_misses": self._cache_stats["roi_hierarchy_misses"],
             "roi_hit_rate_percent": round(roi_hit_rate, 2),
@@ -598,6 +744,9 @@ class NeuPrintConnector:
             "soma_sides_hits": self._cache_stats["soma_sides_hits"],
             "soma_sides_misses": self._cache_stats["soma_sides_misses"],
             "cached_soma_sides_types": len(self._soma_sides_cache),
+            "cached_partner_bodies": len(self._partner_metadata)
+            if self._partner_metadata is not None
+            else 0,
         }
 
     def log_cache_performance(self):
@@ -641,71 +790,53 @@ class NeuPrintConnector:
             )
 
     def _calculate_summary(
-        self, neurons_df: pd.DataFrame, neuron_type: str, soma_side: str
+        self,
+        neurons_df: pd.DataFrame,
+        neuron_type: str,
+        soma_side: str,
+        statistics: Optional[SomaSideStatistics] = None,
+        side: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Calculate summary statistics for the neuron data."""
-        total_count = len(neurons_df)
-
-        # Count by soma side if side column exists
-        left_count = 0
-        right_count = 0
-        middle_count = 0
-
-        if "somaSide" in neurons_df.columns:
-            side_counts = neurons_df["somaSide"].value_counts()
-            left_count = side_counts.get("L", 0)
-            right_count = side_counts.get("R", 0)
-            middle_count = side_counts.get("M", 0)
-
-        # Use dataset adapter to get synapse statistics
-        pre_synapses, post_synapses = self.dataset_adapter.get_synapse_counts(
-            neurons_df
-        )
+        """
+        Calculate summary statistics for the neuron data.
+
+        Args:
+            neurons_df: Neurons to summarize
+            neuron_type: The type of the neurons
+            soma_side: Soma side label of the summary
+            statistics: Precomputed statistics of the raw type data of which
+                neurons_df is the soma side view; computed from neurons_df
+                if omitted
+            side: Soma side code of the view, or None for all neurons
+        """
+        if statistics is None:
+            statistics = self._summarize_soma_sides(neurons_df)
+            side = None
+
+        total_count = statistics.count(side)
+
+        # Count by soma side; a single-side view only has neurons of its side
+        left_count = statistics.count("L") if side in (None, "L") else 0
+        right_count = statistics.count("R") if side in (None, "R") else 0
+        middle_count = statistics.count("M") if side in (None, "M") else 0
+
+        pre_synapses, post_synapses = statistics.synapse_counts(side)
 
         # Calculate hemisphere synapse breakdowns for C pages
-        left_pre_synapses = 0
-        left_post_synapses = 0
-        right_pre_synapses = 0
-        right_post_synapses = 0
-        middle_pre_synapses = 0
-        middle_post_synapses = 0
+        hemisphere_synapses = {"L": (0, 0), "R": (0, 0), "M": (0, 0)}
 
         if (
             "somaSide" in neurons_df.columns
             and not neurons_df.empty
-            and self.dataset_adapter is not None
+            and statistics.has_synapse_columns
         ):
-            # Get synapse column names from dataset adapter
-            pre_col = self.dataset_adapter.dataset_info.pre_synapse_column
-            post_col = self.dataset_adapter.dataset_info.post_synapse_column
+            for code in hemisphere_synapses:
+                if side in (None, code):
+                    hemisphere_synapses[code] = statistics.synapse_counts(code)
 
-            if pre_col in neurons_df.columns and post_col in neurons_df.columns:
-                left_neurons = neurons_df[neurons_df["somaSide"] == "L"]
-                right_neurons = neurons_df[neurons_df["somaSide"] == "R"]
-                middle_neurons = neurons_df[neurons_df["somaSide"] == "M"]
-
-                left_pre_synapses = (
-                    int(left_neurons[pre_col].sum()) if not left_neurons.empty else 0
-                )
-                left_post_synapses = (
-                    int(left_neurons[post_col].sum()) if not left_neurons.empty else 0
-                )
-                right_pre_synapses = (
-                    int(right_neurons[pre_col].sum()) if not right_neurons.empty else 0
-                )
-                right_post_synapses = (
-                    int(right_neurons[post_col].sum()) if not right_neurons.empty else 0
-                )
-                middle_pre_synapses = (
-                    int(middle_neurons[pre_col].sum())
-                    if not middle_neurons.empty
-                    else 0
-                )
-                middle_post_synapses = (
-                    int(middle_neurons[post_col].sum())
-                    if not middle_neurons.empty
-                    else 0
-                )
+        left_pre_synapses, left_post_synapses = hemisphere_synapses["L"]
+        right_pre_synapses, right_post_synapses = hemisphere_synapses["R"]
+        middle_pre_synapses, middle_post_synapses = hemisphere_synapses["M"]
 
         # Extract neurotransmitter and class data from first row (should be consistent across type)
         consensus_nt = None
@@ -838,7 +969,7 @@ class NeuPrintConnector:
         # Calculate neurotransmitter analysis
         nt_analysis = None
         if total_count > 0:
-            nt_analysis = self._calculate_neurotransmitter_analysis(neurons_df)
+            nt_analysis = statistics.nt_analysis(side)
 
         # Calculate hemisphere totals and means for template use
         left_total_synapses = left_pre_synapses + left_post_synapses
@@ -891,18 +1022,25 @@ class NeuPrintConnector:
         """Calculate detailed neurotransmitter analysis for all neurons in the type."""
         if neurons_df.empty:
             return []
+        return self._summarize_soma_sides(neurons_df).nt_analysis()
+
+    def _summarize_soma_sides(self, neurons_df: pd.DataFrame) -> SomaSideStatistics:
+        """
+        Aggregate neuron counts, synapses and neurotransmitters by soma side.
+
+        Args:
+            neurons_df: Neurons of one type
+
+        Returns:
+            SomaSideStatistics of the neurons
+        """
+        dataset_info = self.dataset_adapter.dataset_info
 
         # Determine which neurotransmitter columns to use based on dataset
         consensus_col = None
         confidence_col = None
 
-        # Check dataset type to determine correct neurotransmitter column
-        is_fafb = (
-            self.dataset_adapter
-            and self.dataset_adapter.dataset_info.name == "flywire-fafb"
-        )
-
-        if is_fafb:
+        if dataset_info.name == "flywire-fafb":
             # FAFB uses predictedNt
             if "predictedNt" in neurons_df.columns:
                 consensus_col = "predictedNt"
@@ -922,69 +1060,27 @@ class NeuPrintConnector:
             elif "celltypePredictedNtConfidence" in neurons_df.columns:
                 confidence_col = "celltypePredictedNtConfidence"
 
-        if not consensus_col:
-            return []
-
-        # Count neurotransmitter frequencies and collect confidences
-        nt_counts = {}
-        nt_confidences = {}
-
-        for _, row in neurons_df.iterrows():
-            nt = row.get(consensus_col)
-
-            # Handle empty/null values as "Unknown"
-            if pd.isna(nt) or nt == "" or nt is None:
-                nt = "Unknown"
-
-            if nt not in nt_counts:
-                nt_counts[nt] = 0
-                nt_confidences[nt] = []
-
-            nt_counts[nt] += 1
-
-            # Add confidence if available, but not for Unknown
-            if (
-                confidence_col
-                and confidence_col in neurons_df.columns
-                and nt != "Unknown"
-            ):
-                confidence = row.get(confidence_col)
-                if pd.notna(confidence):
-                    nt_confidences[nt].append(float(confidence))
-
-        # Convert to analysis format sorted by count (descending)
-        nt_analysis = []
-
-        if not nt_counts:
-            return []
-
-        # Sort neurotransmitters: known ones by count (descending), then Unknown at the end
-        known_nts = [(nt, count) for nt, count in nt_counts.items() if nt != "Unknown"]
-        unknown_nts = [
-            (nt, count) for nt, count in nt_counts.items() if nt == "Unknown"
-        ]
-
-        # Sort known neurotransmitters by count (descending)
-        known_nts.sort(key=lambda x: x[1], reverse=True)
-
-        # Combine: known first, then unknown at the end
-        sorted_nts = known_nts + unknown_nts
+        return SomaSideStatistics(
+            neurons_df,
+            dataset_info.pre_synapse_column,
+            dataset_info.post_synapse_column,
+            consensus_col,
+            confidence_col,
+        )
 
-        for nt, count in sorted_nts:
-            mean_confidence = None
+    def _get_soma_side_statistics(self, neuron_type: str) -> SomaSideStatistics:
+        """
+        Get the soma side statistics of a neuron type's raw data.
 
-            if nt != "Unknown" and nt_confidences[nt]:
-                mean_confidence = sum(nt_confidences[nt]) / len(nt_confidences[nt])
+        The statistics are computed once and cached with the raw data.
 
-            nt_analysis.append(
-                {
-                    "nt_type": nt,
-                    "count": count,
-                    "mean_confidence": mean_confidence,
-                }
-            )
+        Args:
+            neuron_type: The type of neuron to summarize
 
-        return nt_analysis
+        Returns:
+            SomaSideStatistics over the cached raw data
+        """
+        return self._get_raw_neuron_data_entry(neuron_type)["statistics"]
 
     def _get_cached_connectivity_summary(
         self,
@@ -996,13 +1092,16 @@ class NeuPrintConnector:
         """Get connectivity summary with caching to avoid redundant queries."""
         # Create cache key based on sorted body IDs to ensure consistent caching
         body_ids_key = tuple(sorted(body_ids))
-        cache_key = f"{neuron_type}_{soma_side}_{hash(body_ids_key)}"
+        cache_key = (
+            f"{_CONNECTIVITY_PREFIX}{neuron_type}_{soma_side}_{hash(body_ids_key)}"
+        )
 
         # Check cache first
-        if cache_key in self._connectivity_cache:
+        cached_connectivity = self._data_cache.get(cache_key)
+        if cached_connectivity is not None:
             self._cache_stats["connectivity_hits"] += 1
             self._cache_stats["connectivity_queries_saved"] += 1
-            return self._connectivity_cache[cache_key]
+            return cached_connectivity
 
         # Cache miss - compute connectivity
         self._cache_stats["connectivity_misses"] += 1
@@ -1010,7 +1109,9 @@ class NeuPrintConnector:
         # Create temporary DataFrame for compatibility with existing method
         if body_ids:
             temp_neurons_df = pd.DataFrame({"bodyId": body_ids})
-            connectivity = self._get_connectivity_summary(temp_neurons_df, roi_df)
+            connectivity = self._get_connectivity_summary(
+                temp_neurons_df, roi_df, neuron_type, soma_side
+            )
         else:
             connectivity = {
                 "upstream": [],
@@ -1019,14 +1120,24 @@ class NeuPrintConnector:
             }
 
         # Cache the result
-        self._connectivity_cache[cache_key] = connectivity
+        self._data_cache.put(cache_key, connectivity)
 
         return connectivity
 
     def _get_connectivity_summary(
-        self, neurons_df: pd.DataFrame, roi_df: pd.DataFrame = None
+        self,
+        neurons_df: pd.DataFrame,
+        roi_df: pd.DataFrame = None,
+        neuron_type: Optional[str] = None,
+        soma_side: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get connectivity summary for the neurons."""
+        """
+        Get connectivity summary for the neurons.
+
+        When neuron_type and soma_side are given and the connectome index
+        holds the type, the neurons must be all neurons of that type and soma
+        side; their partners are then read from the index instead of queried.
+        """
         if neurons_df.empty:
             return {"upstream": [], "downstream": [], "regional_connections": {}}
 
@@ -1051,290 +1162,27 @@ class NeuPrintConnector:
                 # Add enhanced connectivity info for layer-innervating neurons
                 regional_connections = self._get_regional_connections(body_ids)
 
-            # Query for upstream connections (neurons that connect TO these neurons)
-            # Choose neurotransmitter field based on dataset
-            nt_field = (
-                "upstream.predictedNt"
-                if self.dataset_adapter.dataset_info.name == "flywire-fafb"
-                else "upstream.consensusNt"
-            )
-
-            upstream_query = f"""
-            MATCH (upstream:Neuron)-[c:ConnectsTo]->(target:Neuron)
-            WHERE target.bodyId IN {body_ids}
-            WITH upstream.type as partner_type,
-                    CASE
-                        WHEN upstream.somaSide IS NOT NULL THEN upstream.somaSide
-                        WHEN upstream.side IS NOT NULL THEN
-                            CASE upstream.side
-                                WHEN 'LEFT' THEN 'L'
-                                WHEN 'RIGHT' THEN 'R'
-                                WHEN 'CENTER' THEN 'M'
-                                WHEN 'MIDDLE' THEN 'M'
-                                WHEN 'left' THEN 'L'
-                                WHEN 'right' THEN 'R'
-                                WHEN 'center' THEN 'M'
-                                WHEN 'middle' THEN 'M'
-                                ELSE upstream.side
-                            END
-                        ELSE ''
-                    END as soma_side,
-                   COALESCE({nt_field}, 'Unknown') as neurotransmitter,
-                   c.weight as weight,
-                   upstream.bodyId as partner_bodyId
-            RETURN partner_type, soma_side, neurotransmitter, weight, partner_bodyId
-            ORDER BY weight DESC
-            """
-
-            upstream_result = self.client.fetch_custom(upstream_query)
-            upstream_partners = []
-
-            if hasattr(upstream_result, "iterrows"):
-                # First group by (type, soma_side) only to aggregate all connections
-                type_soma_data = {}
-                for _, record in upstream_result.iterrows():
-                    if record["partner_type"]:  # Skip null types
-                        soma_side = (
-                            record["soma_side"] if pd.notna(record["soma_side"]) else ""
-                        )
-                        neurotransmitter = (
-                            record["neurotransmitter"]
-                            if pd.notna(record["neurotransmitter"])
-                            else "Unknown"
-                        )
-                        key = (record["partner_type"], soma_side)
-
-                        if key not in type_soma_data:
-                            type_soma_data[key] = {
-                                "type": record["partner_type"],
-                                "soma_side": soma_side,
-                                "total_weight": 0,
-                                "connection_count": 0,
-                                "neurotransmitters": {},  # Track NT frequencies
-                                "partner_body_ids": set(),  # Track unique partner neurons
-                                "partner_weights": {},  # Track weights per partner neuron for CV calculation
-                            }
-
-                        type_soma_data[key]["total_weight"] += int(record["weight"])
-                        type_soma_data[key]["connection_count"] += 1
-                        type_soma_data[key]["partner_body_ids"].add(
-                            record["partner_bodyId"]
-                        )
-
-                        # Track weights per partner neuron for coefficient of variation calculation
-                        partner_id = record["partner_bodyId"]
-                        if partner_id not in type_soma_data[key]["partner_weights"]:
-                            type_soma_data[key]["partner_weights"][partner_id] = 0
-                        type_soma_data[key]["partner_weights"][partner_id] += int(
-                            record["weight"]
-                        )
-
-                        # Track neurotransmitter frequency by connection weight
-                        if (
-                            neurotransmitter
-                            not in type_soma_data[key]["neurotransmitters"]
-                        ):
-                            type_soma_data[key]["neurotransmitters"][
-                                neurotransmitter
-                            ] = 0
-                        type_soma_data[key]["neurotransmitters"][neurotransmitter] += (
-                            int(record["weight"])
-                        )
-
-                # Convert to partner list with most common neurotransmitter
-                total_upstream_weight = sum(
-                    data["total_weight"] for data in type_soma_data.values()
+            index = self._get_connectome_index() if neuron_type else None
+            if index is not None and index.has_type(neuron_type):
+                side = self.dataset_adapter.resolve_soma_side(soma_side)
+                upstream_partners = index.partners(
+                    neuron_type, side, "upstream", len(body_ids)
                 )
-                for data in type_soma_data.values():
-                    # Find most common neurotransmitter by weight
-                    most_common_nt = max(
-                        data["neurotransmitters"].items(), key=lambda x: x[1]
-                    )[0]
-
-                    weight = data["total_weight"]
-                    percentage = (
-                        (weight / total_upstream_weight * 100)
-                        if total_upstream_weight > 0
-                        else 0
-                    )
-                    connections_per_neuron = weight / len(body_ids)
-
-                    # Calculate coefficient of variation for connections per neuron
-                    partner_weights = list(data["partner_weights"].values())
-                    if len(partner_weights) > 1:
-                        # Convert to connections per target neuron (divide by number of target neurons)
-                        connections_per_target = [
-                            w / len(body_ids) for w in partner_weights
-                        ]
-                        mean_conn = sum(connections_per_target) / len(
-                            connections_per_target
-                        )
-                        variance = sum(
-                            (x - mean_conn) ** 2 for x in connections_per_target
-                        ) / len(connections_per_target)
-                        std_dev = variance**0.5
-                        cv = (std_dev / mean_conn) if mean_conn > 0 else 0
-                    else:
-                        cv = 0  # No variation with only one partner neuron
-
-                    upstream_partners.append(
-                        {
-                            "type": data["type"],
-                            "soma_side": data["soma_side"],
-                            "neurotransmitter": most_common_nt,
-                            "weight": weight,
-                            "connections_per_neuron": connections_per_neuron,
-                            "coefficient_of_variation": round(cv, 3),
-                            "percentage": percentage,
-                            "partner_neuron_count": len(data["partner_body_ids"]),
-                        }
-                    )
-
-                # Sort by total weight descending
-                upstream_partners.sort(key=lambda x: x["weight"], reverse=True)
-
-            # Query for downstream connections (neurons that these neurons connect TO)
-            # Choose neurotransmitter field based on dataset
-            nt_field = (
-                "downstream.predictedNt"
-                if self.dataset_adapter.dataset_info.name == "flywire-fafb"
-                else "downstream.consensusNt"
-            )
-
-            downstream_query = f"""
-            MATCH (source:Neuron)-[c:ConnectsTo]->(downstream:Neuron)
-            WHERE source.bodyId IN {body_ids}
-            WITH downstream.type as partner_type,
-                    CASE
-                        WHEN downstream.somaSide IS NOT NULL THEN downstream.somaSide
-                        WHEN downstream.side IS NOT NULL THEN
-                            CASE downstream.side
-                                WHEN 'LEFT' THEN 'L'
-                                WHEN 'RIGHT' THEN 'R'
-                                WHEN 'CENTER' THEN 'M'
-                                WHEN 'MIDDLE' THEN 'M'
-                                WHEN 'left' THEN 'L'
-                                WHEN 'right' THEN 'R'
-                                WHEN 'center' THEN 'M'
-                                WHEN 'middle' THEN 'M'
-                                ELSE downstream.side
-                            END
-                        ELSE ''
-                    END as soma_side,
-                    COALESCE({nt_field}, 'Unknown') as neurotransmitter,
-                    c.weight as weight,
-                    downstream.bodyId as partner_bodyId
-            RETURN partner_type, soma_side, neurotransmitter, weight, partner_bodyId
-            ORDER BY weight DESC
-            """
-
-            downstream_result = self.client.fetch_custom(downstream_query)
-            downstream_partners = []
-
-            if hasattr(downstream_result, "iterrows"):
-                # First group by (type, soma_side) only to aggregate all connections
-                # Group by (type, soma_side) to aggregate connections
-                type_soma_data = {}
-                for _, record in downstream_result.iterrows():
-                    if record["partner_type"]:  # Skip null types
-                        soma_side = (
-                            record["soma_side"] if pd.notna(record["soma_side"]) else ""
-                        )
-                        neurotransmitter = (
-                            record["neurotransmitter"]
-                            if pd.notna(record["neurotransmitter"])
-                            else "Unknown"
-                        )
-                        key = (record["partner_type"], soma_side)
-
-                        if key not in type_soma_data:
-                            type_soma_data[key] = {
-                                "type": record["partner_type"],
-                                "soma_side": soma_side,
-                                "total_weight": 0,
-                                "connection_count": 0,
-                                "neurotransmitters": {},  # Track NT frequencies
-                                "partner_body_ids": set(),  # Track unique partner neurons
-                                "partner_weights": {},  # Track weights per partner neuron for CV calculation
-                            }
-
-                        type_soma_data[key]["total_weight"] += int(record["weight"])
-                        type_soma_data[key]["connection_count"] += 1
-                        type_soma_data[key]["partner_body_ids"].add(
-                            record["partner_bodyId"]
-                        )
-
-                        # Track weights per partner neuron for coefficient of variation calculation
-                        partner_id = record["partner_bodyId"]
-                        if partner_id not in type_soma_data[key]["partner_weights"]:
-                            type_soma_data[key]["partner_weights"][partner_id] = 0
-                        type_soma_data[key]["partner_weights"][partner_id] += int(
-                            record["weight"]
-                        )
-
-                        # Track neurotransmitter frequency by connection weight
-                        if (
-                            neurotransmitter
-                            not in type_soma_data[key]["neurotransmitters"]
-                        ):
-                            type_soma_data[key]["neurotransmitters"][
-                                neurotransmitter
-                            ] = 0
-                        type_soma_data[key]["neurotransmitters"][neurotransmitter] += (
-                            int(record["weight"])
-                        )
-
-                # Convert to partner list with most common neurotransmitter
-                total_downstream_weight = sum(
-                    data["total_weight"] for data in type_soma_data.values()
+                downstream_partners = index.partners(
+                    neuron_type, side, "downstream", len(body_ids)
+                )
+            else:
+                # Upstream: neurons that connect TO these neurons
+                upstream_result = self._fetch_partner_records(body_ids, "upstream")
+                upstream_partners = self._aggregate_partner_records(
+                    upstream_result, body_ids
                 )
-                for data in type_soma_data.values():
-                    # Find most common neurotransmitter by weight
-                    most_common_nt = max(
-                        data["neurotransmitters"].items(), key=lambda x: x[1]
-                    )[0]
-
-                    weight = data["total_weight"]
-                    percentage = (
-                        (weight / total_downstream_weight * 100)
-                        if total_downstream_weight > 0
-                        else 0
-                    )
-                    connections_per_neuron = weight / len(body_ids)
-
-                    # Calculate coefficient of variation for connections per neuron
-                    partner_weights = list(data["partner_weights"].values())
-                    if len(partner_weights) > 1:
-                        # Convert to connections per source neuron (divide by number of source neurons)
-                        connections_per_source = [
-                            w / len(body_ids) for w in partner_weights
-                        ]
-                        mean_conn = sum(connections_per_source) / len(
-                            connections_per_source
-                        )
-                        variance = sum(
-                            (x - mean_conn) ** 2 for x in connections_per_source
-                        ) / len(connections_per_source)
-                        std_dev = variance**0.5
-                        cv = (std_dev / mean_conn) if mean_conn > 0 else 0
-                    else:
-                        cv = 0  # No variation with only one partner neuron
-
-                    downstream_partners.append(
-                        {
-                            "type": data["type"],
-                            "soma_side": data["soma_side"],
-                            "neurotransmitter": most_common_nt,
-                            "weight": weight,
-                            "connections_per_neuron": connections_per_neuron,
-                            "coefficient_of_variation": round(cv, 3),
-                            "percentage": percentage,
-                            "partner_neuron_count": len(data["partner_body_ids"]),
-                        }
-                    )
 
-                # Sort by total weight descending
-                downstream_partners.sort(key=lambda x: x["weight"], reverse=True)
+                # Downstream: neurons that these neurons connect TO
+                downstream_result = self._fetch_partner_records(body_ids, "downstream")
+                downstream_partners = self._aggregate_partner_records(
+                    downstream_result, body_ids
+                )
 
             result = {
                 "upstream": upstream_partners,
@@ -1352,6 +1200,276 @@ class NeuPrintConnector:
                 "note": f"Error fetching connectivity: {str(e)}",
             }
 
+    def _get_connectome_index(self) -> Optional[ConnectomeIndex]:
+        """
+        Get the connectome index configured in neuprint.connectome_index_dir.
+
+        The index is loaded on first use. An index that is missing or was
+        built for another dataset or dataset version is ignored, and partners
+        are queried.
+
+        Returns:
+            ConnectomeIndex, or None if no usable index is configured
+        """
+        if self._connectome_index_checked:
+            return self._connectome_index
+
+        # Concurrent pages wait for the first load instead of seeing no index
+        with self._connectome_index_lock:
+            if self._connectome_index_checked:
+                return self._connectome_index
+
+            index_dir = self.config.neuprint.connectome_index_dir
+            if index_dir:
+                try:
+                    index = ConnectomeIndex.load(index_dir)
+                    index.validate(
+                        self.config.neuprint.server,
+                        self.config.neuprint.dataset,
+                        self.get_dataset_uuid(),
+                    )
+                    self._connectome_index = index
+                except Exception as e:
+                    logger.warning(f"Not using connectome index in {index_dir}: {e}")
+            self._connectome_index_checked = True
+        return self._connectome_index
+
+    def _fetch_partner_records(
+        self, body_ids: List[int], direction: str
+    ) -> pd.DataFrame:
+        """
+        Fetch one row per connection between the given neurons and their partners.
+
+        Connections to typed partners are queried as (partner bodyId, weight)
+        pairs and joined with the partner metadata table, so the attributes of
+        a partner are only fetched the first time it is seen.
+
+        Args:
+            body_ids: Body IDs of the neurons being summarized
+            direction: 'upstream' for inputs to the neurons, 'downstream' for outputs
+
+        Returns:
+            DataFrame with columns partner_type, soma_side, neurotransmitter,
+            weight and partner_bodyId, ordered by weight descending
+        """
+        if direction == "upstream":
+            match_clause = "MATCH (partner:Neuron)-[c:ConnectsTo]->(target:Neuron)"
+            where_clause = f"WHERE target.bodyId IN {body_ids}"
+        else:
+            match_clause = "MATCH (source:Neuron)-[c:ConnectsTo]->(partner:Neuron)"
+            where_clause = f"WHERE source.bodyId IN {body_ids}"
+
+        query = f"""
+        {match_clause}
+        {where_clause} AND partner.type IS NOT NULL
+        RETURN partner.bodyId as partner_bodyId, c.weight as weight
+        ORDER BY weight DESC
+        """
+
+        connections = self.client.fetch_custom(query)
+        if connections.empty:
+            return pd.DataFrame(columns=PARTNER_RECORD_COLUMNS)
+
+        partner_ids = connections["partner_bodyId"].to_numpy()
+        return self._get_partner_metadata(partner_ids).records(
+            partner_ids, connections["weight"].to_numpy()
+        )
+
+    def _get_partner_metadata(self, partner_ids) -> PartnerMetadataTable:
+        """
+        Get the partner metadata table, fetching the bodies it is missing.
+
+        The table is loaded from the cache of the dataset version on first
+        use. Newly fetched bodies are appended to that cache.
+
+        Args:
+            partner_ids: Partner body IDs that need metadata
+
+        Returns:
+            PartnerMetadataTable covering the given partners
+        """
+        # Side pages of a type are generated on concurrent threads. The lock
+        # only guards loading the table, so their metadata queries overlap.
+        with self._partner_metadata_lock:
+            if self._partner_metadata is None:
+                self._partner_metadata_uuid = self.get_dataset_uuid()
+                cached = (
+                    self._neuron_cache_manager.load_partner_metadata(
+                        self._partner_metadata_uuid
+                    )
+                    if self._partner_metadata_uuid
+                    else None
+                )
+                self._partner_metadata = PartnerMetadataTable(cached)
+            table = self._partner_metadata
+            missing = table.missing(partner_ids)
+
+        fetched = [
+            self._fetch_partner_metadata(
+                missing[start : start + PARTNER_METADATA_PAGE_SIZE]
+            )
+            for start in range(0, len(missing), PARTNER_METADATA_PAGE_SIZE)
+        ]
+        fetched = [metadata for metadata in fetched if not metadata.empty]
+        if not fetched:
+            return table
+
+        for metadata in fetched:
+            table.add(metadata)
+
+        if self._partner_metadata_uuid:
+            self._neuron_cache_manager.save_partner_metadata(
+                self._partner_metadata_uuid,
+                pd.concat(fetched, ignore_index=True)
+                if len(fetched) > 1
+                else fetched[0],
+            )
+        return table
+
+    def _fetch_partner_metadata(self, body_ids: List[int]) -> pd.DataFrame:
+        """
+        Fetch the type, soma side and neurotransmitter shown for partners.
+
+        Args:
+            body_ids: Body IDs of the partners
+
+        Returns:
+            DataFrame with columns bodyId, type, soma_side and neurotransmitter
+        """
+        # Choose neurotransmitter field based on dataset
+        nt_field = (
+            "n.predictedNt"
+            if self.dataset_adapter.dataset_info.name == "flywire-fafb"
+            else "n.consensusNt"
+        )
+        query = f"""
+        MATCH (n:Neuron)
+        WHERE n.bodyId IN {body_ids}
+        RETURN n.bodyId as bodyId,
+               n.type as type,
+               CASE
+                   WHEN n.somaSide IS NOT NULL THEN n.somaSide
+                   WHEN n.side IS NOT NULL THEN
+                       CASE n.side
+                           WHEN 'LEFT' THEN 'L'
+                           WHEN 'RIGHT' THEN 'R'
+                           WHEN 'CENTER' THEN 'M'
+                           WHEN 'MIDDLE' THEN 'M'
+                           WHEN 'left' THEN 'L'
+                           WHEN 'right' THEN 'R'
+                           WHEN 'center' THEN 'M'
+                           WHEN 'middle' THEN 'M'
+                           ELSE n.side
+                       END
+                   ELSE ''
+               END as soma_side,
+               COALESCE({nt_field}, 'Unknown') as neurotransmitter
+        """
+        return self.client.fetch_custom(query)
+
+    def _aggregate_partner_records(
+        self, records: pd.DataFrame, body_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate per-connection partner records into per-(type, soma side) partners.
+
+        Args:
+            records: DataFrame as returned by _fetch_partner_records
+            body_ids: Body IDs of the neurons being summarized
+
+        Returns:
+            List of partner dictionaries sorted by total weight descending
+        """
+        partners = []
+
+        if not hasattr(records, "iterrows"):
+            return partners
+
+        # First group by (type, soma_side) only to aggregate all connections
+        type_soma_data = {}
+        for _, record in records.iterrows():
+            if record["partner_type"]:  # Skip null types
+                soma_side = record["soma_side"] if pd.notna(record["soma_side"]) else ""
+                neurotransmitter = (
+                    record["neurotransmitter"]
+                    if pd.notna(record["neurotransmitter"])
+                    else "Unknown"
+                )
+                key = (record["partner_type"], soma_side)
+
+                if key not in type_soma_data:
+                    type_soma_data[key] = {
+                        "type": record["partner_type"],
+                        "soma_side": soma_side,
+                        "total_weight": 0,
+                        "connection_count": 0,
+                        "neurotransmitters": {},  # Track NT frequencies
+                        "partner_body_ids": set(),  # Track unique partner neurons
+                        "partner_weights": {},  # Track weights per partner neuron for CV calculation
+                    }
+
+                type_soma_data[key]["total_weight"] += int(record["weight"])
+                type_soma_data[key]["connection_count"] += 1
+                type_soma_data[key]["partner_body_ids"].add(record["partner_bodyId"])
+
+                # Track weights per partner neuron for coefficient of variation calculation
+                partner_id = record["partner_bodyId"]
+                if partner_id not in type_soma_data[key]["partner_weights"]:
+                    type_soma_data[key]["partner_weights"][partner_id] = 0
+                type_soma_data[key]["partner_weights"][partner_id] += int(
+                    record["weight"]
+                )
+
+                # Track neurotransmitter frequency by connection weight
+                if neurotransmitter not in type_soma_data[key]["neurotransmitters"]:
+                    type_soma_data[key]["neurotransmitters"][neurotransmitter] = 0
+                type_soma_data[key]["neurotransmitters"][neurotransmitter] += int(
+                    record["weight"]
+                )
+
+        # Convert to partner list with most common neurotransmitter
+        total_weight = sum(data["total_weight"] for data in type_soma_data.values())
+        for data in type_soma_data.values():
+            # Find most common neurotransmitter by weight
+            most_common_nt = max(data["neurotransmitters"].items(), key=lambda x: x[1])[
+                0
+            ]
+
+            weight = data["total_weight"]
+            percentage = (weight / total_weight * 100) if total_weight > 0 else 0
+            connections_per_neuron = weight / len(body_ids)
+
+            # Calculate coefficient of variation for connections per neuron
+            partner_weights = list(data["partner_weights"].values())
+            if len(partner_weights) > 1:
+                # Convert to connections per neuron (divide by number of summarized neurons)
+                connections_per_target = [w / len(body_ids) for w in partner_weights]
+                mean_conn = sum(connections_per_target) / len(connections_per_target)
+                variance = sum(
+                    (x - mean_conn) ** 2 for x in connections_per_target
+                ) / len(connections_per_target)
+                std_dev = variance**0.5
+                cv = (std_dev / mean_conn) if mean_conn > 0 else 0
+            else:
+                cv = 0  # No variation with only one partner neuron
+
+            partners.append(
+                {
+                    "type": data["type"],
+                    "soma_side": data["soma_side"],
+                    "neurotransmitter": most_common_nt,
+                    "weight": weight,
+                    "connections_per_neuron": connections_per_neuron,
+                    "coefficient_of_variation": round(cv, 3),
+                    "percentage": percentage,
+                    "partner_neuron_count": len(data["partner_body_ids"]),
+                }
+            )
+
+        # Sort by total weight descending
+        partners.sort(key=lambda x: x["weight"], reverse=True)
+        return partners
+
     def get_available_types(self) -> List[str]:
         """Get list of available neuron types in the dataset."""
         if not self.client:
@@ -1740,6 +1858,45 @@ class NeuPrintConnector:
         # Return the first N types
         return available_types[: discovery_config.max_types]
 
+    def fetch_column_roi_totals(
+        self, neuron_type: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Sum pre/post synapse counts per innervated optic lobe column ROI.
+
+        Args:
+            neuron_type: Restrict the totals to this neuron type, or None for
+                the whole dataset
+
+        Returns:
+            DataFrame with columns roi, pre and post for every column ROI
+            (ME/LO/LOP_[RL]_col_*) with at least one synapse, ordered by roi
+        """
+        if not self.client:
+            raise ConnectionError("Not connected to NeuPrint")
+
+        if neuron_type is not None:
+            escaped_type = self._escape_for_cypher_string(neuron_type)
+            where_clause = f'WHERE n.type = "{escaped_type}" AND n.roiInfo IS NOT NULL'
+        else:
+            where_clause = "WHERE n.roiInfo IS NOT NULL"
+
+        query = f"""
+            MATCH (n:Neuron)
+            {where_clause}
+            WITH n, apoc.convert.fromJsonMap(n.roiInfo) as roiData
+            UNWIND keys(roiData) as roiName
+            WITH roiName, roiData[roiName] as roiInfo
+            WHERE roiName =~ '^(ME|LO|LOP)_[RL]_col_[A-Za-z0-9]+_[A-Za-z0-9]+$'
+            AND (roiInfo.pre > 0 OR roiInfo.post > 0)
+            WITH roiName,
+                 SUM(COALESCE(roiInfo.pre, 0)) as total_pre,
+                 SUM(COALESCE(roiInfo.post, 0)) as total_post
+            RETURN roiName as roi, total_pre as pre, total_post as post
+            ORDER BY roi
+        """
+        return self.client.fetch_custom(query)
+
     def _check_layer_innervation(
         self, body_ids: List[int], roi_df: pd.DataFrame
     ) -> bool:
@@ -1764,10 +1921,8 @@ class NeuPrintConnector:
                 return False
 
             # Check for layer regions: (ME|LO|LOP)_[LR]_layer_<number>
-            layer_pattern = r"^(ME|LO|LOP)_[LR]_layer_\d+$"
-            layer_rois = neuron_roi_data[
-                neuron_roi_data["roi"].str.match(layer_pattern, na=False)
-            ]
+            layer_mask = roi_attributes(neuron_roi_data["roi"])["is_layer"]
+            layer_rois = neuron_roi_data[layer_mask.to_numpy()]
 
             # Return True if we have any synapses in layer regions
             if not layer_rois.empty:
@@ -1884,17 +2039,19 @@ class NeuPrintConnector:
 
             results = {}
             for neuron_type in neuron_types:
-                raw_neurons_df, raw_roi_df = batch_raw_data.get(
-                    neuron_type, (pd.DataFrame(), pd.DataFrame())
-                )
-
-                # Filter by soma side using adapter
-                if not raw_neurons_df.empty:
-                    neurons_df = self.dataset_adapter.filter_by_soma_side(
-                        raw_neurons_df, soma_side
-                    )
+                cached_data = self._data_cache.get(_RAW_DATA_PREFIX + neuron_type)
+                if cached_data is not None:
+                    partition = cached_data["partition"]
+                    statistics = self._get_soma_side_statistics(neuron_type)
                 else:
-                    neurons_df = pd.DataFrame()
+                    partition = SomaSidePartition(
+                        *batch_raw_data.get(
+                            neuron_type, (pd.DataFrame(), pd.DataFrame())
+                        )
+                    )
+                    statistics = None
+                side = self.dataset_adapter.resolve_soma_side(soma_side)
+                neurons_df = partition.neurons(side)
 
                 if neurons_df.empty:
                     results[neuron_type] = {
@@ -1922,23 +2079,13 @@ class NeuPrintConnector:
                     }
                     continue
 
-                # Filter ROI data to match the filtered neurons
-                if not raw_roi_df.empty and not neurons_df.empty:
-                    body_ids = (
-                        neurons_df["bodyId"].tolist()
-                        if "bodyId" in neurons_df.columns
-                        else []
-                    )
-                    roi_df = (
-                        raw_roi_df[raw_roi_df["bodyId"].isin(body_ids)]
-                        if body_ids
-                        else pd.DataFrame()
-                    )
-                else:
-                    roi_df = pd.DataFrame()
+                # ROI data of the filtered neurons
+                roi_df = partition.roi_counts(side)
 
                 # Calculate summary statistics
-                summary = self._calculate_summary(neurons_df, neuron_type, soma_side)
+                summary = self._calculate_summary(
+                    neurons_df, neuron_type, soma_side, statistics, side
+                )
 
                 # Get connectivity data with caching
                 body_ids = (
@@ -1953,6 +2100,7 @@ class NeuPrintConnector:
                 results[neuron_type] = {
                     "neurons": neurons_df,
                     "roi_counts": roi_df,
+                    "roi_counts_matched": True,
                     "summary": summary,
                     "connectivity": connectivity,
                     "type": neuron_type,
@@ -1981,8 +2129,8 @@ class NeuPrintConnector:
 
         # Check cache for each type
         for neuron_type in neuron_types:
-            if neuron_type in self._raw_neuron_data_cache:
-                cached_data = self._raw_neuron_data_cache[neuron_type]
+            cached_data = self._data_cache.get(_RAW_DATA_PREFIX + neuron_type)
+            if cached_data is not None:
                 results[neuron_type] = (
                     cached_data["neurons_df"],
                     cached_data["roi_df"],
@@ -1999,19 +2147,13 @@ class NeuPrintConnector:
 
             # Cache and add to results
             for neuron_type, (neurons_df, roi_df) in batch_data.items():
-                # Use dataset adapter to process the raw data
-                if not neurons_df.empty:
-                    neurons_df = self.dataset_adapter.normalize_columns(neurons_df)
-                    neurons_df = self.dataset_adapter.extract_soma_side(neurons_df)
-
-                # Cache the raw data
-                self._raw_neuron_data_cache[neuron_type] = {
-                    "neurons_df": neurons_df,
-                    "roi_df": roi_df,
-                    "fetched_at": time.time(),
-                }
-
-                results[neuron_type] = (neurons_df, roi_df)
+                cached_data = self._cache_raw_neuron_data(
+                    neuron_type, neurons_df, roi_df
+                )
+                results[neuron_type] = (
+                    cached_data["neurons_df"],
+                    cached_data["roi_df"],
+                )
 
         return results
 
@@ -2108,48 +2250,13 @@ class NeuPrintConnector:
 
                 # Parse roiInfo JSON into individual ROI records
                 if not roi_info_df.empty:
-                    roi_records = []
-                    for _, row in roi_info_df.iterrows():
-                        body_id = row["bodyId"]
-                        roi_info = row["roiInfo"]
-
-                        # Parse JSON string if needed
-                        if isinstance(roi_info, str):
-                            try:
-                                roi_info = json.loads(roi_info)
-                            except (json.JSONDecodeError, TypeError):
-                                logger.warning(
-                                    f"Failed to parse roiInfo JSON for bodyId {body_id}"
-                                )
-                                continue
-
-                        if roi_info and isinstance(roi_info, dict):
-                            for roi_name, roi_data in roi_info.items():
-                                if isinstance(roi_data, dict):
-                                    roi_records.append(
-                                        {
-                                            "bodyId": body_id,
-                                            "roi": roi_name,
-                                            "pre": roi_data.get("pre", 0),
-                                            "post": roi_data.get("post", 0),
-                                            "downstream": roi_data.get("downstream", 0),
-                                            "upstream": roi_data.get("upstream", 0),
-                                        }
-                                    )
-
-                    if roi_records:
-                        roi_df = pd.DataFrame(roi_records)
-                        logger.debug(
-                            f"Parsed {len(roi_records)} ROI records from roiInfo"
-                        )
-                        # Sort by total synapses (pre + post) descending
-                        roi_df["total_synapses"] = roi_df["pre"] + roi_df["post"]
-                        roi_df = roi_df.sort_values(
-                            ["bodyId", "total_synapses"], ascending=[True, False]
-                        )
-                        roi_df = roi_df.drop("total_synapses", axis=1)
-                    else:
+                    roi_df = self._expand_roi_info(
+                        roi_info_df["bodyId"], roi_info_df["roiInfo"]
+                    )
+                    if roi_df.empty:
                         logger.debug("No ROI records parsed from roiInfo")
+                    else:
+                        logger.debug(f"Parsed {len(roi_df)} ROI records from roiInfo")
 
         # Group results by neuron type
         results = {}
@@ -2172,3 +2279,82 @@ class NeuPrintConnector:
             results[neuron_type] = (type_neurons, type_roi)
 
         return results
+
+    def _expand_roi_info(self, body_ids, roi_infos) -> pd.DataFrame:
+        """
+        Expand roiInfo JSON documents into one row per (body, ROI) pair.
+
+        All JSON strings are decoded with a single parser call and flattened
+        straight into column arrays, avoiding one intermediate dict per row.
+
+        Args:
+            body_ids: Sequence of body IDs
+            roi_infos: Matching roiInfo values (JSON strings or already-decoded dicts)
+
+        Returns:
+            DataFrame with columns bodyId, roi, pre, post, downstream, upstream,
+            sorted by bodyId and then by total synapses (pre + post) descending
+        """
+        body_ids = list(body_ids)
+        roi_infos = list(roi_infos)
+
+        string_positions = [i for i, v in enumerate(roi_infos) if isinstance(v, str)]
+        if string_positions:
+            try:
+                decoded = json.loads(
+                    "[" + ",".join(roi_infos[i] for i in string_positions) + "]"
+                )
+            except (json.JSONDecodeError, TypeError):
+                decoded = None
+            # A document holding several comma-separated values still joins
+            # into valid JSON, but shifts the documents after it to other bodies
+            if decoded is None or len(decoded) != len(string_positions):
+                # Fall back to per-document parsing to isolate invalid entries
+                decoded = []
+                for i in string_positions:
+                    try:
+                        decoded.append(json.loads(roi_infos[i]))
+                    except (json.JSONDecodeError, TypeError):
+                        logger.warning(
+                            f"Failed to parse roiInfo JSON for bodyId {body_ids[i]}"
+                        )
+                        decoded.append(None)
+            for i, value in zip(string_positions, decoded):
+                roi_infos[i] = value
+
+        # Flatten into column arrays: one list of ROI names and one of count dicts
+        roi_names = []
+        roi_data = []
+        counts = []
+        for roi_info in roi_infos:
+            if not isinstance(roi_info, dict):
+                counts.append(0)
+                continue
+            values = roi_info.values()
+            if all(isinstance(data, dict) for data in values):
+                roi_names.extend(roi_info.keys())
+                roi_data.extend(values)
+                counts.append(len(roi_info))
+            else:
+                entries = [(n, d) for n, d in roi_info.items() if isinstance(d, dict)]
+                roi_names.extend(name for name, _ in entries)
+                roi_data.extend(data for _, data in entries)
+                counts.append(len(entries))
+
+        if not roi_names:
+            return pd.DataFrame()
+
+        columns = {
+            "bodyId": np.repeat(np.asarray(body_ids), counts),
+            "roi": roi_names,
+        }
+        for field in ("pre", "post", "downstream", "upstream"):
+            columns[field] = np.fromiter(
+                (data.get(field) or 0 for data in roi_data),
+                dtype=np.int64,
+                count=len(roi_data),
+            )
+
+        order = np.lexsort((-(columns["pre"] + columns["post"]), columns["bodyId"]))
+        roi_df = pd.DataFrame(columns)
+        return roi_df.iloc[order].reset_index(drop=True)
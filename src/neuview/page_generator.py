@@ -12,6 +12,7 @@ import logging
 from typing import Dict, Any, Optional, List
 
 from .config import Config
+from .roi_attributes import LAYER_ROI_PATTERN
 from .visualization.data_transfer_objects import (
     create_grid_generation_request,
     SomaSide,
@@ -538,14 +539,27 @@ class PageGenerator:
         """
         return self.orchestrator.generate_page(request)
 
-    def _aggregate_roi_data(self, roi_counts_df, neurons_df, soma_side, connector=None):
+    def _aggregate_roi_data(
+        self,
+        roi_counts_df,
+        neurons_df,
+        soma_side,
+        connector=None,
+        roi_counts_matched: bool = False,
+    ):
         """Aggregate ROI data across neurons matching the specific soma side to get total pre/post synapses per ROI (primary ROIs only)."""
         return self.data_processing_service.aggregate_roi_data(
-            roi_counts_df, neurons_df, soma_side, connector
+            roi_counts_df, neurons_df, soma_side, connector, roi_counts_matched
         )
 
     def _analyze_layer_roi_data(
-        self, roi_counts_df, neurons_df, soma_side, neuron_type, connector
+        self,
+        roi_counts_df,
+        neurons_df,
+        soma_side,
+        neuron_type,
+        connector,
+        roi_counts_matched: bool = False,
     ):
         """
         Analyze ROI data for layer-based regions matching pattern (ME|LO|LOP)_[LR]_layer_<number>.
@@ -558,10 +572,17 @@ class PageGenerator:
             soma_side: Side of soma (left/right)
             neuron_type: Name of the neuron type
             connector: Database connector for additional queries
+            roi_counts_matched: Whether roi_counts_df holds exactly the ROI
+                rows of neurons_df
         """
         # Delegate to the layer analysis service
         return self.layer_analysis_service.analyze_layer_roi_data(
-            roi_counts_df, neurons_df, soma_side, neuron_type, connector
+            roi_counts_df,
+            neurons_df,
+            soma_side,
+            neuron_type,
+            connector,
+            roi_counts_matched,
         )
 
     def _get_all_dataset_layers(self, layer_pattern, connector):
@@ -575,6 +596,11 @@ class PageGenerator:
         Returns:
             List of tuples: (region, side, layer_num) for all layers in dataset
         """
+        # The standard layer pattern is a dataset constant shared with the
+        # layer analysis
+        if layer_pattern == LAYER_ROI_PATTERN.pattern:
+            dataset_layers_service = self.layer_analysis_service.dataset_layers_service
+            return dataset_layers_service.get_dataset_layers(connector)
         return self.roi_analysis_service.get_all_dataset_layers(
             layer_pattern, connector
         )
@@ -639,6 +665,7 @@ class PageGenerator:
         save_to_files: bool = True,
         hex_size: int = 6,
         spacing_factor: float = 1.1,
+        roi_counts_matched: bool = False,
     ):
         """
         Analyze ROI data for column-based regions matching pattern (ME|LO|LOP)_[RL]_col_hex1_hex2.
@@ -657,6 +684,8 @@ class PageGenerator:
             save_to_files: If True, save files to disk; if False, embed content
             hex_size: Size of hexagons in visualization
             spacing_factor: Spacing factor between hexagons
+            roi_counts_matched: Whether roi_counts_df holds exactly the ROI
+                rows of neurons_df
         """
         # Delegate to the column analysis service
         return self.column_analysis_service.analyze_column_roi_data(
@@ -669,6 +698,7 @@ class PageGenerator:
             save_to_files,
             hex_size,
             spacing_factor,
+            roi_counts_matched,
         )
 
     def _get_col_layer_values(self, neuron_type: str, connector):
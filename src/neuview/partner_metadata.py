@@ -0,0 +1,141 @@
+"""
+Body-level metadata of connectivity partners.
+
+The connectivity tables of a neuron type show the type, soma side and
+neurotransmitter of every partner body. The same partner bodies connect to
+many types, so fetching these attributes with every connection re-reads them
+for each type they connect to. PartnerMetadataTable keeps the attributes per
+body ID: connections are fetched as (partner bodyId, weight) pairs and joined
+with the table locally, and only bodies not yet in the table are fetched.
+"""
+
+import threading
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Columns of per-connection partner records
+PARTNER_RECORD_COLUMNS = [
+    "partner_type",
+    "soma_side",
+    "neurotransmitter",
+    "weight",
+    "partner_bodyId",
+]
+
+# Columns of the partner metadata table
+PARTNER_METADATA_COLUMNS = ["bodyId", "type", "soma_side", "neurotransmitter"]
+
+
+class PartnerMetadataTable:
+    """
+    Type, soma side and neurotransmitter of partner bodies by body ID.
+
+    The table may be read and extended from concurrent threads.
+    """
+
+    def __init__(self, metadata: Optional[pd.DataFrame] = None):
+        """
+        Initialize the table.
+
+        Args:
+            metadata: Frame with the PARTNER_METADATA_COLUMNS, if any
+        """
+        self._lookup = pd.DataFrame(columns=PARTNER_METADATA_COLUMNS).set_index(
+            "bodyId"
+        )
+        # Rows added since the last read, merged into the lookup at once
+        self._pending: List[pd.DataFrame] = []
+        self._pending_ids = set()
+        self._lock = threading.Lock()
+        if metadata is not None:
+            self.add(metadata)
+
+    def __len__(self) -> int:
+        return len(self._consolidated())
+
+    def _consolidated(self) -> pd.DataFrame:
+        """Get the lookup after merging the rows added since the last read."""
+        with self._lock:
+            if self._pending:
+                frames = (
+                    [self._lookup, *self._pending]
+                    if len(self._lookup)
+                    else self._pending
+                )
+                lookup = pd.concat(frames) if len(frames) > 1 else frames[0]
+                self._lookup = lookup[~lookup.index.duplicated(keep="last")]
+                self._pending = []
+                self._pending_ids = set()
+            return self._lookup
+
+    def missing(self, body_ids: Iterable[int]) -> List[int]:
+        """
+        Get the body IDs without metadata in the table.
+
+        Args:
+            body_ids: Body IDs to look up, possibly repeated
+
+        Returns:
+            Sorted unique body IDs not in the table
+        """
+        ids = np.unique(np.asarray(list(body_ids), dtype=np.int64))
+        return ids[self._consolidated().index.get_indexer(ids) < 0].tolist()
+
+    def add(self, metadata: pd.DataFrame) -> int:
+        """
+        Add partner metadata, replacing earlier rows of the same bodies.
+
+        The rows are merged into the lookup on the next read, so adding many
+        pages of metadata copies the table only once.
+
+        Args:
+            metadata: Frame with the PARTNER_METADATA_COLUMNS
+
+        Returns:
+            Number of bodies new to the table
+        """
+        if metadata is None or metadata.empty:
+            return 0
+        rows = metadata[PARTNER_METADATA_COLUMNS].set_index("bodyId")
+        rows.index = rows.index.astype(np.int64)
+        ids = rows.index.unique()
+        with self._lock:
+            new_ids = {
+                body_id
+                for body_id in ids[self._lookup.index.get_indexer(ids) < 0].tolist()
+                if body_id not in self._pending_ids
+            }
+            self._pending.append(rows)
+            self._pending_ids.update(new_ids)
+        return len(new_ids)
+
+    def records(self, partner_ids, weights) -> pd.DataFrame:
+        """
+        Join connections with the metadata of their partner bodies.
+
+        Args:
+            partner_ids: Partner body ID of each connection
+            weights: Weight of each connection
+
+        Returns:
+            One row per connection with the PARTNER_RECORD_COLUMNS, in the
+            order of the connections
+        """
+        partner_ids = np.asarray(partner_ids, dtype=np.int64)
+        attributes = self._consolidated().reindex(partner_ids)
+        return pd.DataFrame(
+            {
+                "partner_type": attributes["type"].to_numpy(),
+                "soma_side": attributes["soma_side"].to_numpy(),
+                "neurotransmitter": attributes["neurotransmitter"].to_numpy(),
+                "weight": np.asarray(weights),
+                "partner_bodyId": partner_ids,
+            },
+            columns=PARTNER_RECORD_COLUMNS,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the table as a frame with the PARTNER_METADATA_COLUMNS."""
+        return self._consolidated().reset_index()[PARTNER_METADATA_COLUMNS]
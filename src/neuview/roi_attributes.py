@@ -0,0 +1,160 @@
+"""
+Interned ROI names and precomputed ROI attributes.
+
+ROI count tables repeat the same few hundred ROI names over many thousands of
+(body, ROI) rows. Storing the ``roi`` column as a pandas categorical interns
+those names, and the attributes analyses need (column/layer pattern matches,
+region, side, hex coordinates, layer number) are parsed once per distinct
+name and cached for the whole process. Analyses then select rows through
+boolean attribute columns instead of running a regex over every row.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+COLUMN_ROI_PATTERN = re.compile(
+    r"^(ME|LO|LOP)_([RL])_col_([A-Za-z0-9]+)_([A-Za-z0-9]+)$"
+)
+LAYER_ROI_PATTERN = re.compile(r"^(ME|LO|LOP)_([LR])_layer_(\d+)$")
+
+ROI_ATTRIBUTE_COLUMNS = [
+    "is_column",
+    "is_layer",
+    "region",
+    "side",
+    "hex1",
+    "hex2",
+    "layer",
+    "is_primary",
+]
+
+
+def _parse_coordinate(value: str) -> Optional[int]:
+    """Parse a column coordinate as decimal, falling back to hexadecimal."""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(value, 16)
+        except ValueError:
+            return None
+
+
+@lru_cache(maxsize=None)
+def parse_roi_name(roi_name: str) -> Tuple:
+    """
+    Parse the structural attributes encoded in an ROI name.
+
+    Args:
+        roi_name: ROI name such as 'ME_R_col_12_07' or 'LO_L_layer_3'
+
+    Returns:
+        Tuple of (is_column, is_layer, region, side, hex1, hex2, layer).
+        Column ROIs whose coordinates cannot be parsed are not columns.
+    """
+    match = COLUMN_ROI_PATTERN.match(roi_name)
+    if match:
+        region, side, coord1, coord2 = match.groups()
+        hex1 = _parse_coordinate(coord1)
+        hex2 = _parse_coordinate(coord2)
+        if hex1 is not None and hex2 is not None:
+            return True, False, region, side, hex1, hex2, None
+        return False, False, None, None, None, None, None
+
+    match = LAYER_ROI_PATTERN.match(roi_name)
+    if match:
+        region, side, layer_num = match.groups()
+        return False, True, region, side, None, None, int(layer_num)
+
+    return False, False, None, None, None, None, None
+
+
+def intern_roi_names(roi_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store the ROI name column of an ROI count table as a categorical.
+
+    Args:
+        roi_df: Long-format ROI count table with a 'roi' column
+
+    Returns:
+        Table with an interned 'roi' column
+    """
+    if (
+        roi_df is None
+        or roi_df.empty
+        or "roi" not in roi_df.columns
+        or isinstance(roi_df["roi"].dtype, pd.CategoricalDtype)
+    ):
+        return roi_df
+    return roi_df.assign(roi=roi_df["roi"].astype("category"))
+
+
+def roi_attribute_table(
+    roi_names: Iterable[str], primary_rois: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """
+    Build the ROI attribute side table for a set of distinct ROI names.
+
+    Args:
+        roi_names: Distinct ROI names
+        primary_rois: Primary ROIs of the dataset, used for 'is_primary'
+
+    Returns:
+        DataFrame indexed by ROI name with ROI_ATTRIBUTE_COLUMNS
+    """
+    names = [str(name) for name in roi_names]
+    parsed = [parse_roi_name(name) for name in names]
+    table = pd.DataFrame(
+        parsed,
+        index=pd.Index(names, name="roi"),
+        columns=ROI_ATTRIBUTE_COLUMNS[:-1],
+    )
+    table["is_column"] = table["is_column"].astype(bool)
+    table["is_layer"] = table["is_layer"].astype(bool)
+    for column in ("hex1", "hex2", "layer"):
+        table[column] = table[column].astype("Int64")
+    primary = set(primary_rois) if primary_rois is not None else set()
+    table["is_primary"] = np.fromiter(
+        (name in primary for name in names), dtype=bool, count=len(names)
+    )
+    return table
+
+
+def roi_attributes(
+    roi_series: pd.Series, primary_rois: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
+    """
+    Look up ROI attributes for every row of an ROI name column.
+
+    The attribute table is built from the distinct names only and broadcast
+    to the rows through the categorical codes.
+
+    Args:
+        roi_series: ROI name column (categorical or plain strings)
+        primary_rois: Primary ROIs of the dataset, used for 'is_primary'
+
+    Returns:
+        DataFrame aligned with roi_series.index with ROI_ATTRIBUTE_COLUMNS
+    """
+    if isinstance(roi_series.dtype, pd.CategoricalDtype):
+        categorical = roi_series
+    else:
+        categorical = roi_series.astype("category")
+
+    table = roi_attribute_table(categorical.cat.categories, primary_rois)
+
+    # Missing ROI names have code -1; map them to an all-empty trailing row
+    missing_row = pd.DataFrame(
+        [[False, False, None, None, pd.NA, pd.NA, pd.NA, False]],
+        columns=ROI_ATTRIBUTE_COLUMNS,
+    ).astype(table.dtypes.to_dict())
+    table = pd.concat([table.reset_index(drop=True), missing_row], ignore_index=True)
+
+    codes = categorical.cat.codes.to_numpy()
+    attributes = table.iloc[codes]
+    attributes.index = roi_series.index
+    return attributes
@@ -0,0 +1,223 @@
+"""
+Flattened index of the ROI hierarchy.
+
+The ROI hierarchy is a nested dictionary of ROI names. Looking up the parent
+of an ROI, or collecting the layer ROIs of a dataset, used to walk the whole
+tree for every lookup. ``RoiHierarchyIndex`` walks it once and keeps the
+results as flat tables: parent pointers and top-level ancestors by cleaned
+ROI name, the cleaned name of every hierarchy key and the column and layer
+ROIs. The index is stored with the hierarchy in the cache, and
+``get_roi_hierarchy_index`` shares one index per hierarchy in the process.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from .roi_attributes import parse_roi_name
+
+INDEX_FORMAT_VERSION = 1
+
+_SHARED_INDEX_LIMIT = 8
+_shared_indexes: Dict[int, Tuple[dict, "RoiHierarchyIndex"]] = {}
+_shared_indexes_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def clean_roi_name(roi_name: str) -> str:
+    """Remove (R), (L), _R, _L suffixes from ROI names to merge left/right regions."""
+    # Remove (R), (L), or (M) suffixes from ROI names (parenthetical format)
+    cleaned = re.sub(r"\s*\([RLM]\)$", "", roi_name)
+
+    # Also remove _R, _L, or _M suffixes from ROI names (underscore format)
+    # This handles FAFB patterns like OL_R and OL_L, treating them both as "OL"
+    cleaned = re.sub(r"_[RLM]$", "", cleaned)
+
+    return cleaned.strip()
+
+
+class RoiHierarchyIndex:
+    """Flat lookup tables built from one ROI hierarchy."""
+
+    def __init__(
+        self,
+        parents: Dict[str, str],
+        top_level: Dict[str, str],
+        clean_names: Dict[str, str],
+        rois: List[str],
+        column_rois: List[str],
+        layer_rois: List[str],
+    ):
+        """
+        Initialize the index from its tables.
+
+        Args:
+            parents: Cleaned ROI name to the cleaned name of its parent
+            top_level: Cleaned ROI name to its cleaned top-level ancestor
+            clean_names: ROI name (without the primary "*" marker) to its
+                cleaned name
+            rois: All ROI names in hierarchy order
+            column_rois: ROI names matching the column pattern
+            layer_rois: ROI names matching the layer pattern
+        """
+        self.parents = parents
+        self.top_level = top_level
+        self.clean_names = clean_names
+        self.rois = rois
+        self.column_rois = column_rois
+        self.layer_rois = layer_rois
+
+    @classmethod
+    def from_hierarchy(cls, hierarchy: Optional[dict]) -> "RoiHierarchyIndex":
+        """
+        Build the index with a single walk over the hierarchy.
+
+        When an ROI occurs more than once, the first occurrence in
+        depth-first order determines its parent.
+
+        Args:
+            hierarchy: Nested ROI hierarchy dictionary
+
+        Returns:
+            Index of the hierarchy
+        """
+        parents: Dict[str, str] = {}
+        top_level: Dict[str, str] = {}
+        clean_names: Dict[str, str] = {}
+        rois: List[str] = []
+
+        # Iterative pre-order walk: (subtree, cleaned parent, cleaned top-level)
+        stack = [(iter((hierarchy or {}).items()), "", "")]
+        while stack:
+            items, parent, top = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                continue
+            key, value = entry
+            roi = key.rstrip("*")
+            cleaned = clean_names.setdefault(roi, clean_roi_name(roi))
+            rois.append(roi)
+            parents.setdefault(cleaned, parent)
+            top_level.setdefault(cleaned, top or cleaned)
+            if isinstance(value, dict) and value:
+                stack.append((iter(value.items()), cleaned, top or cleaned))
+
+        column_rois = []
+        layer_rois = []
+        for roi in rois:
+            is_column, is_layer = parse_roi_name(roi)[:2]
+            if is_column:
+                column_rois.append(roi)
+            elif is_layer:
+                layer_rois.append(roi)
+
+        return cls(parents, top_level, clean_names, rois, column_rois, layer_rois)
+
+    def clean_name(self, roi_name: str) -> str:
+        """Get the cleaned name of an ROI."""
+        cleaned = self.clean_names.get(roi_name)
+        return cleaned if cleaned is not None else clean_roi_name(roi_name)
+
+    def parent(self, cleaned_roi: str) -> str:
+        """
+        Get the parent of an ROI.
+
+        Args:
+            cleaned_roi: ROI name cleaned with clean_roi_name()
+
+        Returns:
+            Cleaned parent ROI name, or "" for top-level and unknown ROIs
+        """
+        return self.parents.get(cleaned_roi, "")
+
+    def top_level_roi(self, cleaned_roi: str) -> str:
+        """
+        Get the top-level ancestor of an ROI.
+
+        Args:
+            cleaned_roi: ROI name cleaned with clean_roi_name()
+
+        Returns:
+            Cleaned top-level ROI name, or "" for unknown ROIs
+        """
+        return self.top_level.get(cleaned_roi, "")
+
+    def dataset_layers(self) -> List[Tuple[str, str, int]]:
+        """Get the sorted (region, side, layer) tuples of all layer ROIs."""
+        layers = set()
+        for roi in self.layer_rois:
+            _, _, region, side, _, _, layer_num = parse_roi_name(roi)
+            layers.add((region, side, layer_num))
+        return sorted(layers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index for the ROI hierarchy cache."""
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "parents": self.parents,
+            "top_level": self.top_level,
+            "clean_names": self.clean_names,
+            "rois": self.rois,
+            "column_rois": self.column_rois,
+            "layer_rois": self.layer_rois,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["RoiHierarchyIndex"]:
+        """
+        Restore a serialized index.
+
+        Returns:
+            The index, or None if the data is missing or of another version
+        """
+        if not data or data.get("version") != INDEX_FORMAT_VERSION:
+            return None
+        try:
+            return cls(
+                data["parents"],
+                data["top_level"],
+                data["clean_names"],
+                data["rois"],
+                data["column_rois"],
+                data["layer_rois"],
+            )
+        except KeyError:
+            return None
+
+
+def get_roi_hierarchy_index(hierarchy: Optional[dict]) -> RoiHierarchyIndex:
+    """
+    Get the shared index of a hierarchy, building it on first use.
+
+    Indexes are shared by hierarchy object, so all services using the
+    connector's cached hierarchy use one index.
+
+    Args:
+        hierarchy: Nested ROI hierarchy dictionary
+
+    Returns:
+        Index of the hierarchy
+    """
+    key = id(hierarchy)
+    with _shared_indexes_lock:
+        shared = _shared_indexes.get(key)
+        # The entry keeps the hierarchy alive, so its id cannot be reused
+        if shared is not None and shared[0] is hierarchy:
+            return shared[1]
+
+    index = RoiHierarchyIndex.from_hierarchy(hierarchy)
+    with _shared_indexes_lock:
+        if len(_shared_indexes) >= _SHARED_INDEX_LIMIT:
+            _shared_indexes.pop(next(iter(_shared_indexes)))
+        _shared_indexes[key] = (hierarchy, index)
+    return index
+
+
+def share_roi_hierarchy_index(hierarchy: dict, index: RoiHierarchyIndex) -> None:
+    """Register a prebuilt index, e.g. one loaded from the cache, for a hierarchy."""
+    with _shared_indexes_lock:
+        if len(_shared_indexes) >= _SHARED_INDEX_LIMIT:
+            _shared_indexes.pop(next(iter(_shared_indexes)))
+        _shared_indexes[id(hierarchy)] = (hierarchy, index)
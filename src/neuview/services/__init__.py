@@ -29,10 +29,15 @@ from .index_generator_service import IndexGeneratorService
 from .neuron_discovery_service import NeuronDiscoveryService
 from .neuron_statistics_service import NeuronStatisticsService
 from .layer_analysis_service import LayerAnalysisService
+from .dataset_layers_service import DatasetLayersService
 from .column_analysis_service import ColumnAnalysisService
 from .url_generation_service import URLGenerationService
 from .neuroglancer_js_service import NeuroglancerJSService
 from .resource_manager_service import ResourceManagerService
+from .output_manifest_service import OutputManifestService
+from .output_writer_service import OutputWriterService
+from .static_bundle_service import StaticBundleService
+from .table_data_service import TableDataService
 from .template_context_service import TemplateContextService
 from .data_processing_service import DataProcessingService
 from .database_query_service import DatabaseQueryService
@@ -45,6 +50,8 @@ from .soma_detection_service import SomaDetectionService
 from .queue_file_manager import QueueFileManager
 from .queue_processor import QueueProcessor
 from .connection_test_service import ConnectionTestService
+from .prefetch_service import PrefetchService
+from .connectome_index_service import ConnectomeIndexService
 from .service_container import ServiceContainer
 
 # Import newly extracted services from page_generator refactoring
@@ -78,6 +85,7 @@ from ..strategies.template import JinjaTemplateStrategy, StaticTemplateStrategy
 from ..strategies.resource import UnifiedResourceStrategy, CompositeResourceStrategy
 from ..strategies.cache import (
     MemoryCacheStrategy,
+    BoundedMemoryCacheStrategy,
     FileCacheStrategy,
     CompositeCacheStrategy,
 )
@@ -93,10 +101,15 @@ __all__ = [
     "NeuronDiscoveryService",
     "NeuronStatisticsService",
     "LayerAnalysisService",
+    "DatasetLayersService",
     "ColumnAnalysisService",
     "URLGenerationService",
     "NeuroglancerJSService",
     "ResourceManagerService",
+    "OutputManifestService",
+    "OutputWriterService",
+    "StaticBundleService",
+    "TableDataService",
     "TemplateContextService",
     "DataProcessingService",
     "DatabaseQueryService",
@@ -107,6 +120,8 @@ __all__ = [
     "QueueFileManager",
     "QueueProcessor",
     "ConnectionTestService",
+    "PrefetchService",
+    "ConnectomeIndexService",
     "ServiceContainer",
     # Newly extracted services from page_generator refactoring
     "FileService",
@@ -140,6 +155,7 @@ __all__ = [
     "UnifiedResourceStrategy",
     "CompositeResourceStrategy",
     "MemoryCacheStrategy",
+    "BoundedMemoryCacheStrategy",
     "FileCacheStrategy",
     "CompositeCacheStrategy",
 ]
@@ -11,17 +11,11 @@ import time
 import logging
 from pathlib import Path
 from typing import Optional, Tuple, Dict
-import pandas as pd
-
-from ..models import (
-    NeuronCollection,
-    NeuronTypeName,
-    Neuron,
-    BodyId,
-    SynapseCount,
-    SomaSide,
-)
+
 from ..commands import GeneratePageCommand
+from ..roi_attributes import roi_attributes
+from ..roi_hierarchy_index import clean_roi_name, get_roi_hierarchy_index
+from .output_writer_service import atomic_write
 
 logger = logging.getLogger(__name__)
 
@@ -86,49 +80,6 @@ class CacheService:
             connectivity_data = neuron_data.get("connectivity", {})
             summary_data = neuron_data.get("summary", {})
 
-            # Convert DataFrame to NeuronCollection for enhanced cache processing
-            neuron_collection = NeuronCollection(
-                type_name=NeuronTypeName(neuron_type_name)
-            )
-
-            if neurons_df is not None and not neurons_df.empty:
-                for _, row in neurons_df.iterrows():
-                    # Extract soma side
-                    soma_side = None
-                    if "somaSide" in row and pd.notna(row["somaSide"]):
-                        soma_side_val = row["somaSide"]
-                        if soma_side_val == "L":
-                            soma_side = SomaSide.LEFT
-                        elif soma_side_val == "R":
-                            soma_side = SomaSide.RIGHT
-                        elif soma_side_val == "M":
-                            soma_side = SomaSide.MIDDLE
-
-                    # Create Neuron object
-                    neuron = Neuron(
-                        body_id=BodyId(int(row["bodyId"])),
-                        type_name=NeuronTypeName(neuron_type_name),
-                        instance=row.get("instance"),
-                        status=row.get("status"),
-                        soma_side=soma_side,
-                        soma_x=row.get("somaLocation", {}).get("x")
-                        if isinstance(row.get("somaLocation"), dict)
-                        else None,
-                        soma_y=row.get("somaLocation", {}).get("y")
-                        if isinstance(row.get("somaLocation"), dict)
-                        else None,
-                        soma_z=row.get("somaLocation", {}).get("z")
-                        if isinstance(row.get("somaLocation"), dict)
-                        else None,
-                        synapse_count=SynapseCount(
-                            pre=int(row.get("pre", 0)), post=int(row.get("post", 0))
-                        ),
-                        cell_class=row.get("cellClass"),
-                        cell_subclass=row.get("cellSubclass"),
-                        cell_superclass=row.get("cellSuperclass"),
-                    )
-                    neuron_collection.add_neuron(neuron)
-
             # Extract ROI summary and parent ROIs from neuron data
             roi_summary = []
             parent_rois = []
@@ -166,7 +117,13 @@ class CacheService:
                         parent_rois = []
                     else:
                         roi_summary_full = self.page_generator._aggregate_roi_data(
-                            roi_counts_df, neurons_df, "combined", active_connector
+                            roi_counts_df,
+                            neurons_df,
+                            "combined",
+                            active_connector,
+                            roi_counts_matched=neuron_data.get(
+                                "roi_counts_matched", False
+                            ),
                         )
 
                         # Filter ROIs by threshold and clean names (same logic as IndexService)
@@ -230,11 +187,17 @@ class CacheService:
 
                         # Calculate spatial metrics for columns if column ROIs are present
                         # Currently these are calculated from both L and R instances
+                        roi_attrs = roi_attributes(roi_counts_df["roi"])
+                        is_column = roi_attrs["is_column"].to_numpy()
+                        column_rows = roi_counts_df[is_column]
+                        column_attrs = roi_attrs[is_column]
                         for side in ["L", "R"]:
                             for region in ["ME", "LO", "LOP"]:
-                                str_pattern = f"{region}_{side}_col_"
-                                col_df = roi_counts_df[
-                                    roi_counts_df["roi"].str.contains(str_pattern)
+                                col_df = column_rows[
+                                    (
+                                        (column_attrs["side"] == side)
+                                        & (column_attrs["region"] == region)
+                                    ).to_numpy()
                                 ]
                                 # Total number of columns innervated by cells from this cell type
                                 spatial_metrics[side][region]["cols_innervated"] = (
@@ -243,7 +206,9 @@ class CacheService:
                                 if not col_df.empty:
                                     # coverage factor - number of cells per column
                                     spatial_metrics[side][region]["coverage"] = (
-                                        col_df.groupby("roi")["bodyId"].nunique().mean()
+                                        col_df.groupby("roi", observed=True)["bodyId"]
+                                        .nunique()
+                                        .mean()
                                     )
                                     # cell size - number of columns per cell
                                     spatial_metrics[side][region]["cell_size"] = (
@@ -383,19 +348,22 @@ class CacheService:
 
     def _clean_roi_name(self, roi_name: str) -> str:
         """Remove (R), (L), _R, _L suffixes from ROI names to merge left/right regions."""
-        import re
+        return clean_roi_name(roi_name)
 
-        # Remove (R), (L), or (M) suffixes from ROI names (parenthetical format)
-        cleaned = re.sub(r"\s*\([RLM]\)$", "", roi_name)
+    def _get_roi_hierarchy_parent(self, roi_name: str, connector=None) -> str:
+        """
+        Get the parent ROI of the given ROI from the hierarchy.
 
-        # Also remove _R, _L, or _M suffixes from ROI names (underscore format)
-        # This handles FAFB patterns like OL_R and OL_L, treating them both as "OL"
-        cleaned = re.sub(r"_[RLM]$", "", cleaned)
+        Like ROIHierarchyService.get_roi_hierarchy_parent(), this returns the
+        cleaned parent name ("OL" rather than the hierarchy key "OL(R)*").
 
-        return cleaned.strip()
+        Args:
+            roi_name: ROI name, with or without side suffix
+            connector: Optional connector used when no hierarchy is cached
 
-    def _get_roi_hierarchy_parent(self, roi_name: str, connector=None) -> str:
-        """Get the parent ROI of the given ROI from the hierarchy."""
+        Returns:
+            Cleaned parent ROI name, or "" for top-level and unknown ROIs
+        """
         try:
             # Load ROI hierarchy from cache or fetch if needed
             hierarchy_data = None
@@ -409,12 +377,10 @@ class CacheService:
             if not hierarchy_data:
                 return ""
 
-            # Clean the ROI name first (remove (R), (L), (M) suffixes)
-            cleaned_roi = self._clean_roi_name(roi_name)
-
-            # Search recursively for the ROI and its parent
-            parent = self._find_roi_parent_recursive(cleaned_roi, hierarchy_data)
-            return parent if parent else ""
+            # Clean the ROI name first (remove (R), (L), (M) suffixes) and look
+            # up its parent in the flattened hierarchy
+            index = get_roi_hierarchy_index(hierarchy_data)
+            return index.parent(index.clean_name(roi_name))
 
         except Exception as e:
             logger.debug(f"Failed to get parent ROI for {roi_name}: {e}")
@@ -502,8 +468,7 @@ class CacheService:
                 "region_map": serializable_region_map,
             }
 
-            with open(cache_file, "w") as f:
-                json.dump(data, f)
+            atomic_write(cache_file, json.dumps(data))
 
             logger.info(f"Saved {len(all_columns)} columns to persistent cache")
 
@@ -543,38 +508,3 @@ class CacheService:
             logger.debug(f"Failed to get column data from cache for {neuron_type}: {e}")
 
         return None, None
-
-    def _find_roi_parent_recursive(
-        self, roi_name: str, hierarchy: dict, parent_name: str = ""
-    ) -> str:
-        """Recursively search for ROI in hierarchy and return its parent."""
-        for key, value in hierarchy.items():
-            # Direct match
-            if key == roi_name:
-                return parent_name
-
-            # Handle ROI naming variations:
-            # - Remove side suffixes: "AOTU(L)*" -> "AOTU"
-            # - Remove asterisks: "AOTU*" -> "AOTU"
-            cleaned_key = (
-                key.replace("(L)", "")
-                .replace("(R)", "")
-                .replace("(M)", "")
-                .replace("*", "")
-                .strip()
-            )
-            if cleaned_key == roi_name:
-                return parent_name
-
-            # Also check if the ROI name matches the beginning of the key
-            if key.startswith(roi_name) and (
-                len(key) == len(roi_name) or key[len(roi_name)] in "(*"
-            ):
-                return parent_name
-
-            # Recursive search
-            if isinstance(value, dict):
-                result = self._find_roi_parent_recursive(roi_name, value, key)
-                if result:
-                    return result
-        return ""
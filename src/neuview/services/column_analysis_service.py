@@ -8,13 +8,15 @@ column analysis including hexagonal grid generation.
 """
 
 import logging
-import re
 import time
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_scalar
 from typing import Dict, Any, List, Optional
 
+from ..roi_attributes import roi_attributes
+from ..soma_side_partition import roi_rows_for_neurons
+from ..strategies.cache import BoundedMemoryCacheStrategy
 from ..visualization.data_transfer_objects import (
     create_grid_generation_request,
     SomaSide,
@@ -23,6 +25,9 @@ from ..visualization.data_processing.data_adapter import DataAdapter
 
 logger = logging.getLogger(__name__)
 
+# Memory budget of the column analysis results kept between pages
+COLUMN_ANALYSIS_CACHE_MB = 256
+
 
 class ColumnAnalysisService:
     """Service for analyzing column-based ROI data and generating column summaries."""
@@ -34,7 +39,9 @@ class ColumnAnalysisService:
             page_generator: PageGenerator instance for accessing hexagon generator and column methods
         """
         self.page_generator = page_generator
-        self._column_analysis_cache = {}
+        self._column_analysis_cache = BoundedMemoryCacheStrategy(
+            max_memory_mb=COLUMN_ANALYSIS_CACHE_MB
+        )
 
     def analyze_column_roi_data(
         self,
@@ -47,6 +54,7 @@ class ColumnAnalysisService:
         save_to_files: bool = True,
         hex_size: int = 6,
         spacing_factor: float = 1.1,
+        roi_counts_matched: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """
         Analyze ROI data for column-based regions matching pattern (ME|LO|LOP)_[RL]_col_hex1_hex2.
@@ -65,6 +73,8 @@ class ColumnAnalysisService:
             save_to_files: If True, save files to disk; if False, embed content
             hex_size: Size of hexagons in visualization
             spacing_factor: Spacing factor between hexagons
+            roi_counts_matched: Whether roi_counts_df holds exactly the ROI
+                rows of neurons_df, so they need no filtering
 
         Returns:
             Dictionary containing column analysis results or None if no column data
@@ -73,11 +83,12 @@ class ColumnAnalysisService:
 
         # Create cache key for this specific analysis
         cache_key = f"{neuron_type}_{soma_side}_{file_type}_{save_to_files}_{hex_size}_{spacing_factor}"
-        if cache_key in self._column_analysis_cache:
+        cached_result = self._column_analysis_cache.get(cache_key)
+        if cached_result is not None:
             logger.info(
                 f"analyze_column_roi_data: returning cached result for {cache_key} in {time.time() - start_time:.3f}s"
             )
-            return self._column_analysis_cache[cache_key]
+            return cached_result
 
         try:
             # Early exit for empty data
@@ -101,7 +112,7 @@ class ColumnAnalysisService:
 
             # Filter ROI data to include only neurons that belong to this specific soma side
             roi_counts_soma_filtered = self._filter_roi_data_by_soma_side(
-                roi_counts_df, neurons_df
+                roi_counts_df, neurons_df, roi_counts_matched
             )
 
             if roi_counts_soma_filtered.empty:
@@ -110,13 +121,11 @@ class ColumnAnalysisService:
                 )
                 return None
 
-            # Pattern to match column ROIs: (ME|LO|LOP)_[RL]_col_hex1_hex2
-            column_pattern = r"^(ME|LO|LOP)_([RL])_col_([A-Za-z0-9]+)_([A-Za-z0-9]+)$"
-
-            # Filter ROIs that match the column pattern
-            column_rois = roi_counts_soma_filtered[
-                roi_counts_soma_filtered["roi"].str.match(column_pattern, na=False)
-            ].copy()
+            # Filter ROIs that match the column pattern (ME|LO|LOP)_[RL]_col_hex1_hex2,
+            # parsed once per distinct ROI name
+            roi_attrs = roi_attributes(roi_counts_soma_filtered["roi"])
+            column_mask = roi_attrs["is_column"].to_numpy()
+            column_rois = roi_counts_soma_filtered[column_mask]
 
             if column_rois.empty:
                 logger.info(
@@ -125,7 +134,9 @@ class ColumnAnalysisService:
                 return None
 
             # Extract column information
-            roi_info = self._extract_column_information(column_rois, column_pattern)
+            roi_info = self._extract_column_information(
+                column_rois, roi_attrs[column_mask]
+            )
 
             if not roi_info:
                 logger.info(
@@ -215,7 +226,7 @@ class ColumnAnalysisService:
             }
 
             # Cache the result for future use
-            self._column_analysis_cache[cache_key] = result
+            self._column_analysis_cache.put(cache_key, result)
 
             # Also update the neuron type columns cache with full column data for CacheService
             self._update_neuron_type_columns_cache(
@@ -234,63 +245,40 @@ class ColumnAnalysisService:
             return None
 
     def _filter_roi_data_by_soma_side(
-        self, roi_counts_df: pd.DataFrame, neurons_df: pd.DataFrame
+        self,
+        roi_counts_df: pd.DataFrame,
+        neurons_df: pd.DataFrame,
+        matched: bool = False,
     ) -> pd.DataFrame:
         """Filter ROI data to include only neurons from specific soma side."""
-        if "bodyId" in neurons_df.columns and "bodyId" in roi_counts_df.columns:
-            soma_side_body_ids = list(neurons_df["bodyId"].values)
-            return roi_counts_df[roi_counts_df["bodyId"].isin(soma_side_body_ids)]
-        else:
-            return roi_counts_df
+        return roi_rows_for_neurons(roi_counts_df, neurons_df, matched)
 
     def _extract_column_information(
-        self, column_rois: pd.DataFrame, column_pattern: str
+        self, column_rois: pd.DataFrame, column_attrs: pd.DataFrame
     ) -> List[Dict[str, Any]]:
-        """Extract column information from column ROIs."""
-        roi_info = []
-
-        for _, row in column_rois.iterrows():
-            roi_name = str(row["roi"])
-            match = re.match(column_pattern, roi_name)
-            if match:
-                region, side, coord1, coord2 = match.groups()
-
-                # Try to parse coordinates as decimal first, then hex if that fails
-                try:
-                    row_dec = int(coord1)
-                except ValueError:
-                    try:
-                        row_dec = int(coord1, 16)
-                    except ValueError:
-                        continue  # Skip invalid coordinates
-
-                try:
-                    col_dec = int(coord2)
-                except ValueError:
-                    try:
-                        col_dec = int(coord2, 16)
-                    except ValueError:
-                        continue  # Skip invalid coordinates
-
-                pre_val = row.get("pre", 0) if "pre" in row else 0
-                post_val = row.get("post", 0) if "post" in row else 0
-                total_val = row.get("total") if "total" in row else (pre_val + post_val)
-
-                roi_info.append(
-                    {
-                        "roi": roi_name,
-                        "bodyId": row["bodyId"],
-                        "region": region,
-                        "side": side,
-                        "hex1": row_dec,
-                        "hex2": col_dec,
-                        "pre": pre_val,
-                        "post": post_val,
-                        "total": total_val,
-                    }
-                )
-
-        return roi_info
+        """Extract column information from column ROIs and their ROI attributes."""
+        if column_rois.empty:
+            return []
+
+        pre = column_rois["pre"] if "pre" in column_rois.columns else 0
+        post = column_rois["post"] if "post" in column_rois.columns else 0
+        total = column_rois["total"] if "total" in column_rois.columns else pre + post
+
+        column_info = pd.DataFrame(
+            {
+                "roi": column_rois["roi"].astype(str),
+                "bodyId": column_rois["bodyId"],
+                "region": column_attrs["region"].to_numpy(),
+                "side": column_attrs["side"].to_numpy(),
+                "hex1": column_attrs["hex1"].to_numpy(dtype="int64"),
+                "hex2": column_attrs["hex2"].to_numpy(dtype="int64"),
+                "pre": pre,
+                "post": post,
+                "total": total,
+            },
+            index=column_rois.index,
+        )
+        return column_info.to_dict("records")
 
     def _analyze_column_data(
         self, roi_info: List[Dict[str, Any]], neuron_type: str, connector
@@ -355,6 +343,9 @@ class ColumnAnalysisService:
         for _, row in neurons_per_column.iterrows():
             key = (row["region"], row["side"], row["hex1"], row["hex2"])
             hex1, hex2 = coord_map.get(key, (row["hex1"], row["hex2"]))
+            # Per-layer counts are arrays, or empty lists for missing columns
+            synapses = row.get("synapses_list", [])
+            neurons = row.get("neurons_list", [])
 
             column_summary.append(
                 {
@@ -366,15 +357,7 @@ class ColumnAnalysisService:
                     "neuron_count": int(row["bodyId"]),
                     "total_pre": int(row["pre"]),
                     "total_post": int(row["post"]),
-                    "total_synapses": int(
-                        np.nan_to_num(
-                            sum(row.get("synapses_list", []))
-                            if isinstance(row.get("synapses_list", []), list)
-                            and len(row.get("synapses_list", [])) > 0
-                            else 0,
-                            nan=0.0,
-                        )
-                    ),
+                    "total_synapses": int(np.sum(synapses)) if len(synapses) else 0,
                     "mean_pre_per_neuron": float(
                         round(float(row["mean_pre_per_neuron"]), 1)
                     ),
@@ -387,26 +370,13 @@ class ColumnAnalysisService:
                     "layers": [
                         {
                             "layer_index": i + 1,
-                            "synapse_count": int(row.get("synapses_list", [])[i])
-                            if i < len(row.get("synapses_list", []))
-                            else 0,
-                            "neuron_count": int(row.get("neurons_list", [])[i])
-                            if i < len(row.get("neurons_list", []))
+                            "synapse_count": int(synapses[i])
+                            if i < len(synapses)
                             else 0,
-                            "value": float(row.get("synapses_list", [])[i])
-                            if i < len(row.get("synapses_list", []))
-                            else 0.0,
+                            "neuron_count": int(neurons[i]) if i < len(neurons) else 0,
+                            "value": float(synapses[i]) if i < len(synapses) else 0.0,
                         }
-                        for i in range(
-                            max(
-                                len(row.get("synapses_list", []))
-                                if isinstance(row.get("synapses_list", []), list)
-                                else 0,
-                                len(row.get("neurons_list", []))
-                                if isinstance(row.get("neurons_list", []), list)
-                                else 0,
-                            )
-                        )
+                        for i in range(max(len(synapses), len(neurons)))
                     ],
                 }
             )
@@ -491,6 +461,7 @@ class ColumnAnalysisService:
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about the column analysis cache."""
         return {
-            "cache_size": len(self._column_analysis_cache),
-            "cache_keys": list(self._column_analysis_cache.keys()),
+            "cache_size": self._column_analysis_cache.size(),
+            "cache_keys": self._column_analysis_cache.keys(),
+            "cache_bytes": self._column_analysis_cache.stats()["bytes"],
         }
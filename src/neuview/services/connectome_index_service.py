@@ -0,0 +1,92 @@
+"""
+Connectome Index Service for neuView.
+
+This service precomputes the partner connectivity of every neuron type and
+soma side into a ConnectomeIndex, so page generation can build the upstream
+and downstream partner tables without a connectivity query per page.
+"""
+
+import logging
+import time
+
+from ..commands import BuildConnectomeIndexCommand
+from ..connectome_index import (
+    DIRECTIONS,
+    ConnectomeIndexBuilder,
+    default_connectome_index_dir,
+)
+from ..result import Result, Ok, Err
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectomeIndexService:
+    """Service for building the connectome index of a dataset."""
+
+    def __init__(self, neuprint_connector, config):
+        """Initialize connectome index service.
+
+        Args:
+            neuprint_connector: NeuPrint or snapshot connector instance
+            config: Configuration object
+        """
+        self.connector = neuprint_connector
+        self.config = config
+
+    async def build_connectome_index(
+        self, command: BuildConnectomeIndexCommand
+    ) -> Result[str, str]:
+        """Fetch the partners of every neuron type and soma side into an index."""
+        try:
+            start_time = time.time()
+            index_dir = (
+                command.index_dir
+                or self.config.neuprint.connectome_index_dir
+                or default_connectome_index_dir(self.config)
+            )
+
+            neuron_types = self.connector.get_available_types()
+            if not neuron_types:
+                return Err("No neuron types found in dataset")
+
+            builder = ConnectomeIndexBuilder()
+            for position, neuron_type in enumerate(neuron_types, start=1):
+                logger.info(
+                    f"Indexing {neuron_type} ({position} of {len(neuron_types)})"
+                )
+                partition = self.connector._get_soma_side_partition(neuron_type)
+                for side in partition.sides:
+                    body_ids = partition.neurons(side)["bodyId"].tolist()
+                    builder.add_row(
+                        neuron_type,
+                        side,
+                        {
+                            direction: self.connector._fetch_partner_records(
+                                body_ids, direction
+                            )
+                            for direction in DIRECTIONS
+                        },
+                    )
+                # Raw neuron data is not needed again while building the index
+                self.connector.clear_neuron_data_cache(neuron_type)
+
+            index = builder.build(
+                {
+                    "server": self.config.neuprint.server,
+                    "dataset": self.config.neuprint.dataset,
+                    "uuid": self.connector.get_dataset_uuid(),
+                }
+            )
+            index.save(index_dir)
+
+            elapsed = time.time() - start_time
+            manifest = index.manifest
+            return Ok(
+                f"Wrote connectome index to {index_dir} ({manifest['rows']} rows, "
+                f"{manifest['partners']} partners, {manifest['connections']} "
+                f"connections) in {elapsed:.1f}s"
+            )
+
+        except Exception as e:
+            logger.error(f"Building connectome index failed: {e}")
+            return Err(f"Building connectome index failed: {str(e)}")
@@ -8,13 +8,27 @@ extracting logic from PageGenerator to improve modularity and testability.
 import logging
 import pandas as pd
 import numpy as np
-import json
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from ..column_layer_cache import (
+    column_layer_frame,
+    load_column_layer_cache,
+    pack_column_layer_cache,
+)
+from ..roi_attributes import COLUMN_ROI_PATTERN, LAYER_ROI_PATTERN, roi_attributes
+from ..soma_side_partition import roi_rows_for_neurons
+from .output_writer_service import atomic_write
+
 logger = logging.getLogger(__name__)
 
+# Layer ROIs whose per-column synapse values make up the column layer data
+COLUMN_LAYER_PATTERN = LAYER_ROI_PATTERN.pattern
+
+# Number of neuron types per batched column layer query
+COLUMN_LAYER_BATCH_SIZE = 20
+
 
 class DataProcessingService:
     """Service for data processing and aggregation operations."""
@@ -34,6 +48,7 @@ class DataProcessingService:
         neurons_df: pd.DataFrame,
         soma_side: str,
         connector=None,
+        roi_counts_matched: bool = False,
     ) -> List[Dict[str, Any]]:
         """Aggregate ROI data across neurons matching the specific soma side.
 
@@ -44,6 +59,8 @@ class DataProcessingService:
             neurons_df: DataFrame with neuron data
             soma_side: Soma side filter
             connector: Optional NeuPrint connector for getting primary ROIs
+            roi_counts_matched: Whether roi_counts_df holds exactly the ROI
+                rows of neurons_df, so they need no filtering
 
         Returns:
             List of dictionaries with aggregated ROI data
@@ -57,17 +74,10 @@ class DataProcessingService:
             return []
 
         # Filter ROI data to include only neurons that belong to this specific soma side
-        if "bodyId" in neurons_df.columns and "bodyId" in roi_counts_df.columns:
-            # Get bodyIds of neurons that match this soma side
-            soma_side_body_ids = set(neurons_df["bodyId"].values)
-            # Filter ROI counts to include only these neurons
-            roi_counts_soma_filtered = roi_counts_df[
-                roi_counts_df["bodyId"].isin(list(soma_side_body_ids))
-            ]
-        else:
-            # If bodyId columns are not available, fall back to using all ROI data
-            # This shouldn't happen in normal operation but provides a safety net
-            roi_counts_soma_filtered = roi_counts_df
+        # If bodyId columns are not available, all ROI data is used
+        roi_counts_soma_filtered = roi_rows_for_neurons(
+            roi_counts_df, neurons_df, roi_counts_matched
+        )
 
         if roi_counts_soma_filtered.empty:
             return []
@@ -81,11 +91,13 @@ class DataProcessingService:
         elif not isinstance(primary_rois, list):
             primary_rois = list(primary_rois) if primary_rois is not None else []
 
-        # Filter ROI counts to include only primary ROIs
+        # Filter ROI counts to include only primary ROIs; the flag is looked
+        # up once per distinct ROI name
         if len(primary_rois) > 0:
-            roi_counts_filtered = roi_counts_soma_filtered[
-                roi_counts_soma_filtered["roi"].isin(primary_rois)
-            ]
+            primary_mask = roi_attributes(
+                roi_counts_soma_filtered["roi"], primary_rois
+            )["is_primary"]
+            roi_counts_filtered = roi_counts_soma_filtered[primary_mask.to_numpy()]
         else:
             # If no primary ROIs available, return empty
             return []
@@ -95,7 +107,7 @@ class DataProcessingService:
 
         # Group by ROI and sum pre/post synapses across all neurons
         roi_aggregated = (
-            roi_counts_filtered.groupby("roi")
+            roi_counts_filtered.groupby("roi", observed=True)
             .agg({"pre": "sum", "post": "sum", "downstream": "sum", "upstream": "sum"})
             .reset_index()
         )
@@ -160,10 +172,7 @@ class DataProcessingService:
             Tuple of (results_df, thresholds, min_max_data)
         """
         # Setup cache
-        cache_dir = Path("output/.cache/col_layers")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", neuron_type).strip("_")
-        cache_path = cache_dir / f"{safe_name}.json"
+        cache_path = self._column_layer_cache_path(neuron_type)
 
         # Try to load from cache
         cached_result = self._load_column_layer_cache(cache_path)
@@ -171,30 +180,137 @@ class DataProcessingService:
             return cached_result
 
         # Query data from database
-        layer_pattern = r"^(ME|LO|LOP)_([LR])_layer_(\d+)$"
         query = self._build_column_layer_query(neuron_type)
 
         try:
             df = connector.client.fetch_custom(query)
-            df = self._clean_column_layer_data(df)
+            return self._cache_column_layer_values(
+                self._clean_column_layer_data(df), cache_path, connector
+            )
 
-            # Compute thresholds for colorscales using ThresholdService
-            threshold_service = self.page_generator.threshold_service
-            thresholds = threshold_service.compute_thresholds(df, n_bins=5)
+        except Exception as e:
+            logger.warning(f"Error querying column layer data for {neuron_type}: {e}")
+            return pd.DataFrame(), {}, {}
 
-            # Process and aggregate data
-            results, min_max_data = self._process_column_layer_data(
-                df, layer_pattern, connector
-            )
+    def warm_column_layer_cache(
+        self,
+        neuron_types: List[str],
+        connector,
+        chunk_size: int = COLUMN_LAYER_BATCH_SIZE,
+    ) -> List[str]:
+        """Fill the column layer cache of many neuron types with batched queries.
+
+        Only types that innervate a column ROI are warmed, since the column
+        analysis asks for column layer values of no other type. Those without
+        a cache entry are queried ``chunk_size`` at a time with one UNWIND
+        query per chunk. The rows of each type are processed and
+        cached exactly like get_column_layer_values() does, so later page
+        generation reads the cache instead of querying every type on its own.
 
-            # Save to cache
-            self._save_column_layer_cache(cache_path, results, thresholds, min_max_data)
+        Args:
+            neuron_types: Neuron types to warm
+            connector: NeuPrint connector instance for database queries
+            chunk_size: Maximum number of types per query
 
-            return results, thresholds, min_max_data
+        Returns:
+            Neuron types whose cache entry was written
+        """
+        if not getattr(connector, "client", None):
+            return []
 
+        # Column layer values only exist in datasets with layer ROIs
+        if not self.page_generator._get_all_dataset_layers(
+            COLUMN_LAYER_PATTERN, connector
+        ):
+            return []
+
+        pending = [
+            neuron_type
+            for neuron_type in dict.fromkeys(neuron_types)
+            if not self._column_layer_cache_path(neuron_type).exists()
+        ]
+        if not pending:
+            return []
+
+        try:
+            column_types = self._column_roi_types(pending, connector)
         except Exception as e:
-            logger.warning(f"Error querying column layer data for {neuron_type}: {e}")
-            return pd.DataFrame(), {}, {}
+            logger.warning(f"Error querying column ROI innervation: {e}")
+            return []
+        if len(column_types) < len(pending):
+            logger.debug(
+                f"Skipping {len(pending) - len(column_types)} types without column ROIs"
+            )
+        pending = column_types
+
+        warmed = []
+        for start in range(0, len(pending), max(1, chunk_size)):
+            chunk = pending[start : start + max(1, chunk_size)]
+            try:
+                df = connector.client.fetch_custom(
+                    self._build_batch_column_layer_query(chunk)
+                )
+                df = self._clean_column_layer_data(df)
+                rows_by_type = dict(tuple(df.groupby("type", sort=False)))
+            except Exception as e:
+                # Left to the per-type query of get_column_layer_values()
+                logger.warning(
+                    f"Error querying column layer data for {len(chunk)} types: {e}"
+                )
+                continue
+
+            for neuron_type in chunk:
+                type_df = rows_by_type.get(neuron_type, df.iloc[0:0])
+                try:
+                    self._cache_column_layer_values(
+                        type_df.drop(columns="type"),
+                        self._column_layer_cache_path(neuron_type),
+                        connector,
+                    )
+                    warmed.append(neuron_type)
+                except Exception as e:
+                    logger.warning(
+                        f"Error processing column layer data for {neuron_type}: {e}"
+                    )
+
+        logger.info(
+            f"Warmed column layer cache for {len(warmed)} of {len(pending)} types"
+        )
+        return warmed
+
+    def _column_roi_types(self, neuron_types: List[str], connector) -> List[str]:
+        """Get the neuron types that innervate at least one column ROI."""
+        df = connector.client.fetch_custom(
+            self._build_column_roi_types_query(neuron_types)
+        )
+        found = set(df["type"]) if not df.empty else set()
+        return [neuron_type for neuron_type in neuron_types if neuron_type in found]
+
+    def _column_layer_cache_path(self, neuron_type: str) -> Path:
+        """Get the column layer cache file of a neuron type."""
+        cache_dir = Path("output/.cache/col_layers")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", neuron_type).strip("_")
+        return cache_dir / f"{safe_name}.npz"
+
+    def _cache_column_layer_values(
+        self, df: pd.DataFrame, cache_path: Path, connector
+    ) -> Tuple[pd.DataFrame, Dict, Dict]:
+        """Aggregate the cleaned per-body rows of one type and cache them."""
+        # Compute thresholds for colorscales using ThresholdService; they are
+        # stored in the column layer cache, not in the threshold cache
+        threshold_service = self.page_generator.threshold_service
+        thresholds = threshold_service.compute_thresholds(df, n_bins=5, persist=False)
+
+        # Process and aggregate data
+        arrays, min_max_data = self._process_column_layer_data(
+            df, COLUMN_LAYER_PATTERN, connector
+        )
+
+        # Save to cache
+        self._save_column_layer_cache(cache_path, arrays, thresholds, min_max_data)
+
+        return column_layer_frame(arrays), thresholds, min_max_data
 
     def _load_column_layer_cache(
         self, cache_path: Path
@@ -204,17 +320,8 @@ class DataProcessingService:
             return None
 
         try:
-            with open(cache_path, "r") as f:
-                cached = json.load(f)
-
-            if (
-                isinstance(cached, dict)
-                and "results" in cached
-                and "thresholds" in cached
-            ):
-                results_df = pd.DataFrame(cached["results"])
-                min_max_data = cached.get("min_max_data", {})
-                return results_df, cached["thresholds"], min_max_data
+            arrays, thresholds, min_max_data = load_column_layer_cache(cache_path)
+            return column_layer_frame(arrays), thresholds, min_max_data
         except Exception as e:
             logger.debug(f"Failed to load cache from {cache_path}: {e}")
 
@@ -246,6 +353,53 @@ class DataProcessingService:
         ORDER BY hex1, hex2, layer
         """
 
+    def _cypher_type_list(self, neuron_types: List[str]) -> str:
+        """Format neuron types as a Cypher list of string literals."""
+        escaped_types = [
+            neuron_type.replace("\\", "\\\\").replace("'", "\\'")
+            for neuron_type in neuron_types
+        ]
+        return "[" + ", ".join(f"'{t}'" for t in escaped_types) + "]"
+
+    def _build_column_roi_types_query(self, neuron_types: List[str]) -> str:
+        """Build the NeuPrint query for the types with a column ROI in roiInfo."""
+        # roiInfo is a JSON object keyed by ROI name
+        column_roi_key = '.*"' + COLUMN_ROI_PATTERN.pattern[1:-1] + '".*'
+        return f"""
+        UNWIND {self._cypher_type_list(neuron_types)} AS target_type
+        MATCH (n:Neuron)
+        WHERE n.type = target_type AND n.roiInfo =~ '{column_roi_key}'
+        RETURN DISTINCT target_type AS type
+        """
+
+    def _build_batch_column_layer_query(self, neuron_types: List[str]) -> str:
+        """Build the NeuPrint query for the column layer data of many types."""
+        return f"""
+        UNWIND {self._cypher_type_list(neuron_types)} AS target_type
+        MATCH (n:Neuron)-[:Contains]->(nss:SynapseSet)-[:Contains]->(ns:Synapse)
+        WHERE n.type = target_type
+        WITH target_type, ns,  CASE
+               WHEN exists(ns['ME(R)']) THEN ['ME', 'R']
+               WHEN exists(ns['ME(L)']) THEN ['ME', 'L']
+               WHEN exists(ns['LO(R)']) THEN ['LO', 'R']
+               WHEN exists(ns['LO(L)']) THEN ['LO', 'L']
+               WHEN exists(ns['LOP(R)']) THEN ['LOP', 'R']
+               WHEN exists(ns['LOP(L)']) THEN ['LOP', 'L']
+             END AS layerKey,
+             count(ns) AS n_synapses
+        RETURN
+            target_type AS type,
+            ns.olHex1 AS hex1,
+            ns.olHex2 AS hex2,
+            ns.olLayer AS layer,
+            layerKey[0] as region,
+            layerKey[1] as side,
+            sum(n_synapses) as total_synapses,
+            ns.bodyId as bodyId,
+            count(DISTINCT ns.bodyId) as neuron_count
+        ORDER BY type, hex1, hex2, layer
+        """
+
     def _clean_column_layer_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and validate column layer data."""
         # Create explicit copy to avoid SettingWithCopyWarning
@@ -257,8 +411,8 @@ class DataProcessingService:
 
     def _process_column_layer_data(
         self, df: pd.DataFrame, layer_pattern: str, connector
-    ) -> Tuple[pd.DataFrame, Dict]:
-        """Process column layer data into final format."""
+    ) -> Tuple[Dict[str, np.ndarray], Dict]:
+        """Aggregate column layer data into per-column layer count arrays."""
         # Aggregate data
         df_unique = df.groupby(
             ["hex1", "hex2", "layer", "side", "region"], as_index=False
@@ -288,102 +442,48 @@ class DataProcessingService:
             "max_cells_region": max_cells_region.to_dict(),
         }
 
-        # Build results
-        results = []
-        for group_key, group in df_unique.groupby(["hex1", "hex2", "region", "side"]):
-            hex1, hex2, region, side = list(group_key)
-            layers_for_group = sorted(layer_map[(region, side)])
-            max_layer = max(layers_for_group)
-
-            # Initialize lists with zeros
-            synapse_list = [0] * max_layer
-            neuron_list = [0] * max_layer
-
-            # Fill values where data exists
-            for _, row in group.iterrows():
-                idx = int(row["layer"]) - 1
-                synapse_list[idx] = int(row["total_synapses"])
-                neuron_list[idx] = int(row["neuron_count"])
-
-            results.append(
-                {
-                    "hex1": int(hex1),
-                    "hex2": int(hex2),
-                    "region": region,
-                    "side": side,
-                    "synapses_list": synapse_list,  # Backward compatible column name
-                    "neurons_list": neuron_list,  # Backward compatible column name
-                    "layers": [
-                        {
-                            "layer_index": i + 1,
-                            "synapse_count": int(synapse_list[i])
-                            if i < len(synapse_list)
-                            else 0,
-                            "neuron_count": int(neuron_list[i])
-                            if i < len(neuron_list)
-                            else 0,
-                            "value": float(synapse_list[i])
-                            if i < len(synapse_list)
-                            else 0.0,
-                        }
-                        for i in range(max(len(synapse_list), len(neuron_list)))
-                    ],
-                }
-            )
-
-        return pd.DataFrame(results), min_max_data
+        # One row per column; layer counts are zero-padded to the widest column
+        columns = df_unique.groupby(["hex1", "hex2", "region", "side"], sort=True)
+        column_keys = columns.size().index.to_frame(index=False)
+        layer_count = np.array(
+            [
+                max(layer_map[(region, side)])
+                for region, side in zip(column_keys["region"], column_keys["side"])
+            ],
+            dtype=np.int16,
+        )
+        width = int(layer_count.max()) if len(layer_count) else 0
+        row = columns.ngroup().to_numpy()
+        layer_index = df_unique["layer"].to_numpy() - 1
+
+        synapses = np.zeros((len(column_keys), width), dtype=np.int32)
+        neurons = np.zeros((len(column_keys), width), dtype=np.int32)
+        synapses[row, layer_index] = df_unique["total_synapses"].to_numpy()
+        neurons[row, layer_index] = df_unique["neuron_count"].to_numpy()
+
+        arrays = {
+            "hex1": column_keys["hex1"].to_numpy(dtype=np.int32),
+            "hex2": column_keys["hex2"].to_numpy(dtype=np.int32),
+            "region": column_keys["region"].to_numpy(dtype=str),
+            "side": column_keys["side"].to_numpy(dtype=str),
+            "layer_count": layer_count,
+            "synapses": synapses,
+            "neurons": neurons,
+        }
+        return arrays, min_max_data
 
     def _save_column_layer_cache(
         self,
         cache_path: Path,
-        results: pd.DataFrame,
+        arrays: Dict[str, np.ndarray],
         thresholds: Dict,
         min_max_data: Dict,
     ):
-        """Save column layer data to cache."""
+        """Save column layer arrays to cache."""
         try:
-            # Convert to JSON-serializable format
-            results_dict = results.to_dict("records")
-
-            # Ensure all values are JSON-serializable
-            for record in results_dict:
-                for key, value in record.items():
-                    if key in ["hex1", "hex2"]:
-                        record[key] = int(value)
-                    elif isinstance(value, (np.integer, np.floating)):
-                        record[key] = value.item()
-                    elif isinstance(value, np.ndarray):
-                        record[key] = value.tolist()
-                    elif isinstance(value, list):
-                        record[key] = [
-                            v.item() if isinstance(v, (np.integer, np.floating)) else v
-                            for v in value
-                        ]
-
-            # Make thresholds JSON-serializable
-            json_thresholds = {}
-            for key, value in thresholds.items():
-                if isinstance(value, (np.integer, np.floating)):
-                    json_thresholds[key] = value.item()
-                elif isinstance(value, np.ndarray):
-                    json_thresholds[key] = value.tolist()
-                elif isinstance(value, list):
-                    json_thresholds[key] = [
-                        v.item() if isinstance(v, (np.integer, np.floating)) else v
-                        for v in value
-                    ]
-                else:
-                    json_thresholds[key] = value
-
-            cache_data = {
-                "results": results_dict,
-                "thresholds": json_thresholds,
-                "min_max_data": min_max_data,
-            }
-
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f, indent=2)
-
+            atomic_write(
+                cache_path, pack_column_layer_cache(arrays, thresholds, min_max_data)
+            )
         except Exception as e:
             logger.warning(f"Failed to save cache to {cache_path}: {e}")
 
@@ -11,6 +11,8 @@ import re
 from typing import Dict, Optional, List, Tuple, Set
 import pandas as pd
 
+from ..roi_hierarchy_index import clean_roi_name, get_roi_hierarchy_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,23 +91,8 @@ class DatabaseQueryService:
             return persistent_result
 
         try:
-            # Query all column ROIs from neuron roiInfo JSON data with aggregated counts
-            query = """
-                MATCH (n:Neuron)
-                WHERE n.roiInfo IS NOT NULL
-                WITH n, apoc.convert.fromJsonMap(n.roiInfo) as roiData
-                UNWIND keys(roiData) as roiName
-                WITH roiName, roiData[roiName] as roiInfo
-                WHERE roiName =~ '^(ME|LO|LOP)_[RL]_col_[A-Za-z0-9]+_[A-Za-z0-9]+$'
-                AND (roiInfo.pre > 0 OR roiInfo.post > 0)
-                WITH roiName,
-                     SUM(COALESCE(roiInfo.pre, 0)) as total_pre,
-                     SUM(COALESCE(roiInfo.post, 0)) as total_post
-                RETURN roiName as roi, total_pre as pre, total_post as post
-                ORDER BY roi
-            """
-
-            result = connector.client.fetch_custom(query)
+            # Aggregated synapse counts for every innervated column ROI
+            result = connector.fetch_column_roi_totals()
 
             if result is None or result.empty:
                 return [], {}
@@ -533,24 +520,7 @@ class DatabaseQueryService:
         def _clean_roi_name(name: str) -> str:
             if not name:
                 return ""
-            name = name.rstrip("*").strip()
-            # Remove (R), (L), or (M) suffixes from ROI names (parenthetical format)
-            cleaned = re.sub(r"\s*\([RLM]\)$", "", name)
-            # Also remove _R, _L, or _M suffixes from ROI names (underscore format)
-            # This handles FAFB patterns like OL_R and OL_L, treating them both as "OL"
-            cleaned = re.sub(r"_[RLM]$", "", cleaned)
-            return cleaned.strip()
-
-        def _find_parent_recursive(target: str, tree: dict, parent: str = "") -> str:
-            for k, v in (tree or {}).items():
-                ck = _clean_roi_name(k)
-                if ck == target:
-                    return parent
-                if isinstance(v, dict):
-                    hit = _find_parent_recursive(target, v, ck)
-                    if hit:
-                        return hit
-            return ""
+            return clean_roi_name(name.rstrip("*").strip())
 
         def _get_parent_from_hierarchy(roi_name: str, connector) -> str:
             try:
@@ -559,7 +529,7 @@ class DatabaseQueryService:
                 return ""
             if not hierarchy:
                 return ""
-            return _find_parent_recursive(_clean_roi_name(roi_name), hierarchy) or ""
+            return get_roi_hierarchy_index(hierarchy).parent(_clean_roi_name(roi_name))
 
         # Check cache first
         try:
@@ -0,0 +1,102 @@
+"""
+Dataset Layers Service for neuView.
+
+The layer ROIs of a dataset, as (region, side, layer) tuples of the
+``(ME|LO|LOP)_[LR]_layer_N`` ROIs, are a dataset constant used by the layer
+tables and the column/layer analysis of every optic lobe page. This service
+derives them once per dataset version, keyed by the dataset UUID, shares
+them within the process and persists them beside the ROI hierarchy cache.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from ..roi_hierarchy_index import get_roi_hierarchy_index
+
+logger = logging.getLogger(__name__)
+
+# Placeholders reported by NeuPrint and snapshots when no UUID is known
+_UNKNOWN_UUIDS = {"", "Unknown", "no UUID"}
+
+# Layers shared by all service instances of the process, by dataset UUID
+_layers_by_dataset: Dict[str, List[Tuple[str, str, int]]] = {}
+_layers_lock = threading.Lock()
+
+
+class DatasetLayersService:
+    """Provides the layer ROIs of a dataset, computed once per dataset version."""
+
+    def __init__(self, cache_manager=None):
+        """
+        Initialize the dataset layers service.
+
+        Args:
+            cache_manager: Optional cache manager used to persist the layers
+        """
+        self.cache_manager = cache_manager
+        # Layers of datasets without a known UUID, for this instance only
+        self._layers_by_connector_dataset: Dict[str, List[Tuple[str, str, int]]] = {}
+
+    def get_dataset_layers(self, connector) -> List[Tuple[str, str, int]]:
+        """
+        Get all layer ROIs of the connector's dataset.
+
+        Args:
+            connector: NeuPrint connector of the dataset
+
+        Returns:
+            Sorted (region, side, layer) tuples
+        """
+        uuid = self._dataset_uuid(connector)
+        if uuid is None:
+            key = self._fallback_key(connector)
+            layers = self._layers_by_connector_dataset.get(key)
+            if layers is None:
+                layers = self._compute_dataset_layers(connector)
+                if layers:
+                    self._layers_by_connector_dataset[key] = layers
+            return layers
+
+        with _layers_lock:
+            layers = _layers_by_dataset.get(uuid)
+        if layers is not None:
+            return layers
+
+        if self.cache_manager:
+            layers = self.cache_manager.load_dataset_layers(uuid)
+
+        if layers is None:
+            layers = self._compute_dataset_layers(connector)
+            if self.cache_manager and layers:
+                self.cache_manager.save_dataset_layers(uuid, layers)
+
+        # Failed lookups are not shared, so a later page can retry them
+        if layers:
+            with _layers_lock:
+                _layers_by_dataset[uuid] = layers
+        return layers
+
+    def _compute_dataset_layers(self, connector) -> List[Tuple[str, str, int]]:
+        """Derive the layer ROIs from the dataset's ROI hierarchy."""
+        try:
+            roi_hierarchy = connector._get_roi_hierarchy()
+            if roi_hierarchy:
+                return get_roi_hierarchy_index(roi_hierarchy).dataset_layers()
+        except Exception as e:
+            logger.warning(f"Failed to get ROI hierarchy for layer analysis: {e}")
+        return []
+
+    @staticmethod
+    def _dataset_uuid(connector) -> Optional[str]:
+        """Get the dataset UUID of a connector, if it is known."""
+        get_uuid = getattr(connector, "get_dataset_uuid", None)
+        uuid = get_uuid() if get_uuid else None
+        return None if uuid in _UNKNOWN_UUIDS else uuid
+
+    @staticmethod
+    def _fallback_key(connector) -> str:
+        """Process-local key of a dataset without a known UUID."""
+        config = getattr(connector, "config", None)
+        neuprint = getattr(config, "neuprint", None)
+        return f"{getattr(neuprint, 'server', '')}/{getattr(neuprint, 'dataset', '')}"
@@ -5,8 +5,12 @@ This module provides utilities for generating consistent filenames and managing
 file paths for the page generation system.
 """
 
+import hashlib
 from pathlib import Path
 
+# Number of hex digits of the filename hash used as shard directory name
+SHARD_PREFIX_LENGTH = 2
+
 
 class FileService:
     """
@@ -58,6 +62,44 @@ class FileService:
                 return f"{clean_type}.html"
             return f"{clean_type}_{soma_side_suffix}.html"
 
+    @staticmethod
+    def shard_prefix(filename: str) -> str:
+        """
+        Get the shard directory name for a file in a sharded output layout.
+
+        The prefix is derived from a hash of the filename, so files spread
+        evenly over 256 subdirectories and the shard of a file can be computed
+        without looking at the disk.
+
+        Args:
+            filename: File name without directory
+
+        Returns:
+            Shard directory name (two hex digits)
+        """
+        digest = hashlib.md5(filename.encode("utf-8")).hexdigest()
+        return digest[:SHARD_PREFIX_LENGTH]
+
+    @staticmethod
+    def sharded_path(filename: str, sharded: bool = True) -> str:
+        """
+        Get the path of a file relative to its output directory.
+
+        Args:
+            filename: File name without directory
+            sharded: Whether the output directory uses the sharded layout
+
+        Returns:
+            'shard/filename' if sharded, otherwise the filename itself
+
+        Example:
+            >>> FileService.sharded_path("ME_Mi1_L_cell_count.svg", sharded=False)
+            'ME_Mi1_L_cell_count.svg'
+        """
+        if not sharded:
+            return filename
+        return f"{FileService.shard_prefix(filename)}/{filename}"
+
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """
@@ -6,11 +6,11 @@ README documentation, help pages, and landing pages.
 """
 
 import logging
-import json
 from pathlib import Path
-from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from .neuron_search_service import NeuronSearchService
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +23,7 @@ class IndexGeneratorService:
     async def generate_neuron_search_js(
         self, output_dir: Path, neuron_data: List[Dict[str, Any]], generation_time
     ) -> Optional[str]:
-        """Generate the neuron-search.js file with embedded neuron types data."""
+        """Generate neuron-search.js and the sharded neuron search index."""
         # Prepare neuron types data for JavaScript
         neuron_types_for_js = []
 
@@ -66,33 +66,10 @@ class IndexGeneratorService:
         # Sort neuron types alphabetically
         neuron_types_for_js.sort(key=lambda x: x["name"])
 
-        # Extract just the names for the simple search functionality
-        neuron_names = [neuron["name"] for neuron in neuron_types_for_js]
-
-        # Prepare template data
-        js_template_data = {
-            "neuron_types_json": json.dumps(neuron_names, indent=2),
-            "neuron_types_data_json": json.dumps(neuron_types_for_js, indent=2),
-            "generation_timestamp": generation_time.strftime("%Y-%m-%d %H:%M:%S")
-            if generation_time
-            else datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "neuron_types": neuron_types_for_js,
-        }
-
-        # Load and render the neuron-search.js template
-        js_template = self.page_generator.env.get_template(
-            "static/js/neuron-search.js.template.jinja"
-        )
-        js_content = js_template.render(js_template_data)
-
-        # Ensure static/js directory exists
-        js_dir = output_dir / "static" / "js"
-        js_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write the neuron-search.js file
-        js_path = js_dir / "neuron-search.js"
-        js_path.write_text(js_content, encoding="utf-8")
-        return str(js_path)
+        # Write the sharded search index; unchanged shards are kept as they are
+        search_service = NeuronSearchService(output_dir, self.page_generator.env)
+        search_service.write_search_index(neuron_types_for_js)
+        return str(search_service.get_output_path())
 
     async def generate_readme(
         self, output_dir: Path, template_data: Dict[str, Any]
@@ -242,9 +242,9 @@ class IndexService:
         if names_needing_db_lookup or not roi_hierarchy_loaded:
             try:
                 init_start = time.time()
-                from ..neuprint_connector import NeuPrintConnector
+                from ..snapshot_connector import create_connector
 
-                connector = NeuPrintConnector(self.config)
+                connector = create_connector(self.config)
 
                 # Load ROI hierarchy if not already cached
                 if not roi_hierarchy_loaded:
@@ -265,9 +265,9 @@ class IndexService:
             # we still need the connector for metadata retrieval (UUID, etc.)
             try:
                 init_start = time.time()
-                from ..neuprint_connector import NeuPrintConnector
+                from ..snapshot_connector import create_connector
 
-                connector = NeuPrintConnector(self.config)
+                connector = create_connector(self.config)
                 init_time = time.time() - init_start
                 logger.info(
                     f"Database connector initialized for metadata retrieval in {init_time:.3f}s"
@@ -10,6 +10,8 @@ import logging
 from typing import Dict, Any, Optional, Callable
 from jinja2 import Environment, FileSystemLoader, Template
 
+from .static_bundle_service import get_static_bundles
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +79,9 @@ class JinjaTemplateService:
         # Register custom filters
         self._register_utility_filters(utility_services)
 
+        # URLs of the shared, content-hashed JavaScript bundles
+        self.env.globals["static_bundle"] = get_static_bundles().url
+
         self._initialized = True
         logger.info(
             f"Jinja2 environment initialized with template directory: {self.template_dir}"
@@ -8,23 +8,29 @@ layer analysis including central brain, AME, and LA regions.
 """
 
 import logging
-import re
 import pandas as pd
 from typing import Dict, Any, List, Optional, Tuple
 
+from ..roi_attributes import roi_attributes
+from ..soma_side_partition import roi_rows_for_neurons
+from .dataset_layers_service import DatasetLayersService
+
 logger = logging.getLogger(__name__)
 
 
 class LayerAnalysisService:
     """Service for analyzing layer-based ROI data and generating layer summaries."""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, dataset_layers_service=None):
         """Initialize layer analysis service.
 
         Args:
             config: Optional configuration object for dataset information
+            dataset_layers_service: Optional provider of the dataset's layer
+                ROIs, shared with the column analysis
         """
         self.config = config
+        self.dataset_layers_service = dataset_layers_service or DatasetLayersService()
 
     def analyze_layer_roi_data(
         self,
@@ -33,6 +39,7 @@ class LayerAnalysisService:
         soma_side: str,
         neuron_type: str,
         connector,
+        roi_counts_matched: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """
         Analyze ROI data for layer-based regions matching pattern (ME|LO|LOP)_[LR]_layer_<number>.
@@ -45,6 +52,8 @@ class LayerAnalysisService:
             soma_side: Side of soma (left/right)
             neuron_type: Name of the neuron type
             connector: Database connector for additional queries
+            roi_counts_matched: Whether roi_counts_df holds exactly the ROI
+                rows of neurons_df, so they need no filtering
 
         Returns:
             Dictionary containing layer analysis results or None if no layer data
@@ -59,19 +68,16 @@ class LayerAnalysisService:
 
         # Filter ROI data to include only neurons that belong to this specific soma side
         roi_counts_soma_filtered = self._filter_roi_data_by_soma_side(
-            roi_counts_df, neurons_df
+            roi_counts_df, neurons_df, roi_counts_matched
         )
 
         if roi_counts_soma_filtered.empty:
             return None
 
-        # Pattern to match layer ROIs: (ME|LO|LOP)_[LR]_layer_<number>
-        layer_pattern = r"^(ME|LO|LOP)_([LR])_layer_(\d+)$"
-
-        # Filter ROIs that match the layer pattern
-        layer_rois = roi_counts_soma_filtered[
-            roi_counts_soma_filtered["roi"].str.match(layer_pattern, na=False)
-        ].copy()
+        # Filter ROIs that match the layer pattern (ME|LO|LOP)_[LR]_layer_<number>,
+        # parsed once per distinct ROI name
+        layer_mask = roi_attributes(roi_counts_soma_filtered["roi"])["is_layer"]
+        layer_rois = roi_counts_soma_filtered[layer_mask.to_numpy()]
 
         # Filter ROI data to include only ROIs in the ipsilateral optic lobe.
         layer_rois_filtered = self._filter_roi_data_by_optic_lobe_side(
@@ -90,13 +96,15 @@ class LayerAnalysisService:
         )
 
         # Extract layer information and aggregate by layer
-        layer_info = self._extract_layer_information(layer_rois_filtered, layer_pattern)
+        layer_info = self._extract_layer_information(
+            layer_rois_filtered, roi_attributes(layer_rois_filtered["roi"])
+        )
 
         if not layer_info:
             return None
 
         # Query the ENTIRE dataset for all available layers (not just this neuron type)
-        all_dataset_layers = self._get_all_dataset_layers(layer_pattern, connector)
+        all_dataset_layers = self._get_all_dataset_layers(connector)
 
         # Process layer data and calculate aggregations
         layer_aggregated = self._aggregate_layer_data(layer_info)
@@ -128,14 +136,13 @@ class LayerAnalysisService:
         }
 
     def _filter_roi_data_by_soma_side(
-        self, roi_counts_df: pd.DataFrame, neurons_df: pd.DataFrame
+        self,
+        roi_counts_df: pd.DataFrame,
+        neurons_df: pd.DataFrame,
+        matched: bool = False,
     ) -> pd.DataFrame:
         """Filter ROI data to include only neurons from specific soma side."""
-        if "bodyId" in neurons_df.columns and "bodyId" in roi_counts_df.columns:
-            soma_side_body_ids = list(neurons_df["bodyId"].values)
-            return roi_counts_df[roi_counts_df["bodyId"].isin(soma_side_body_ids)]
-        else:
-            return roi_counts_df
+        return roi_rows_for_neurons(roi_counts_df, neurons_df, matched)
 
     def _filter_roi_data_by_optic_lobe_side(
         self, layer_rois: pd.DataFrame, soma_side: str
@@ -305,70 +312,35 @@ class LayerAnalysisService:
         return mean if mean > 0 else 0.0  # Show 0.0 if rounds to zero but has synapses
 
     def _extract_layer_information(
-        self, layer_rois: pd.DataFrame, layer_pattern: str
+        self, layer_rois: pd.DataFrame, layer_attrs: pd.DataFrame
     ) -> List[Dict[str, Any]]:
-        """Extract layer information from layer ROIs."""
-        layer_info = []
-        for _, row in layer_rois.iterrows():
-            roi_name = str(row["roi"])
-            match = re.match(layer_pattern, roi_name)
-            if match:
-                region, side, layer_num = match.groups()
-                pre_val = row.get("pre", 0) if "pre" in row else 0
-                post_val = row.get("post", 0) if "post" in row else 0
-                total_val = row.get("total") if "total" in row else (pre_val + post_val)
-                layer_info.append(
-                    {
-                        "roi": roi_name,
-                        "region": region,
-                        "side": side,
-                        "layer": int(layer_num),
-                        "bodyId": row["bodyId"],  # Include bodyId for proper grouping
-                        "pre": pre_val,
-                        "post": post_val,
-                        "total": total_val,
-                    }
-                )
-        return layer_info
+        """Extract layer information from layer ROIs and their ROI attributes."""
+        if layer_rois.empty:
+            return []
+
+        pre = layer_rois["pre"] if "pre" in layer_rois.columns else 0
+        post = layer_rois["post"] if "post" in layer_rois.columns else 0
+        total = layer_rois["total"] if "total" in layer_rois.columns else pre + post
+
+        layer_info = pd.DataFrame(
+            {
+                "roi": layer_rois["roi"].astype(str),
+                "region": layer_attrs["region"].to_numpy(),
+                "side": layer_attrs["side"].to_numpy(),
+                "layer": layer_attrs["layer"].to_numpy(dtype="int64"),
+                "bodyId": layer_rois["bodyId"],  # Include bodyId for proper grouping
+                "pre": pre,
+                "post": post,
+                "total": total,
+            },
+            index=layer_rois.index,
+        )
+        return layer_info.to_dict("records")
 
-    def _get_all_dataset_layers(
-        self, layer_pattern: str, connector
-    ) -> List[Tuple[str, str, int]]:
+    def _get_all_dataset_layers(self, connector) -> List[Tuple[str, str, int]]:
         """Query the entire dataset for all available layer patterns."""
-        try:
-            # Try to get ROI hierarchy for all available ROIs
-            roi_hierarchy = connector._get_roi_hierarchy()
-            if roi_hierarchy:
-
-                def extract_roi_names(hierarchy_dict):
-                    """Recursively extract ROI names from hierarchy."""
-                    roi_names = []
-                    if isinstance(hierarchy_dict, dict):
-                        for key, value in hierarchy_dict.items():
-                            # Remove * marker if present
-                            clean_key = key.rstrip("*")
-                            roi_names.append(clean_key)
-                            if isinstance(value, dict):
-                                roi_names.extend(extract_roi_names(value))
-                    return roi_names
-
-                all_rois = extract_roi_names(roi_hierarchy)
-            else:
-                # Fallback to empty list if hierarchy query fails
-                all_rois = []
-        except Exception as e:
-            logger.warning(f"Failed to get ROI hierarchy for layer analysis: {e}")
-            all_rois = []
-
-        # Extract layer information from all ROIs
-        all_layers = []
-        for roi in all_rois:
-            match = re.match(layer_pattern, roi)
-            if match:
-                region, side, layer_num = match.groups()
-                all_layers.append((region, side, int(layer_num)))
-
-        return sorted(set(all_layers))
+        # A dataset constant, computed once per dataset version
+        return self.dataset_layers_service.get_dataset_layers(connector)
 
     def _aggregate_layer_data(
         self, layer_info: List[Dict[str, Any]]
@@ -655,9 +627,9 @@ class LayerAnalysisService:
             elif region == "central brain":
                 containers["central_brain"]["data"]["pre"]["central brain"] = pre
                 containers["central_brain"]["data"]["post"]["central brain"] = post
-                containers["central_brain"]["data"]["neuron_count"][
-                    "central brain"
-                ] = neuron_count
+                containers["central_brain"]["data"]["neuron_count"]["central brain"] = (
+                    neuron_count
+                )
             elif region == "ME" and layer_num > 0:
                 col_name = f"ME {layer_num}"
                 if col_name in containers["me"]["data"]["pre"]:
@@ -1,28 +1,40 @@
 """
 Neuron search service for generating JavaScript search functionality.
 
-This service manages the generation of neuron-search.js files with embedded
-neuron type data for client-side search functionality.
+This service manages the generation of neuron-search.js and its search index
+for client-side search functionality. The index is split into shards by the
+first character of the type name (static/js/search/<key>.<hash>.js); the
+small neuron-search.js only lists the shards and loads them on the first
+keystroke. Shard file names contain a content hash, so rebuilding the index
+only writes the shards whose neuron types changed.
 """
 
 from pathlib import Path
+import hashlib
 import json
 import logging
-from datetime import datetime
+import re
+from collections import defaultdict
 from typing import List, Optional, Dict, Any
 from jinja2 import Environment
 
+from .output_writer_service import get_output_writer
+
 logger = logging.getLogger(__name__)
 
+SEARCH_SHARD_DIR = "search"
+SHARD_HASH_LENGTH = 10
+_SHARD_FILE_PATTERN = re.compile(rf"[a-z0-9_]\.[0-9a-f]{{{SHARD_HASH_LENGTH}}}\.js")
+
 
 class NeuronSearchService:
     """
     Service for generating JavaScript neuron search files.
 
     This service handles:
-    - Generation of neuron-search.js with embedded neuron types data
+    - Generation of neuron-search.js listing the search index shards
+    - Sharding and JSON serialization of neuron data
     - Template rendering for JavaScript content
-    - JSON serialization of neuron data
     - File output management
     """
 
@@ -41,7 +53,10 @@ class NeuronSearchService:
 
     def generate_neuron_search_js(self, force_regenerate: bool = False) -> bool:
         """
-        Generate neuron-search.js with embedded neuron types data.
+        Generate neuron-search.js and a search index of the queued types.
+
+        The index only contains the type names; ``create-list`` replaces it
+        with the full index including URLs, synonyms and FlyWire types.
 
         Args:
             force_regenerate: If True, regenerate even if file exists
@@ -71,11 +86,7 @@ class NeuronSearchService:
                 logger.warning(f"Neuron search template not found: {template_path}")
                 return False
 
-            # Generate JavaScript content
-            js_content = self._render_template(template_path, neuron_types)
-
-            # Write to output directory
-            self._write_js_file(output_js_file, js_content)
+            self.write_search_index([{"name": name} for name in neuron_types])
 
             logger.info(
                 f"Generated neuron-search.js with {len(neuron_types)} neuron types"
@@ -120,13 +131,113 @@ class NeuronSearchService:
         except Exception:
             return False
 
-    def _render_template(self, template_path: str, neuron_types: List[str]) -> str:
+    def write_search_index(
+        self,
+        entries: List[Dict[str, Any]],
+        output_path: Optional[Path] = None,
+    ) -> List[Path]:
+        """
+        Write the sharded search index and neuron-search.js.
+
+        Shards that already exist are up to date, since their name contains
+        the content hash. Shards that are no longer listed are removed, and
+        neuron-search.js is only rewritten when its content changes.
+
+        Args:
+            entries: Search entries with "name" and optionally "urls",
+                "primary_url", "synonyms" and "flywire_types"
+            output_path: Optional path of the loader script, defaults to
+                static/js/neuron-search.js
+
+        Returns:
+            Paths of the files that were written
+        """
+        output_path = output_path or self.get_output_path()
+        shard_dir = output_path.parent / SEARCH_SHARD_DIR
+        writer = get_output_writer()
+        written = []
+
+        shard_files = {}
+        for key, shard_entries in self.shard_entries(entries).items():
+            content = self._render_shard(key, shard_entries)
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            filename = f"{key}.{digest[:SHARD_HASH_LENGTH]}.js"
+            shard_files[key] = filename
+            target = shard_dir / filename
+            if not target.exists():
+                writer.write(target, content)
+                written.append(target)
+
+        if shard_dir.exists():
+            current = set(shard_files.values())
+            for path in shard_dir.glob("*.js"):
+                if path.name not in current and _SHARD_FILE_PATTERN.fullmatch(
+                    path.name
+                ):
+                    path.unlink(missing_ok=True)
+
+        search_index = {"count": len(entries), "shards": shard_files}
+        js_content = self._render_template(
+            "static/js/neuron-search.js.template.jinja", search_index
+        )
+        if not (
+            output_path.exists()
+            and output_path.read_text(encoding="utf-8") == js_content
+        ):
+            self._write_js_file(output_path, js_content)
+            written.append(output_path)
+
+        logger.debug(
+            f"Search index: {len(shard_files)} shards, {len(written)} files written"
+        )
+        return written
+
+    @staticmethod
+    def shard_key(name: str) -> str:
+        """
+        Get the shard key of a neuron type name.
+
+        Args:
+            name: Neuron type name
+
+        Returns:
+            Lowercase first character if it is an ASCII letter or digit,
+            otherwise "_"
+        """
+        first = name[:1].lower()
+        return first if first.isascii() and first.isalnum() else "_"
+
+    def shard_entries(
+        self, entries: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Split search entries into shards.
+
+        Args:
+            entries: Search entries
+
+        Returns:
+            Dictionary mapping shard keys to their compacted entries, sorted
+            by name
         """
-        Render the JavaScript template with neuron data.
+        shards = defaultdict(list)
+        for entry in sorted(entries, key=lambda item: item["name"]):
+            shards[self.shard_key(entry["name"])].append(_compact_entry(entry))
+        return dict(sorted(shards.items()))
+
+    @staticmethod
+    def _render_shard(key: str, entries: List[Dict[str, Any]]) -> str:
+        """Render a shard script registering its entries with the index."""
+        payload = json.dumps(entries, separators=(",", ":"), ensure_ascii=False)
+        return f'NeuronSearchIndex.addShard("{key}",{payload});\n'
+
+    def _render_template(self, template_path: str, search_index: Dict[str, Any]) -> str:
+        """
+        Render the JavaScript template with the search index shards.
 
         Args:
             template_path: Path to the template file
-            neuron_types: List of neuron type names
+            search_index: Number of neuron types and shard file names
 
         Returns:
             Rendered JavaScript content
@@ -138,12 +249,8 @@ class NeuronSearchService:
 
         # Prepare template context
         context = {
-            "neuron_types": neuron_types,
-            "neuron_types_json": json.dumps(neuron_types, indent=2),
-            "neuron_types_data_json": json.dumps(
-                [], indent=2
-            ),  # Placeholder for future data
-            "generation_timestamp": datetime.now().isoformat(),
+            "search_index": search_index,
+            "search_index_json": json.dumps(search_index, separators=(",", ":")),
         }
 
         # Generate the JavaScript content
@@ -195,12 +302,8 @@ class NeuronSearchService:
             PermissionError: If unable to write to output path
             OSError: If directory creation fails
         """
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write content to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Write content to file (creating the directory if needed)
+        get_output_writer().write(output_path, content)
 
         logger.debug(f"Written neuron search JavaScript to: {output_path}")
 
@@ -223,26 +326,26 @@ class NeuronSearchService:
         Generate neuron search file with custom neuron data.
 
         This method allows for more flexible generation with custom
-        neuron data structures and additional template variables.
+        neuron data structures.
 
         Args:
-            neuron_data: List of neuron data dictionaries
+            neuron_data: List of neuron data dictionaries or type names
             output_filename: Optional custom output filename
-            template_vars: Optional additional template variables
+            template_vars: Unused, the template only lists the index shards
 
         Returns:
             True if generation successful, False otherwise
         """
         try:
-            # Extract neuron types from data
-            neuron_types = []
+            # Normalize neuron data to search entries
+            entries = {}
             for item in neuron_data:
-                if isinstance(item, dict) and "type" in item:
-                    neuron_types.append(item["type"])
+                if isinstance(item, dict) and "name" in item:
+                    entries[item["name"]] = item
+                elif isinstance(item, dict) and "type" in item:
+                    entries[item["type"]] = dict(item, name=item["type"])
                 elif isinstance(item, str):
-                    neuron_types.append(item)
-
-            neuron_types = sorted(set(neuron_types))
+                    entries[item] = {"name": item}
 
             # Determine output path
             if output_filename:
@@ -250,31 +353,13 @@ class NeuronSearchService:
             else:
                 output_path = self.get_output_path()
 
-            # Prepare template context
-            context = {
-                "neuron_types": neuron_types,
-                "neuron_types_json": json.dumps(neuron_types, indent=2),
-                "neuron_types_data_json": json.dumps(neuron_data, indent=2),
-                "generation_timestamp": datetime.now().isoformat(),
-            }
-
-            # Add custom template variables
-            if template_vars:
-                context.update(template_vars)
-
-            # Load and render template
             template_path = "static/js/neuron-search.js.template.jinja"
 
             if not self._template_exists(template_path):
                 logger.error(f"Template not found: {template_path}")
                 return False
 
-            template = self.template_env.get_template(template_path)
-            js_content = template.render(**context)
-            js_content = self._fix_html_entities(js_content)
-
-            # Write to file
-            self._write_js_file(output_path, js_content)
+            self.write_search_index(list(entries.values()), output_path)
 
             logger.info(f"Generated custom neuron search file: {output_path}")
             return True
@@ -285,7 +370,7 @@ class NeuronSearchService:
 
     def cleanup_output_file(self) -> bool:
         """
-        Remove the generated neuron search JavaScript file.
+        Remove the generated neuron search JavaScript file and its index.
 
         Returns:
             True if file was removed or didn't exist, False if removal failed
@@ -295,7 +380,23 @@ class NeuronSearchService:
             if output_path.exists():
                 output_path.unlink()
                 logger.debug(f"Removed neuron search file: {output_path}")
+            shard_dir = output_path.parent / SEARCH_SHARD_DIR
+            for path in shard_dir.glob("*.js"):
+                if _SHARD_FILE_PATTERN.fullmatch(path.name):
+                    path.unlink()
             return True
         except Exception as e:
             logger.error(f"Failed to remove neuron search file: {e}")
             return False
+
+
+def _compact_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty fields and URLs from a search entry."""
+    compact = {"name": entry["name"]}
+    urls = {side: url for side, url in (entry.get("urls") or {}).items() if url}
+    if urls:
+        compact["urls"] = urls
+    for field in ("primary_url", "synonyms", "flywire_types"):
+        if entry.get(field):
+            compact[field] = entry[field]
+    return compact
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 
 from ..models import NeuronTypeName, NeuronTypeStatistics
 from ..result import Result, Ok, Err
+from ..type_bundle import TypeBundle
 
 logger = logging.getLogger(__name__)
 
@@ -37,19 +38,30 @@ class NeuronStatisticsService:
         """
         self.connector = connector
 
-    async def get_neuron_count(self, neuron_type: str) -> Result[int, str]:
+    def _combined_data(
+        self, neuron_type: str, bundle: Optional[TypeBundle]
+    ) -> Dict[str, Any]:
+        """Get the combined neuron data from the type bundle or the connector."""
+        if bundle is not None:
+            return bundle.neuron_data("combined")
+        return self.connector.get_neuron_data(neuron_type, "combined")
+
+    async def get_neuron_count(
+        self, neuron_type: str, bundle: Optional[TypeBundle] = None
+    ) -> Result[int, str]:
         """
         Get the count of neurons for a specific type.
 
         Args:
             neuron_type: The neuron type name
+            bundle: Type bundle whose combined data is used, if any
 
         Returns:
             Result containing the neuron count or error message
         """
         try:
             # Always use combined data to get total count
-            data = self.connector.get_neuron_data(neuron_type, "combined")
+            data = self._combined_data(neuron_type, bundle)
             if not data or "neurons" not in data:
                 return Ok(0)
 
@@ -64,13 +76,14 @@ class NeuronStatisticsService:
             return Err(f"Failed to get neuron count: {str(e)}")
 
     async def get_soma_side_distribution(
-        self, neuron_type: str
+        self, neuron_type: str, bundle: Optional[TypeBundle] = None
     ) -> Result[Dict[str, int], str]:
         """
         Get the distribution of neurons across soma sides.
 
         Args:
             neuron_type: The neuron type name
+            bundle: Type bundle whose combined data is used, if any
 
         Returns:
             Result containing soma side counts or error message
@@ -83,7 +96,7 @@ class NeuronStatisticsService:
                     return Ok(distribution)
 
             # Fallback: get combined data and calculate distribution
-            data = self.connector.get_neuron_data(neuron_type, "combined")
+            data = self._combined_data(neuron_type, bundle)
             if not data or "neurons" not in data:
                 return Ok({})
 
@@ -176,18 +189,21 @@ class NeuronStatisticsService:
             logger.error(f"Failed to get synapse stats for {neuron_type}: {e}")
             return Err(f"Failed to get synapse statistics: {str(e)}")
 
-    async def has_data(self, neuron_type: str) -> Result[bool, str]:
+    async def has_data(
+        self, neuron_type: str, bundle: Optional[TypeBundle] = None
+    ) -> Result[bool, str]:
         """
         Check if a neuron type has available data.
 
         Args:
             neuron_type: The neuron type name
+            bundle: Type bundle whose combined data is used, if any
 
         Returns:
             Result containing boolean indicating data availability
         """
         try:
-            count_result = await self.get_neuron_count(neuron_type)
+            count_result = await self.get_neuron_count(neuron_type, bundle)
             if count_result.is_err():
                 return Err(count_result.unwrap_err())
 
@@ -0,0 +1,144 @@
+"""
+Output Manifest Service for neuView.
+
+Records which files each neuron type produced (HTML pages and eyemaps), so
+regenerating a type can remove exactly its own files instead of scanning the
+output directories with filename globs.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from .file_service import FileService
+from .output_writer_service import atomic_write
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SUBDIRECTORY = ".cache/output_manifest"
+
+
+class OutputManifestService:
+    """Per-type manifest of generated output files."""
+
+    def __init__(self, output_dir: Path):
+        """Initialize the manifest service.
+
+        Args:
+            output_dir: Base output directory; recorded paths are relative to it
+        """
+        self.output_dir = Path(output_dir)
+        self.manifest_dir = self.output_dir / MANIFEST_SUBDIRECTORY
+        self._lock = threading.Lock()
+
+    def _manifest_path(self, neuron_type: str) -> Path:
+        """Manifest file of a neuron type."""
+        clean_type = FileService.sanitize_filename(neuron_type) or "_"
+        return self.manifest_dir / f"{clean_type}.json"
+
+    def load(self, neuron_type: str) -> Optional[Dict[str, List[str]]]:
+        """
+        Load the recorded files of a neuron type.
+
+        Args:
+            neuron_type: Neuron type name
+
+        Returns:
+            Dictionary mapping page filenames to the files generated for that
+            page (relative to the output directory), or None if the type has
+            no manifest
+        """
+        path = self._manifest_path(neuron_type)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable output manifest {path}: {e}")
+            return None
+
+        if data.get("neuron_type") != neuron_type:
+            # Another type whose name sanitizes to the same manifest file
+            return None
+        return data.get("pages", {})
+
+    def _write(self, neuron_type: str, pages: Dict[str, List[str]]) -> None:
+        """Atomically replace the manifest of a neuron type."""
+        path = self._manifest_path(neuron_type)
+        if not pages:
+            path.unlink(missing_ok=True)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(
+            path, json.dumps({"neuron_type": neuron_type, "pages": pages}, indent=1)
+        )
+
+    def record(
+        self,
+        neuron_type: str,
+        soma_side: str,
+        files: Iterable[Union[str, Path]],
+    ) -> None:
+        """
+        Record the files generated for one page of a neuron type.
+
+        Args:
+            neuron_type: Neuron type name
+            soma_side: Soma side of the page
+            files: Generated files, absolute or relative to the output directory
+        """
+        page = FileService.generate_filename(neuron_type, soma_side)
+        relative_files = set()
+        for file_path in files:
+            file_path = Path(file_path)
+            if file_path.is_absolute():
+                try:
+                    file_path = file_path.relative_to(self.output_dir)
+                except ValueError:
+                    continue
+            relative_files.add(file_path.as_posix())
+
+        with self._lock:
+            pages = self.load(neuron_type) or {}
+            pages[page] = sorted(relative_files)
+            self._write(neuron_type, pages)
+
+    def remove(self, neuron_type: str, soma_side: Optional[str] = None) -> Set[str]:
+        """
+        Forget the files of a neuron type, or of one of its pages.
+
+        Args:
+            neuron_type: Neuron type name
+            soma_side: If given, only forget the page for this soma side
+
+        Returns:
+            Relative paths that are no longer referenced by any page of the
+            type and can be deleted
+        """
+        with self._lock:
+            pages = self.load(neuron_type) or {}
+            if soma_side is None:
+                removed_pages = list(pages)
+            else:
+                page = FileService.generate_filename(neuron_type, soma_side)
+                removed_pages = [page] if page in pages else []
+
+            removed = set()
+            for page in removed_pages:
+                removed.update(pages.pop(page))
+            for files in pages.values():
+                removed.difference_update(files)
+
+            self._write(neuron_type, pages)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all manifests."""
+        with self._lock:
+            if self.manifest_dir.exists():
+                for path in self.manifest_dir.glob("*.json"):
+                    path.unlink(missing_ok=True)
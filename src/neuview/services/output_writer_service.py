@@ -0,0 +1,290 @@
+"""
+Output Writer Service for neuView.
+
+Generated pages and eyemaps are written atomically: content goes to a
+temporary file in the target directory that is then renamed over the target,
+so readers (e.g. an rsync publisher running mid-build) see either the old or
+the new file, never a partial one.
+
+During a ``generate`` or ``pop`` run, ``buffered_output_writes()`` installs a
+write-behind writer. Writes are queued on a bounded queue and performed by a
+background thread, so rendering the next page overlaps the disk I/O of the
+previous one. When the run ends the queue is drained and all written files
+are fsynced in one batch. Outside such a run writes happen immediately.
+Code that reads back a file it may have just written calls ``flush_path()``
+first, which waits only for the queued writes of that file.
+"""
+
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from ..tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 64
+
+_STOP = object()
+
+
+def atomic_write(
+    path: Union[str, Path], data: Union[str, bytes], encoding: str = "utf-8"
+) -> int:
+    """
+    Write a file through a temporary file and a rename.
+
+    Args:
+        path: Target file
+        data: Text or binary content
+        encoding: Encoding used for text content
+
+    Returns:
+        Number of bytes written
+    """
+    path = Path(path)
+    payload = data.encode(encoding) if isinstance(data, str) else data
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return len(payload)
+
+
+def _fsync_path(path: str) -> None:
+    """Flush a file or directory to disk; directories may not be supported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class OutputWriterService:
+    """Atomic file writer with optional write-behind and batched fsync."""
+
+    def __init__(
+        self, write_behind: bool = False, queue_size: int = DEFAULT_QUEUE_SIZE
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            write_behind: Queue writes for a background thread and remember
+                written files for a batched fsync in sync()
+            queue_size: Maximum number of queued writes; writers block while
+                the queue is full
+        """
+        self.write_behind = write_behind
+        self._queue: Optional[queue.Queue] = (
+            queue.Queue(maxsize=queue_size) if write_behind else None
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending: Dict[str, int] = {}
+        self._written: Dict[str, None] = {}
+        self._errors: List[Exception] = []
+
+    def write(
+        self, path: Union[str, Path], data: Union[str, bytes], encoding: str = "utf-8"
+    ) -> int:
+        """
+        Write a file atomically, in the background if write-behind is enabled.
+
+        Args:
+            path: Target file; missing parent directories are created
+            data: Text or binary content
+            encoding: Encoding used for text content
+
+        Returns:
+            Size of the file in bytes
+        """
+        path = Path(path)
+        payload = data.encode(encoding) if isinstance(data, str) else data
+
+        if not self.write_behind:
+            self._write_now(path, payload)
+        else:
+            self._ensure_thread()
+            key = os.path.abspath(path)
+            with self._lock:
+                self._pending[key] = self._pending.get(key, 0) + 1
+            self._queue.put((path, payload))
+        return len(payload)
+
+    def _write_now(self, path: Path, payload: bytes) -> None:
+        """Perform one write on the calling thread."""
+        with trace_span(path.name, "write", bytes=len(payload)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, payload)
+        if self.write_behind:
+            with self._lock:
+                self._written[str(path)] = None
+
+    def _ensure_thread(self) -> None:
+        """Start the background writer thread on first use."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain, name="neuview-output-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _drain(self) -> None:
+        """Background thread: perform queued writes until stopped."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                path, payload = item
+                try:
+                    self._write_now(path, payload)
+                except Exception as e:
+                    logger.error(f"Failed to write {path}: {e}")
+                    with self._lock:
+                        self._errors.append(e)
+                finally:
+                    self._write_done(os.path.abspath(path))
+            finally:
+                self._queue.task_done()
+
+    def _write_done(self, key: str) -> None:
+        """Mark one queued write of a file as performed."""
+        with self._idle:
+            remaining = self._pending.pop(key, 1) - 1
+            if remaining > 0:
+                self._pending[key] = remaining
+            self._idle.notify_all()
+
+    def flush_path(self, path: Union[str, Path]) -> None:
+        """
+        Wait until the queued writes of one file have been performed.
+
+        Errors of those writes are not raised here but by the next flush();
+        a failed write simply leaves the file as it was.
+
+        Args:
+            path: File whose pending writes to wait for
+        """
+        if not self.write_behind:
+            return
+        key = os.path.abspath(path)
+        with self._idle:
+            self._idle.wait_for(lambda: key not in self._pending)
+
+    def flush(self) -> None:
+        """
+        Wait until all queued writes have been performed.
+
+        Raises:
+            OSError: The first error of a background write since the last flush
+        """
+        if self._queue is not None and self._thread is not None:
+            self._queue.join()
+
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def sync(self) -> int:
+        """
+        Flush pending writes and fsync every file written since the last sync,
+        then the directories containing them.
+
+        Returns:
+            Number of files synced
+        """
+        self.flush()
+        with self._lock:
+            paths, self._written = list(self._written), {}
+
+        with trace_span("fsync", "write", files=len(paths)):
+            for path in paths:
+                _fsync_path(path)
+            for directory in {os.path.dirname(path) for path in paths}:
+                _fsync_path(directory)
+        return len(paths)
+
+    def close(self, sync: bool = True) -> None:
+        """
+        Drain the queue, stop the background thread and optionally sync.
+
+        Args:
+            sync: Whether to fsync the written files
+        """
+        try:
+            if sync:
+                self.sync()
+            else:
+                self.flush()
+        finally:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+
+
+_default_writer = OutputWriterService()
+_active_writer: Optional[OutputWriterService] = None
+
+
+def get_output_writer() -> OutputWriterService:
+    """Get the writer of the current run, or the immediate default writer."""
+    return _active_writer or _default_writer
+
+
+@contextmanager
+def buffered_output_writes(
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> Iterator[OutputWriterService]:
+    """
+    Use a write-behind writer for the enclosed run.
+
+    On exit all queued writes are completed and the written files are fsynced.
+    Write errors are raised when the run finished cleanly; if the run itself
+    failed they are logged, so they do not replace the run's exception.
+    Nested uses share the outer writer.
+
+    Args:
+        queue_size: Maximum number of queued writes
+
+    Yields:
+        The active writer
+    """
+    global _active_writer
+    if _active_writer is not None:
+        yield _active_writer
+        return
+
+    writer = OutputWriterService(write_behind=True, queue_size=queue_size)
+    _active_writer = writer
+    run_failed = False
+    try:
+        yield writer
+    except BaseException:
+        run_failed = True
+        raise
+    finally:
+        _active_writer = None
+        try:
+            writer.close(sync=True)
+        except Exception as e:
+            if not run_failed:
+                raise
+            logger.error(f"Failed to complete output writes: {e}")
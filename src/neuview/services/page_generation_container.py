@@ -205,6 +205,7 @@ class PageGenerationContainer:
                 output_dir=self.get("output_dir"),
                 eyemaps_dir=directories["eyemaps"],
                 save_to_files=True,
+                shard_eyemaps=self.get("config").output.shard_eyemaps,
             )
             return EyemapGenerator(config=eyemap_config)
 
@@ -329,10 +330,20 @@ class PageGenerationContainer:
     def _register_analysis_factories(self) -> None:
         """Register analysis service factories."""
 
+        def dataset_layers_service_factory():
+            from .dataset_layers_service import DatasetLayersService
+
+            cache_manager = (
+                self.get("cache_manager") if self.has("cache_manager") else None
+            )
+            return DatasetLayersService(cache_manager)
+
         def layer_analysis_service_factory():
             from .layer_analysis_service import LayerAnalysisService
 
-            return LayerAnalysisService(self.get("config"))
+            return LayerAnalysisService(
+                self.get("config"), self.get("dataset_layers_service")
+            )
 
         def neuron_selection_service_factory():
             from .neuron_selection_service import NeuronSelectionService
@@ -347,13 +358,17 @@ class PageGenerationContainer:
         def threshold_service_factory():
             from .threshold_service import ThresholdService
 
-            return ThresholdService()
+            cache_manager = (
+                self.get("cache_manager") if self.has("cache_manager") else None
+            )
+            return ThresholdService(cache_manager=cache_manager)
 
         def youtube_service_factory():
             from .youtube_service import YouTubeService
 
             return YouTubeService()
 
+        self.register_factory("dataset_layers_service", dataset_layers_service_factory)
         self.register_factory("layer_analysis_service", layer_analysis_service_factory)
         self.register_factory(
             "neuron_selection_service", neuron_selection_service_factory
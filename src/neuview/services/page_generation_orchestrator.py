@@ -9,7 +9,7 @@ a unified interface for page generation.
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..models.page_generation import (
     PageGenerationRequest,
@@ -19,7 +19,10 @@ from ..models.page_generation import (
     URLCollection,
     AnalysisConfiguration,
 )
+from ..tracing import trace_span
+from ..utils.html_minifier import MinificationPool, get_minification_pool
 from ..visualization.constants import DEFAULT_HEX_SIZE, DEFAULT_SPACING_FACTOR
+from .output_writer_service import get_output_writer
 
 logger = logging.getLogger(__name__)
 
@@ -79,30 +82,46 @@ class PageGenerationOrchestrator:
                     "Invalid page generation request: missing required data"
                 )
 
-            # Create analysis configuration
-            analysis_config = AnalysisConfiguration.from_request(request)
-
-            # Prepare generation context
-            context = self._prepare_generation_context(request, analysis_config)
-
-            # Render the page
-            html_content = self._render_page(context)
-
-            # Post-process HTML
-            if request.minify:
-                html_content = self.html_utils.minify_html(html_content, minify_js=True)
+            page_name = f"{request.get_neuron_name()} ({request.get_soma_side()})"
+            with trace_span(page_name, "page"):
+                # Create analysis configuration
+                analysis_config = AnalysisConfiguration.from_request(request)
+
+                # Prepare generation context
+                context = self._prepare_generation_context(request, analysis_config)
+
+                # Render the page; with lazy tables the table rows go to a
+                # separate JSON file instead of the HTML
+                template_context = self._prepare_template_context(context)
+                table_data = None
+                if self._lazy_tables_enabled():
+                    with trace_span("table_data", "render"):
+                        table_data = self._prepare_table_data(request, template_context)
+                with trace_span("neuron_page.html.jinja", "render"):
+                    html_content = self._render_page(template_context)
+
+                # Post-process HTML, unless worker processes minify it
+                minification_pool = get_minification_pool() if request.minify else None
+                if request.minify and minification_pool is None:
+                    with trace_span("minify_html", "minify", bytes=len(html_content)):
+                        html_content = self.html_utils.minify_html(
+                            html_content, minify_js=True
+                        )
 
-            # Save the page
-            output_path = self._save_page(html_content, request)
+                # Save the page
+                output_path, file_size = self._save_page(
+                    html_content, request, minification_pool
+                )
+                extra_files = []
+                if table_data is not None:
+                    extra_files.append(self._save_table_data(table_data, output_path))
+                self._record_output_files(request, context, output_path, extra_files)
 
-            # Generate auxiliary files
-            self._generate_auxiliary_files()
+                # Generate auxiliary files
+                self._generate_auxiliary_files()
 
-            # Calculate generation time and file size
+            # Calculate generation time
             generation_time = (time.time() - start_time) * 1000
-            file_size = (
-                Path(output_path).stat().st_size if Path(output_path).exists() else None
-            )
 
             return PageGenerationResponse.success_response(
                 output_path=str(output_path),
@@ -133,10 +152,12 @@ class PageGenerationOrchestrator:
         analysis_results = self._run_analyses(request, analysis_config)
 
         # Generate URLs
-        urls = self._generate_urls(request)
+        with trace_span("generate_urls", "analysis"):
+            urls = self._generate_urls(request)
 
         # Get additional context
-        type_region = self._get_type_region(request)
+        with trace_span("type_region", "analysis"):
+            type_region = self._get_type_region(request)
 
         # Get neuroglancer variables
         neuroglancer_vars = self._extract_neuroglancer_vars(urls)
@@ -171,12 +192,16 @@ class PageGenerationOrchestrator:
             # ROI analysis (both modes)
             if analysis_config.run_roi_analysis:
                 try:
-                    results.roi_summary = self.page_generator._aggregate_roi_data(
-                        neuron_data.get("roi_counts"),
-                        neuron_data.get("neurons"),
-                        soma_side,
-                        request.connector,
-                    )
+                    with trace_span("roi_analysis", "analysis"):
+                        results.roi_summary = self.page_generator._aggregate_roi_data(
+                            neuron_data.get("roi_counts"),
+                            neuron_data.get("neurons"),
+                            soma_side,
+                            request.connector,
+                            roi_counts_matched=neuron_data.get(
+                                "roi_counts_matched", False
+                            ),
+                        )
                 except Exception as e:
                     logger.warning(f"ROI analysis failed for {neuron_name}: {e}")
                     results.roi_summary = None
@@ -184,15 +209,19 @@ class PageGenerationOrchestrator:
             # Layer analysis (both modes)
             if analysis_config.run_layer_analysis:
                 try:
-                    results.layer_analysis = (
-                        self.page_generator._analyze_layer_roi_data(
-                            neuron_data.get("roi_counts"),
-                            neuron_data.get("neurons"),
-                            soma_side,
-                            neuron_name,
-                            request.connector,
+                    with trace_span("layer_analysis", "analysis"):
+                        results.layer_analysis = (
+                            self.page_generator._analyze_layer_roi_data(
+                                neuron_data.get("roi_counts"),
+                                neuron_data.get("neurons"),
+                                soma_side,
+                                neuron_name,
+                                request.connector,
+                                roi_counts_matched=neuron_data.get(
+                                    "roi_counts_matched", False
+                                ),
+                            )
                         )
-                    )
                 except Exception as e:
                     logger.warning(f"Layer analysis failed for {neuron_name}: {e}")
                     results.layer_analysis = None
@@ -200,8 +229,8 @@ class PageGenerationOrchestrator:
             # Column analysis (both modes)
             if analysis_config.run_column_analysis:
                 try:
-                    results.column_analysis = (
-                        self.page_generator._analyze_column_roi_data(
+                    with trace_span("column_analysis", "analysis"):
+                        results.column_analysis = self.page_generator._analyze_column_roi_data(
                             neuron_data.get("roi_counts"),
                             neuron_data.get("neurons"),
                             soma_side,
@@ -217,8 +246,10 @@ class PageGenerationOrchestrator:
                             spacing_factor=getattr(
                                 request, "spacing_factor", DEFAULT_SPACING_FACTOR
                             ),
+                            roi_counts_matched=neuron_data.get(
+                                "roi_counts_matched", False
+                            ),
                         )
-                    )
                 except Exception as e:
                     logger.warning(f"Column analysis failed for {neuron_name}: {e}")
                     results.column_analysis = None
@@ -256,12 +287,12 @@ class PageGenerationOrchestrator:
                 )
 
                 urls.neuroglancer_url = neuroglancer_url
-                # Store neuroglancer_vars for later use
-                self._neuroglancer_vars = neuroglancer_vars
+                # Keep neuroglancer_vars with the request's URLs for later use
+                urls.neuroglancer_vars = neuroglancer_vars
             except Exception as e:
                 logger.warning(f"Failed to generate neuroglancer URL: {e}")
                 urls.neuroglancer_url = None
-                self._neuroglancer_vars = None
+                urls.neuroglancer_vars = None
 
             # Generate NeuPrint URL
             try:
@@ -292,7 +323,7 @@ class PageGenerationOrchestrator:
         self, urls: URLCollection
     ) -> Optional[Dict[str, Any]]:
         """Extract neuroglancer variables from URL generation."""
-        return getattr(self, "_neuroglancer_vars", None)
+        return urls.neuroglancer_vars
 
     def _get_type_region(self, request: PageGenerationRequest) -> Optional[str]:
         """Get the type's assigned region for setting the NG view."""
@@ -304,19 +335,18 @@ class PageGenerationOrchestrator:
             logger.warning(f"Error getting type region: {e}")
             return None
 
-    def _render_page(self, context: PageGenerationContext) -> str:
+    def _prepare_template_context(
+        self, context: PageGenerationContext
+    ) -> Dict[str, Any]:
         """
-        Render the HTML page using the template.
+        Prepare the variables the neuron page template is rendered with.
 
         Args:
             context: Complete generation context
 
         Returns:
-            Rendered HTML content
+            Template context dictionary
         """
-        # Load template
-        template = self.env.get_template("neuron_page.html.jinja")
-
         # Prepare template context using the service
         template_context = self.template_context_service.prepare_neuron_page_context(
             context.request.get_neuron_name(),
@@ -334,19 +364,92 @@ class PageGenerationOrchestrator:
                 template_context, context.neuroglancer_vars
             )
 
-        # Render template
+        return template_context
+
+    def _render_page(self, template_context: Dict[str, Any]) -> str:
+        """
+        Render the HTML page using the template.
+
+        Args:
+            template_context: Variables for the neuron page template
+
+        Returns:
+            Rendered HTML content
+        """
+        template = self.env.get_template("neuron_page.html.jinja")
         return template.render(**template_context)
 
-    def _save_page(self, html_content: str, request: PageGenerationRequest) -> str:
+    def _lazy_tables_enabled(self) -> bool:
+        """Whether table rows are written to JSON files loaded by the page."""
+        output_config = getattr(self.page_generator.config, "output", None)
+        return bool(getattr(output_config, "lazy_tables", False))
+
+    def _prepare_table_data(
+        self, request: PageGenerationRequest, template_context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the table rows of a page and point the template at their file.
+
+        Args:
+            request: Page generation request
+            template_context: Template context; gains the ``tables_url`` of
+                the table data file, relative to the page
+
+        Returns:
+            Table data to save next to the page
+        """
+        from .file_service import FileService
+        from .table_data_service import TableDataService
+
+        page_filename = FileService.generate_filename(
+            request.get_neuron_name(), request.get_soma_side()
+        )
+        template_context["tables_url"] = TableDataService.table_data_filename(
+            page_filename
+        )
+        return TableDataService(self.env).build_table_data(template_context)
+
+    def _save_table_data(self, table_data: Dict[str, Any], output_path: str) -> Path:
+        """
+        Save the table data of a page next to it.
+
+        Args:
+            table_data: Table rows built by TableDataService
+            output_path: Path of the page
+
+        Returns:
+            Path of the table data file
+        """
+        from .table_data_service import TableDataService
+
+        page_path = Path(output_path)
+        tables_path = page_path.with_name(
+            TableDataService.table_data_filename(page_path.name)
+        )
+        get_output_writer().write(tables_path, TableDataService.serialize(table_data))
+        return tables_path
+
+    def _save_page(
+        self,
+        html_content: str,
+        request: PageGenerationRequest,
+        minification_pool: Optional[MinificationPool] = None,
+    ) -> Tuple[str, Optional[int]]:
         """
         Save the HTML page to disk.
 
+        The page is written atomically; during a buffered run the write
+        completes in the background.
+
         Args:
             html_content: Rendered HTML content
             request: Page generation request
+            minification_pool: If given, the page is minified in a worker
+                process and written once minification completes
 
         Returns:
-            Path to the saved file
+            Path to the saved file and its size in bytes, or None for the
+            size if the page is still being minified
         """
         # Generate output filename
         from .file_service import FileService
@@ -357,10 +460,50 @@ class PageGenerationOrchestrator:
         output_path = self.types_dir / output_filename
 
         # Write HTML file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        writer = get_output_writer()
+        if minification_pool is not None:
+            minification_pool.submit(
+                html_content,
+                lambda minified: writer.write(output_path, minified),
+                minify_js=True,
+            )
+            return str(output_path), None
+
+        file_size = writer.write(output_path, html_content)
 
-        return str(output_path)
+        return str(output_path), file_size
+
+    def _record_output_files(
+        self,
+        request: PageGenerationRequest,
+        context: PageGenerationContext,
+        output_path: str,
+        extra_files: Optional[List[Path]] = None,
+    ):
+        """
+        Record the page and its eyemaps in the output manifest.
+
+        Args:
+            request: Page generation request
+            context: Generation context holding the analysis results
+            output_path: Path of the saved page
+            extra_files: Other files saved for the page, e.g. its table data
+        """
+        files = [Path(output_path), *(extra_files or [])]
+        column_analysis = context.analysis_results.column_analysis or {}
+        for grids in (column_analysis.get("comprehensive_region_grids") or {}).values():
+            for eyemap in grids.values():
+                # Saved eyemaps are linked relative to the types directory;
+                # embedded ones are SVG content and have no file
+                if isinstance(eyemap, str) and eyemap.startswith("../eyemaps/"):
+                    files.append(Path(eyemap[len("../") :]))
+
+        try:
+            self.page_generator.resource_manager.output_manifest.record(
+                request.get_neuron_name(), request.get_soma_side(), files
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record output files for {output_path}: {e}")
 
     def _generate_auxiliary_files(self):
         """Generate auxiliary files like neuron-search.js if needed."""
@@ -6,6 +6,7 @@ PageGenerationOrchestrator architecture.
 """
 
 import logging
+from typing import List
 from ..result import Result, Err
 from ..commands import GeneratePageCommand
 
@@ -65,3 +66,19 @@ class PageGenerationService:
 
         except Exception as e:
             return Err(f"Failed to generate pages: {str(e)}")
+
+    def warm_column_layer_cache(self, neuron_types: List[str]) -> List[str]:
+        """Fill the column layer cache of many neuron types with batched queries.
+
+        Args:
+            neuron_types: Neuron types about to be generated
+
+        Returns:
+            Neuron types whose cache entry was written
+        """
+        data_processing_service = self.generator.data_processing_service
+        if data_processing_service is None:
+            return []
+        return data_processing_service.warm_column_layer_cache(
+            neuron_types, self.connector
+        )
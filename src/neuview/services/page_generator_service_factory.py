@@ -114,6 +114,7 @@ class PageGeneratorServiceFactory:
             output_dir=self.output_dir,
             eyemaps_dir=self.services["eyemaps_dir"],
             save_to_files=True,
+            shard_eyemaps=self.config.output.shard_eyemaps,
         )
         self.services["hexagon_generator"] = EyemapGenerator(config=eyemap_config)
 
@@ -169,6 +170,7 @@ class PageGeneratorServiceFactory:
 
     def _create_analysis_services(self):
         """Create analysis and computation services."""
+        from .dataset_layers_service import DatasetLayersService
         from .layer_analysis_service import LayerAnalysisService
         from .neuron_selection_service import NeuronSelectionService
         from .file_service import FileService
@@ -176,10 +178,17 @@ class PageGeneratorServiceFactory:
         from .youtube_service import YouTubeService
 
         # Initialize service dependencies
-        self.services["layer_analysis_service"] = LayerAnalysisService(self.config)
+        self.services["dataset_layers_service"] = DatasetLayersService(
+            self.cache_manager
+        )
+        self.services["layer_analysis_service"] = LayerAnalysisService(
+            self.config, self.services["dataset_layers_service"]
+        )
         self.services["neuron_selection_service"] = NeuronSelectionService(self.config)
         self.services["file_service"] = FileService()
-        self.services["threshold_service"] = ThresholdService()
+        self.services["threshold_service"] = ThresholdService(
+            cache_manager=self.cache_manager
+        )
         self.services["youtube_service"] = YouTubeService()
 
     def _create_template_environment(self):
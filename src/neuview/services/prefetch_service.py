@@ -0,0 +1,127 @@
+"""
+Prefetch Service for neuView.
+
+This service exports a whole NeuPrint dataset into a local snapshot with a
+small number of paged bulk queries, so that full-site builds can serve every
+neuron type from disk instead of querying NeuPrint type by type.
+"""
+
+import logging
+import time
+
+import pandas as pd
+from neuprint import NeuronCriteria, fetch_neurons
+
+from ..commands import PrefetchCommand
+from ..result import Result, Ok, Err
+from ..snapshot import DatasetSnapshot
+from ..snapshot_connector import default_snapshot_dir
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchService:
+    """Service for exporting a dataset snapshot from NeuPrint."""
+
+    def __init__(self, neuprint_connector, config):
+        """Initialize prefetch service.
+
+        Args:
+            neuprint_connector: Live NeuPrint connector instance
+            config: Configuration object
+        """
+        self.connector = neuprint_connector
+        self.config = config
+
+    async def prefetch(self, command: PrefetchCommand) -> Result[str, str]:
+        """Export neurons, ROI counts, partner attributes and edges to a snapshot."""
+        try:
+            start_time = time.time()
+            snapshot_dir = command.snapshot_dir or default_snapshot_dir(self.config)
+            snapshot = DatasetSnapshot(snapshot_dir)
+
+            body_ids = self._fetch_typed_body_ids()
+            if not body_ids:
+                return Err("No typed neurons found in dataset")
+
+            neuron_pages, roi_pages, partner_pages, edge_pages = [], [], [], []
+            for page_start in range(0, len(body_ids), command.page_size):
+                page = body_ids[page_start : page_start + command.page_size]
+                logger.info(
+                    f"Prefetching neurons {page_start + 1}-{page_start + len(page)} "
+                    f"of {len(body_ids)}"
+                )
+                neurons_df, roi_df = self._fetch_neuron_page(page)
+                neuron_pages.append(neurons_df)
+                roi_pages.append(roi_df)
+                partner_pages.append(self._fetch_partner_page(page))
+                edge_pages.append(self._fetch_edge_page(page))
+
+            tables = {
+                "neurons": _concat(neuron_pages),
+                "rois": _concat(roi_pages),
+                "partners": _concat(partner_pages),
+                "edges": _concat(edge_pages),
+            }
+
+            manifest = snapshot.write(
+                tables,
+                self.connector._get_roi_hierarchy(),
+                {
+                    "server": self.config.neuprint.server,
+                    "dataset": self.config.neuprint.dataset,
+                    "uuid": self.connector.test_connection().get("version"),
+                    "page_size": command.page_size,
+                },
+            )
+
+            elapsed = time.time() - start_time
+            counts = ", ".join(
+                f"{info['rows']} {name}" for name, info in manifest["tables"].items()
+            )
+            return Ok(f"Wrote snapshot to {snapshot_dir} ({counts}) in {elapsed:.1f}s")
+
+        except Exception as e:
+            logger.error(f"Prefetch failed: {e}")
+            return Err(f"Prefetch failed: {str(e)}")
+
+    def _fetch_typed_body_ids(self) -> list:
+        """Fetch the body IDs of all neurons that have a type."""
+        query = """
+        MATCH (n:Neuron)
+        WHERE n.type IS NOT NULL
+        RETURN n.bodyId as bodyId
+        ORDER BY bodyId
+        """
+        result = self.connector.client.fetch_custom(query)
+        return result["bodyId"].tolist() if not result.empty else []
+
+    def _fetch_neuron_page(self, body_ids: list) -> tuple:
+        """Fetch neuron properties, neurotransmitter fields and ROI counts."""
+        neurons_df, roi_df = fetch_neurons(
+            NeuronCriteria(bodyId=body_ids), client=self.connector.client
+        )
+        if not neurons_df.empty:
+            nt_df = self.connector._fetch_neurotransmitter_data(body_ids)
+            if not nt_df.empty:
+                neurons_df = neurons_df.merge(nt_df, on="bodyId", how="left")
+        return neurons_df, roi_df
+
+    def _fetch_partner_page(self, body_ids: list) -> pd.DataFrame:
+        """Fetch the type, soma side and neurotransmitter shown for partners."""
+        return self.connector._fetch_partner_metadata(body_ids)
+
+    def _fetch_edge_page(self, body_ids: list) -> pd.DataFrame:
+        """Fetch outgoing body-level connections to typed partners."""
+        query = f"""
+        MATCH (a:Neuron)-[c:ConnectsTo]->(b:Neuron)
+        WHERE a.bodyId IN {body_ids} AND b.type IS NOT NULL
+        RETURN a.bodyId as source, b.bodyId as target, c.weight as weight
+        """
+        return self.connector.client.fetch_custom(query)
+
+
+def _concat(pages: list) -> pd.DataFrame:
+    """Concatenate non-empty result pages."""
+    pages = [page for page in pages if page is not None and not page.empty]
+    return pd.concat(pages, ignore_index=True) if pages else pd.DataFrame()
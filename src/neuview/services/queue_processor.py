@@ -7,14 +7,19 @@ and executing queued generation commands.
 
 import logging
 from pathlib import Path
+from typing import List, Optional
 import yaml
 
 from ..result import Result, Ok, Err
 from ..commands import PopCommand, GeneratePageCommand
 from ..models import NeuronTypeName
+from .data_processing_service import COLUMN_LAYER_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Marker next to a queue file whose type one process warms the cache for
+WARM_MARKER_SUFFIX = ".warming"
+
 
 class QueueProcessor:
     """Service for handling processing of queue files."""
@@ -80,11 +85,22 @@ class QueueProcessor:
                     minify=command.minify,
                 )
 
+                # Warm the column layer cache of the pending queue batch too,
+                # leaving out files another pop has already reserved
+                warm_types = (
+                    [options["neuron-type"]]
+                    if self._reserve_for_warming(yaml_file)
+                    else []
+                ) + self._reserve_pending_queue_types(
+                    queue_dir, stored_config_file, COLUMN_LAYER_BATCH_SIZE - 1
+                )
+
                 # Process the command
                 result = await self._process_generate_command(
-                    generate_command, stored_config_file
+                    generate_command, stored_config_file, warm_types
                 )
 
+                yaml_file.with_suffix(WARM_MARKER_SUFFIX).unlink(missing_ok=True)
                 if result.is_ok():
                     # Success - delete the lock file
                     lock_file.unlink()
@@ -98,6 +114,7 @@ class QueueProcessor:
 
             except Exception as e:
                 # Any error during processing - rename back to .yaml
+                yaml_file.with_suffix(WARM_MARKER_SUFFIX).unlink(missing_ok=True)
                 if lock_file.exists():
                     lock_file.rename(yaml_file)
                 raise e
@@ -105,13 +122,68 @@ class QueueProcessor:
         except Exception as e:
             return Err(f"Failed to pop queue: {str(e)}")
 
+    def _reserve_pending_queue_types(
+        self, queue_dir: Path, stored_config_file: Optional[str], limit: int
+    ) -> List[str]:
+        """
+        Reserve unclaimed queue files using the same config for cache warming.
+
+        Concurrent pops see the same unclaimed files in the same order, so
+        each file is reserved for the warming batch of one process only.
+
+        Args:
+            queue_dir: Queue directory
+            stored_config_file: Config file of the claimed queue file
+            limit: Maximum number of types to return
+
+        Returns:
+            Neuron types of the files reserved by this process
+        """
+        neuron_types = []
+        for yaml_file in sorted(queue_dir.glob("*.yaml")):
+            if len(neuron_types) >= limit:
+                break
+            try:
+                with open(yaml_file, "r") as f:
+                    queue_data = yaml.safe_load(f)
+                if queue_data.get("config_file") != stored_config_file:
+                    continue
+                if self._reserve_for_warming(yaml_file):
+                    neuron_types.append(queue_data["options"]["neuron-type"])
+            except Exception:
+                # Claimed by another process or not a valid queue file
+                continue
+        return neuron_types
+
+    def _reserve_for_warming(self, yaml_file: Path) -> bool:
+        """
+        Reserve a queue file's type for this process's cache warming.
+
+        The marker is created exclusively and removed when the queue file is
+        processed.
+
+        Args:
+            yaml_file: Queue file (claimed or unclaimed)
+
+        Returns:
+            True if this process reserved the file, False if another one did
+        """
+        try:
+            yaml_file.with_suffix(WARM_MARKER_SUFFIX).touch(exist_ok=False)
+            return True
+        except FileExistsError:
+            return False
+
     async def _process_generate_command(
-        self, generate_command: GeneratePageCommand, stored_config_file: str = None
+        self,
+        generate_command: GeneratePageCommand,
+        stored_config_file: str = None,
+        warm_types: Optional[List[str]] = None,
     ) -> Result[str, str]:
         """Process a generate command from the queue."""
         try:
             # Get page service from container (we need access to it)
-            from ..neuprint_connector import NeuPrintConnector
+            from ..snapshot_connector import create_connector
             from ..config import Config
             from ..page_generator import PageGenerator
 
@@ -122,7 +194,7 @@ class QueueProcessor:
                 config = self.config
 
             # Create services with the appropriate config
-            connector = NeuPrintConnector(config)
+            connector = create_connector(config)
 
             # Create queue service to check for queued neuron types
             from ..core_services import QueueService
@@ -143,6 +215,9 @@ class QueueProcessor:
 
             page_service = PageGenerationService(connector, generator, config)
 
+            if warm_types:
+                page_service.warm_column_layer_cache(warm_types)
+
             # Generate the page
             result = await page_service.generate_page(generate_command)
             return result
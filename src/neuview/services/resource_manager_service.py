@@ -12,6 +12,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 from .neuroglancer_js_service import NeuroglancerJSService
+from .output_manifest_service import OutputManifestService
+from .static_bundle_service import get_static_bundles
+from .table_data_service import TABLE_DATA_SUFFIX
 from ..utils import get_templates_dir, get_static_dir, get_project_root
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,7 @@ class ResourceManagerService:
         self.output_dir = output_dir
         self._jinja_env = jinja_env
         self._neuroglancer_js_service = None
+        self._output_manifest = None
         # Use built-in template directory
         self.template_dir = get_templates_dir()
 
@@ -45,6 +49,13 @@ class ResourceManagerService:
             logger.debug("Neuroglancer JS service created lazily")
         return self._neuroglancer_js_service
 
+    @property
+    def output_manifest(self) -> OutputManifestService:
+        """Lazy property for the manifest of generated files per neuron type."""
+        if self._output_manifest is None:
+            self._output_manifest = OutputManifestService(self.output_dir)
+        return self._output_manifest
+
     @neuroglancer_js_service.setter
     def neuroglancer_js_service(self, value):
         """Setter for neuroglancer JS service property."""
@@ -116,6 +127,7 @@ class ResourceManagerService:
         This includes:
         - CSS files from static/css/
         - JS files from static/js/ (with selective copying)
+        - Content-hashed JS bundles from static/js/bundles/
         - Generated neuroglancer-url-generator.js
         - Images and other assets from static/images/ and other subdirectories
         - LICENSE file from static/
@@ -173,6 +185,9 @@ class ResourceManagerService:
                 else:
                     logger.debug("JS files already exist, skipping copy")
 
+            # Publish the shared JavaScript bundles under content-hashed names
+            get_static_bundles().write_bundles(directories["js"])
+
             # Generate neuroglancer JavaScript file with dynamic template selection
             generated_file = output_js_dir / "neuroglancer-url-generator.js"
             if force_copy or not generated_file.exists():
@@ -339,6 +354,10 @@ class ResourceManagerService:
             "js/neuron-page.js",
             "js/neuroglancer-url-generator.js",
         ]
+        bundles = get_static_bundles()
+        essential_files.extend(
+            f"js/{bundles.hashed_name(name)}" for name in bundles.bundle_names()
+        )
 
         for file_path in essential_files:
             full_path = output_static_dir / file_path
@@ -513,6 +532,10 @@ class ResourceManagerService:
         """
         Clean dynamic files that should be regenerated (HTML pages and eyemaps).
 
+        Files of a single neuron type are looked up in the output manifest, so
+        only that type's files are touched. Types without a manifest (output
+        from older versions) fall back to scanning the output directories.
+
         Args:
             neuron_type: If specified, only clean files for this neuron type
             soma_side: If specified, only clean files for this soma side
@@ -521,6 +544,16 @@ class ResourceManagerService:
             True if successful, False otherwise
         """
         try:
+            if neuron_type and self.output_manifest.load(neuron_type) is not None:
+                for relative_path in self.output_manifest.remove(
+                    neuron_type, soma_side
+                ):
+                    file_path = self.output_dir / relative_path
+                    if file_path.exists():
+                        file_path.unlink()
+                        logger.debug(f"Removed file: {relative_path}")
+                return True
+
             directories = self.setup_output_directories()
 
             # Clean HTML pages in types directory
@@ -538,10 +571,11 @@ class ResourceManagerService:
                         html_file.unlink()
                         logger.debug(f"Removed HTML file: {html_file.name}")
                 else:
-                    # Clean all HTML files
-                    for html_file in types_dir.glob("*.html"):
-                        html_file.unlink()
-                        logger.debug(f"Removed HTML file: {html_file.name}")
+                    # Clean all HTML files and their lazy table data
+                    for pattern in ("*.html", f"*{TABLE_DATA_SUFFIX}"):
+                        for html_file in types_dir.glob(pattern):
+                            html_file.unlink()
+                            logger.debug(f"Removed HTML file: {html_file.name}")
 
             # Clean eyemap images
             eyemaps_dir = directories["eyemaps"]
@@ -557,12 +591,15 @@ class ResourceManagerService:
                         eyemap_file.unlink()
                         logger.debug(f"Removed eyemap file: {eyemap_file.name}")
                 else:
-                    # Clean all eyemap files
-                    for eyemap_file in eyemaps_dir.glob("*"):
+                    # Clean all eyemap files, including sharded ones
+                    for eyemap_file in eyemaps_dir.rglob("*"):
                         if eyemap_file.is_file():
                             eyemap_file.unlink()
                             logger.debug(f"Removed eyemap file: {eyemap_file.name}")
 
+            if not neuron_type:
+                self.output_manifest.clear()
+
             return True
 
         except Exception as e:
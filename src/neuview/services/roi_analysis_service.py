@@ -533,23 +533,7 @@ class ROIAnalysisService:
 
         try:
             # Optimized query for specific neuron type only
-            escaped_type = connector._escape_for_cypher_string(neuron_type)
-            query = f"""
-                MATCH (n:Neuron)
-                WHERE n.type = "{escaped_type}" AND n.roiInfo IS NOT NULL
-                WITH n, apoc.convert.fromJsonMap(n.roiInfo) as roiData
-                UNWIND keys(roiData) as roiName
-                WITH roiName, roiData[roiName] as roiInfo
-                WHERE roiName =~ '^(ME|LO|LOP)_[RL]_col_[A-Za-z0-9]+_[A-Za-z0-9]+$'
-                AND (roiInfo.pre > 0 OR roiInfo.post > 0)
-                WITH roiName,
-                     SUM(COALESCE(roiInfo.pre, 0)) as total_pre,
-                     SUM(COALESCE(roiInfo.post, 0)) as total_post
-                RETURN roiName as roi, total_pre as pre, total_post as post
-                ORDER BY roi
-            """
-
-            result = connector.client.fetch_custom(query)
+            result = connector.fetch_column_roi_totals(neuron_type)
             query_time = time.time() - start_time
 
             if result is None or result.empty:
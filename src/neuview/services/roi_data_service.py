@@ -12,6 +12,8 @@ from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 import time
 
+from .output_writer_service import atomic_write
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,8 +91,7 @@ class ROIDataService:
 
             # Cache the result
             try:
-                with open(cache_file, "w") as f:
-                    json.dump(data, f, indent=2)
+                atomic_write(cache_file, json.dumps(data, indent=2))
                 logger.debug(f"Cached ROI data to: {cache_filename}")
             except IOError as e:
                 logger.warning(f"Failed to cache data to {cache_filename}: {e}")
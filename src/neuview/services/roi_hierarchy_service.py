@@ -9,6 +9,13 @@ from pathlib import Path
 import json
 import time
 
+from ..roi_hierarchy_index import (
+    RoiHierarchyIndex,
+    clean_roi_name,
+    get_roi_hierarchy_index,
+)
+from .output_writer_service import atomic_write
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,35 +31,7 @@ class ROIHierarchyService:
 
     def _clean_roi_name(self, roi_name: str) -> str:
         """Remove (R), (L), _R, _L suffixes from ROI names to merge left/right regions."""
-        import re
-
-        # Remove (R), (L), or (M) suffixes from ROI names (parenthetical format)
-        cleaned = re.sub(r"\s*\([RLM]\)$", "", roi_name)
-
-        # Also remove _R, _L, or _M suffixes from ROI names (underscore format)
-        # This handles FAFB patterns like OL_R and OL_L, treating them both as "OL"
-        cleaned = re.sub(r"_[RLM]$", "", cleaned)
-
-        return cleaned.strip()
-
-    def _find_roi_parent_recursive(
-        self, target_roi: str, current_dict: dict, parent_name: str = ""
-    ) -> str:
-        """Recursively search for ROI in hierarchy and return its parent."""
-        for key, value in current_dict.items():
-            cleaned_key = self._clean_roi_name(key.rstrip("*"))  # Remove stars too
-
-            # If we found our target ROI, return the parent
-            if cleaned_key == target_roi:
-                return parent_name
-
-            # If this is a dictionary, search recursively
-            if isinstance(value, dict):
-                result = self._find_roi_parent_recursive(target_roi, value, cleaned_key)
-                if result:
-                    return result
-
-        return ""
+        return clean_roi_name(roi_name)
 
     def get_roi_hierarchy_cached(self, connector, output_dir=None):
         """Get ROI hierarchy with persistent caching to avoid repeated expensive fetches."""
@@ -112,12 +91,10 @@ class ROIHierarchyService:
                 self._roi_parent_cache[roi_name] = ""
                 return ""
 
-            # Clean the ROI name first (remove (R), (L), (M) suffixes)
-            cleaned_roi = self._clean_roi_name(roi_name)
-
-            # Search recursively for the ROI and its parent
-            parent = self._find_roi_parent_recursive(cleaned_roi, hierarchy)
-            result = parent if parent else ""
+            # Clean the ROI name first (remove (R), (L), (M) suffixes) and look
+            # up its parent in the flattened hierarchy
+            index = get_roi_hierarchy_index(hierarchy)
+            result = index.parent(index.clean_name(roi_name))
 
             # Cache the result
             self._roi_parent_cache[roi_name] = result
@@ -127,6 +104,10 @@ class ROIHierarchyService:
             self._roi_parent_cache[roi_name] = ""
             return ""
 
+    def get_roi_hierarchy_index(self, connector) -> RoiHierarchyIndex:
+        """Get the shared flattened index of the cached ROI hierarchy."""
+        return get_roi_hierarchy_index(self.get_roi_hierarchy_cached(connector))
+
     def _load_persistent_roi_cache(self):
         """Load ROI hierarchy from persistent cache file."""
         try:
@@ -162,8 +143,7 @@ class ROIHierarchyService:
 
             cache_data = {"hierarchy": hierarchy, "timestamp": time.time()}
 
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            atomic_write(cache_path, json.dumps(cache_data, indent=2))
 
             logger.info(f"Saved ROI hierarchy to persistent cache: {cache_path}")
 
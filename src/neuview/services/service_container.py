@@ -57,9 +57,9 @@ class ServiceContainer:
         """Get or create NeuPrint connector."""
 
         def create():
-            from ..neuprint_connector import NeuPrintConnector
+            from ..snapshot_connector import create_connector
 
-            return NeuPrintConnector(self.config)
+            return create_connector(self.config)
 
         return self._get_or_create_service("neuprint_connector", create)
 
@@ -245,6 +245,30 @@ class ServiceContainer:
 
         return self._get_or_create_service("connection_service", create)
 
+    @property
+    def prefetch_service(self):
+        """Get or create prefetch service."""
+
+        def create():
+            from ..neuprint_connector import NeuPrintConnector
+            from .prefetch_service import PrefetchService
+
+            # Prefetch always reads from the live server, never from a snapshot
+            return PrefetchService(NeuPrintConnector(self.config), self.config)
+
+        return self._get_or_create_service("prefetch_service", create)
+
+    @property
+    def connectome_index_service(self):
+        """Get or create connectome index service."""
+
+        def create():
+            from .connectome_index_service import ConnectomeIndexService
+
+            return ConnectomeIndexService(self.neuprint_connector, self.config)
+
+        return self._get_or_create_service("connectome_index_service", create)
+
     @property
     def queue_file_manager(self):
         """Get or create queue file manager."""
@@ -5,10 +5,13 @@ This service handles auto-detection of soma sides and multi-page generation
 using the modern PageGenerationRequest workflow.
 """
 
+import asyncio
 import logging
 from ..result import Result, Ok, Err
 from ..commands import GeneratePageCommand
 from ..models.page_generation import PageGenerationRequest
+from ..tracing import trace_span
+from ..type_bundle import TypeBundle
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +52,13 @@ class SomaDetectionService:
             self.generator.clean_dynamic_files_for_neuron(neuron_type_name)
             logger.debug(f"Cleaned dynamic files for neuron type: {neuron_type_name}")
 
+            # The type's data is computed once per soma side and shared by
+            # every stage below
+            bundle = self.connector.get_type_bundle(neuron_type_name)
+
             # First check if data exists using modern statistics service
             has_data_result = await self.neuron_statistics_service.has_data(
-                neuron_type_name
+                neuron_type_name, bundle
             )
             if has_data_result.is_err():
                 return Err(has_data_result.unwrap_err())
@@ -62,7 +69,7 @@ class SomaDetectionService:
             # Get soma side distribution
             soma_dist_result = (
                 await self.neuron_statistics_service.get_soma_side_distribution(
-                    neuron_type_name
+                    neuron_type_name, bundle
                 )
             )
             if soma_dist_result.is_err():
@@ -100,58 +107,51 @@ class SomaDetectionService:
                 if sides_with_data == 1 and unknown_count == 0:
                     should_generate_combined = False
 
-                if should_generate_combined:
-                    combined_result = await self._generate_page_for_soma_side(
-                        command, neuron_type_name, "combined", None
-                    )
-                    if combined_result.is_ok():
-                        generated_files.append(combined_result.unwrap())
-                        logger.info(
-                            f"Generated general page: {combined_result.unwrap()}"
-                        )
-                    else:
-                        logger.warning(
-                            f"Failed to generate combined page: {combined_result.unwrap_err()}"
+                sides = ["combined"] if should_generate_combined else []
+                sides += [
+                    side
+                    for side, count in [
+                        ("left", left_count),
+                        ("right", right_count),
+                        ("middle", middle_count),
+                    ]
+                    if count > 0
+                ]
+
+                # The type's raw data is loaded by the soma side distribution
+                # above, so the side pages are independent and are generated
+                # concurrently on worker threads. The persistent cache is
+                # saved on the event loop meanwhile.
+                *side_results, _ = await asyncio.gather(
+                    *[
+                        self._generate_page_for_soma_side(
+                            command, neuron_type_name, side, bundle
                         )
+                        for side in sides
+                    ],
+                    self._save_to_persistent_cache(bundle, command),
+                )
 
-                # Generate side-specific pages
-                for side, count in [
-                    ("left", left_count),
-                    ("right", right_count),
-                    ("middle", middle_count),
-                ]:
-                    if count > 0:
-                        side_result = await self._generate_page_for_soma_side(
-                            command, neuron_type_name, side, None
-                        )
-                        if side_result.is_ok():
-                            generated_files.append(side_result.unwrap())
+                for side, side_result in zip(sides, side_results):
+                    if side_result.is_ok():
+                        generated_files.append(side_result.unwrap())
+                        if side == "combined":
                             logger.info(
-                                f"Generated {side.upper()} page: {side_result.unwrap()}"
+                                f"Generated general page: {side_result.unwrap()}"
                             )
                         else:
-                            logger.warning(
-                                f"Failed to generate {side} page: {side_result.unwrap_err()}"
+                            logger.info(
+                                f"Generated {side.upper()} page: {side_result.unwrap()}"
                             )
-
-                # Save to persistent cache for index generation (using combined data)
-                try:
-                    combined_data = self.connector.get_neuron_data(
-                        neuron_type_name, "combined"
-                    )
-                    if self.cache_service:
-                        await self.cache_service.save_neuron_data_to_cache(
-                            neuron_type_name, combined_data, command, self.connector
+                    else:
+                        logger.warning(
+                            f"Failed to generate {side} page: {side_result.unwrap_err()}"
                         )
-                except Exception as e:
-                    logger.warning(f"Failed to save to cache: {e}")
 
-                # Log cache performance before clearing
+                # Log cache performance; the connector's data cache stays
+                # within its memory budget, so the raw data is kept for reuse
                 self.connector.log_cache_performance()
 
-                # Clear cache after successful generation to free memory
-                self.connector.clear_neuron_data_cache(neuron_type_name)
-
                 if not generated_files:
                     return Err(f"No pages could be generated for {neuron_type_name}")
 
@@ -167,20 +167,46 @@ class SomaDetectionService:
         except Exception as e:
             return Err(f"Failed to generate pages with auto-detection: {str(e)}")
 
+    async def _save_to_persistent_cache(
+        self, bundle: TypeBundle, command: GeneratePageCommand
+    ):
+        """Save the combined data of a type to the persistent cache for index generation."""
+        try:
+            if self.cache_service:
+                await self.cache_service.save_neuron_data_to_cache(
+                    bundle.neuron_type,
+                    bundle.neuron_data("combined"),
+                    command,
+                    self.connector,
+                )
+        except Exception as e:
+            logger.warning(f"Failed to save to cache: {e}")
+
     async def _generate_page_for_soma_side(
         self,
         command: GeneratePageCommand,
         neuron_type_name: str,
         soma_side: str,
-        neuron_data: dict,
+        bundle: TypeBundle,
+    ) -> Result[str, str]:
+        """Generate a single page for a specific soma side on a worker thread."""
+        return await asyncio.to_thread(
+            self._generate_side_page, command, neuron_type_name, soma_side, bundle
+        )
+
+    def _generate_side_page(
+        self,
+        command: GeneratePageCommand,
+        neuron_type_name: str,
+        soma_side: str,
+        bundle: TypeBundle,
     ) -> Result[str, str]:
         """Generate a single page for a specific soma side using modern workflow."""
         try:
             # Get neuron data for the specific soma side
             try:
-                soma_side_data = self.connector.get_neuron_data(
-                    neuron_type_name, soma_side
-                )
+                with trace_span(f"{neuron_type_name} ({soma_side})", "data"):
+                    soma_side_data = bundle.neuron_data(soma_side)
             except Exception as e:
                 return Err(
                     f"Failed to fetch neuron data for {neuron_type_name} ({soma_side}): {str(e)}"
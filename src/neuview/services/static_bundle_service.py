@@ -0,0 +1,129 @@
+"""
+Static Bundle Service for neuView.
+
+JavaScript that is the same on every page (the global feedback button, the
+neuron page table setup and the eyemap tooltip code) lives in
+``static/js/bundles/`` instead of being inlined into every page and SVG. Each
+bundle is published as ``static/js/<name>.<hash>.js``, where the hash is
+taken from the bundle's content, so browsers can cache it indefinitely and a
+changed bundle gets a new URL. Pages only inline the data specific to them.
+
+Bundle names depend only on the bundle sources, so every process (e.g.
+parallel ``pop`` workers) computes the same names without coordination.
+"""
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..utils import get_static_dir
+from .output_writer_service import get_output_writer
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_SOURCE_SUBDIRECTORY = "js/bundles"
+BUNDLE_HASH_LENGTH = 10
+
+
+class StaticBundleService:
+    """Publishes shared JavaScript bundles under content-hashed file names."""
+
+    def __init__(self, source_dir: Optional[Path] = None):
+        """
+        Initialize the bundle service.
+
+        Args:
+            source_dir: Directory containing the bundle sources
+                (default: static/js/bundles)
+        """
+        self.source_dir = (
+            Path(source_dir)
+            if source_dir is not None
+            else get_static_dir() / BUNDLE_SOURCE_SUBDIRECTORY
+        )
+        self._hashed_names: Dict[str, str] = {}
+
+    def bundle_names(self) -> List[str]:
+        """Names of all bundle sources."""
+        if not self.source_dir.exists():
+            return []
+        return sorted(path.name for path in self.source_dir.glob("*.js"))
+
+    def hashed_name(self, name: str) -> str:
+        """
+        Get the published file name of a bundle.
+
+        Args:
+            name: Bundle source name, e.g. "eyemap.js"
+
+        Returns:
+            File name including the content hash, e.g. "eyemap.1a2b3c4d5e.js"
+
+        Raises:
+            FileNotFoundError: If the bundle source does not exist
+        """
+        hashed = self._hashed_names.get(name)
+        if hashed is None:
+            content = (self.source_dir / name).read_bytes()
+            digest = hashlib.sha256(content).hexdigest()[:BUNDLE_HASH_LENGTH]
+            hashed = f"{Path(name).stem}.{digest}.js"
+            self._hashed_names[name] = hashed
+        return hashed
+
+    def url(self, name: str, prefix: str = "") -> str:
+        """
+        Get the URL of a bundle relative to a page.
+
+        Args:
+            name: Bundle source name
+            prefix: Path from the page to the output directory, e.g. "../"
+
+        Returns:
+            Relative URL of the published bundle
+        """
+        return f"{prefix}static/js/{self.hashed_name(name)}"
+
+    def write_bundles(self, js_dir: Path) -> List[Path]:
+        """
+        Publish all bundles to an output JS directory.
+
+        Bundles that already exist are up to date, since their name contains
+        the content hash. Older versions of the bundles are removed.
+
+        Args:
+            js_dir: Output static/js directory
+
+        Returns:
+            Paths of the bundles that were written
+        """
+        written = []
+        for name in self.bundle_names():
+            hashed = self.hashed_name(name)
+            target = js_dir / hashed
+            if not target.exists():
+                get_output_writer().write(target, (self.source_dir / name).read_bytes())
+                written.append(target)
+                logger.debug(f"Published static bundle {hashed}")
+
+            stem = Path(name).stem
+            stale_pattern = re.compile(
+                rf"{re.escape(stem)}\.[0-9a-f]{{{BUNDLE_HASH_LENGTH}}}\.js"
+            )
+            for path in js_dir.glob(f"{stem}.*.js"):
+                if path.name != hashed and stale_pattern.fullmatch(path.name):
+                    path.unlink(missing_ok=True)
+                    logger.debug(f"Removed outdated static bundle {path.name}")
+        return written
+
+
+_shared_bundles: Optional[StaticBundleService] = None
+
+
+def get_static_bundles() -> StaticBundleService:
+    """Get the process-wide bundle service."""
+    global _shared_bundles
+    if _shared_bundles is None:
+        _shared_bundles = StaticBundleService()
+    return _shared_bundles
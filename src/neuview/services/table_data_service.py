@@ -0,0 +1,137 @@
+"""
+Table Data Service for neuView.
+
+With ``output.lazy_tables`` enabled, the ROI innervation and connectivity
+tables of a neuron page are not rendered as HTML rows. Their rows are written
+to a compact JSON file next to the page (``types/<page>.tables.json``) and
+DataTables builds the rows in the browser. This keeps large partner tables
+out of page rendering and HTML minification.
+
+Each row is a list of cells. A cell is its HTML content, or a pair of
+content and the attributes of the ``<td>`` (classes, titles, body IDs) when
+it has any. The cells are rendered by the same macros as the server-rendered
+tables (``roi_innervation_cells`` and ``partner_cells`` in macros.html.jinja),
+so both modes display identical tables.
+"""
+
+import json
+import logging
+import re
+from html import unescape
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TABLE_DATA_SUFFIX = ".tables.json"
+
+Cell = Union[str, List[Any]]
+
+# The row macros render one <td> per cell with quoted attributes
+_CELL_PATTERN = re.compile(r"<td(?P<attrs>[^>]*)>(?P<content>.*?)</td>", re.DOTALL)
+_ATTRIBUTE_PATTERN = re.compile(r"""([\w-]+)=(["'])(.*?)\2""", re.DOTALL)
+
+
+class TableDataService:
+    """Builds the row data of lazily loaded neuron page tables."""
+
+    def __init__(self, jinja_env):
+        """
+        Initialize the table data service.
+
+        Args:
+            jinja_env: Jinja2 environment providing the table row macros
+        """
+        self.env = jinja_env
+        self._macros = jinja_env.get_template("macros.html.jinja").module
+
+    @staticmethod
+    def table_data_filename(page_filename: str) -> str:
+        """
+        Get the name of the table data file of a page.
+
+        Args:
+            page_filename: Page file name, e.g. "Mi1_L.html"
+
+        Returns:
+            Table data file name, e.g. "Mi1_L.tables.json"
+        """
+        stem = (
+            page_filename[: -len(".html")]
+            if page_filename.endswith(".html")
+            else page_filename
+        )
+        return f"{stem}{TABLE_DATA_SUFFIX}"
+
+    def build_table_data(self, template_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the rows and cumulative percentage data of all page tables.
+
+        Args:
+            template_context: Context the neuron page is rendered with
+
+        Returns:
+            Dictionary with the rows and precise percentages of the ROI,
+            upstream and downstream tables
+        """
+        roi_summary = template_context.get("roi_summary") or []
+        connectivity = template_context.get("connectivity") or {}
+        connected_bids = template_context.get("connected_bids")
+        upstream = connectivity.get("upstream") or []
+        downstream = connectivity.get("downstream") or []
+
+        return {
+            "roiRows": [self._roi_row(roi) for roi in roi_summary],
+            "roiInputPreciseData": [
+                round(roi["post_percentage"], 5) for roi in roi_summary
+            ],
+            "roiOutputPreciseData": [
+                round(roi["pre_percentage"], 5) for roi in roi_summary
+            ],
+            "upstreamRows": [
+                self._partner_row(partner, "upstream", connected_bids)
+                for partner in upstream
+            ],
+            "upstreamPreciseData": [
+                round(partner.get("percentage", 0), 5) for partner in upstream
+            ],
+            "downstreamRows": [
+                self._partner_row(partner, "downstream", connected_bids)
+                for partner in downstream
+            ],
+            "downstreamPreciseData": [
+                round(partner.get("percentage", 0), 5) for partner in downstream
+            ],
+        }
+
+    @staticmethod
+    def serialize(table_data: Dict[str, Any]) -> str:
+        """Serialize table data as compact JSON."""
+        return json.dumps(table_data, separators=(",", ":"), ensure_ascii=False)
+
+    def _roi_row(self, roi: Dict[str, Any]) -> List[Cell]:
+        """Cells of one ROI innervation row."""
+        return _split_cells(self._macros.roi_innervation_cells(roi))
+
+    def _partner_row(
+        self,
+        partner: Dict[str, Any],
+        direction: str,
+        connected_bids: Optional[Dict[str, Any]],
+    ) -> List[Cell]:
+        """Cells of one partner row."""
+        return _split_cells(
+            self._macros.partner_cells(partner, direction, connected_bids)
+        )
+
+
+def _split_cells(html: str) -> List[Cell]:
+    """Split the ``<td>`` elements rendered by a row macro into cells."""
+    cells: List[Cell] = []
+    for match in _CELL_PATTERN.finditer(str(html)):
+        content = match.group("content").strip()
+        attributes = {
+            name: unescape(value)
+            for name, _, value in _ATTRIBUTE_PATTERN.findall(match.group("attrs"))
+        }
+        cells.append([content, attributes] if attributes else content)
+    return cells
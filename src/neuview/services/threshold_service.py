@@ -17,6 +17,20 @@ from .threshold_config import get_threshold_config, ThresholdConfig, ThresholdMe
 
 logger = logging.getLogger(__name__)
 
+# Version of the threshold computation; part of every cache key
+THRESHOLD_CACHE_VERSION = 1
+
+# Columns compute_thresholds() reads, and therefore fingerprints
+_FINGERPRINT_COLUMNS = (
+    "hex1",
+    "hex2",
+    "layer",
+    "side",
+    "region",
+    "total_synapses",
+    "bodyId",
+)
+
 
 class ThresholdService:
     """
@@ -27,15 +41,18 @@ class ThresholdService:
     for multiple calculation methods and configuration-driven behavior.
     """
 
-    def __init__(self, config: Optional[ThresholdConfig] = None):
+    def __init__(self, config: Optional[ThresholdConfig] = None, cache_manager=None):
         """
         Initialize the threshold service.
 
         Args:
             config: Optional threshold configuration. If None, uses global config.
+            cache_manager: Optional cache manager used to persist computed
+                thresholds across runs
         """
         self.config = config or get_threshold_config()
-        self._cache: Dict[str, Tuple[List[float], str]] = {}
+        self.cache_manager = cache_manager
+        self._cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
         self._cache_enabled = True
 
     def enable_cache(self, enabled: bool = True) -> None:
@@ -54,6 +71,7 @@ class ThresholdService:
         n_bins: int = 5,
         method: str = "linear",
         profile_name: Optional[str] = None,
+        persist: bool = True,
     ) -> Dict[str, Any]:
         """
         Compute threshold lists for synapse and neuron counts at different aggregation levels.
@@ -75,6 +93,10 @@ class ThresholdService:
             Threshold calculation method. Default is 'linear'.
         profile_name : str, optional
             Name of threshold profile to use for configuration.
+        persist : bool, optional
+            Whether to save computed thresholds through the cache manager.
+            Callers that store the thresholds with their own cached data
+            pass False. Default is True.
 
         Returns
         -------
@@ -119,10 +141,10 @@ class ThresholdService:
             cache_key = self._create_cache_key(df, n_bins, method)
 
             # Check cache first
-            if self._cache_enabled and cache_key in self._cache:
-                cached_thresholds, timestamp = self._cache[cache_key]
-                logger.debug(f"Using cached thresholds from {timestamp}")
-                return self._deserialize_thresholds(cached_thresholds)
+            if self._cache_enabled:
+                cached_thresholds = self._get_cached_thresholds(cache_key)
+                if cached_thresholds is not None:
+                    return cached_thresholds
 
             # Across all layers - find the max per column across all regions.
             synapse_data = df.groupby(["hex1", "hex2", "side", "region"])[
@@ -173,6 +195,8 @@ class ThresholdService:
                     serialized_thresholds,
                     datetime.now().isoformat(),
                 )
+                if self.cache_manager and persist:
+                    self.cache_manager.save_thresholds(cache_key, serialized_thresholds)
 
             # Update configuration if profile was specified
             if profile_name:
@@ -569,39 +593,54 @@ class ThresholdService:
         }
 
     def _create_cache_key(self, df: pd.DataFrame, n_bins: int, method: str) -> str:
-        """Create a cache key for threshold computation."""
-        # Create a hash based on dataframe shape, columns, and parameters
-        df_signature = f"{df.shape}_{sorted(df.columns)}_{df.dtypes.to_dict()}"
-        params_signature = f"{n_bins}_{method}"
-        combined = f"{df_signature}_{params_signature}"
-        return hashlib.md5(combined.encode()).hexdigest()
-
-    def _serialize_thresholds(self, thresholds: Dict[str, Any]) -> List[float]:
-        """Serialize threshold dictionary to a flat list for caching."""
-        flat_list = []
-        if thresholds.get("total_synapses", {}).get("all"):
-            flat_list.extend(thresholds["total_synapses"]["all"])
-        if thresholds.get("neuron_count", {}).get("all"):
-            flat_list.extend(thresholds["neuron_count"]["all"])
-        # Add layer thresholds
-        for region in ["ME", "LO", "LOP"]:
-            if thresholds.get("total_synapses", {}).get("layers", {}).get(region):
-                flat_list.extend(thresholds["total_synapses"]["layers"][region])
-            if thresholds.get("neuron_count", {}).get("layers", {}).get(region):
-                flat_list.extend(thresholds["neuron_count"]["layers"][region])
-        return flat_list
-
-    def _deserialize_thresholds(self, flat_list: List[float]) -> Dict[str, Any]:
-        """Deserialize flat list back to threshold dictionary structure."""
-        # This is a simplified version - in practice, you'd need to store
-        # metadata about the structure to properly reconstruct
-        thresholds = {
-            "total_synapses": {"all": None, "layers": {}},
-            "neuron_count": {"all": None, "layers": {}},
-        }
-        # For now, return empty structure - implement proper deserialization
-        # based on your specific needs
-        return thresholds
+        """
+        Create a content-addressed cache key for threshold computation.
+
+        The key hashes the values of the columns the thresholds are computed
+        from, so equally shaped frames with different data get different keys
+        and a key stays valid across runs.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{THRESHOLD_CACHE_VERSION}_{n_bins}_{method}".encode())
+        for column in _FINGERPRINT_COLUMNS:
+            if column not in df.columns:
+                continue
+            values = df[column]
+            digest.update(f"_{column}:{values.dtype}:{len(values)}_".encode())
+            if values.dtype.kind in "biuf":
+                # Hash the NumPy buffer of numeric columns directly
+                digest.update(np.ascontiguousarray(values.to_numpy()))
+            else:
+                digest.update(
+                    pd.util.hash_pandas_object(values, index=False).to_numpy()
+                )
+        return digest.hexdigest()
+
+    def _get_cached_thresholds(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get thresholds from the memory cache or the persistent cache."""
+        if cache_key in self._cache:
+            cached_thresholds, timestamp = self._cache[cache_key]
+            logger.debug(f"Using cached thresholds from {timestamp}")
+            return self._deserialize_thresholds(cached_thresholds)
+
+        if self.cache_manager:
+            cached_thresholds = self.cache_manager.load_thresholds(cache_key)
+            if cached_thresholds is not None:
+                self._cache[cache_key] = (
+                    cached_thresholds,
+                    datetime.now().isoformat(),
+                )
+                return self._deserialize_thresholds(cached_thresholds)
+        return None
+
+    def _serialize_thresholds(self, thresholds: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize a threshold dictionary to JSON-compatible values for caching."""
+        return _copy_thresholds(thresholds)
+
+    def _deserialize_thresholds(self, serialized: Dict[str, Any]) -> Dict[str, Any]:
+        """Deserialize cached thresholds into a new threshold dictionary."""
+        # Callers get their own copy, so changing it cannot alter the cache
+        return _copy_thresholds(serialized)
 
     def _update_profile_thresholds(
         self, profile_name: str, thresholds: Dict[str, Any]
@@ -618,3 +657,24 @@ class ThresholdService:
                 )
         except Exception as e:
             logger.warning(f"Failed to update profile thresholds: {e}")
+
+
+def _copy_thresholds(thresholds: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a threshold dictionary with all threshold lists as plain floats."""
+    return {
+        metric: {
+            "all": _float_list(scopes.get("all")),
+            "layers": {
+                region: _float_list(values)
+                for region, values in scopes.get("layers", {}).items()
+            },
+        }
+        for metric, scopes in thresholds.items()
+    }
+
+
+def _float_list(values: Optional[List[Any]]) -> Optional[List[float]]:
+    """Copy a threshold list as plain floats, keeping None."""
+    if values is None:
+        return None
+    return [float(value) for value in values]
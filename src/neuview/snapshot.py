@@ -0,0 +1,303 @@
+"""
+Local columnar snapshot of a NeuPrint dataset.
+
+A snapshot holds every typed neuron, its per-ROI synapse counts, the partner
+attributes used by connectivity tables and the body-level ConnectsTo edges,
+stored as Parquet files next to a JSON manifest. It is written once by
+``neuview prefetch`` and then read by the SnapshotConnector so that page
+generation does not need per-type network queries.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .partner_metadata import PARTNER_RECORD_COLUMNS, PartnerMetadataTable
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetSnapshot:
+    """Read and write a Parquet snapshot of a NeuPrint dataset."""
+
+    FORMAT_VERSION = 1
+    MANIFEST_FILE = "manifest.json"
+    ROI_HIERARCHY_FILE = "roi_hierarchy.json"
+    TABLES = ("neurons", "rois", "partners", "edges")
+    # Tables are stored sorted by these columns so lookups can binary search
+    SORT_KEYS = {"rois": "bodyId", "partners": "bodyId", "edges": "source"}
+
+    def __init__(self, directory):
+        """
+        Initialize the snapshot.
+
+        Args:
+            directory: Directory holding (or receiving) the snapshot files
+        """
+        self.directory = Path(directory)
+        self._manifest = None
+        self._tables = {}
+        self._roi_hierarchy = None
+        self._type_index = None
+        self._roi_body_ids = None
+        self._edge_sources = None
+        self._edge_target_order = None
+        self._edge_targets = None
+        self._partner_lookup = None
+
+    def exists(self) -> bool:
+        """Check whether a complete snapshot manifest is present."""
+        return (self.directory / self.MANIFEST_FILE).exists()
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """Snapshot manifest, loaded on first access."""
+        if self._manifest is None:
+            manifest_path = self.directory / self.MANIFEST_FILE
+            if not manifest_path.exists():
+                raise FileNotFoundError(
+                    f"No dataset snapshot found in {self.directory}"
+                )
+            with open(manifest_path, "r") as f:
+                self._manifest = json.load(f)
+        return self._manifest
+
+    def validate(self, server: str, dataset: str):
+        """
+        Make sure the snapshot belongs to the configured server and dataset.
+
+        Raises:
+            ValueError: If the snapshot was written for another dataset or
+                with an incompatible format version
+        """
+        manifest = self.manifest
+        if manifest.get("format_version") != self.FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot in {self.directory} has format version "
+                f"{manifest.get('format_version')}, expected {self.FORMAT_VERSION}. "
+                "Run 'neuview prefetch' again."
+            )
+        if manifest.get("server") != server or manifest.get("dataset") != dataset:
+            raise ValueError(
+                f"Snapshot in {self.directory} was created for "
+                f"{manifest.get('dataset')} on {manifest.get('server')}, "
+                f"not {dataset} on {server}"
+            )
+
+    def write(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        roi_hierarchy: Optional[dict],
+        metadata: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Write all snapshot tables, the ROI hierarchy and the manifest.
+
+        The manifest is written last so that an interrupted export never
+        looks like a complete snapshot.
+
+        Args:
+            tables: DataFrames keyed by table name (see TABLES)
+            roi_hierarchy: ROI hierarchy as returned by fetch_roi_hierarchy
+            metadata: Extra manifest entries (server, dataset, uuid, ...)
+
+        Returns:
+            The manifest that was written
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.directory / self.MANIFEST_FILE
+        if manifest_path.exists():
+            manifest_path.unlink()
+
+        table_info = {}
+        for name in self.TABLES:
+            df = tables.get(name, pd.DataFrame())
+            sort_key = self.SORT_KEYS.get(name)
+            if sort_key and sort_key in df.columns:
+                df = df.sort_values(sort_key, kind="stable").reset_index(drop=True)
+            df, json_columns = self._encode_for_parquet(df)
+            df.to_parquet(self.directory / f"{name}.parquet", index=False)
+            table_info[name] = {"rows": len(df), "json_columns": json_columns}
+
+        with open(self.directory / self.ROI_HIERARCHY_FILE, "w") as f:
+            json.dump(roi_hierarchy or {}, f)
+
+        manifest = {
+            **metadata,
+            "format_version": self.FORMAT_VERSION,
+            "created_at": time.time(),
+            "tables": table_info,
+        }
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        self._manifest = manifest
+        self._tables = {}
+        return manifest
+
+    def table(self, name: str) -> pd.DataFrame:
+        """Load a snapshot table, decoding JSON-encoded columns."""
+        if name not in self._tables:
+            df = pd.read_parquet(self.directory / f"{name}.parquet")
+            json_columns = self.manifest["tables"].get(name, {}).get("json_columns", [])
+            for column in json_columns:
+                df[column] = [
+                    json.loads(value) if isinstance(value, str) else None
+                    for value in df[column]
+                ]
+            self._tables[name] = df
+        return self._tables[name]
+
+    @property
+    def roi_hierarchy(self) -> dict:
+        """ROI hierarchy stored with the snapshot."""
+        if self._roi_hierarchy is None:
+            with open(self.directory / self.ROI_HIERARCHY_FILE, "r") as f:
+                self._roi_hierarchy = json.load(f)
+        return self._roi_hierarchy
+
+    def neuron_types(self) -> List[str]:
+        """Sorted list of neuron types in the snapshot."""
+        return sorted(self._get_type_index().keys())
+
+    def neurons_for_type(self, neuron_type: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get the neuron and ROI rows of one neuron type.
+
+        Returns:
+            Tuple of (neurons_df, roi_df) in the same layout as fetch_neurons
+        """
+        positions = self._get_type_index().get(neuron_type)
+        if positions is None:
+            return pd.DataFrame(), pd.DataFrame()
+
+        neurons_df = self.table("neurons").iloc[positions].reset_index(drop=True)
+
+        rois = self.table("rois")
+        if rois.empty:
+            return neurons_df, pd.DataFrame()
+        if self._roi_body_ids is None:
+            self._roi_body_ids = rois["bodyId"].to_numpy()
+        roi_positions = sorted_key_positions(
+            self._roi_body_ids, neurons_df["bodyId"].to_numpy()
+        )
+        roi_df = rois.iloc[roi_positions].reset_index(drop=True)
+        return neurons_df, roi_df
+
+    def partner_records(self, body_ids: List[int], direction: str) -> pd.DataFrame:
+        """
+        Get one row per connection between the given neurons and their partners.
+
+        Args:
+            body_ids: Body IDs of the neurons being summarized
+            direction: 'upstream' for inputs to the neurons, 'downstream' for outputs
+
+        Returns:
+            DataFrame with columns partner_type, soma_side, neurotransmitter,
+            weight and partner_bodyId, ordered by weight descending
+        """
+        edges = self.table("edges")
+        if edges.empty:
+            return pd.DataFrame(columns=PARTNER_RECORD_COLUMNS)
+        if self._edge_sources is None:
+            self._edge_sources = edges["source"].to_numpy()
+            self._edge_target_order = np.argsort(
+                edges["target"].to_numpy(), kind="stable"
+            )
+            self._edge_targets = edges["target"].to_numpy()[self._edge_target_order]
+
+        ids = np.asarray(body_ids, dtype=self._edge_sources.dtype)
+        if direction == "upstream":
+            positions = self._edge_target_order[
+                sorted_key_positions(self._edge_targets, ids)
+            ]
+            partner_column = "source"
+        else:
+            positions = sorted_key_positions(self._edge_sources, ids)
+            partner_column = "target"
+
+        selected = edges.iloc[positions]
+        records = self._get_partner_lookup().records(
+            selected[partner_column].to_numpy(), selected["weight"].to_numpy()
+        )
+        return records.sort_values(
+            "weight", ascending=False, kind="stable"
+        ).reset_index(drop=True)
+
+    def _get_type_index(self) -> Dict[str, np.ndarray]:
+        """Map each neuron type to the row positions of its neurons."""
+        if self._type_index is None:
+            neurons = self.table("neurons")
+            if neurons.empty or "type" not in neurons.columns:
+                self._type_index = {}
+            else:
+                self._type_index = neurons.groupby("type", sort=False).indices
+        return self._type_index
+
+    def _get_partner_lookup(self) -> PartnerMetadataTable:
+        """Partner attributes by bodyId."""
+        if self._partner_lookup is None:
+            self._partner_lookup = PartnerMetadataTable(self.table("partners"))
+        return self._partner_lookup
+
+    @staticmethod
+    def _encode_for_parquet(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        JSON-encode object columns that Arrow cannot store natively.
+
+        NeuPrint properties are schemaless, so a column may mix e.g. strings
+        and dictionaries. Those columns are stored as JSON text and listed in
+        the manifest so that table() can restore them.
+        """
+        json_columns = []
+        for column in df.columns:
+            if df[column].dtype != object:
+                continue
+            try:
+                pa.array(df[column], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                if not json_columns:
+                    df = df.copy()
+                df[column] = [
+                    json.dumps(value, default=str) if not _is_missing(value) else None
+                    for value in df[column]
+                ]
+                json_columns.append(column)
+        return df, json_columns
+
+
+def sorted_key_positions(sorted_keys: np.ndarray, ids) -> np.ndarray:
+    """
+    Find the positions of all entries of a sorted key array matching any of ids.
+
+    Args:
+        sorted_keys: Key array sorted ascending (duplicates allowed)
+        ids: Keys to look up
+
+    Returns:
+        Integer positions into sorted_keys, grouped by key in ascending order
+    """
+    ids = np.unique(np.asarray(ids, dtype=sorted_keys.dtype))
+    left = np.searchsorted(sorted_keys, ids, side="left")
+    right = np.searchsorted(sorted_keys, ids, side="right")
+    found = right > left
+    starts = left[found]
+    lengths = right[found] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.intp)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def _is_missing(value) -> bool:
+    """Check for scalar missing values without tripping over containers."""
+    if value is None or value is pd.NA:
+        return True
+    return isinstance(value, float) and np.isnan(value)
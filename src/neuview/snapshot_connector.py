@@ -0,0 +1,201 @@
+"""
+Snapshot-backed NeuPrint connector.
+
+The SnapshotConnector answers neuron, ROI, connectivity and column queries
+from a local dataset snapshot written by ``neuview prefetch`` instead of
+querying NeuPrint type by type. Queries the snapshot does not cover (such as
+per-synapse column/layer data) still go to the live server.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .config import Config
+from .neuprint_connector import NeuPrintConnector
+from .roi_attributes import roi_attributes
+from .snapshot import DatasetSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def default_snapshot_dir(config: Config) -> Path:
+    """Default snapshot location inside the output cache directory."""
+    return Path(config.output.directory) / ".cache" / "snapshot"
+
+
+def create_connector(config: Config) -> NeuPrintConnector:
+    """
+    Create the connector configured for this run.
+
+    Returns a SnapshotConnector when ``neuprint.snapshot_dir`` points at a
+    complete snapshot, and a live NeuPrintConnector otherwise.
+    """
+    snapshot_dir = config.neuprint.snapshot_dir
+    if snapshot_dir:
+        if DatasetSnapshot(snapshot_dir).exists():
+            return SnapshotConnector(config, snapshot_dir)
+        logger.warning(
+            f"No dataset snapshot found in {snapshot_dir}, "
+            "falling back to live NeuPrint queries"
+        )
+    return NeuPrintConnector(config)
+
+
+class SnapshotConnector(NeuPrintConnector):
+    """NeuPrint connector that serves per-type data from a local snapshot."""
+
+    def __init__(self, config: Config, snapshot_dir: Optional[str] = None):
+        """
+        Initialize the snapshot connector.
+
+        Args:
+            config: Configuration object containing server, dataset, and auth info
+            snapshot_dir: Snapshot directory, defaults to neuprint.snapshot_dir
+        """
+        self.snapshot = DatasetSnapshot(
+            snapshot_dir or config.neuprint.snapshot_dir or default_snapshot_dir(config)
+        )
+        self.snapshot.validate(config.neuprint.server, config.neuprint.dataset)
+        self._column_roi_totals_cache = {}
+        super().__init__(config)
+        logger.info(f"Serving neuron data from snapshot {self.snapshot.directory}")
+
+    def _fetch_raw_neuron_data(self, neuron_type: str) -> tuple:
+        """Look up raw neuron and ROI data for a neuron type in the snapshot."""
+        return self.snapshot.neurons_for_type(neuron_type)
+
+    def _fetch_batch_raw_neuron_data(self, neuron_types: List[str]) -> Dict[str, tuple]:
+        """Look up raw neuron and ROI data for several neuron types in the snapshot."""
+        return {
+            neuron_type: self.snapshot.neurons_for_type(neuron_type)
+            for neuron_type in neuron_types
+        }
+
+    def _fetch_partner_records(
+        self, body_ids: List[int], direction: str
+    ) -> pd.DataFrame:
+        """Look up per-connection partner records in the snapshot edge table."""
+        return self.snapshot.partner_records(body_ids, direction)
+
+    def get_available_types(self) -> List[str]:
+        """Get list of neuron types in the snapshot."""
+        return self.snapshot.neuron_types()
+
+    def get_types_with_soma_sides(self) -> Dict[str, List[str]]:
+        """Get neuron types in the snapshot with their available soma sides."""
+        return {
+            neuron_type: self.get_soma_sides_for_type(neuron_type)
+            for neuron_type in self.get_available_types()
+        }
+
+    def get_soma_sides_for_type(self, neuron_type: str) -> List[str]:
+        """
+        Get soma sides for a specific neuron type from the snapshot.
+
+        Mirrors the live query: rootSide takes precedence over somaSide, and
+        types without either property fall back to the dataset adapter.
+        """
+        if neuron_type in self._soma_sides_cache:
+            self._cache_stats["soma_sides_hits"] += 1
+            return self._soma_sides_cache[neuron_type]
+
+        self._cache_stats["soma_sides_misses"] += 1
+        neurons_df, _ = self.snapshot.neurons_for_type(neuron_type)
+
+        raw_sides = pd.Series(index=neurons_df.index, dtype=object)
+        for column in ("somaSide", "rootSide"):
+            if column in neurons_df.columns:
+                raw_sides = neurons_df[column].where(
+                    neurons_df[column].notna(), raw_sides
+                )
+        raw_sides = raw_sides.dropna()
+
+        if not raw_sides.empty:
+            sides = _normalize_soma_sides(raw_sides.unique(), keep_unknown=False)
+        elif not neurons_df.empty and "instance" in neurons_df.columns:
+            mini_df = self.dataset_adapter.extract_soma_side(
+                neurons_df[["type", "instance"]].dropna(subset=["instance"])
+            )
+            extracted = (
+                mini_df["somaSide"].dropna().unique()
+                if "somaSide" in mini_df.columns
+                else []
+            )
+            sides = _normalize_soma_sides(
+                [side for side in extracted if side != "U"], keep_unknown=True
+            )
+        else:
+            sides = []
+
+        self._soma_sides_cache[neuron_type] = sides
+        return sides
+
+    def fetch_column_roi_totals(
+        self, neuron_type: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Sum pre/post synapse counts per innervated column ROI from the snapshot."""
+        if neuron_type in self._column_roi_totals_cache:
+            return self._column_roi_totals_cache[neuron_type]
+
+        if neuron_type is None:
+            roi_df = self.snapshot.table("rois")
+        else:
+            _, roi_df = self.snapshot.neurons_for_type(neuron_type)
+
+        if roi_df.empty:
+            totals = pd.DataFrame(columns=["roi", "pre", "post"])
+        else:
+            column_mask = roi_attributes(roi_df["roi"])["is_column"].to_numpy()
+            column_df = roi_df.loc[column_mask, ["roi", "pre", "post"]]
+            totals = (
+                column_df.fillna({"pre": 0, "post": 0})
+                .groupby("roi", as_index=False, observed=True)[["pre", "post"]]
+                .sum()
+            )
+            totals["roi"] = totals["roi"].astype(str)
+            totals = totals[(totals["pre"] > 0) | (totals["post"] > 0)]
+            totals = totals.sort_values("roi").reset_index(drop=True)
+
+        self._column_roi_totals_cache[neuron_type] = totals
+        return totals
+
+    def get_dataset_uuid(self) -> Optional[str]:
+        """Get the dataset UUID recorded when the snapshot was exported."""
+        uuid = self.snapshot.manifest.get("uuid")
+        return str(uuid) if uuid else super().get_dataset_uuid()
+
+    def _get_roi_hierarchy(self) -> dict:
+        """Get the ROI hierarchy stored with the snapshot."""
+        if self._roi_hierarchy_cache is None:
+            self._cache_stats["roi_hierarchy_misses"] += 1
+            self._roi_hierarchy_cache = self.snapshot.roi_hierarchy
+        else:
+            self._cache_stats["roi_hierarchy_hits"] += 1
+        return self._roi_hierarchy_cache
+
+
+def _normalize_soma_sides(raw_sides, keep_unknown: bool) -> List[str]:
+    """
+    Normalize soma side values to sorted unique L/R/M codes.
+
+    Args:
+        raw_sides: Raw soma side values
+        keep_unknown: Keep unrecognized values (uppercased) instead of dropping them
+    """
+    normalized_sides = set()
+    for side in raw_sides:
+        if not side or not str(side).strip():
+            continue
+        side_str = str(side).strip().upper()
+        if side_str in ["L", "LEFT"]:
+            normalized_sides.add("L")
+        elif side_str in ["R", "RIGHT"]:
+            normalized_sides.add("R")
+        elif side_str in ["M", "MIDDLE", "MID"]:
+            normalized_sides.add("M")
+        elif keep_unknown:
+            normalized_sides.add(side_str)
+    return sorted(normalized_sides)
@@ -0,0 +1,146 @@
+"""
+Soma-side partitions of raw per-type neuron data.
+
+Page generation asks for the same neuron type once per soma side
+(combined, left, right, middle), and every analysis used to re-select the
+neurons and ROI rows of that side with boolean masks. A SomaSidePartition
+groups the rows of each side into one contiguous block once per type, so a
+side's neurons and ROI counts are plain positional slices of the reordered
+frames. Slices are built on first use and then reused.
+
+The ROI counts of a side hold exactly the ROI rows of the side's neurons.
+get_neuron_data() says so with 'roi_counts_matched' in its result, and the
+analyses pass that flag to roi_rows_for_neurons() instead of filtering the
+rows by bodyId again.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def roi_rows_for_neurons(
+    roi_df: pd.DataFrame, neurons_df: pd.DataFrame, matched: bool = False
+) -> pd.DataFrame:
+    """
+    Select the ROI rows that belong to a set of neurons.
+
+    Args:
+        roi_df: Long-format ROI count table with a 'bodyId' column
+        neurons_df: Neurons whose ROI rows should be kept
+        matched: Whether roi_df is known to hold exactly the ROI rows of
+            neurons_df, e.g. a side's neurons and ROI counts from a
+            SomaSidePartition; such tables are returned as they are
+
+    Returns:
+        ROI rows of the given neurons
+    """
+    if matched:
+        return roi_df
+
+    if "bodyId" in neurons_df.columns and "bodyId" in roi_df.columns:
+        return roi_df[roi_df["bodyId"].isin(neurons_df["bodyId"].to_numpy())]
+    return roi_df
+
+
+class SomaSidePartition:
+    """Neurons and ROI counts of one neuron type grouped by soma side."""
+
+    def __init__(self, neurons_df: pd.DataFrame, roi_df: pd.DataFrame):
+        """
+        Partition raw neuron data by soma side.
+
+        Args:
+            neurons_df: Neurons of one type with an extracted 'somaSide' column
+            roi_df: Long-format ROI counts of those neurons
+        """
+        self.neurons_df = neurons_df
+        self._views: Dict[Optional[str], Tuple[pd.DataFrame, pd.DataFrame]] = {}
+
+        if neurons_df.empty or "somaSide" not in neurons_df.columns:
+            self._sides = np.array([], dtype=object)
+            self._sorted_neurons = neurons_df
+            self._neuron_bounds = np.zeros(1, dtype=np.int64)
+            self.roi_df = roi_df
+            self._roi_bounds = np.array([0, len(roi_df)], dtype=np.int64)
+            return
+
+        side_values = neurons_df["somaSide"].fillna("U").astype(str).to_numpy()
+        self._sides, neuron_codes = np.unique(side_values, return_inverse=True)
+        code_range = np.arange(len(self._sides) + 1)
+
+        # Stable sorts keep the original (bodyId) order within each side
+        neuron_order = np.argsort(neuron_codes, kind="stable")
+        self._sorted_neurons = neurons_df.take(neuron_order)
+        self._neuron_bounds = np.searchsorted(neuron_codes[neuron_order], code_range)
+
+        if roi_df.empty or "bodyId" not in roi_df.columns:
+            self.roi_df = roi_df
+            self._roi_bounds = np.zeros(len(code_range), dtype=np.int64)
+            return
+
+        # ROI rows of bodies outside neurons_df get the last code and sort last
+        body_codes = pd.Series(neuron_codes, index=neurons_df["bodyId"].to_numpy())
+        body_codes = body_codes[~body_codes.index.duplicated()]
+        roi_codes = (
+            body_codes.reindex(roi_df["bodyId"].to_numpy())
+            .fillna(len(self._sides))
+            .to_numpy(dtype=np.int64)
+        )
+        roi_order = np.argsort(roi_codes, kind="stable")
+        self.roi_df = roi_df.take(roi_order)
+        self._roi_bounds = np.searchsorted(roi_codes[roi_order], code_range)
+
+    @property
+    def sides(self) -> list:
+        """Soma side codes present in this neuron type."""
+        return self._sides.tolist()
+
+    def neurons(self, side: Optional[str]) -> pd.DataFrame:
+        """
+        Neurons on one soma side.
+
+        Args:
+            side: Soma side code ('L', 'R', 'M', ...), or None for all neurons
+        """
+        return self._view(side)[0]
+
+    def roi_counts(self, side: Optional[str]) -> pd.DataFrame:
+        """
+        ROI counts of the neurons on one soma side.
+
+        Args:
+            side: Soma side code ('L', 'R', 'M', ...), or None for all neurons
+        """
+        return self._view(side)[1]
+
+    def _view(self, side: Optional[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Get (or build once) the neuron and ROI slices for a soma side."""
+        if side in self._views:
+            return self._views[side]
+
+        if side is None:
+            neurons_df = self.neurons_df
+            rois = slice(0, int(self._roi_bounds[-1]))
+        else:
+            position = np.searchsorted(self._sides, side)
+            if position < len(self._sides) and self._sides[position] == side:
+                neurons_df = self._sorted_neurons.iloc[
+                    self._neuron_bounds[position] : self._neuron_bounds[position + 1]
+                ]
+                rois = slice(
+                    int(self._roi_bounds[position]),
+                    int(self._roi_bounds[position + 1]),
+                )
+            else:
+                neurons_df = self._sorted_neurons.iloc[0:0]
+                rois = slice(0, 0)
+
+        if neurons_df.empty or self.roi_df.empty:
+            roi_df = pd.DataFrame()
+        else:
+            roi_df = self.roi_df.iloc[rois]
+
+        self._views[side] = (neurons_df, roi_df)
+        return self._views[side]
@@ -0,0 +1,169 @@
+"""
+Soma-side summary statistics of raw per-type neuron data.
+
+The summary of a neuron type page counts the neurons of each soma side,
+sums their pre and post synapses and tallies their neurotransmitter
+predictions. The same raw data is summarized for every soma side page and
+for the complete type, which used to mask and iterate the frame for each
+summary. SomaSideStatistics aggregates the raw frame once, grouped by soma
+side, so the summary of any side only combines a few precomputed rows.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+UNKNOWN_NT = "Unknown"
+
+
+class SomaSideStatistics:
+    """Neuron counts, synapse sums and neurotransmitter tallies per soma side."""
+
+    def __init__(
+        self,
+        neurons_df: pd.DataFrame,
+        pre_column: str,
+        post_column: str,
+        nt_column: Optional[str] = None,
+        confidence_column: Optional[str] = None,
+    ):
+        """
+        Aggregate the neurons of one type by soma side.
+
+        Args:
+            neurons_df: Neurons of one type, optionally with a 'somaSide' column
+            pre_column: Column with the pre-synapse count of each neuron
+            post_column: Column with the post-synapse count of each neuron
+            nt_column: Column with the neurotransmitter of each neuron, if any
+            confidence_column: Column with the neurotransmitter confidence
+        """
+        self.has_synapse_columns = (
+            pre_column in neurons_df.columns and post_column in neurons_df.columns
+        )
+        self.has_nt_column = nt_column is not None
+
+        # Neurons without a soma side are grouped under ""
+        if "somaSide" in neurons_df.columns:
+            sides = neurons_df["somaSide"].fillna("").astype(str).to_numpy()
+        else:
+            sides = np.full(len(neurons_df), "", dtype=object)
+
+        totals = pd.DataFrame(
+            {
+                "side": sides,
+                "pre": _column_values(neurons_df, pre_column),
+                "post": _column_values(neurons_df, post_column),
+            }
+        )
+        self._totals: Dict[str, Tuple[int, int, int]] = {
+            side: (int(count), int(pre), int(post))
+            for side, count, pre, post in totals.groupby("side", sort=False)
+            .agg(
+                count=("side", "size"),
+                pre=("pre", "sum"),
+                post=("post", "sum"),
+            )
+            .itertuples()
+        }
+
+        self._nt_tallies = None
+        if nt_column is not None:
+            nt = neurons_df[nt_column]
+            nt = nt.astype(object).where(~(nt.isna() | (nt == "")), UNKNOWN_NT)
+            if confidence_column in neurons_df.columns:
+                confidence = pd.to_numeric(
+                    neurons_df[confidence_column], errors="coerce"
+                )
+            else:
+                confidence = pd.Series(np.nan, index=neurons_df.index)
+            # Unknown neurotransmitters have no confidence
+            confidence = confidence.where(nt != UNKNOWN_NT)
+
+            self._nt_tallies = (
+                pd.DataFrame(
+                    {
+                        "side": sides,
+                        "nt": nt.to_numpy(),
+                        "confidence": confidence.to_numpy(dtype=float),
+                        "position": np.arange(len(neurons_df)),
+                    }
+                )
+                .groupby(["side", "nt"], sort=False)
+                .agg(
+                    count=("position", "size"),
+                    first=("position", "min"),
+                    confidence_sum=("confidence", "sum"),
+                    confidence_count=("confidence", "count"),
+                )
+                .reset_index()
+            )
+
+    def count(self, side: Optional[str] = None) -> int:
+        """Number of neurons on a soma side, or of all neurons for None."""
+        return self._total(side)[0]
+
+    def synapse_counts(self, side: Optional[str] = None) -> Tuple[int, int]:
+        """Total (pre, post) synapses on a soma side, or of all neurons for None."""
+        _, pre, post = self._total(side)
+        return pre, post
+
+    def nt_analysis(self, side: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Neurotransmitter distribution on a soma side, or of all neurons for None.
+
+        Returns:
+            One entry per neurotransmitter with its neuron count and mean
+            confidence, known neurotransmitters by descending count (ties in
+            order of appearance) and "Unknown" last
+        """
+        if self._nt_tallies is None:
+            return []
+
+        tallies = self._nt_tallies
+        if side is not None:
+            tallies = tallies[tallies["side"] == side]
+        if tallies.empty:
+            return []
+
+        tallies = tallies.groupby("nt", sort=False).agg(
+            count=("count", "sum"),
+            first=("first", "min"),
+            confidence_sum=("confidence_sum", "sum"),
+            confidence_count=("confidence_count", "sum"),
+        )
+        tallies["unknown"] = tallies.index == UNKNOWN_NT
+        tallies = tallies.sort_values(
+            ["unknown", "count", "first"], ascending=[True, False, True]
+        )
+
+        return [
+            {
+                "nt_type": nt,
+                "count": int(count),
+                "mean_confidence": confidence_sum / confidence_count
+                if confidence_count and not unknown
+                else None,
+            }
+            for nt, count, _, confidence_sum, confidence_count, unknown in (
+                tallies.itertuples()
+            )
+        ]
+
+    def _total(self, side: Optional[str]) -> Tuple[int, int, int]:
+        """(count, pre, post) of a soma side, or summed over all sides for None."""
+        if side is not None:
+            return self._totals.get(side, (0, 0, 0))
+        count = pre = post = 0
+        for side_count, side_pre, side_post in self._totals.values():
+            count += side_count
+            pre += side_pre
+            post += side_post
+        return count, pre, post
+
+
+def _column_values(neurons_df: pd.DataFrame, column: str) -> np.ndarray:
+    """Values of a numeric column, or zeros if the frame has no such column."""
+    if column in neurons_df.columns:
+        return neurons_df[column].to_numpy()
+    return np.zeros(len(neurons_df), dtype=np.int64)
@@ -30,6 +30,7 @@ from .exceptions import (
 # Import cache strategy implementations
 from .cache import (
     MemoryCacheStrategy,
+    BoundedMemoryCacheStrategy,
     FileCacheStrategy,
     CompositeCacheStrategy,
 )
@@ -67,6 +68,7 @@ __all__ = [
     "CacheError",
     # Cache strategy implementations
     "MemoryCacheStrategy",
+    "BoundedMemoryCacheStrategy",
     "FileCacheStrategy",
     "CompositeCacheStrategy",
     # Resource strategy implementations
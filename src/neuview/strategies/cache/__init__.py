@@ -7,6 +7,7 @@ with various performance characteristics and eviction policies.
 
 Cache Strategies:
 - MemoryCacheStrategy: In-memory caching with LRU eviction
+- BoundedMemoryCacheStrategy: In-memory caching within a memory budget
 - FileCacheStrategy: File-based persistent caching
 
 These strategies can be mixed and matched to create optimal caching solutions.
@@ -20,6 +21,7 @@ from ..exceptions import CacheError
 
 # Import individual cache strategy implementations
 from .memory_cache import MemoryCacheStrategy
+from .bounded_memory_cache import BoundedMemoryCacheStrategy, estimate_size
 from .file_cache import FileCacheStrategy
 from .composite_cache import CompositeCacheStrategy
 
@@ -28,6 +30,8 @@ __all__ = [
     "CacheStrategy",
     "CacheError",
     "MemoryCacheStrategy",
+    "BoundedMemoryCacheStrategy",
+    "estimate_size",
     "FileCacheStrategy",
     "CompositeCacheStrategy",
 ]
@@ -0,0 +1,175 @@
+"""
+Memory-Bounded Cache Strategy Implementation
+
+This module provides an in-memory cache strategy with a memory budget. Items
+are sized when they are stored, DataFrames by their deep memory usage, and
+the least recently used items are evicted once the cached items exceed the
+budget. Optional TTL expiration and hit/miss/eviction statistics come from
+the LRUCache of the eyemap performance module.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Set
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ..base import CacheStrategy
+from ...visualization.performance.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any, _seen: Optional[Set[int]] = None) -> int:
+    """
+    Estimate the memory used by a value in bytes.
+
+    DataFrames and Series are measured with memory_usage(deep=True), NumPy
+    arrays by their buffer size. Containers and object attributes are
+    followed recursively; objects reachable more than once are counted once.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, seen) + estimate_size(item, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, seen)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += estimate_size(vars(value), seen)
+    return size
+
+
+class BoundedMemoryCacheStrategy(CacheStrategy):
+    """
+    In-memory cache strategy with a memory budget and LRU eviction.
+
+    This strategy provides:
+    - A memory budget in MB with DataFrame-aware size estimation
+    - LRU eviction when the budget or the item limit is exceeded
+    - Optional TTL (time-to-live) for automatic expiration
+    - Hit, miss, eviction and memory statistics
+    - Thread-safe operations
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: Optional[float] = None,
+        max_size: Optional[int] = None,
+        default_ttl: Optional[int] = None,
+    ):
+        """
+        Initialize the memory-bounded cache strategy.
+
+        Args:
+            max_memory_mb: Memory budget in MB (None for unlimited)
+            max_size: Maximum number of items to cache (None for unlimited)
+            default_ttl: Default TTL in seconds (None for no expiration)
+        """
+        self.max_memory_mb = max_memory_mb
+        self._cache = LRUCache(
+            max_size=max_size,
+            default_ttl=default_ttl,
+            max_bytes=(
+                int(max_memory_mb * 1024 * 1024) if max_memory_mb is not None else None
+            ),
+            size_of=estimate_size,
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        return self._cache.get(key)
+
+    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in the cache, evicting older values over the budget.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds (None for the default TTL)
+        """
+        self._cache.put(key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key was found and deleted, False otherwise
+        """
+        return self._cache.invalidate(key)
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        self._cache.clear()
+
+    def contains(self, key: str) -> bool:
+        """
+        Check if a key exists in the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key exists and is not expired, False otherwise
+        """
+        return key in self._cache
+
+    def keys(self) -> List[str]:
+        """
+        Get all cache keys.
+
+        Returns:
+            List of all cache keys, least recently used first
+        """
+        return self._cache.keys()
+
+    def size(self) -> int:
+        """
+        Get the number of items in the cache.
+
+        Returns:
+            Number of cached items
+        """
+        return len(self.keys())
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Entry count, memory use and budget in bytes, hits, misses,
+            evictions, expirations and hit rate
+        """
+        return self._cache.statistics()
@@ -0,0 +1,303 @@
+"""
+Per-run performance tracing.
+
+Tracing is off unless a Tracer is started, e.g. by ``neuview generate
+--trace out.json``. While it is active, instrumented code records spans for
+Cypher queries (normalized query text, rows, bytes, latency), analysis
+services, template rendering, minification and file writes. A finished trace
+can be exported in Chrome trace-event format (chrome://tracing, Perfetto) or
+speedscope format, and summarized as a table of where the time went.
+
+When tracing is off, ``trace_span`` hands out a shared no-op span, so the
+instrumentation costs one global lookup per span.
+"""
+
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+TRACE_FORMATS = ("chrome", "speedscope")
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_LITERAL_LIST = re.compile(r"\[\s*\?(?:\s*,\s*\?)*\s*\]")
+
+_active_tracer: Optional["Tracer"] = None
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize Cypher text so queries of the same shape share a span name.
+
+    Whitespace is collapsed and string/number literals and literal lists are
+    replaced with '?'.
+    """
+    normalized = _STRING_LITERAL.sub("?", query)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _LITERAL_LIST.sub("[?]", normalized)
+    return " ".join(normalized.split())
+
+
+@dataclass
+class Span:
+    """A timed section of work recorded by a Tracer."""
+
+    name: str
+    category: str
+    start: float
+    end: float = 0.0
+    thread_id: int = 0
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    enabled = True
+
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds."""
+        return self.end - self.start
+
+    def set(self, **args) -> None:
+        """Attach measurements (rows, bytes, ...) to the span."""
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Span handed out while tracing is off; records nothing."""
+
+    enabled = False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects spans for one run and exports them."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        """Add a finished span."""
+        with self._lock:
+            self.spans.append(span)
+
+    def _relative_us(self, timestamp: float) -> float:
+        """Microseconds since the tracer was started."""
+        return (timestamp - self.origin) * 1e6
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Export spans as Chrome trace-event complete ('X') events."""
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(self._relative_us(span.start), 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": 1,
+                "tid": span.thread_id,
+                "args": span.args,
+            }
+            for span in sorted(self.spans, key=lambda s: s.start)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "neuview") -> Dict[str, Any]:
+        """
+        Export spans as speedscope evented profiles, one per thread.
+
+        Speedscope requires strictly nested events, so a span that outlives
+        its enclosing span is cut off at the parent's end.
+        """
+        frames: List[Dict[str, str]] = []
+        frame_index: Dict[str, int] = {}
+        profiles = []
+
+        spans_by_thread: Dict[int, List[Span]] = {}
+        for span in self.spans:
+            spans_by_thread.setdefault(span.thread_id, []).append(span)
+
+        for thread_id, spans in sorted(spans_by_thread.items()):
+            events = []
+            stack: List[float] = []  # end times (ms) of open spans
+            frame_ids: List[int] = []  # frames of open spans
+
+            def close_until(at: float):
+                while stack and stack[-1] <= at:
+                    end = stack.pop()
+                    events.append({"type": "C", "frame": frame_ids.pop(), "at": end})
+
+            for span in sorted(spans, key=lambda s: (s.start, -s.end)):
+                start = self._relative_us(span.start) / 1000
+                end = self._relative_us(span.end) / 1000
+                close_until(start)
+                if stack:
+                    end = min(end, stack[-1])
+                if span.name not in frame_index:
+                    frame_index[span.name] = len(frames)
+                    frames.append({"name": span.name, "file": span.category})
+                frame = frame_index[span.name]
+                events.append({"type": "O", "frame": frame, "at": start})
+                stack.append(end)
+                frame_ids.append(frame)
+            close_until(float("inf"))
+
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"{name} thread {thread_id}",
+                    "unit": "milliseconds",
+                    "startValue": events[0]["at"] if events else 0,
+                    "endValue": max((e["at"] for e in events), default=0),
+                    "events": events,
+                }
+            )
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "name": name,
+            "exporter": "neuview",
+        }
+
+    def write(self, path: Union[str, Path], trace_format: str = "chrome") -> Path:
+        """
+        Write the trace to a file.
+
+        Args:
+            path: Output file
+            trace_format: 'chrome' or 'speedscope'
+
+        Returns:
+            Path of the written file
+        """
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(
+                f"Unknown trace format: {trace_format} (use one of {TRACE_FORMATS})"
+            )
+        data = (
+            self.to_speedscope(Path(path).stem)
+            if trace_format == "speedscope"
+            else self.to_chrome_trace()
+        )
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        return path
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate spans by category and name.
+
+        Returns:
+            Rows with count, total/mean/max milliseconds, and summed rows and
+            bytes, sorted by total time
+        """
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for span in self.spans:
+            key = (span.category, span.name)
+            row = groups.get(key)
+            if row is None:
+                row = groups[key] = {
+                    "category": span.category,
+                    "name": span.name,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "rows": 0,
+                    "bytes": 0,
+                }
+            duration_ms = span.duration * 1000
+            row["count"] += 1
+            row["total_ms"] += duration_ms
+            row["max_ms"] = max(row["max_ms"], duration_ms)
+            row["rows"] += span.args.get("rows", 0) or 0
+            row["bytes"] += span.args.get("bytes", 0) or 0
+
+        rows = sorted(groups.values(), key=lambda r: r["total_ms"], reverse=True)
+        for row in rows:
+            row["mean_ms"] = row["total_ms"] / row["count"]
+        return rows
+
+    def format_summary(self, limit: int = 25, name_width: int = 60) -> str:
+        """Format the summary as a fixed-width text table."""
+        header = (
+            f"{'Category':<10} {'Span':<{name_width}} {'Count':>6} "
+            f"{'Total ms':>10} {'Mean ms':>9} {'Max ms':>9} {'Rows':>9} {'MB':>8}"
+        )
+        lines = [header, "-" * len(header)]
+        for row in self.summary()[:limit]:
+            name = row["name"]
+            if len(name) > name_width:
+                name = name[: name_width - 3] + "..."
+            lines.append(
+                f"{row['category']:<10} {name:<{name_width}} {row['count']:>6} "
+                f"{row['total_ms']:>10.1f} {row['mean_ms']:>9.1f} "
+                f"{row['max_ms']:>9.1f} {row['rows']:>9} "
+                f"{row['bytes'] / 1e6:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans into a new process-wide tracer."""
+    global _active_tracer
+    _active_tracer = Tracer()
+    return _active_tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording spans and return the tracer that was active."""
+    global _active_tracer
+    tracer, _active_tracer = _active_tracer, None
+    return tracer
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are currently being recorded."""
+    return _active_tracer is not None
+
+
+@contextmanager
+def trace_span(name: str, category: str, **args) -> Iterator[Union[Span, _NullSpan]]:
+    """
+    Record the enclosed block as a span when tracing is active.
+
+    Args:
+        name: Span name, e.g. a normalized query or an operation name
+        category: Span category ('cypher', 'analysis', 'render', ...)
+        **args: Extra values stored with the span
+
+    Yields:
+        The span, whose ``set`` method attaches measurements. Check
+        ``span.enabled`` before computing expensive measurements.
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+
+    span = Span(
+        name=name,
+        category=category,
+        start=time.perf_counter(),
+        thread_id=threading.get_ident(),
+        args=args,
+    )
+    try:
+        yield span
+    finally:
+        span.end = time.perf_counter()
+        tracer.record(span)
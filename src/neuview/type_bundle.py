@@ -0,0 +1,58 @@
+"""
+Per-type bundle of neuron data shared by all stages of page generation.
+
+Generating the pages of a neuron type needs the type's combined data for the
+neuron count, the soma side distribution, the combined page and the
+persistent cache, and the data of every side for its page. Each
+``get_neuron_data`` call re-selects the side's neurons and rebuilds its
+summaries, even when the raw data is cached. A TypeBundle is created once per
+type and handed to every stage: it holds the type's soma-side partition (the
+raw frames and per-side views) and computes the neuron data of each soma side
+(neurons, ROI counts, summaries, connectivity) at most once.
+"""
+
+from typing import Any, Dict
+
+from .soma_side_partition import SomaSidePartition
+
+
+class TypeBundle:
+    """Neuron data of one neuron type, computed once per soma side."""
+
+    def __init__(self, connector, neuron_type: str):
+        """
+        Initialize the bundle.
+
+        Args:
+            connector: NeuPrint connector providing the type's data
+            neuron_type: Neuron type of the bundle
+        """
+        self.connector = connector
+        self.neuron_type = neuron_type
+        self._neuron_data: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def partition(self) -> SomaSidePartition:
+        """Raw neurons and ROI counts of the type grouped by soma side."""
+        return self.connector._get_soma_side_partition(self.neuron_type)
+
+    def neuron_data(self, soma_side: str = "combined") -> Dict[str, Any]:
+        """
+        Get the neuron data of one soma side, computing it on first use.
+
+        Different sides may be requested from concurrent threads.
+
+        Args:
+            soma_side: 'combined', 'left', 'right' or 'middle'
+
+        Returns:
+            Dictionary as returned by the connector's get_neuron_data()
+        """
+        side = getattr(soma_side, "value", soma_side)
+        if side == "all":
+            side = "combined"
+        data = self._neuron_data.get(side)
+        if data is None:
+            data = self.connector.get_neuron_data(self.neuron_type, side)
+            self._neuron_data[side] = data
+        return data
@@ -0,0 +1,255 @@
+"""
+HTML minification stage.
+
+The minifier scans a document once, splitting it into markup and inline
+script blocks. The markup is minified with script bodies replaced by short
+placeholders; each script body is minified on its own and spliced back in.
+Most inline scripts are identical on every neuron page, so minified script
+bodies are cached by content.
+
+minify-js 0.6.0 (used by minify-html) panics on JavaScript control flow, so
+script blocks containing control flow are kept as they are. This is decided
+per block; a single such block no longer disables JS minification for the
+whole page.
+
+minify-html holds the GIL, so ``MinificationPool`` runs minification in
+worker processes, each with its own script cache, separate from rendering.
+The workers are started by a fork server (or spawned), never forked from the
+generating process, whose writer and page threads may hold locks at that time.
+"""
+
+import logging
+import multiprocessing
+import re
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCRIPT_BLOCK = re.compile(
+    r"(<script\b[^>]*>)(.*?)(</script\s*>)", re.DOTALL | re.IGNORECASE
+)
+_PLACEHOLDER = re.compile(r"/\*neuview-script:(\d+)\*/")
+_JS_TYPE = re.compile(r"""\btype\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+
+# Script types whose content is JavaScript; anything else (JSON, templates)
+# is left unchanged
+_JS_MIME_TYPES = {"text/javascript", "application/javascript", "module"}
+
+# JavaScript constructs that crash minify-js 0.6.0
+_UNSAFE_JS_PATTERNS = (
+    "if (",
+    "if(",
+    "for (",
+    "for(",
+    "while (",
+    "while(",
+    "function ",
+    "switch (",
+    "switch(",
+    "try {",
+)
+
+DEFAULT_SCRIPT_CACHE_SIZE = 256
+MAX_CACHED_SCRIPT_LENGTH = 256 * 1024
+
+
+class HTMLMinifier:
+    """Single-pass HTML minifier with a cache of minified inline scripts."""
+
+    def __init__(self, script_cache_size: int = DEFAULT_SCRIPT_CACHE_SIZE):
+        """
+        Initialize the minifier.
+
+        Args:
+            script_cache_size: Number of minified script bodies to keep
+        """
+        self.script_cache_size = script_cache_size
+        self._script_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def minify(self, html_content: str, minify_js: bool = True) -> str:
+        """
+        Minify an HTML document.
+
+        Args:
+            html_content: Raw HTML content to minify
+            minify_js: Whether to minify JavaScript in inline script blocks
+
+        Returns:
+            Minified HTML content
+        """
+        import minify_html
+
+        scripts: List[str] = []
+
+        def stash(match: "re.Match") -> str:
+            open_tag, body, close_tag = match.groups()
+            if not body.strip():
+                return match.group(0)
+            scripts.append(self._minify_script(open_tag, body, minify_js))
+            return f"{open_tag}/*neuview-script:{len(scripts) - 1}*/{close_tag}"
+
+        skeleton = _SCRIPT_BLOCK.sub(stash, html_content)
+        minified = minify_html.minify(
+            skeleton,
+            minify_js=False,
+            minify_css=True,
+            remove_processing_instructions=True,
+        )
+        if not scripts:
+            return minified
+        return _PLACEHOLDER.sub(lambda m: scripts[int(m.group(1))], minified)
+
+    def _minify_script(self, open_tag: str, body: str, minify_js: bool) -> str:
+        """Minify one script body, using the cache for repeated bodies."""
+        if not minify_js or not self._is_minifiable_js(open_tag, body):
+            return body
+
+        cacheable = len(body) <= MAX_CACHED_SCRIPT_LENGTH
+        if cacheable:
+            cached = self._script_cache.get(body)
+            if cached is not None:
+                self._script_cache.move_to_end(body)
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+
+        minified = _minify_js(body)
+        if cacheable:
+            self._script_cache[body] = minified
+            if len(self._script_cache) > self.script_cache_size:
+                self._script_cache.popitem(last=False)
+        return minified
+
+    @staticmethod
+    def _is_minifiable_js(open_tag: str, body: str) -> bool:
+        """Whether a script block is JavaScript that minify-js can handle."""
+        type_match = _JS_TYPE.search(open_tag)
+        if type_match and type_match.group(1).lower() not in _JS_MIME_TYPES:
+            return False
+        # LEGACY WORKAROUND: remove when minify-html no longer uses minify-js 0.6
+        return not any(pattern in body for pattern in _UNSAFE_JS_PATTERNS)
+
+
+def _minify_js(body: str) -> str:
+    """Minify a JavaScript body, keeping it unchanged if minification fails."""
+    import minify_html
+
+    wrapped = f"<script>{body}</script>"
+    try:
+        minified = minify_html.minify(wrapped, minify_js=True)
+    except BaseException as e:  # minify-js panics surface as PanicException
+        if isinstance(e, (KeyboardInterrupt, SystemExit)):
+            raise
+        logger.debug(f"Keeping script unminified after minifier error: {e}")
+        return body
+
+    if minified.startswith("<script>") and minified.endswith("</script>"):
+        return minified[len("<script>") : -len("</script>")]
+    return body
+
+
+_shared_minifier = HTMLMinifier()
+
+
+def minify_html_document(html_content: str, minify_js: bool = True) -> str:
+    """Minify a document with the process-wide minifier and its script cache."""
+    return _shared_minifier.minify(html_content, minify_js=minify_js)
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for minification workers that does not fork this process."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class MinificationPool:
+    """Worker processes that minify pages while the caller keeps rendering."""
+
+    def __init__(self, workers: int):
+        """
+        Start the pool.
+
+        Args:
+            workers: Number of worker processes
+        """
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=_worker_context()
+        )
+
+    def submit(
+        self,
+        html_content: str,
+        on_done: Callable[[str], None],
+        minify_js: bool = True,
+    ) -> Future:
+        """
+        Minify a document in a worker process.
+
+        Args:
+            html_content: Raw HTML content to minify
+            on_done: Called with the minified document, or with the original
+                document if minification failed
+            minify_js: Whether to minify JavaScript in inline script blocks
+
+        Returns:
+            Future of the minified document
+        """
+        future = self._executor.submit(minify_html_document, html_content, minify_js)
+
+        def deliver(done: Future) -> None:
+            try:
+                result = done.result()
+            except Exception as e:
+                logger.warning(f"Minification failed, writing unminified page: {e}")
+                result = html_content
+            try:
+                on_done(result)
+            except Exception as e:
+                logger.error(f"Failed to handle minified page: {e}")
+
+        future.add_done_callback(deliver)
+        return future
+
+    def close(self) -> None:
+        """Wait for all submitted documents and stop the workers."""
+        self._executor.shutdown(wait=True)
+
+
+_active_pool: Optional[MinificationPool] = None
+
+
+def get_minification_pool() -> Optional[MinificationPool]:
+    """Get the worker pool of the current run, if one is active."""
+    return _active_pool
+
+
+@contextmanager
+def minification_workers(workers: int) -> Iterator[Optional[MinificationPool]]:
+    """
+    Minify pages in worker processes for the enclosed run.
+
+    Args:
+        workers: Number of worker processes; 0 minifies on the calling thread
+
+    Yields:
+        The active pool, or None if minification stays in-line
+    """
+    global _active_pool
+    if workers <= 0 or _active_pool is not None:
+        yield _active_pool
+        return
+
+    pool = MinificationPool(workers)
+    _active_pool = pool
+    try:
+        yield pool
+    finally:
+        _active_pool = None
+        pool.close()
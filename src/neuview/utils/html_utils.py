@@ -66,6 +66,9 @@ class HTMLUtils:
         """
         Minify HTML content by removing unnecessary whitespace.
 
+        Inline scripts are minified per block, with a cache for blocks that
+        repeat across pages (see html_minifier).
+
         Args:
             html_content: Raw HTML content to minify
             minify_js: Whether to minify JavaScript content within script tags
@@ -73,48 +76,6 @@ class HTMLUtils:
         Returns:
             Minified HTML content
         """
-        import minify_html
-        import re
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        # LEGACY WORKAROUND: minify-js 0.6.0 has bugs with JavaScript control flow
-        # This can be removed when upgrading to a newer version of minify-html
-        # that doesn't use the problematic minify-js library
-        if minify_js:
-            # Quick check for JavaScript control flow that crashes minify-js
-            script_pattern = r"<script[^>]*>(.*?)</script>"
-            scripts = re.findall(
-                script_pattern, html_content, re.DOTALL | re.IGNORECASE
-            )
-
-            for script_content in scripts:
-                if script_content.strip() and any(
-                    pattern in script_content
-                    for pattern in [
-                        "if (",
-                        "if(",
-                        "for (",
-                        "for(",
-                        "while (",
-                        "while(",
-                        "function ",
-                        "switch (",
-                        "switch(",
-                        "try {",
-                    ]
-                ):
-                    logger.debug(
-                        "Disabling JS minification due to minify-js library limitations"
-                    )
-                    minify_js = False
-                    break
+        from .html_minifier import minify_html_document
 
-        minified = minify_html.minify(
-            html_content,
-            minify_js=minify_js,
-            minify_css=True,
-            remove_processing_instructions=True,
-        )
-        return minified
+        return minify_html_document(html_content, minify_js=minify_js)
@@ -44,6 +44,7 @@ class EyemapConfiguration:
     # Directory configuration
     output_dir: Optional[Path] = None
     eyemaps_dir: Optional[Path] = None
+    shard_eyemaps: bool = False
 
     # Operation modes
     embed_mode: bool = False
@@ -206,6 +207,7 @@ class EyemapConfiguration:
             spacing_factor=self.spacing_factor,
             output_dir=self.output_dir,
             eyemaps_dir=self.eyemaps_dir,
+            shard_eyemaps=self.shard_eyemaps,
             margin=self.margin,
             save_to_files=self.save_to_files,
             embed_mode=self.embed_mode,
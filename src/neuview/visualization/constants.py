@@ -56,6 +56,12 @@ TOOLTIP_CELL_LABEL: str = "Cell count"
 EYEMAPS_SUBDIRECTORY: str = "eyemaps"
 """Default subdirectory name for saving eyemap files."""
 
+EYEMAP_FINGERPRINT_SUBDIRECTORY: str = ".cache/eyemap_fingerprints"
+"""Subdirectory of the output directory holding eyemap content fingerprints."""
+
+EYEMAP_FINGERPRINT_VERSION: int = 1
+"""Version mixed into eyemap fingerprints; bump when the rendered output changes."""
+
 # Error Messages
 ERROR_NO_COLUMNS: str = "No columns provided"
 """Error message when no column data is available."""
@@ -235,11 +235,9 @@ class EyemapGenerator:
                     error_message=f"Request validation failed: {e.message}",
                 )
 
-            # Set embed mode based on save_to_files parameter
-            self.embed_mode = not request.save_to_files
-            self.config.update(
-                embed_mode=self.embed_mode, save_to_files=request.save_to_files
-            )
+            # Whether grids are saved or embedded is read from the request
+            # only: the generator is shared by concurrently generated pages,
+            # so it must not keep per-request state
 
             warnings = []
 
@@ -249,22 +247,51 @@ class EyemapGenerator:
                     "organize_data_by_side", self._organize_data_by_side, request
                 )
 
-                # Process all regions and sides to generate grids using the processor
-                processed_grids = safe_operation(
-                    "process_all_regions_and_sides",
-                    self.region_processor.process_all_regions_and_sides,
+                # Resolve every region/side grid and its content fingerprint up
+                # front, so grids whose saved files are current skip rendering
+                from ..services.static_bundle_service import get_static_bundles
+
+                fingerprint_settings = (
+                    {
+                        "hex_size": self.config.hex_size,
+                        "spacing_factor": self.config.spacing_factor,
+                        "margin": self.config.margin,
+                        "eyemap_script": get_static_bundles().hashed_name("eyemap.js"),
+                    }
+                    if request.save_to_files
+                    else None
+                )
+                grid_plans = safe_operation(
+                    "plan_all_regions_and_sides",
+                    self.region_processor.plan_all_regions_and_sides,
                     request,
                     data_maps,
+                    fingerprint_settings,
+                )
+                reused_grids = self.file_manager.find_up_to_date_grids(
+                    request, grid_plans, self.rendering_manager
+                )
+
+                # Generate the remaining grids using the processor
+                processed_grids = safe_operation(
+                    "process_planned_grids",
+                    self.region_processor.process_planned_grids,
+                    request,
+                    grid_plans,
                     self.generate_comprehensive_single_region_grid,
+                    reused_grids.keys(),
                 )
 
                 # Handle output for all processed grids
-                region_grids = safe_operation(
+                new_grids = safe_operation(
                     "handle_all_grid_outputs",
                     self._handle_all_grid_outputs,
                     request,
                     processed_grids,
                 )
+                region_grids = {
+                    key: reused_grids.get(key) or new_grids[key] for key in grid_plans
+                }
 
                 processing_time = time.time() - start_time
                 logger.debug(
@@ -369,6 +396,7 @@ class EyemapGenerator:
                 synapse_content,
                 cell_content,
                 self.rendering_manager,
+                grid_data.get("fingerprint"),
             )
 
         return region_grids
@@ -11,6 +11,11 @@ import os
 from pathlib import Path
 from typing import Dict, Optional, Union
 
+from .constants import (
+    EYEMAP_FINGERPRINT_SUBDIRECTORY,
+    METRIC_CELL_COUNT,
+    METRIC_SYNAPSE_DENSITY,
+)
 from .rendering import OutputFormat
 
 logger = logging.getLogger(__name__)
@@ -57,6 +62,7 @@ class FileOutputManager:
         synapse_content: str,
         cell_content: str,
         rendering_manager,
+        fingerprint: Optional[str] = None,
     ) -> Dict:
         """
         Handle saving or returning grid content based on request configuration.
@@ -68,6 +74,7 @@ class FileOutputManager:
             synapse_content: Generated synapse grid content
             cell_content: Generated cell grid content
             rendering_manager: RenderingManager instance for file operations
+            fingerprint: Content fingerprint recorded next to saved files
 
         Returns:
             Dictionary with 'synapse_density' and 'cell_count' keys mapping to
@@ -75,30 +82,128 @@ class FileOutputManager:
         """
         if self._should_save_to_files(request):
             return self._save_grids_to_files(
-                request, region, side, synapse_content, cell_content, rendering_manager
+                request,
+                region,
+                side,
+                synapse_content,
+                cell_content,
+                rendering_manager,
+                fingerprint,
             )
         else:
             return self._return_grid_content(synapse_content, cell_content)
 
-    def _should_generate_eyemap(self, filename: str) -> bool:
+    def find_up_to_date_grids(
+        self, request, grid_plans: Dict, rendering_manager
+    ) -> Dict:
+        """
+        Find planned grids whose saved files match their content fingerprint.
+
+        A grid is up to date when the files of both metrics exist and the
+        fingerprint recorded when they were written equals the planned one.
+
+        Args:
+            request: GridGenerationRequest containing output configuration
+            grid_plans: Plans from RegionGridProcessor.plan_all_regions_and_sides()
+            rendering_manager: RenderingManager instance for file naming
+
+        Returns:
+            Dictionary mapping region_side keys of up-to-date grids to the same
+            output handle_grid_output() would return for them
+        """
+        if not self._should_save_to_files(request) or not self.eyemaps_dir:
+            return {}
+
+        format_enum = self._get_output_format_enum(request.output_format)
+        renderer = rendering_manager._get_renderer(format_enum)
+
+        up_to_date = {}
+        for region_side_key, plan in grid_plans.items():
+            fingerprint = plan.get("fingerprint")
+            if not fingerprint:
+                continue
+
+            outputs = {}
+            for metric_type in (METRIC_SYNAPSE_DENSITY, METRIC_CELL_COUNT):
+                eyemap_path = self._eyemap_path(
+                    renderer, request, plan["region"], plan["side"], metric_type
+                )
+                if not self._is_eyemap_up_to_date(eyemap_path, fingerprint):
+                    break
+                outputs[metric_type] = f"../eyemaps/{eyemap_path}"
+            else:
+                up_to_date[region_side_key] = outputs
+
+        if up_to_date:
+            logger.debug(
+                f"Reusing {len(up_to_date)} up-to-date eyemap grids for "
+                f"{request.neuron_type}"
+            )
+        return up_to_date
+
+    def _eyemap_path(
+        self, renderer, request, region: str, side: str, metric_type: str
+    ) -> str:
+        """Path of an eyemap file relative to the eyemaps directory."""
+        return renderer.config.get_eyemap_path(
+            renderer.config.get_clean_filename(
+                self._generate_filename(
+                    region, request.neuron_type, request.soma_side, side, metric_type
+                )
+            )
+        )
+
+    def _fingerprint_path(self, eyemap_path: str) -> Path:
+        """Path of the fingerprint recorded for an eyemap file."""
+        return (
+            self.output_dir / EYEMAP_FINGERPRINT_SUBDIRECTORY / (eyemap_path + ".txt")
+        )
+
+    def _is_eyemap_up_to_date(self, eyemap_path: str, fingerprint: str) -> bool:
         """
-        Check if eyemap file should be generated (doesn't exist yet).
+        Check whether an eyemap file exists and was written from the same inputs.
 
         Args:
-            filename: The filename to check
+            eyemap_path: Eyemap file path relative to the eyemaps directory
+            fingerprint: Expected content fingerprint
 
         Returns:
-            True if file should be generated, False if it already exists
+            True if the file can be reused as it is
         """
-        if not self.eyemaps_dir:
-            return True
+        from ..services.output_writer_service import get_output_writer
 
-        file_path = self.eyemaps_dir / filename
-        if file_path.exists():
-            logger.debug(f"Eyemap already exists, skipping generation: {filename}")
+        # Another page of this run may still have the file queued for writing
+        writer = get_output_writer()
+        fingerprint_path = self._fingerprint_path(eyemap_path)
+        writer.flush_path(self.eyemaps_dir / eyemap_path)
+        writer.flush_path(fingerprint_path)
+
+        if not (self.eyemaps_dir / eyemap_path).exists():
             return False
 
-        return True
+        try:
+            stored = fingerprint_path.read_text().strip()
+        except OSError:
+            return False
+        return stored == fingerprint
+
+    def _record_eyemap_fingerprint(self, eyemap_path: str, fingerprint: str):
+        """
+        Record the fingerprint of a freshly written eyemap file.
+
+        Args:
+            eyemap_path: Eyemap file path relative to the eyemaps directory
+            fingerprint: Content fingerprint of the written file
+        """
+        from ..services.output_writer_service import get_output_writer
+
+        path = self._fingerprint_path(eyemap_path)
+        try:
+            # Queued after the eyemap itself, so it never describes a file
+            # that has not been written yet
+            get_output_writer().write(path, fingerprint)
+        except OSError as e:
+            logger.warning(f"Failed to record eyemap fingerprint {path}: {e}")
 
     def _should_save_to_files(self, request) -> bool:
         """
@@ -120,6 +225,7 @@ class FileOutputManager:
         synapse_content: str,
         cell_content: str,
         rendering_manager,
+        fingerprint: Optional[str] = None,
     ) -> Dict:
         """
         Save grid content to files and return file paths.
@@ -131,6 +237,7 @@ class FileOutputManager:
             synapse_content: Generated synapse grid content
             cell_content: Generated cell grid content
             rendering_manager: RenderingManager instance for file operations
+            fingerprint: Content fingerprint recorded next to the saved files
 
         Returns:
             Dictionary mapping metric types to file paths
@@ -144,30 +251,26 @@ class FileOutputManager:
 
         # Generate file names
         synapse_filename = self._generate_filename(
-            region, request.neuron_type, side, "synapse_density"
+            region, request.neuron_type, request.soma_side, side, METRIC_SYNAPSE_DENSITY
         )
         cell_filename = self._generate_filename(
-            region, request.neuron_type, side, "cell_count"
+            region, request.neuron_type, request.soma_side, side, METRIC_CELL_COUNT
         )
 
-        # Check if files already exist and return existing paths if so
-        synapse_path = None
-        cell_path = None
+        # Up-to-date grids are filtered out before rendering, so always write
+        synapse_path = renderer.save_to_file(synapse_content, synapse_filename)
+        cell_path = renderer.save_to_file(cell_content, cell_filename)
 
-        if self._should_generate_eyemap(synapse_filename):
-            synapse_path = renderer.save_to_file(synapse_content, synapse_filename)
-        else:
-            synapse_path = self.eyemaps_dir / synapse_filename
-
-        if self._should_generate_eyemap(cell_filename):
-            cell_path = renderer.save_to_file(cell_content, cell_filename)
-        else:
-            cell_path = self.eyemaps_dir / cell_filename
+        if fingerprint and self.output_dir:
+            for metric_type in (METRIC_SYNAPSE_DENSITY, METRIC_CELL_COUNT):
+                self._record_eyemap_fingerprint(
+                    self._eyemap_path(renderer, request, region, side, metric_type),
+                    fingerprint,
+                )
 
-        if synapse_path and cell_path:
-            logger.debug(
-                f"Generated/reused grids for {region}_{side}: {synapse_path}, {cell_path}"
-            )
+        logger.debug(
+            f"Generated grids for {region}_{side}: {synapse_path}, {cell_path}"
+        )
 
         return {"synapse_density": str(synapse_path), "cell_count": str(cell_path)}
 
@@ -202,21 +305,33 @@ class FileOutputManager:
             raise ValueError(f"Unsupported output format: {output_format}")
 
     def _generate_filename(
-        self, region: str, neuron_type: str, side: str, metric_type: str
+        self,
+        region: str,
+        neuron_type: str,
+        soma_side,
+        side: str,
+        metric_type: str,
     ) -> str:
         """
         Generate a standardized filename for eyemap files.
 
+        The page's soma side is part of the name: the combined and the
+        per-side pages of a type render the same region from different data,
+        so they must not share image or fingerprint files.
+
         Args:
             region: Region name
             neuron_type: Neuron type identifier
+            soma_side: Soma side of the page the eyemap belongs to
             side: Side identifier
             metric_type: Type of metric ('synapse_density' or 'cell_count')
 
         Returns:
             Generated filename (without extension)
         """
-        return f"{region}_{neuron_type}_{side}_{metric_type}"
+        page_side = str(getattr(soma_side, "value", soma_side)).lower()
+        page_side = {"l": "left", "r": "right", "m": "middle"}.get(page_side, page_side)
+        return f"{region}_{neuron_type}_{page_side}_{side}_{metric_type}"
 
     def get_output_path(
         self, filename: str, use_eyemaps_dir: bool = True
@@ -7,9 +7,10 @@ to optimize frequently computed values in eyemap generation.
 
 import hashlib
 import logging
+import threading
 import time
 from collections import OrderedDict
-from typing import Any, Dict, Hashable, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -20,91 +21,153 @@ class LRUCache:
 
     Features:
     - Size-based eviction (LRU policy)
+    - Optional memory budget with per-item byte accounting
     - Time-based expiration (TTL)
     - Thread-safe operations
     - Memory-efficient implementation
     - Cache statistics tracking
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = None):
+    def __init__(
+        self,
+        max_size: Optional[int] = 1000,
+        default_ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        size_of: Optional[Callable[[Any], int]] = None,
+    ):
         """
         Initialize LRU cache.
 
         Args:
-            max_size: Maximum number of items to cache
+            max_size: Maximum number of items to cache (None = no item limit)
             default_ttl: Default time-to-live in seconds (None = no expiration)
+            max_bytes: Memory budget of all items in bytes (None = no budget)
+            size_of: Estimates the size of an item in bytes; required for
+                a memory budget
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.size_of = size_of
         self._cache = OrderedDict()
         self._timestamps = {}
         self._access_times = {}
+        self._sizes = {}
+        self._lock = threading.RLock()
 
         # Statistics
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        self.expirations = 0
+        self.current_bytes = 0
 
     def get(self, key: Hashable, default: Any = None) -> Any:
         """Get value from cache."""
-        if key not in self._cache:
-            self.misses += 1
-            return default
+        with self._lock:
+            if key not in self._cache:
+                self.misses += 1
+                return default
 
-        # Check TTL expiration
-        if self._is_expired(key):
-            self._remove(key)
-            self.misses += 1
-            return default
+            # Check TTL expiration
+            if self._is_expired(key):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
 
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        self._access_times[key] = time.time()
-        self.hits += 1
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            self._access_times[key] = time.time()
+            self.hits += 1
 
-        return self._cache[key]
+            return self._cache[key]
 
     def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
         """Put value into cache."""
-        # Remove if exists to update position
-        if key in self._cache:
-            self._remove(key)
-
-        # Evict if at capacity
-        while len(self._cache) >= self.max_size:
-            self._evict_lru()
-
-        # Add new item
-        self._cache[key] = value
-        current_time = time.time()
-        self._access_times[key] = current_time
-
-        if ttl is not None or self.default_ttl is not None:
-            ttl_value = ttl if ttl is not None else self.default_ttl
-            if ttl_value is not None:
-                expiry_time = current_time + ttl_value
-                self._timestamps[key] = expiry_time
+        size = self.size_of(value) if self.size_of is not None else 0
+
+        with self._lock:
+            # Remove if exists to update position
+            if key in self._cache:
+                self._remove(key)
+
+            # Evict if at capacity
+            while self.max_size is not None and len(self._cache) >= self.max_size:
+                self._evict_lru()
+
+            # Add new item
+            self._cache[key] = value
+            self._sizes[key] = size
+            self.current_bytes += size
+            current_time = time.time()
+            self._access_times[key] = current_time
+
+            if ttl is not None or self.default_ttl is not None:
+                ttl_value = ttl if ttl is not None else self.default_ttl
+                if ttl_value is not None:
+                    expiry_time = current_time + ttl_value
+                    self._timestamps[key] = expiry_time
+
+            # Evict older items over the memory budget; the new item is
+            # kept even if it exceeds the budget on its own
+            while (
+                self.max_bytes is not None
+                and self.current_bytes > self.max_bytes
+                and len(self._cache) > 1
+            ):
+                self._evict_lru()
 
     def invalidate(self, key: Hashable) -> bool:
         """Remove specific key from cache."""
-        if key in self._cache:
-            self._remove(key)
-            return True
-        return False
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                return True
+            return False
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._cache.clear()
-        self._timestamps.clear()
-        self._access_times.clear()
-        self.hits = 0
-        self.misses = 0
-        self.evictions = 0
+        with self._lock:
+            self._cache.clear()
+            self._timestamps.clear()
+            self._access_times.clear()
+            self._sizes.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.current_bytes = 0
 
     def size(self) -> int:
         """Get current cache size."""
         return len(self._cache)
 
+    def keys(self) -> List[Hashable]:
+        """Get the keys of all unexpired entries, least recently used first."""
+        with self._lock:
+            return [key for key in self._cache if not self._is_expired(key)]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check for an unexpired entry without counting a hit or miss."""
+        with self._lock:
+            return key in self._cache and not self._is_expired(key)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Get entry, memory and hit/miss/eviction statistics."""
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hit_rate(),
+            }
+
     def hit_rate(self) -> float:
         """Calculate cache hit rate."""
         total = self.hits + self.misses
@@ -112,12 +175,14 @@ class LRUCache:
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries and return count removed."""
-        expired_keys = [key for key in self._cache.keys() if self._is_expired(key)]
+        with self._lock:
+            expired_keys = [key for key in self._cache.keys() if self._is_expired(key)]
 
-        for key in expired_keys:
-            self._remove(key)
+            for key in expired_keys:
+                self._remove(key)
+            self.expirations += len(expired_keys)
 
-        return len(expired_keys)
+            return len(expired_keys)
 
     def _is_expired(self, key: Hashable) -> bool:
         """Check if key has expired."""
@@ -130,6 +195,7 @@ class LRUCache:
         self._cache.pop(key, None)
         self._timestamps.pop(key, None)
         self._access_times.pop(key, None)
+        self.current_bytes -= self._sizes.pop(key, 0)
 
     def _evict_lru(self) -> None:
         """Evict least recently used item."""
@@ -6,10 +6,14 @@ regions and sides for eyemap generation, including mirroring, filtering, and
 grid generation coordination.
 """
 
+import dataclasses
+import hashlib
+import json
 import logging
-from typing import Dict, Tuple
+from enum import Enum
+from typing import Any, Collection, Dict, Optional, Tuple
 
-from .constants import REGION_ORDER
+from .constants import EYEMAP_FINGERPRINT_VERSION, REGION_ORDER
 from .data_processing import DataProcessor
 from .data_transfer_objects import (
     GridGenerationRequest,
@@ -20,6 +24,28 @@ from .data_transfer_objects import (
 logger = logging.getLogger(__name__)
 
 
+def _canonical(value: Any) -> Any:
+    """Convert grid inputs into a JSON-serializable form with a stable order."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _canonical(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        items = [(_canonical(k), _canonical(v)) for k, v in value.items()]
+        return sorted(items, key=lambda item: repr(item[0]))
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if hasattr(value, "tolist"):
+        # numpy scalars and arrays
+        return _canonical(value.tolist())
+    return value
+
+
 class RegionGridProcessor:
     """
     Service class for processing regions and sides in eyemap generation.
@@ -52,50 +78,118 @@ class RegionGridProcessor:
         Returns:
             Dictionary mapping region_side keys to their generated grids
         """
-        region_grids = {}
+        return self.process_planned_grids(
+            request,
+            self.plan_all_regions_and_sides(request, data_maps),
+            grid_generator_func,
+        )
+
+    def plan_all_regions_and_sides(
+        self,
+        request: GridGenerationRequest,
+        data_maps: Dict,
+        fingerprint_settings: Optional[Dict] = None,
+    ) -> Dict:
+        """
+        Resolve the configuration of every region/side grid before generating any.
+
+        Args:
+            request: GridGenerationRequest containing all generation parameters
+            data_maps: Dictionary mapping sides to their organized data maps
+            fingerprint_settings: Rendering settings that affect the output; when
+                given, each plan gets a content fingerprint
+
+        Returns:
+            Dictionary mapping region_side keys to plans with region, side,
+            data_map, region_config and fingerprint (None if not requested)
+        """
+        grid_plans = {}
 
-        # Generate grids for each region and side
         for region in REGION_ORDER:
             for side, data_map in data_maps.items():
-                logger.debug(f"Processing region {region}, side {side}")
+                region_config = self._get_region_configuration(request, region, side)
+                fingerprint = None
+                if fingerprint_settings is not None:
+                    fingerprint = self.compute_grid_fingerprint(
+                        request,
+                        region,
+                        side,
+                        data_map,
+                        region_config,
+                        fingerprint_settings,
+                    )
+
+                grid_plans[f"{region}_{side}"] = {
+                    "region": region,
+                    "side": side,
+                    "data_map": data_map,
+                    "region_config": region_config,
+                    "fingerprint": fingerprint,
+                }
+
+        return grid_plans
+
+    def process_planned_grids(
+        self,
+        request: GridGenerationRequest,
+        grid_plans: Dict,
+        grid_generator_func,
+        skip_keys: Collection[str] = (),
+    ) -> Dict:
+        """
+        Generate grids for planned region/side combinations.
+
+        Args:
+            request: GridGenerationRequest containing all generation parameters
+            grid_plans: Plans from plan_all_regions_and_sides()
+            grid_generator_func: Function to call for generating individual grids
+            skip_keys: region_side keys whose existing output is reused
+
+        Returns:
+            Dictionary mapping region_side keys to their generated grids
+        """
+        region_grids = {}
 
-                # Process this specific region and side combination
-                region_side_grids = self._process_single_region_side(
-                    request, region, side, data_map, grid_generator_func
-                )
+        for region_side_key, plan in grid_plans.items():
+            if region_side_key in skip_keys:
+                logger.debug(f"Reusing up-to-date grids for {region_side_key}")
+                continue
 
-                region_side_key = f"{region}_{side}"
-                region_grids[region_side_key] = region_side_grids
+            logger.debug(f"Processing region {plan['region']}, side {plan['side']}")
+            region_grids[region_side_key] = self._process_single_region_side(
+                request, plan, grid_generator_func
+            )
 
         return region_grids
 
     def _process_single_region_side(
         self,
         request: GridGenerationRequest,
-        region: str,
-        side: str,
-        data_map: Dict,
+        plan: Dict,
         grid_generator_func,
     ) -> Dict:
         """
-        Process a single region and side combination.
+        Process a single planned region and side combination.
 
         Args:
             request: GridGenerationRequest containing all generation parameters
-            region: Region name (e.g., 'ME', 'LO', 'LOP')
-            side: Side identifier ('L' or 'R')
-            data_map: Organized data map for this side
+            plan: Region/side plan from plan_all_regions_and_sides()
             grid_generator_func: Function to call for generating individual grids
 
         Returns:
             Dictionary with generated grid content for this region/side
         """
-        # Get region-specific configuration
-        region_config = self._get_region_configuration(request, region, side)
+        region = plan["region"]
+        side = plan["side"]
 
         # Generate grids for both metrics
         synapse_content, cell_content = self._generate_metric_grids(
-            request, region, side, data_map, region_config, grid_generator_func
+            request,
+            region,
+            side,
+            plan["data_map"],
+            plan["region_config"],
+            grid_generator_func,
         )
 
         return {
@@ -103,7 +197,58 @@ class RegionGridProcessor:
             "cell_content": cell_content,
             "region": region,
             "side": side,
+            "fingerprint": plan["fingerprint"],
+        }
+
+    def compute_grid_fingerprint(
+        self,
+        request: GridGenerationRequest,
+        region: str,
+        side: str,
+        data_map: Dict,
+        region_config: Dict,
+        fingerprint_settings: Dict,
+    ) -> str:
+        """
+        Compute a fingerprint of everything that determines a region/side grid.
+
+        The fingerprint covers the region's column data and column
+        layout, thresholds and min/max normalization, the output format and the
+        given rendering settings, so a changed input yields a new fingerprint.
+
+        Args:
+            request: GridGenerationRequest containing all generation parameters
+            region: Region name
+            side: Side identifier
+            data_map: Organized data map for this side
+            region_config: Region-specific configuration
+            fingerprint_settings: Rendering settings that affect the output
+
+        Returns:
+            Hex digest identifying the grid content
+        """
+        fingerprint_input = {
+            "version": EYEMAP_FINGERPRINT_VERSION,
+            "region": region,
+            "side": side,
+            "soma_side": request.soma_side,
+            "neuron_type": request.neuron_type,
+            "output_format": request.output_format,
+            "thresholds": request.thresholds_all,
+            "min_max_data": request.min_max_data,
+            "region_config": region_config,
+            # Grids only read the data map entries of their own region
+            "data_map": {
+                key: column
+                for key, column in data_map.items()
+                if isinstance(key, tuple) and key[:1] == (region,)
+            },
+            "settings": fingerprint_settings,
         }
+        encoded = json.dumps(
+            _canonical(fingerprint_input), separators=(",", ":"), default=repr
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
     def _get_region_configuration(
         self, request: GridGenerationRequest, region: str, side: str
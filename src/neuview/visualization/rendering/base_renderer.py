@@ -148,12 +148,13 @@ class BaseRenderer(ABC):
         if not self.config.eyemaps_dir:
             raise ValueError("eyemaps_dir must be set to save files")
 
-        # Ensure the eyemaps directory exists
-        self.config.eyemaps_dir.mkdir(parents=True, exist_ok=True)
-
         # Create clean filename with appropriate extension
         clean_filename = self.config.get_clean_filename(filename)
-        file_path = self.config.eyemaps_dir / clean_filename
+        relative_path = self.config.get_eyemap_path(clean_filename)
+        file_path = self.config.eyemaps_dir / relative_path
+
+        # Ensure the eyemaps directory (or its shard) exists
+        file_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Check if file already exists to avoid duplicate generation
         # Allow overwriting for dedicated soma side files (_L_ or _R_ in filename)
@@ -162,7 +163,7 @@ class BaseRenderer(ABC):
             is_dedicated_mode = "_L_" in clean_filename or "_R_" in clean_filename
             if not is_dedicated_mode:
                 logger.debug(f"Eyemap already exists, skipping generation: {file_path}")
-                return f"../eyemaps/{clean_filename}"
+                return f"../eyemaps/{relative_path}"
             else:
                 logger.debug(
                     f"Overwriting existing dedicated soma side eyemap: {file_path}"
@@ -173,7 +174,7 @@ class BaseRenderer(ABC):
             logger.debug(f"Saved {self.__class__.__name__} output to {file_path}")
 
             # Return relative path from neuron page location (types/ to eyemaps/)
-            return f"../eyemaps/{clean_filename}"
+            return f"../eyemaps/{relative_path}"
 
         except Exception as e:
             logger.error(f"Failed to save file {file_path}: {e}")
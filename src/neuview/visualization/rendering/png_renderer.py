@@ -114,8 +114,9 @@ class PNGRenderer(BaseRenderer):
         base64_data = content.split(",", 1)[1]
 
         # Write binary PNG data
-        with open(file_path, "wb") as f:
-            f.write(base64.b64decode(base64_data))
+        from ...services.output_writer_service import get_output_writer
+
+        get_output_writer().write(file_path, base64.b64decode(base64_data))
 
     def _convert_svg_to_png(self, svg_content: str) -> str:
         """
@@ -39,6 +39,7 @@ class RenderingConfig:
     # File management
     output_dir: Optional[Path] = None
     eyemaps_dir: Optional[Path] = None
+    shard_eyemaps: bool = False
 
     # Layout configuration
     hex_size: int = 6
@@ -90,6 +91,12 @@ class RenderingConfig:
         extension = ".svg" if self.output_format == OutputFormat.SVG else ".png"
         return clean_name + extension
 
+    def get_eyemap_path(self, clean_filename: str) -> str:
+        """Get the path of an eyemap file relative to the eyemaps directory."""
+        from ...services.file_service import FileService
+
+        return FileService.sharded_path(clean_filename, self.shard_eyemaps)
+
     def copy(self, **overrides) -> "RenderingConfig":
         """Create a copy of this config with optional overrides."""
         from dataclasses import replace
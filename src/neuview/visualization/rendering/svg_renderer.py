@@ -109,8 +109,9 @@ class SVGRenderer(BaseRenderer):
             content: SVG content to write
             file_path: Path to write to
         """
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        from ...services.output_writer_service import get_output_writer
+
+        get_output_writer().write(file_path, content)
 
     def _get_template(self) -> Template:
         """
@@ -258,6 +259,7 @@ class SVGRenderer(BaseRenderer):
             "enumerate": enumerate,
             "soma_side": self.config.soma_side,
             "min_max_data": self.config.min_max_data or {},
+            "eyemap_script_src": self._get_eyemap_script_src(),
         }
 
         # Add color information if available
@@ -272,6 +274,22 @@ class SVGRenderer(BaseRenderer):
 
         return template_vars
 
+    def _get_eyemap_script_src(self) -> str:
+        """
+        Get the URL of the shared eyemap script relative to the SVG.
+
+        Saved SVGs live in eyemaps/ (or an eyemaps/ shard); embedded SVGs are
+        part of a page in types/.
+
+        Returns:
+            Relative URL of the content-hashed eyemap bundle
+        """
+        from ...services.static_bundle_service import get_static_bundles
+
+        sharded_file = self.config.shard_eyemaps and not self.config.embed_mode
+        prefix = "../../" if sharded_file else "../"
+        return get_static_bundles().url("eyemap.js", prefix)
+
     def _add_tooltips_to_hexagons(
         self, hexagons: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -0,0 +1,247 @@
+// Eyemap tooltips and layer switching
+// Shared by every eyemap SVG, which references this content-hashed bundle
+
+function getRegionAndLayerFromPath(path) {
+  let parent = path;
+  while (parent && parent.nodeType === 1) {
+    if (parent.id && parent.id.indexOf("hexplot-") === 0) {
+      const regionId = parent.id.slice("hexplot-".length);
+      const L = parseInt(parent.getAttribute("data-current-layer") || "0", 10);
+      return { regionId, layer: Number.isFinite(L) ? L : 0 };
+    }
+    parent = parent.parentNode;
+  }
+  return { regionId: null, layer: 0 };
+}
+
+function computeTitleForPath(path, layer) {
+  // Always use attributes as source of truth
+  let baseTitle = "";
+  try { baseTitle = JSON.parse(path.getAttribute("base-title") || '""'); } catch (_) {}
+  let tips = [];
+  try { tips = JSON.parse(path.getAttribute("tooltip-layers") || "[]"); } catch (_) {}
+
+  if (layer > 0 && Array.isArray(tips)) {
+    const idx = layer - 1;
+    if (idx >= 0 && idx < tips.length && typeof tips[idx] === "string") {
+      let srch = /count: \d+\nROI: (LOP|LO|ME)\d*?.*?\(/g;
+      let rtn = baseTitle.replace(srch, "count: " + tips[idx] + " (");
+      return rtn;
+    }
+  }
+  return baseTitle || "";
+}
+// sT = showTooltip
+function sT(evt) {
+  const tooltip = document.getElementById("tooltip");
+  const path = evt.target;
+
+  // figure out which layer is currently active
+  const { layer: currentLayer } = getRegionAndLayerFromPath(path);
+
+  // compute the text to show; do NOT cache from <title>
+  const text = computeTitleForPath(path, currentLayer);
+  if (!text) return;
+
+  // suppress native tooltip
+  const titleElement = path.querySelector("title");
+  if (titleElement) titleElement.textContent = "";
+
+  // render custom tooltip
+  const lines = text.split("\n");
+  const textGroup = document.getElementById("tooltip-text-group");
+  while (textGroup.firstChild) textGroup.removeChild(textGroup.firstChild);
+
+  let maxWidth = 0;
+  const lineHeight = 14;
+  const padding = 6;
+
+  for (let i = 0; i < lines.length; i++) {
+    const s = lines[i].trim();
+    if (!s) continue;
+    const t = document.createElementNS("http://www.w3.org/2000/svg", "text");
+    t.setAttribute("x", padding);
+    t.setAttribute("y", padding + lineHeight + (i * lineHeight));
+    t.setAttribute("class", "tooltip-text");
+    t.textContent = s;
+    textGroup.appendChild(t);
+    const approx = s.length * 6.5; // same approximation you used
+    if (approx > maxWidth) maxWidth = approx;
+  }
+
+  const rect = document.getElementById("tooltip-rect");
+  const boxWidth = Math.max(maxWidth + padding * 2, 100);
+  const boxHeight = lines.length * lineHeight + padding * 2;
+  rect.setAttribute("width", boxWidth);
+  rect.setAttribute("height", boxHeight);
+
+  const svgElement = evt.currentTarget.ownerSVGElement;
+  const svgRect = svgElement.getBoundingClientRect();
+  const svgWidth = svgElement.viewBox.baseVal.width || svgRect.width;
+  let x = evt.clientX - svgRect.left + 10;
+  let y = evt.clientY - svgRect.top - boxHeight - 10;
+
+  if (x + boxWidth > svgWidth) x = svgWidth - boxWidth - 5;
+  if (y < 0) y = evt.clientY - svgRect.top + 10;
+  if (x < 0) x = 5;
+
+  tooltip.setAttribute("transform", "translate(" + x + "," + y + ")");
+  tooltip.setAttribute("opacity", "1");
+}
+
+/* ht = hideTooltip */
+function ht() {
+    var tooltip = document.getElementById("tooltip");
+    if (tooltip) {
+        tooltip.setAttribute("opacity", "0");
+    }
+}
+/* rT = restore Title */
+function rT(evt) {
+  const path = evt.target;
+  const { layer: currentLayer } = getRegionAndLayerFromPath(path);
+  const titleElement = path.querySelector("title");
+  if (!titleElement) return;
+  titleElement.textContent = computeTitleForPath(path, currentLayer);
+}
+
+
+/* Highlight the active layer square */
+function setActiveLayerControl(regionId, layer) {
+    var group = document.getElementById("layerControls-" + regionId);
+    if (!group) return;
+    var squares = group.querySelectorAll("rect.ls");
+    squares.forEach(function(r) {
+        if (parseInt(r.getAttribute("data-layer"), 10) === layer) {
+            r.classList.remove("inactive");
+            r.classList.add("active");
+        } else {
+            r.classList.remove("active");
+            r.classList.add("inactive");
+        }
+    });
+
+}
+
+/* ===== Legend threshold switching ===== */
+
+function updateLegendThresholds(layer, regionId) {
+    // Find the legend group for this region
+    var legend = document.getElementById("legend-" + regionId);
+    if (!legend) return;
+
+    var baseThresholds = [];
+    var regionThresholds = {}; // dict: { ME: [...], LO: [...], LOP: [...] }
+
+    try {
+        baseThresholds = JSON.parse(legend.getAttribute("data-base-thresholds") || "[]");
+        // Previously this was a list-of-lists; now it's a dict keyed by regionId
+        var raw = legend.getAttribute("data-layer-thresholds") || "{}";
+        regionThresholds = JSON.parse(raw);
+    } catch (e) {
+        return; // malformed JSON; bail quietly
+    }
+
+    // Choose thresholds
+    var thr;
+    if (layer === 0) {
+        thr = baseThresholds; // default thresholds (length 6)
+    } else {
+        // Same thresholds for all layers of the same region
+        thr = (regionThresholds && regionThresholds[regionId]) || baseThresholds;
+    }
+
+    // Update tick labels (expect 6 ticks)
+    for (var i = 0; i < 6; i++) {
+        var t = document.getElementById("legend-label-" + i + "-" + regionId);
+        if (t) t.textContent = Math.round((thr[i] ?? 0));
+    }
+
+}
+
+function updateLayer(layer, regionId) {
+  // --- helpers ---
+  const toInt = (v) => {
+    const n = Number.parseInt(v, 10);
+    return Number.isFinite(n) ? n : 0;
+  };
+
+  const parseJSONAttr = (el, attr, fallback) => {
+    const raw = el.getAttribute(attr);
+    if (!raw) return fallback;
+    try { return JSON.parse(raw); } catch (_) { return fallback; }
+  };
+
+  const normHex = (c) =>
+    (typeof c === "string" ? c.trim().toLowerCase() : "");
+
+  const chooseFallback = (defaultColor) =>
+    defaultColor === "#999999" ? defaultColor : "#ffffff";
+
+  // --- inputs & container ---
+  const L = toInt(layer);
+  const hexplot = document.getElementById("hexplot-" + regionId);
+  if (!hexplot) return;
+
+  // NodeList is iterable in modern browsers
+  const paths = hexplot.querySelectorAll("path");
+
+  paths.forEach((path) => {
+    // Palette and values per path
+    const colors = parseJSONAttr(path, "layer-colors", []);
+
+    // Default color precedence: explicit default-fill, then existing fill, then white
+    const defaultColor =
+      path.getAttribute("default-fill") ||
+      path.getAttribute("fill") ||
+      "#ffffff";
+
+    // Layer 0 => use default color directly
+    if (L === 0) {
+      path.setAttribute("fill", defaultColor);
+    } else {
+      // 1..N -> 0..N-1 index
+      const idx = L - 1;
+      let chosen = defaultColor;
+
+      if (Array.isArray(colors) && idx >= 0 && idx < colors.length) {
+        const candidate = colors[idx];
+        const hex = normHex(candidate);
+
+        // Treat pure white as "no data" and fall back
+        const pass = hex !== "#ffffff" && hex !== "";
+
+        chosen = pass ? candidate : chooseFallback(normHex(defaultColor));
+      } else {
+        // If no palette entry, still fall back predictably
+        chosen = chooseFallback(normHex(defaultColor));
+      }
+
+      path.setAttribute("fill", chosen);
+    }
+
+    // ----- Tooltip/title handling -----
+    const titleEl = path.querySelector("title");
+    if (!titleEl) return;
+
+    const baseTitle = parseJSONAttr(path, "base-title", "");
+    const tips = parseJSONAttr(path, "tooltip-layers", []);
+
+    let newTitle = baseTitle;
+    if (L > 0 && Array.isArray(tips)) {
+      const li = L - 1;
+      if (li >= 0 && li < tips.length && typeof tips[li] === "string") {
+        newTitle = tips[li];
+      }
+    }
+
+    titleEl.textContent = computeTitleForPath(path, L);
+  });
+
+  // Store current layer for other UI logic
+  hexplot.setAttribute("data-current-layer", String(L));
+
+  // External UI updates (assumed to exist)
+  updateLegendThresholds(L, regionId);
+  setActiveLayerControl(regionId, L);
+}
@@ -0,0 +1,28 @@
+// Global JavaScript functionality for all pages
+// Bundled as a content-hashed file; page-specific values are passed in
+
+// Open a prefilled GitHub feedback issue from the feedback button
+function initializeFeedbackButton(options) {
+  document.addEventListener("DOMContentLoaded", function () {
+    const feedbackBtn = document.getElementById("feedback-btn");
+    if (feedbackBtn) {
+      feedbackBtn.addEventListener("click", function (e) {
+        e.preventDefault();
+        const githubUrl =
+          options.githubRepo +
+          "/issues/new?template=feedback.yml" +
+          "&url=" +
+          encodeURIComponent(window.location.href) +
+          "&browser=" +
+          encodeURIComponent(navigator.userAgent) +
+          "&dataset=" +
+          encodeURIComponent(options.dataset) +
+          "&neuview-version=" +
+          encodeURIComponent(options.version) +
+          "&snapshot-date=" +
+          encodeURIComponent(options.snapshotDate);
+        window.open(githubUrl, "_blank");
+      });
+    }
+  });
+}
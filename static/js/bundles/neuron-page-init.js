@@ -0,0 +1,268 @@
+// Neuron page initialization
+// Bundled as a content-hashed file; the page passes its own data to
+// initializeNeuronPage()
+
+// Render function for percentage columns: display as is, sort numerically
+function renderPercentageColumn(data, type, row) {
+  if (type === "display") {
+    return data;
+  }
+  return parseFloat(data.replace("%", "")) || 0;
+}
+
+// CSV and copy buttons of a DataTable
+function createTableButtons(pageData, filename, title, description) {
+  const iconStyle =
+    'width="16" height="16" style="filter: brightness(0) invert(1);"';
+  return [
+    {
+      extend: "csv",
+      text:
+        '<img src="' +
+        pageData.staticPrefix +
+        'static/icons/download.svg" ' +
+        iconStyle +
+        ">",
+      filename: filename,
+      title: title,
+      exportOptions: { modifier: { search: "applied" } },
+      attr: { title: "Download currently visible " + description + " as CSV" },
+    },
+    {
+      extend: "copy",
+      text:
+        '<img src="' +
+        pageData.staticPrefix +
+        'static/icons/copy.svg" ' +
+        iconStyle +
+        ">",
+      exportOptions: { modifier: { search: "applied" } },
+      attr: { title: "Copy currently visible " + description + " to clipboard" },
+    },
+  ];
+}
+
+// DataTables options for rows loaded from the page's table data file.
+// Each cell is its HTML content or a [content, attributes] pair; rows get
+// the same ids (prefix + index) and cell attributes as server-rendered rows.
+function createLazyRowOptions(rows, rowPrefix) {
+  if (!rows) return {};
+  return {
+    data: rows.map(function (row) {
+      return row.map(function (cell) {
+        return typeof cell === "string" ? cell : cell[0];
+      });
+    }),
+    createdRow: function (tr, data, dataIndex) {
+      tr.id = rowPrefix + dataIndex;
+      rows[dataIndex].forEach(function (cell, col) {
+        if (typeof cell === "string") return;
+        const td = tr.cells[col];
+        Object.keys(cell[1]).forEach(function (name) {
+          if (name === "class") {
+            td.classList.add.apply(td.classList, cell[1][name].split(" "));
+          } else {
+            td.setAttribute(name, cell[1][name]);
+          }
+        });
+      });
+    },
+  };
+}
+
+// ROI innervation table with % input and % output filters
+function initializeRoiTable(pageData) {
+  const neuronType = pageData.neuronType;
+
+  // Add custom search for ROI table (checks % In and % Out)
+  $.fn.dataTable.ext.search.push(createROIPercentageFilter("roi-table"));
+
+  const options = {
+    order: [[1, "desc"]],
+    pageLength: -1,
+    paging: false,
+    responsive: true,
+    buttons: createTableButtons(
+      pageData,
+      "roi_innervation_" + neuronType,
+      "ROI Innervation Data - " + neuronType,
+      "ROI innervation data",
+    ),
+    layout: {
+      topStart: "search",
+      topEnd: [$(createROIPercentageSliderInHeader("roi-table")), "buttons"],
+      bottomEnd: null,
+    },
+    language: {
+      search: "",
+      searchPlaceholder: "Filter",
+      info: "Filter for _TOTAL_ of _MAX_ ROIs innervated by " + neuronType,
+      infoEmpty:
+        "None of the _MAX_ ROI regions innervated by " +
+        neuronType +
+        " match filter",
+      infoFiltered: "",
+    },
+    columnDefs: [
+      { targets: 2, type: "num-fmt", render: renderPercentageColumn },
+      { targets: 5, type: "num-fmt", render: renderPercentageColumn },
+    ],
+    drawCallback: function (settings) {
+      calculateCumulativePercentages(
+        this.api(),
+        2,
+        pageData.roiInputPreciseData,
+      );
+      calculateCumulativePercentages(
+        this.api(),
+        5,
+        pageData.roiOutputPreciseData,
+      );
+    },
+    initComplete: function (settings, json) {
+      setupROIPercentageSlider(
+        "roi-percentage-slider",
+        "roi-slider-value",
+        this.api(),
+      );
+    },
+  };
+  Object.assign(options, createLazyRowOptions(pageData.roiRows, "r"));
+  return $("#roi-table").DataTable(options);
+}
+
+// Upstream or downstream partner table with a connections filter
+function initializePartnerTable(pageData, direction, preciseData) {
+  const neuronType = pageData.neuronType;
+  const tableId = direction + "-table";
+  const partnerLabel = direction === "upstream" ? "input" : "output";
+  const capitalized = direction.charAt(0).toUpperCase() + direction.slice(1);
+
+  // Add custom search for this table only
+  $.fn.dataTable.ext.search.push(createConnectionsFilter(tableId, 3));
+
+  const options = {
+    order: [[3, "desc"]],
+    pageLength: -1,
+    paging: false,
+    responsive: true,
+    buttons: createTableButtons(
+      pageData,
+      "roi_innervation_" + neuronType,
+      capitalized + " Partner Data - " + neuronType,
+      direction + " partner data",
+    ),
+    layout: {
+      topStart: "search",
+      topEnd: [
+        $(createConnectionsSliderInHeader(tableId, neuronType)),
+        "buttons",
+      ],
+    },
+    language: {
+      search: "",
+      searchPlaceholder: "Filter",
+      info:
+        "Filter for _TOTAL_ of _MAX_ " +
+        partnerLabel +
+        " neuron types to " +
+        neuronType,
+      infoEmpty:
+        "None of the _MAX_ " +
+        partnerLabel +
+        " neuron types to " +
+        neuronType +
+        " match filter",
+      infoFiltered: "",
+    },
+    columnDefs: [{ targets: 4, type: "num-fmt", render: renderPercentageColumn }],
+    drawCallback: function (settings) {
+      calculateCumulativePercentages(this.api(), 4, preciseData);
+    },
+    initComplete: function (settings, json) {
+      setupConnectionsSlider(
+        direction + "-connections-slider",
+        direction + "-slider-value",
+        this.api(),
+      );
+    },
+  };
+  Object.assign(
+    options,
+    createLazyRowOptions(pageData[direction + "Rows"], direction.charAt(0)),
+  );
+  return $("#" + tableId).DataTable(options);
+}
+
+// Light/dark theme toggle of the neuron visualization section
+function initializeThemeToggle() {
+  const section = document.getElementById("neuron-visualization");
+  const input = document.getElementById("nv-theme-toggle");
+  if (!section || !input) return;
+
+  // Load saved or system preference
+  const saved =
+    localStorage.getItem("nvTheme") ||
+    (window.matchMedia && matchMedia("(prefers-color-scheme: light)").matches
+      ? "light"
+      : "dark");
+
+  section.setAttribute("data-theme", saved);
+  input.checked = saved === "light";
+
+  input.addEventListener("change", () => {
+    const mode = input.checked ? "light" : "dark";
+    section.setAttribute("data-theme", mode);
+    localStorage.setItem("nvTheme", mode);
+  });
+}
+
+// ROI, upstream and downstream tables of the page
+function initializeTables(pageData) {
+  if (pageData.roiInputPreciseData && pageData.roiInputPreciseData.length > 0) {
+    initializeRoiTable(pageData);
+  }
+  if (pageData.upstreamPreciseData && pageData.upstreamPreciseData.length > 0) {
+    initializePartnerTable(pageData, "upstream", pageData.upstreamPreciseData);
+  }
+  if (
+    pageData.downstreamPreciseData &&
+    pageData.downstreamPreciseData.length > 0
+  ) {
+    initializePartnerTable(
+      pageData,
+      "downstream",
+      pageData.downstreamPreciseData,
+    );
+  }
+}
+
+// Initialize a neuron page from its page-specific data
+function initializeNeuronPage(pageData) {
+  $(document).ready(function () {
+    // Initialize neuroglancer links BEFORE DataTables to ensure checkboxes are set up first
+    initializeNeuroglancerLinks(pageData.neuroglancer);
+
+    if (pageData.tablesUrl) {
+      // Lazy tables: rows come from the table data file next to the page
+      fetch(pageData.tablesUrl)
+        .then(function (response) {
+          if (!response.ok) throw new Error(response.statusText);
+          return response.json();
+        })
+        .then(function (tableData) {
+          initializeTables(Object.assign({}, pageData, tableData));
+          initializeAllTooltips();
+        })
+        .catch(function (error) {
+          console.error("Failed to load table data:", pageData.tablesUrl, error);
+        });
+    } else {
+      initializeTables(pageData);
+    }
+
+    initializeAllTooltips();
+  });
+
+  document.addEventListener("DOMContentLoaded", initializeThemeToggle);
+}
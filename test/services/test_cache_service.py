@@ -0,0 +1,130 @@
+"""
+Test suite for CacheService persistent neuron type cache records.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+
+from neuview.commands import GeneratePageCommand
+from neuview.models.domain_models import NeuronTypeName
+from neuview.services.cache_service import CacheService
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a cache manager that records the saved cache data."""
+    manager = Mock()
+    manager.load_roi_hierarchy.return_value = {"roi": "hierarchy"}
+    return manager
+
+
+@pytest.fixture
+def command():
+    """Create a sample GeneratePageCommand."""
+    return GeneratePageCommand(neuron_type=NeuronTypeName("Tm3"))
+
+
+def _summary(left, right):
+    return {
+        "total_count": left + right,
+        "left_count": left,
+        "right_count": right,
+        "middle_count": 0,
+        "total_pre_synapses": 900,
+        "total_post_synapses": 1200,
+        "avg_pre_synapses": 3.0,
+        "avg_post_synapses": 4.0,
+        "consensus_nt": "ACh",
+    }
+
+
+@pytest.mark.unit
+class TestCacheService:
+    """Test cases for CacheService.save_neuron_data_to_cache."""
+
+    @pytest.mark.unit
+    def test_record_is_built_from_summary_without_per_neuron_rows(
+        self, cache_manager, command
+    ):
+        """Neuron rows that cannot become domain objects do not block the save."""
+        neurons = pd.DataFrame(
+            {
+                "bodyId": np.arange(3000, dtype=float),
+                "somaSide": ["L", "R"] * 1500,
+                "pre": ["n/a"] * 3000,
+            }
+        )
+        neurons.loc[0, "bodyId"] = np.nan
+        neuron_data = {
+            "neurons": neurons,
+            "summary": _summary(1500, 1500),
+            "connectivity": {"upstream": [{"type": "Mi1"}], "downstream": []},
+        }
+
+        service = CacheService(cache_manager)
+        asyncio.run(service.save_neuron_data_to_cache("Tm3", neuron_data, command))
+
+        record = cache_manager.save_neuron_type_cache.call_args.args[0]
+        assert record.total_count == 3000
+        assert record.soma_side_counts == {
+            "left": 1500,
+            "right": 1500,
+            "middle": 0,
+            "total": 3000,
+        }
+        assert record.synapse_stats["avg_total"] == 7.0
+        assert record.soma_sides_available == ["left", "right", "combined"]
+        assert record.has_connectivity
+        assert record.consensus_nt == "ACh"
+
+    @pytest.mark.unit
+    def test_spatial_metrics_from_column_rois(self, cache_manager, command):
+        """Column coverage and cell size are aggregated per region and side."""
+        roi_counts = pd.DataFrame(
+            {
+                "bodyId": [1, 1, 2, 2, 2, 3, 3],
+                "roi": [
+                    "ME_R_col_10_11",
+                    "ME_R_col_10_12",
+                    "ME_R_col_10_12",
+                    "ME_R_col_10_13",
+                    "ME(R)",
+                    "LO_L_col_1_2",
+                    "ME_R_layer_3",
+                ],
+                "pre": [1] * 7,
+                "post": [1] * 7,
+            }
+        ).astype({"roi": "category"})
+        neuron_data = {
+            "neurons": pd.DataFrame({"bodyId": [1, 2, 3]}),
+            "roi_counts": roi_counts,
+            "summary": _summary(1, 2),
+        }
+        page_generator = Mock()
+        page_generator._aggregate_roi_data.return_value = []
+
+        service = CacheService(cache_manager, page_generator)
+        asyncio.run(
+            service.save_neuron_data_to_cache("Tm3", neuron_data, command, Mock())
+        )
+
+        metrics = cache_manager.save_neuron_type_cache.call_args.args[0].spatial_metrics
+        assert metrics["R"]["ME"] == {
+            "cols_innervated": 3,
+            "coverage": pytest.approx(4 / 3),
+            "cell_size": 2.0,
+        }
+        assert metrics["L"]["LO"] == {
+            "cols_innervated": 1,
+            "coverage": 1.0,
+            "cell_size": 1.0,
+        }
+        assert metrics["L"]["ME"]["cols_innervated"] == 0
+        assert metrics["L"]["ME"]["coverage"] is None
+        assert metrics["both"]["ME"]["cols_innervated"] == 1.5
+        assert metrics["both"]["LOP"]["coverage"] is None
@@ -2,12 +2,17 @@
 Test suite for SomaDetectionService combined page generation logic.
 """
 
+import threading
+import time
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock
 from neuview.services.soma_detection_service import SomaDetectionService
 from neuview.commands import GeneratePageCommand
-from neuview.models.domain_models import NeuronTypeName, SomaSide
+from neuview.models.domain_models import NeuronTypeName
 from neuview.result import Ok, Err
+from neuview.type_bundle import TypeBundle
 
 
 @pytest.fixture
@@ -42,7 +47,6 @@ def sample_command():
     """Create a sample GeneratePageCommand."""
     return GeneratePageCommand(
         neuron_type=NeuronTypeName("CB0674"),
-        soma_side=SomaSide.ALL,
         output_directory="output",
         image_format="svg",
         embed_images=False,
@@ -251,3 +255,81 @@ class TestSomaDetectionService:
         assert result["unknown_count"] == 0
         # Two sides should generate combined page
         assert result["should_generate_combined"]
+
+    @pytest.mark.asyncio
+    async def test_side_pages_are_generated_concurrently(
+        self, detection_service, mock_dependencies, sample_command
+    ):
+        """Test that the side pages of a type are generated at the same time."""
+        mock_dependencies["neuron_statistics_service"].has_data = AsyncMock(
+            return_value=Ok(True)
+        )
+        mock_dependencies[
+            "neuron_statistics_service"
+        ].get_soma_side_distribution = AsyncMock(
+            return_value=Ok({"left": 3, "right": 4, "middle": 0, "total": 7})
+        )
+        connector = mock_dependencies["connector"]
+        connector.get_neuron_data = Mock(return_value={"neurons": [1, 2, 3]})
+        connector.get_type_bundle = lambda neuron_type: TypeBundle(
+            connector, neuron_type
+        )
+        mock_dependencies["cache_service"].save_neuron_data_to_cache = AsyncMock()
+
+        # Each page waits until all three pages are being generated
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate_page(request):
+            barrier.wait()
+            return SimpleNamespace(success=True, output_path=request.soma_side)
+
+        mock_dependencies["page_generator"].generate_page_unified = generate_page
+
+        result = await detection_service.generate_pages_with_auto_detection(
+            sample_command
+        )
+
+        assert result.unwrap() == "combined, left, right"
+        mock_dependencies[
+            "cache_service"
+        ].save_neuron_data_to_cache.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_side_page_does_not_stop_other_sides(
+        self, detection_service, mock_dependencies, sample_command
+    ):
+        """Test that pages are reported in side order when one of them fails."""
+        mock_dependencies["neuron_statistics_service"].has_data = AsyncMock(
+            return_value=Ok(True)
+        )
+        mock_dependencies[
+            "neuron_statistics_service"
+        ].get_soma_side_distribution = AsyncMock(
+            return_value=Ok({"left": 3, "right": 4, "middle": 2, "total": 9})
+        )
+        connector = mock_dependencies["connector"]
+        connector.get_neuron_data = Mock(return_value={"neurons": [1, 2, 3]})
+        connector.get_type_bundle = lambda neuron_type: TypeBundle(
+            connector, neuron_type
+        )
+        mock_dependencies["cache_service"].save_neuron_data_to_cache = AsyncMock()
+
+        def generate_page(request):
+            if request.soma_side == "combined":
+                time.sleep(0.1)
+            return SimpleNamespace(
+                success=request.soma_side != "right",
+                output_path=request.soma_side,
+                error_message="render failed",
+            )
+
+        mock_dependencies["page_generator"].generate_page_unified = generate_page
+
+        result = await detection_service.generate_pages_with_auto_detection(
+            sample_command
+        )
+
+        assert result.unwrap() == "combined, left, middle"
+        mock_dependencies[
+            "cache_service"
+        ].save_neuron_data_to_cache.assert_awaited_once()
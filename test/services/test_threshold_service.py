@@ -0,0 +1,100 @@
+"""
+Test suite for the content-addressed threshold cache of ThresholdService.
+"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from neuview.cache import NeuronTypeCacheManager
+from neuview.services.threshold_service import ThresholdService
+
+
+def _column_layer_frame(synapses):
+    return pd.DataFrame(
+        {
+            "hex1": [1, 1, 2],
+            "hex2": [5, 5, 6],
+            "layer": [1, 2, 1],
+            "region": ["ME", "ME", "LO"],
+            "side": ["R", "R", "R"],
+            "total_synapses": synapses,
+            "bodyId": [10, 11, 10],
+        }
+    )
+
+
+@pytest.mark.unit
+class TestThresholdCache:
+    """Test cases for the ThresholdService threshold cache."""
+
+    @pytest.mark.unit
+    def test_equally_shaped_frames_do_not_share_entries(self):
+        """Keys fingerprint the column values, not just the frame shape."""
+        service = ThresholdService()
+        first = _column_layer_frame([3, 4, 7])
+        second = _column_layer_frame([30, 40, 70])
+
+        assert service._create_cache_key(first, 5, "linear") != (
+            service._create_cache_key(second, 5, "linear")
+        )
+        assert service._create_cache_key(first, 5, "linear") == (
+            service._create_cache_key(first.copy(), 5, "linear")
+        )
+
+        expected = ThresholdService().compute_thresholds(second)
+        service.compute_thresholds(first)
+        assert service.compute_thresholds(second) == expected
+        assert service.compute_thresholds(second) == expected
+        assert expected["total_synapses"]["layers"]["ME"][-1] == 40.0
+
+    @pytest.mark.unit
+    def test_thresholds_persist_across_services(self, tmp_path, monkeypatch):
+        """A new service reads thresholds persisted by an earlier one."""
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        frame = _column_layer_frame([3, 4, 7])
+        expected = ThresholdService(cache_manager=cache_manager).compute_thresholds(
+            frame
+        )
+
+        service = ThresholdService(cache_manager=cache_manager)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("thresholds were recomputed")
+
+        monkeypatch.setattr(service, "calculate_thresholds", fail)
+        cached = service.compute_thresholds(frame)
+        assert cached == expected
+        assert cached is not expected
+
+        cached["neuron_count"]["all"].append(99.0)
+        assert service.compute_thresholds(frame) == expected
+        assert "thresholds" not in cache_manager.list_cached_neuron_types()
+
+    @pytest.mark.unit
+    def test_unused_entries_are_pruned(self, tmp_path):
+        """Entries not saved or loaded within the expiry time are removed."""
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        cache_manager.save_thresholds("stale", {"total_synapses": {}})
+        cache_manager.save_thresholds("used", {"total_synapses": {}})
+        old = time.time() - cache_manager.cache_expiry_seconds - 60
+        for key in ("stale", "used"):
+            os.utime(tmp_path / "thresholds" / f"{key}.json", (old, old))
+
+        assert cache_manager.load_thresholds("used") == {"total_synapses": {}}
+        assert cache_manager.prune_thresholds() == 1
+        assert cache_manager.load_thresholds("stale") is None
+        assert cache_manager.load_thresholds("used") is not None
+
+    @pytest.mark.unit
+    def test_unpersisted_thresholds_stay_in_memory(self, tmp_path):
+        """Callers that cache thresholds themselves skip the threshold files."""
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        service = ThresholdService(cache_manager=cache_manager)
+        frame = _column_layer_frame([3, 4, 7])
+
+        thresholds = service.compute_thresholds(frame, persist=False)
+        assert service.compute_thresholds(frame, persist=False) == thresholds
+        assert not list(tmp_path.glob("thresholds/*.json"))
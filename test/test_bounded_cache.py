@@ -0,0 +1,107 @@
+"""Unit tests for the memory-bounded cache of the connector data."""
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.config import Config
+from neuview.neuprint_connector import NeuPrintConnector
+from neuview.strategies.cache import BoundedMemoryCacheStrategy, estimate_size
+
+
+def _neurons(count):
+    return pd.DataFrame(
+        {
+            "bodyId": range(count),
+            "somaSide": ["L", "R"] * (count // 2),
+            "type": [f"type_{i}" for i in range(count)],
+        }
+    )
+
+
+@pytest.mark.unit
+class TestBoundedMemoryCache:
+    """Test cases for BoundedMemoryCacheStrategy."""
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used_over_budget(self, monkeypatch):
+        """Entries are sized deeply and the oldest are evicted over budget."""
+        frame = _neurons(1000)
+        assert estimate_size(frame) == frame.memory_usage(deep=True).sum()
+        assert estimate_size({"a": frame, "b": frame}) < 2 * estimate_size(frame)
+
+        budget = 2.5 * estimate_size(frame)
+        cache = BoundedMemoryCacheStrategy(max_memory_mb=budget / 1024 / 1024)
+        cache.put("first", frame)
+        cache.put("second", frame.copy())
+        assert cache.get("first") is frame
+        cache.put("third", frame.copy())
+
+        assert cache.keys() == ["first", "third"]
+        assert cache.get("second") is None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert 0 < stats["bytes"] <= stats["max_bytes"]
+
+        now = 1000.0
+        monkeypatch.setattr(
+            "neuview.visualization.performance.cache.time.time", lambda: now
+        )
+        cache.put("short", "value", ttl=10)
+        assert cache.contains("short")
+        now += 11
+        assert cache.get("short") is None
+        assert cache.stats()["expirations"] == 1
+
+        cache.clear()
+        assert cache.size() == 0 and cache.stats()["bytes"] == 0
+
+    @pytest.mark.unit
+    def test_connector_data_cache_stays_within_budget(self):
+        """Raw neuron data of old types is evicted and later refetched."""
+        config = Config.create_minimal_for_testing()
+        # Each entry holds the frame and its soma side partition: room for two
+        config.neuprint.cache_memory_mb = 6 * estimate_size(_neurons(2000)) / 2**20
+        with patch("neuview.neuprint_connector.Client") as mock_client_class:
+            mock_client_class.return_value = Mock()
+            connector = NeuPrintConnector(config)
+
+        fetched = []
+
+        def fetch(neuron_type):
+            fetched.append(neuron_type)
+            return _neurons(2000), pd.DataFrame()
+
+        connector._fetch_raw_neuron_data = fetch
+        for neuron_type in ["A", "B", "A", "C", "A", "D", "A"]:
+            neurons_df, _ = connector._get_or_fetch_raw_neuron_data(neuron_type)
+            assert len(neurons_df) == 2000
+
+        assert fetched == ["A", "B", "C", "D"]
+        stats = connector.get_cache_stats()
+        assert stats["cached_neuron_types"] == 2
+        assert stats["data_cache_evictions"] == 2
+        assert stats["data_cache_bytes"] <= stats["data_cache_max_bytes"]
+        assert (stats["cache_hits"], stats["cache_misses"]) == (3, 4)
+
+        connector.clear_neuron_data_cache("A")
+        assert connector.get_cache_stats()["cached_neuron_types"] == 1
+
+    @pytest.mark.unit
+    def test_connector_entries_are_sized_with_statistics(self):
+        """Raw data entries are complete when the cache sizes them."""
+        config = Config.create_minimal_for_testing()
+        with patch("neuview.neuprint_connector.Client") as mock_client_class:
+            mock_client_class.return_value = Mock()
+            connector = NeuPrintConnector(config)
+
+        cached_data = connector._cache_raw_neuron_data(
+            "A", _neurons(500), pd.DataFrame()
+        )
+        assert "statistics" in cached_data
+        bytes_cached = connector.get_cache_stats()["data_cache_bytes"]
+        assert bytes_cached == estimate_size(cached_data)
+
+        assert connector._get_soma_side_statistics("A") is cached_data["statistics"]
+        assert connector.get_cache_stats()["data_cache_bytes"] == bytes_cached
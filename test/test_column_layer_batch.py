@@ -0,0 +1,130 @@
+"""Unit tests for the batched column layer query."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from neuview.column_layer_cache import load_column_layer_cache
+from neuview.services.data_processing_service import DataProcessingService
+from neuview.services.threshold_service import ThresholdService
+
+LAYERS = [("ME", "R", 1), ("ME", "R", 2)]
+
+
+def _rows(neuron_type=None):
+    rows = pd.DataFrame(
+        {
+            "hex1": [1, 1, 2],
+            "hex2": [5, 5, 6],
+            "layer": [1, 2, 1],
+            "region": ["ME"] * 3,
+            "side": ["R"] * 3,
+            "total_synapses": [3, 4, 7],
+            "bodyId": [10, 11, 10],
+            "neuron_count": [1, 1, 1],
+        }
+    )
+    if neuron_type is not None:
+        rows.insert(0, "type", neuron_type)
+    return rows
+
+
+class _Client:
+    """NeuPrint client stub recording the column layer queries it receives."""
+
+    def __init__(self, result, column_types=()):
+        self.result = result
+        self.column_types = list(column_types)
+        self.queries = []
+        self.column_roi_queries = []
+
+    def fetch_custom(self, query):
+        if "roiInfo" in query:
+            self.column_roi_queries.append(query)
+            return pd.DataFrame({"type": self.column_types})
+        self.queries.append(query)
+        return self.result
+
+
+def _service():
+    page_generator = SimpleNamespace(
+        config=None,
+        threshold_service=ThresholdService(),
+        _get_all_dataset_layers=lambda pattern, connector: LAYERS,
+    )
+    return DataProcessingService(page_generator)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return _service()
+
+
+@pytest.mark.unit
+class TestColumnLayerBatch:
+    """Test cases for DataProcessingService.warm_column_layer_cache."""
+
+    @pytest.mark.unit
+    def test_batch_matches_single_type_query(self, service, tmp_path):
+        """A warmed cache entry equals the one of the per-type query."""
+        single = SimpleNamespace(client=_Client(_rows()))
+        expected = _service().get_column_layer_values("Tm3", single)
+        cache_dir = tmp_path / "output/.cache/col_layers"
+        expected_arrays, *expected_metadata = load_column_layer_cache(
+            cache_dir / "Tm3.npz"
+        )
+        (cache_dir / "Tm3.npz").unlink()
+
+        mi1_rows = _rows("Mi1").head(2)
+        batch = SimpleNamespace(
+            client=_Client(pd.concat([_rows("Tm3"), mi1_rows]), ["Mi1", "Tm3"])
+        )
+        assert service.warm_column_layer_cache(["Tm3", "Mi1"], batch) == [
+            "Tm3",
+            "Mi1",
+        ]
+        assert len(batch.client.queries) == 1
+        assert "UNWIND ['Tm3', 'Mi1'] AS target_type" in batch.client.queries[0]
+        arrays, *metadata = load_column_layer_cache(cache_dir / "Tm3.npz")
+        assert metadata == expected_metadata
+        for name, array in expected_arrays.items():
+            np.testing.assert_array_equal(arrays[name], array)
+
+        results = service.get_column_layer_values("Mi1", batch)[0]
+        assert len(batch.client.queries) == 1
+        pd.testing.assert_frame_equal(results, expected[0].head(1))
+
+    @pytest.mark.unit
+    def test_batches_are_chunked_and_skip_cached_types(self, service):
+        """Cached types are not queried and the rest is split into chunks."""
+        connector = SimpleNamespace(client=_Client(_rows("A"), ["A", "B", "C", "D'x"]))
+        assert service.warm_column_layer_cache(["A"], connector) == ["A"]
+
+        types = ["A", "B", "C", "D'x"]
+        warmed = service.warm_column_layer_cache(types, connector, chunk_size=2)
+        assert warmed == ["B", "C", "D'x"]
+        assert len(connector.client.queries) == 3
+        assert "UNWIND ['D\\'x'] AS target_type" in connector.client.queries[2]
+
+        # Types without rows are cached empty, like the per-type query does
+        results = service.get_column_layer_values("B", connector)[0]
+        assert results.empty
+        assert len(connector.client.queries) == 3
+
+    @pytest.mark.unit
+    def test_only_column_types_are_warmed(self, service, tmp_path):
+        """Types without column ROIs and malformed results are left alone."""
+        connector = SimpleNamespace(client=_Client(_rows("Tm3"), ["Tm3"]))
+        warmed = service.warm_column_layer_cache(["Tm3", "PFNa", "EPG"], connector)
+        assert warmed == ["Tm3"]
+        assert "UNWIND ['Tm3'] AS target_type" in connector.client.queries[0]
+        cache_dir = tmp_path / "output/.cache/col_layers"
+        assert sorted(path.name for path in cache_dir.iterdir()) == ["Tm3.npz"]
+
+        # A batch result without a type column falls back to per-type queries
+        malformed = SimpleNamespace(client=_Client(_rows(), ["Mi1"]))
+        assert service.warm_column_layer_cache(["Mi1"], malformed) == []
+        assert not (cache_dir / "Mi1.npz").exists()
@@ -0,0 +1,115 @@
+"""Unit tests for the binary column layer cache."""
+
+import json
+import zipfile
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from neuview.column_layer_cache import load_column_layer_cache
+from neuview.services.data_processing_service import DataProcessingService
+from neuview.services.threshold_service import ThresholdService
+
+LAYERS = [("ME", "R", 1), ("ME", "R", 2), ("ME", "R", 3), ("LO", "R", 1)]
+
+
+def _rows():
+    return pd.DataFrame(
+        {
+            "hex1": [1, 1, 2, 4],
+            "hex2": [5, 5, 6, 7],
+            "layer": [1, 3, 2, 1],
+            "region": ["ME", "ME", "ME", "LO"],
+            "side": ["R"] * 4,
+            "total_synapses": [3, 4, 7, 9],
+            "bodyId": [10, 11, 10, 12],
+            "neuron_count": [1, 1, 1, 1],
+        }
+    )
+
+
+class _Client:
+    """NeuPrint client stub counting the queries it receives."""
+
+    def __init__(self, result):
+        self.result = result
+        self.queries = 0
+
+    def fetch_custom(self, query):
+        self.queries += 1
+        return self.result
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    page_generator = SimpleNamespace(
+        config=None,
+        threshold_service=ThresholdService(),
+        _get_all_dataset_layers=lambda pattern, connector: LAYERS,
+    )
+    return DataProcessingService(page_generator)
+
+
+@pytest.mark.unit
+class TestColumnLayerCache:
+    """Test cases for the binary column layer cache."""
+
+    @pytest.mark.unit
+    def test_cached_values_are_memory_mapped_arrays(self, service, tmp_path):
+        """Cached values load as memory-mapped arrays equal to fresh ones."""
+        connector = SimpleNamespace(client=_Client(_rows()))
+        results, thresholds, min_max_data = service.get_column_layer_values(
+            "Tm3", connector
+        )
+
+        assert list(results["hex1"]) == [1, 2, 4]
+        assert [list(v) for v in results["synapses_list"]] == [
+            [3, 0, 4],
+            [0, 7, 0],
+            [9],
+        ]
+        assert [list(v) for v in results["neurons_list"]] == [
+            [1, 0, 1],
+            [0, 1, 0],
+            [1],
+        ]
+
+        cached = service.get_column_layer_values("Tm3", connector)
+        assert connector.client.queries == 1
+        pd.testing.assert_frame_equal(cached[0], results)
+        assert cached[1:] == (thresholds, min_max_data)
+        assert min_max_data["max_syn_region"] == {"LO": 9, "ME": 7}
+
+        arrays, _, _ = load_column_layer_cache(
+            tmp_path / "output/.cache/col_layers/Tm3.npz"
+        )
+        assert isinstance(arrays["synapses"], np.memmap)
+        assert arrays["synapses"].shape == (3, 3)
+        assert list(arrays["layer_count"]) == [3, 3, 1]
+
+    @pytest.mark.unit
+    def test_unreadable_entries_are_requeried(self, service, tmp_path):
+        """Entries of another cache version or layout are queried again."""
+        connector = SimpleNamespace(client=_Client(_rows()))
+        cache_path = tmp_path / "output/.cache/col_layers/Tm3.npz"
+        service.get_column_layer_values("Tm3", connector)
+
+        with zipfile.ZipFile(cache_path) as archive:
+            metadata = json.loads(archive.read("meta.json"))
+        with zipfile.ZipFile(cache_path, "w") as archive:
+            archive.writestr("meta.json", json.dumps({**metadata, "version": 0}))
+        with pytest.raises(ValueError):
+            load_column_layer_cache(cache_path)
+
+        results = service.get_column_layer_values("Tm3", connector)[0]
+        assert connector.client.queries == 2
+        assert len(results) == 3
+
+        # Types without rows are cached as empty arrays
+        empty = SimpleNamespace(client=_Client(_rows().iloc[0:0]))
+        assert service.get_column_layer_values("Mi1", empty)[0].empty
+        assert service.get_column_layer_values("Mi1", empty)[0].empty
+        assert empty.client.queries == 1
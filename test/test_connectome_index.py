@@ -0,0 +1,229 @@
+"""Unit tests for the precomputed connectome index."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.commands import BuildConnectomeIndexCommand
+from neuview.config import Config
+from neuview.connectome_index import (
+    CONNECTOME_INDEX_VERSION,
+    ConnectomeIndex,
+    ConnectomeIndexBuilder,
+)
+from neuview.neuprint_connector import NeuPrintConnector
+from neuview.partner_metadata import PartnerMetadataTable
+from neuview.services.connectome_index_service import ConnectomeIndexService
+from neuview.soma_side_partition import SomaSidePartition
+
+NEURONS = pd.DataFrame(
+    {
+        "bodyId": [10, 11, 12, 13, 20, 21],
+        "type": ["Tm3", "Tm3", "Tm3", "Tm3", "Mi1", "Mi1"],
+        "somaSide": ["L", "R", "R", None, "L", "L"],
+    }
+)
+
+PARTNERS = pd.DataFrame(
+    {
+        "bodyId": [1, 2, 3, 4, 5, 6],
+        "type": ["Mi1", "Mi1", "Mi1", "T4a", "T4a", "Dm4"],
+        "soma_side": ["L", "L", "R", "R", "R", None],
+        "neurotransmitter": ["ach", "gaba", "ach", "glu", "glu", None],
+    }
+)
+
+# Body-level connections as (neuron, partner, weight) per direction
+CONNECTIONS = {
+    "upstream": pd.DataFrame(
+        {
+            "bodyId": [10, 10, 11, 11, 12, 12, 13, 20, 21],
+            "partner_bodyId": [1, 2, 1, 3, 4, 5, 6, 4, 2],
+            "weight": [12, 5, 7, 3, 20, 2, 4, 9, 1],
+        }
+    ),
+    "downstream": pd.DataFrame(
+        {
+            "bodyId": [10, 11, 12, 12, 13, 20],
+            "partner_bodyId": [4, 4, 5, 6, 1, 3],
+            "weight": [6, 8, 11, 3, 2, 5],
+        }
+    ),
+}
+
+
+def _partner_records(body_ids, direction):
+    connections = CONNECTIONS[direction]
+    connections = connections[connections["bodyId"].isin(body_ids)]
+    return PartnerMetadataTable(PARTNERS).records(
+        connections["partner_bodyId"], connections["weight"]
+    )
+
+
+class _Connector:
+    """Connector stub serving partitions and partner records of NEURONS."""
+
+    def __init__(self):
+        self.cleared = []
+
+    def get_available_types(self):
+        return ["Tm3", "Mi1"]
+
+    def _get_soma_side_partition(self, neuron_type):
+        neurons = NEURONS[NEURONS["type"] == neuron_type].reset_index(drop=True)
+        return SomaSidePartition(neurons, pd.DataFrame())
+
+    def _fetch_partner_records(self, body_ids, direction):
+        return _partner_records(body_ids, direction)
+
+    def clear_neuron_data_cache(self, neuron_type=None):
+        self.cleared.append(neuron_type)
+
+    def get_dataset_uuid(self):
+        return "dataset-uuid"
+
+
+def _connector(index_dir=None, uuid="dataset-uuid"):
+    config = Config.create_minimal_for_testing()
+    config.neuprint.connectome_index_dir = index_dir
+    with patch("neuview.neuprint_connector.Client") as mock_client_class:
+        mock_client_class.return_value = Mock()
+        connector = NeuPrintConnector(config)
+    connector.get_dataset_uuid = lambda: uuid
+    connector._fetch_partner_records = _partner_records
+    return connector
+
+
+def _build_index():
+    builder = ConnectomeIndexBuilder()
+    connector = _Connector()
+    for neuron_type in connector.get_available_types():
+        partition = connector._get_soma_side_partition(neuron_type)
+        for side in partition.sides:
+            body_ids = partition.neurons(side)["bodyId"].tolist()
+            builder.add_row(
+                neuron_type,
+                side,
+                {
+                    direction: _partner_records(body_ids, direction)
+                    for direction in CONNECTIONS
+                },
+            )
+    return builder.build({"server": "test.neuprint.janelia.org", "dataset": "test"})
+
+
+@pytest.mark.unit
+class TestConnectomeIndex:
+    """Test cases for ConnectomeIndex and its use by the connector."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("side", [None, "L", "R", "U"])
+    def test_partners_match_aggregated_records(self, side):
+        """Partners from the index equal those aggregated from live records."""
+        index = _build_index()
+        assert index.manifest["rows"] == 4
+        assert not index.has_type("Dm4")
+
+        connector = _connector()
+        neurons = NEURONS[NEURONS["type"] == "Tm3"]
+        if side is not None:
+            neurons = neurons[neurons["somaSide"].fillna("U") == side]
+        body_ids = neurons["bodyId"].tolist()
+
+        for direction in CONNECTIONS:
+            expected = connector._aggregate_partner_records(
+                _partner_records(body_ids, direction), body_ids
+            )
+            partners = index.partners("Tm3", side, direction, len(body_ids))
+            assert [p["weight"] for p in partners] == [p["weight"] for p in expected]
+
+            def key(partner):
+                return (partner["type"], partner["soma_side"])
+
+            assert sorted(partners, key=key) == pytest.approx(sorted(expected, key=key))
+
+    @pytest.mark.unit
+    def test_service_builds_index_the_connector_serves(self, tmp_path):
+        """The built index is saved, validated and used instead of queries."""
+        stub = _Connector()
+        service = ConnectomeIndexService(stub, Config.create_minimal_for_testing())
+        command = BuildConnectomeIndexCommand(index_dir=str(tmp_path / "index"))
+        result = asyncio.run(service.build_connectome_index(command))
+        assert result.is_ok(), result.unwrap_err()
+        assert stub.cleared == ["Tm3", "Mi1"]
+
+        index = ConnectomeIndex.load(tmp_path / "index")
+        assert index.manifest["uuid"] == "dataset-uuid"
+        assert index.arrays["upstream_indices"].dtype == np.int32
+
+        live = _connector()
+        connector = _connector(str(tmp_path / "index"))
+        connector._fetch_partner_records = Mock(side_effect=AssertionError)
+        body_ids = [11, 12]
+        neurons = pd.DataFrame({"bodyId": body_ids})
+        served = connector._get_connectivity_summary(neurons, None, "Tm3", "right")
+        expected = live._get_connectivity_summary(neurons, None, "Tm3", "right")
+        assert [p["type"] for p in served["upstream"]] == ["T4a", "Mi1", "Mi1"]
+        assert served["upstream"] == pytest.approx(expected["upstream"])
+        assert served["downstream"] == pytest.approx(expected["downstream"])
+
+        # Types missing from the index and indexes of other datasets are queried
+        connector._fetch_partner_records = _partner_records
+        summary = connector._get_connectivity_summary(
+            pd.DataFrame({"bodyId": [99]}), None, "Dm4", "left"
+        )
+        assert summary["upstream"] == []
+
+        manifest_path = tmp_path / "index" / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["version"] = CONNECTOME_INDEX_VERSION + 1
+        manifest_path.write_text(json.dumps(manifest))
+        assert _connector(str(tmp_path / "index"))._get_connectome_index() is None
+
+    @pytest.mark.unit
+    def test_index_of_another_dataset_version_is_not_used(self, tmp_path, caplog):
+        """An index built before a dataset update is rejected with a warning."""
+        index = _build_index()
+        index.manifest["uuid"] = "dataset-uuid"
+        index.save(tmp_path / "index")
+
+        assert _connector(str(tmp_path / "index"))._get_connectome_index()
+        with caplog.at_level("WARNING"):
+            updated = _connector(str(tmp_path / "index"), uuid="updated-uuid")
+            assert updated._get_connectome_index() is None
+        assert "build-connectome-index" in caplog.text
+        assert (
+            _connector(str(tmp_path / "index"), uuid=None)._get_connectome_index()
+            is None
+        )
+
+    @pytest.mark.unit
+    def test_concurrent_pages_wait_for_the_index(self, tmp_path, monkeypatch):
+        """Threads asking during the first load get the index, loaded once."""
+        index = _build_index()
+        index.manifest["uuid"] = "dataset-uuid"
+        index.save(tmp_path / "index")
+        load = ConnectomeIndex.load
+        loads = []
+
+        def slow_load(index_dir):
+            loads.append(index_dir)
+            time.sleep(0.2)
+            return load(index_dir)
+
+        monkeypatch.setattr(ConnectomeIndex, "load", staticmethod(slow_load))
+        connector = _connector(str(tmp_path / "index"))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            indexes = list(
+                executor.map(lambda _: connector._get_connectome_index(), range(4))
+            )
+
+        assert indexes[0] is not None
+        assert all(served is indexes[0] for served in indexes)
+        assert len(loads) == 1
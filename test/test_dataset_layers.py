@@ -0,0 +1,79 @@
+"""Unit tests for the dataset-level layer ROI artifact."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from neuview.cache import NeuronTypeCacheManager
+from neuview.services.dataset_layers_service import DatasetLayersService
+from neuview.services.layer_analysis_service import LayerAnalysisService
+
+HIERARCHY = {
+    "OL(R)": {"ME(R)*": {"ME_R_layer_02": {}, "ME_R_layer_01": {}}},
+    "OL(L)": {"LO(L)*": {"LO_L_layer_1": {}}},
+}
+
+
+class _Connector:
+    """Connector stub counting ROI hierarchy requests."""
+
+    def __init__(self, dataset_uuid):
+        self.dataset_uuid = dataset_uuid
+        self.config = SimpleNamespace(
+            neuprint=SimpleNamespace(server="server", dataset="optic-lobe")
+        )
+        self.hierarchy_requests = 0
+
+    def get_dataset_uuid(self):
+        return self.dataset_uuid
+
+    def _get_roi_hierarchy(self):
+        self.hierarchy_requests += 1
+        return HIERARCHY
+
+
+@pytest.mark.unit
+class TestDatasetLayers:
+    """Test cases for DatasetLayersService."""
+
+    @pytest.mark.unit
+    def test_layers_are_computed_once_per_dataset(self, tmp_path):
+        """Layers are derived once, persisted by UUID and shared."""
+        dataset_uuid = uuid.uuid4().hex
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        connector = _Connector(dataset_uuid)
+        expected = [("LO", "L", 1), ("ME", "R", 1), ("ME", "R", 2)]
+
+        service = DatasetLayersService(cache_manager)
+        assert service.get_dataset_layers(connector) == expected
+        assert (
+            LayerAnalysisService(None, service)._get_all_dataset_layers(connector)
+            == expected
+        )
+        assert DatasetLayersService().get_dataset_layers(connector) == expected
+        assert connector.hierarchy_requests == 1
+
+        assert cache_manager.load_dataset_layers(dataset_uuid) == expected
+        assert cache_manager.load_dataset_layers("other") is None
+        assert "dataset_layers" not in cache_manager.list_cached_neuron_types()
+
+    @pytest.mark.unit
+    def test_persisted_layers_skip_the_hierarchy(self, tmp_path):
+        """A persisted artifact is used without loading the hierarchy."""
+        dataset_uuid = uuid.uuid4().hex
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        cache_manager.save_dataset_layers(dataset_uuid, [("ME", "L", 3)])
+        connector = _Connector(dataset_uuid)
+
+        layers = DatasetLayersService(cache_manager).get_dataset_layers(connector)
+        assert layers == [("ME", "L", 3)]
+        assert connector.hierarchy_requests == 0
+
+        unknown = _Connector("Unknown")
+        service = DatasetLayersService(cache_manager)
+        assert service.get_dataset_layers(unknown) == service.get_dataset_layers(
+            unknown
+        )
+        assert unknown.hierarchy_requests == 1
+        assert cache_manager.load_dataset_layers("Unknown") is None
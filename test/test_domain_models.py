@@ -0,0 +1,99 @@
+"""Unit tests for the slotted domain value objects and entities."""
+
+import dataclasses
+import statistics
+
+import pytest
+
+from neuview.models.domain_models import (
+    BodyId,
+    ConnectivityPartner,
+    Neuron,
+    NeuronCollection,
+    NeuronTypeName,
+    RoiName,
+    SomaSide,
+    SynapseCount,
+)
+
+SIDES = [SomaSide.LEFT, SomaSide.RIGHT, SomaSide.RIGHT, None, SomaSide.MIDDLE]
+PRE = [10, 3, 7, 0, 5]
+POST = [20, 9, 1, 4, 6]
+
+
+def _neurons():
+    return [
+        Neuron(
+            body_id=BodyId(100 + i),
+            type_name=NeuronTypeName("Tm3"),
+            soma_side=side,
+            synapse_count=SynapseCount(pre=pre, post=post),
+            instance=f"Tm3_{i}" if i % 2 else None,
+        )
+        for i, (side, pre, post) in enumerate(zip(SIDES, PRE, POST))
+    ]
+
+
+@pytest.mark.unit
+class TestDomainModels:
+    """Test cases for the domain models."""
+
+    @pytest.mark.unit
+    def test_value_objects_are_slotted(self):
+        """Value objects and per-neuron entities carry no instance dict."""
+        neuron = _neurons()[0]
+        partner = ConnectivityPartner(
+            neuron_type="Mi1",
+            connection_count=5,
+            neurotransmitter="ACh",
+        )
+        for value in (
+            BodyId(1),
+            NeuronTypeName("Tm3"),
+            SynapseCount(pre=1, post=2),
+            RoiName("ME(R)"),
+            neuron,
+            partner,
+        ):
+            assert not hasattr(value, "__dict__")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            BodyId(1).value = 2
+        assert partner.neuron_type == NeuronTypeName("Mi1")
+        assert {BodyId(1), BodyId(1)} == {BodyId(1)}
+
+    @pytest.mark.unit
+    def test_collection_of_slotted_neurons(self):
+        """Collections keep their dataclass semantics with slotted neurons."""
+        neurons = _neurons()
+        collection = NeuronCollection(NeuronTypeName("Tm3"), list(neurons))
+
+        assert collection == NeuronCollection(NeuronTypeName("Tm3"), list(neurons))
+        assert repr(collection).startswith("NeuronCollection(")
+        assert collection.count == 5
+        assert collection.body_ids == [n.body_id for n in neurons]
+        assert collection.get_soma_side_counts() == {
+            "left": 1,
+            "right": 2,
+            "middle": 1,
+            "unknown": 1,
+        }
+        totals = [pre + post for pre, post in zip(PRE, POST)]
+        assert collection.get_synapse_statistics() == pytest.approx(
+            {
+                "avg_pre": statistics.mean(PRE),
+                "avg_post": statistics.mean(POST),
+                "avg_total": statistics.mean(totals),
+                "median_total": statistics.median(totals),
+                "std_dev_total": statistics.pstdev(totals),
+            }
+        )
+
+        right = collection.filter_by_soma_side(SomaSide.RIGHT)
+        assert [n.body_id.value for n in right.neurons] == [101, 102]
+        assert collection.filter_by_soma_side(SomaSide.ALL) is collection
+
+        with pytest.raises(ValueError):
+            collection.add_neuron(
+                Neuron(body_id=BodyId(1), type_name=NeuronTypeName("Mi1"))
+            )
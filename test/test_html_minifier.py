@@ -0,0 +1,86 @@
+"""Unit tests for the single-pass HTML minifier."""
+
+import pytest
+
+from neuview.utils.html_minifier import (
+    HTMLMinifier,
+    get_minification_pool,
+    minification_workers,
+)
+
+SIMPLE_SCRIPT = (
+    "<script>\n  var  config = { a : 1 };\n  console.log( config );\n</script>"
+)
+CONTROL_FLOW_SCRIPT = "<script>\nfunction init() { if (x) { y(); } }\n</script>"
+JSON_SCRIPT = '<script type="application/json">{ "k" :  1 }</script>'
+
+
+def _page(*scripts):
+    body = "".join(scripts)
+    return (
+        "<html><head><style> .a { color : red ; } </style></head>"
+        f"<body>\n  <p>  Hello   world  </p>\n  {body}\n</body></html>"
+    )
+
+
+@pytest.mark.unit
+class TestHTMLMinifier:
+    """Test cases for HTMLMinifier and the minification worker pool."""
+
+    @pytest.mark.unit
+    def test_minifies_markup_css_and_scripts(self):
+        """Whitespace, CSS and inline JavaScript are minified."""
+        minified = HTMLMinifier().minify(_page(SIMPLE_SCRIPT))
+
+        assert "<p>Hello world" in minified
+        assert ".a{color:red}" in minified
+        assert "<script>var config={a:1};console.log(config)</script>" in minified
+        assert "neuview-script" not in minified
+
+    @pytest.mark.unit
+    def test_repeated_scripts_are_cached(self):
+        """Identical script blocks are minified once."""
+        minifier = HTMLMinifier()
+        first = minifier.minify(_page(SIMPLE_SCRIPT, SIMPLE_SCRIPT))
+        second = minifier.minify(_page(SIMPLE_SCRIPT))
+
+        assert first.count("console.log(config)") == 2
+        assert "console.log(config)" in second
+        assert minifier.cache_misses == 1
+        assert minifier.cache_hits == 2
+
+    @pytest.mark.unit
+    def test_unsafe_and_non_js_blocks_kept_verbatim(self):
+        """Control flow and JSON blocks are kept; other blocks still minify."""
+        minified = HTMLMinifier().minify(
+            _page(CONTROL_FLOW_SCRIPT, JSON_SCRIPT, SIMPLE_SCRIPT)
+        )
+
+        assert "function init() { if (x) { y(); } }" in minified
+        assert '{ "k" :  1 }' in minified
+        assert "var config={a:1}" in minified
+
+    @pytest.mark.unit
+    def test_minify_js_disabled(self):
+        """Scripts are left unchanged when JavaScript minification is off."""
+        minified = HTMLMinifier().minify(_page(SIMPLE_SCRIPT), minify_js=False)
+
+        assert "console.log( config );" in minified
+        assert "<p>Hello world" in minified
+
+    @pytest.mark.unit
+    def test_worker_pool_delivers_minified_pages(self):
+        """Pages minified in worker processes are handed to the callback."""
+        results = []
+        html = _page(SIMPLE_SCRIPT)
+
+        with minification_workers(0) as pool:
+            assert pool is None
+        with minification_workers(1) as pool:
+            assert get_minification_pool() is pool
+            # Workers must not be forked from the threaded generating process
+            assert pool._executor._mp_context.get_start_method() != "fork"
+            pool.submit(html, results.append)
+
+        assert get_minification_pool() is None
+        assert results == [HTMLMinifier().minify(html)]
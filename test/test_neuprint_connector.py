@@ -0,0 +1,72 @@
+"""Unit tests for NeuPrintConnector data processing helpers."""
+
+import json
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.config import Config
+from neuview.neuprint_connector import NeuPrintConnector
+
+
+@pytest.fixture
+def connector():
+    """Connector with a mocked NeuPrint client."""
+    config = Config.create_minimal_for_testing()
+    with patch("neuview.neuprint_connector.Client") as mock_client_class:
+        mock_client_class.return_value = Mock()
+        yield NeuPrintConnector(config)
+
+
+@pytest.mark.unit
+class TestExpandRoiInfo:
+    """Test cases for bulk roiInfo expansion."""
+
+    @pytest.mark.unit
+    def test_expands_json_strings_and_dicts(self, connector):
+        """JSON strings and decoded dicts expand into sorted per-ROI rows."""
+        roi_df = connector._expand_roi_info(
+            [2, 1],
+            [
+                json.dumps({"LO(R)": {"pre": 1, "post": 1}, "ME(R)": {"pre": 5}}),
+                {"ME(R)": {"pre": 2, "post": 3, "downstream": 4, "upstream": 6}},
+            ],
+        )
+
+        assert roi_df["bodyId"].tolist() == [1, 2, 2]
+        assert roi_df["roi"].tolist() == ["ME(R)", "ME(R)", "LO(R)"]
+        assert roi_df["post"].tolist() == [3, 0, 1]
+        assert roi_df.loc[0, "upstream"] == 6
+
+    @pytest.mark.unit
+    def test_skips_invalid_documents(self, connector):
+        """Invalid JSON and non-dict entries are skipped without losing valid rows."""
+        roi_df = connector._expand_roi_info(
+            [1, 2, 3],
+            ["{not json", json.dumps({"ME(R)": {"pre": 1}, "note": "x"}), None],
+        )
+
+        assert roi_df["bodyId"].tolist() == [2]
+        assert roi_df["roi"].tolist() == ["ME(R)"]
+
+    @pytest.mark.unit
+    def test_documents_are_not_shifted_to_other_bodies(self, connector):
+        """An entry holding two JSON objects cannot shift later documents."""
+        roi_df = connector._expand_roi_info(
+            [1, 2],
+            [
+                '{"ME(R)": {"pre": 1}}, {"LO(R)": {"pre": 2}}',
+                json.dumps({"LOP(R)": {"pre": 3}}),
+            ],
+        )
+
+        assert roi_df["bodyId"].tolist() == [2]
+        assert roi_df["roi"].tolist() == ["LOP(R)"]
+        assert roi_df["pre"].tolist() == [3]
+
+    @pytest.mark.unit
+    def test_empty_input(self, connector):
+        """No parsable ROI data gives an empty DataFrame."""
+        assert connector._expand_roi_info([], []).empty
+        assert isinstance(connector._expand_roi_info([1], ["{}"]), pd.DataFrame)
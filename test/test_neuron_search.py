@@ -0,0 +1,75 @@
+"""Unit tests for the sharded neuron search index."""
+
+import json
+
+import pytest
+
+from neuview.services.jinja_template_service import JinjaTemplateService
+from neuview.services.neuron_search_service import NeuronSearchService
+from neuview.utils import get_templates_dir
+
+
+def _entry(name, **fields):
+    return {"name": name, "urls": {"left": f"types/{name}_L.html"}, **fields}
+
+
+@pytest.fixture
+def search_service(tmp_path):
+    env = JinjaTemplateService(get_templates_dir()).setup_jinja_env({})
+    return NeuronSearchService(tmp_path, env)
+
+
+@pytest.mark.unit
+class TestNeuronSearchIndex:
+    """Test cases for the sharded search index of NeuronSearchService."""
+
+    @pytest.mark.unit
+    def test_entries_are_sharded_by_first_character(self, search_service):
+        """Types are grouped by the first character of their name."""
+        shards = search_service.shard_entries(
+            [
+                _entry("Mi1", synonyms=""),
+                _entry("mALD1"),
+                _entry("Tm3", flywire_types="Tm3"),
+                _entry("5-HTPMPD01"),
+                _entry("(PVLP)L1"),
+            ]
+        )
+
+        assert list(shards) == ["5", "_", "m", "t"]
+        assert [entry["name"] for entry in shards["m"]] == ["Mi1", "mALD1"]
+        assert shards["m"][0] == {
+            "name": "Mi1",
+            "urls": {"left": "types/Mi1_L.html"},
+        }
+        assert shards["t"][0]["flywire_types"] == "Tm3"
+
+    @pytest.mark.unit
+    def test_rebuild_only_writes_changed_shards(self, search_service):
+        """Unchanged shards are kept and replaced shards are removed."""
+        entries = [_entry("Mi1"), _entry("Tm3")]
+        written = search_service.write_search_index(entries)
+        loader = search_service.get_output_path()
+        shard_dir = loader.parent / "search"
+        assert loader in written
+        assert len(list(shard_dir.glob("*.js"))) == 2
+
+        script = loader.read_text()
+        assert "Tm3" not in script
+        search_index = json.loads(
+            script.split("const SEARCH_INDEX = ")[1].split(";")[0]
+        )
+        assert search_index["count"] == 2
+        assert set(search_index["shards"]) == {"m", "t"}
+
+        assert search_service.write_search_index(entries) == []
+
+        old_shard = shard_dir / search_index["shards"]["t"]
+        written = search_service.write_search_index(
+            [_entry("Mi1"), _entry("Tm3", synonyms="Fischbach: Tm3")]
+        )
+        assert loader in written
+        assert [path.parent for path in written if path != loader] == [shard_dir]
+        assert len(written) == 2
+        assert not old_shard.exists()
+        assert (shard_dir / search_index["shards"]["m"]).exists()
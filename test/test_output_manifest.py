@@ -0,0 +1,63 @@
+"""Unit tests for the output manifest and manifest-driven cleanup."""
+
+import pytest
+
+from neuview.config import Config
+from neuview.services.file_service import FileService
+from neuview.services.output_manifest_service import OutputManifestService
+from neuview.services.resource_manager_service import ResourceManagerService
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x")
+    return path
+
+
+@pytest.mark.unit
+class TestOutputManifest:
+    """Test cases for OutputManifestService and clean_dynamic_files."""
+
+    @pytest.mark.unit
+    def test_sharded_path(self):
+        """Shards are stable two-digit prefixes; unsharded paths are unchanged."""
+        path = FileService.sharded_path("ME_Mi1_L_cell_count.svg")
+        shard, filename = path.split("/")
+        assert filename == "ME_Mi1_L_cell_count.svg"
+        assert len(shard) == 2
+        assert path == FileService.sharded_path("ME_Mi1_L_cell_count.svg")
+        assert FileService.sharded_path("Mi1.html", sharded=False) == "Mi1.html"
+
+    @pytest.mark.unit
+    def test_remove_keeps_files_shared_with_other_pages(self, tmp_path):
+        """Removing one soma side keeps files still listed by another page."""
+        manifest = OutputManifestService(tmp_path)
+        manifest.record(
+            "KC/a", "left", [tmp_path / "types/KC_a_L.html", "eyemaps/ab/ME.svg"]
+        )
+        manifest.record("KC/a", "combined", ["types/KC_a.html", "eyemaps/ab/ME.svg"])
+
+        assert set(manifest.load("KC/a")) == {"KC_a_L.html", "KC_a.html"}
+        assert [p.name for p in manifest.manifest_dir.iterdir()] == ["KC_a.json"]
+        assert manifest.load("KC_a") is None
+        assert manifest.remove("KC/a", "left") == {"types/KC_a_L.html"}
+        assert manifest.remove("KC/a") == {"types/KC_a.html", "eyemaps/ab/ME.svg"}
+        assert manifest.load("KC/a") is None
+
+    @pytest.mark.unit
+    def test_clean_dynamic_files_uses_manifest(self, tmp_path):
+        """Only files recorded for the type are removed, not prefix matches."""
+        resources = ResourceManagerService(
+            Config.create_minimal_for_testing(), tmp_path
+        )
+        own_files = [
+            _touch(tmp_path / "types" / "Mi1.html"),
+            _touch(tmp_path / "eyemaps" / "3f" / "ME_Mi1_L_cell_count.svg"),
+        ]
+        other_page = _touch(tmp_path / "types" / "Mi1_extra_L.html")
+        resources.output_manifest.record("Mi1", "combined", own_files)
+
+        assert resources.clean_dynamic_files("Mi1")
+        assert not any(path.exists() for path in own_files)
+        assert other_page.exists()
+        assert resources.output_manifest.load("Mi1") is None
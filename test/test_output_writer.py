@@ -0,0 +1,101 @@
+"""Unit tests for atomic and write-behind output writes."""
+
+import time
+
+import pytest
+
+from neuview.services import output_writer_service
+from neuview.services.output_writer_service import (
+    OutputWriterService,
+    atomic_write,
+    buffered_output_writes,
+    get_output_writer,
+)
+
+
+@pytest.mark.unit
+class TestOutputWriter:
+    """Test cases for OutputWriterService."""
+
+    @pytest.mark.unit
+    def test_atomic_write_replaces_without_leftovers(self, tmp_path):
+        """Files are replaced in one step and no temporary files remain."""
+        target = tmp_path / "page.html"
+        target.write_text("old")
+
+        assert atomic_write(target, "new ü") == len("new ü".encode("utf-8"))
+        assert target.read_text(encoding="utf-8") == "new ü"
+        assert [p.name for p in tmp_path.iterdir()] == ["page.html"]
+
+    @pytest.mark.unit
+    def test_write_behind_completes_on_flush(self, tmp_path):
+        """Queued writes land in order and are synced as one batch."""
+        writer = OutputWriterService(write_behind=True, queue_size=2)
+        for index in range(5):
+            writer.write(tmp_path / "types" / "page.html", f"version {index}")
+        writer.write(tmp_path / "eyemaps" / "ME.svg", b"<svg/>")
+
+        writer.flush()
+        assert (tmp_path / "types" / "page.html").read_text() == "version 4"
+        assert (tmp_path / "eyemaps" / "ME.svg").read_bytes() == b"<svg/>"
+        assert writer.sync() == 2
+        writer.close()
+
+    @pytest.mark.unit
+    def test_background_errors_surface_on_flush(self, tmp_path):
+        """A failed background write is raised by the next flush."""
+        (tmp_path / "blocker").write_text("not a directory")
+        writer = OutputWriterService(write_behind=True)
+        writer.write(tmp_path / "blocker" / "page.html", "content")
+
+        with pytest.raises(OSError):
+            writer.flush()
+        writer.close()
+
+    @pytest.mark.unit
+    def test_buffered_run_installs_writer(self, tmp_path):
+        """Inside a buffered run writes are deferred and drained on exit."""
+        default_writer = get_output_writer()
+        assert not default_writer.write_behind
+
+        with buffered_output_writes() as writer:
+            assert get_output_writer() is writer
+            with buffered_output_writes() as nested:
+                assert nested is writer
+            writer.write(tmp_path / "page.html", "content")
+
+        assert get_output_writer() is default_writer
+        assert (tmp_path / "page.html").read_text() == "content"
+
+    @pytest.mark.unit
+    def test_write_errors_do_not_mask_run_errors(self, tmp_path):
+        """Write errors surface after a clean run but not over a failed one."""
+        (tmp_path / "blocker").write_text("not a directory")
+
+        with pytest.raises(OSError):
+            with buffered_output_writes() as writer:
+                writer.write(tmp_path / "blocker" / "page.html", "content")
+
+        with pytest.raises(KeyError):
+            with buffered_output_writes() as writer:
+                writer.write(tmp_path / "blocker" / "page.html", "content")
+                raise KeyError("page failed")
+        assert get_output_writer() is not writer
+
+    @pytest.mark.unit
+    def test_flush_path_waits_for_queued_write(self, tmp_path, monkeypatch):
+        """A file reads back complete once its pending writes are flushed."""
+        original_write = output_writer_service.atomic_write
+
+        def slow_write(path, data):
+            time.sleep(0.2)
+            return original_write(path, data)
+
+        monkeypatch.setattr(output_writer_service, "atomic_write", slow_write)
+        writer = OutputWriterService(write_behind=True)
+        writer.write(tmp_path / "eyemaps" / "ME.svg", "<svg/>")
+
+        writer.flush_path(tmp_path / "eyemaps" / "ME.svg")
+        assert (tmp_path / "eyemaps" / "ME.svg").read_text() == "<svg/>"
+        writer.flush_path(tmp_path / "never-written.svg")
+        writer.close()
@@ -0,0 +1,134 @@
+"""Unit tests for the cross-type partner metadata table."""
+
+import ast
+import re
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.cache import NeuronTypeCacheManager
+from neuview.config import Config
+from neuview.neuprint_connector import NeuPrintConnector
+from neuview.partner_metadata import PARTNER_RECORD_COLUMNS, PartnerMetadataTable
+
+METADATA = pd.DataFrame(
+    {
+        "bodyId": [1, 2, 3, 4],
+        "type": ["Mi1", "Mi1", "Tm3", "T4a"],
+        "soma_side": ["L", "R", "R", ""],
+        "neurotransmitter": ["ach", "ach", "glu", "Unknown"],
+    }
+)
+
+CONNECTIONS = {
+    10: pd.DataFrame({"partner_bodyId": [2, 1, 2], "weight": [9, 5, 3]}),
+    20: pd.DataFrame({"partner_bodyId": [3, 2, 4], "weight": [8, 4, 1]}),
+}
+
+
+class _Client:
+    """NeuPrint client stub answering connection and partner metadata queries."""
+
+    def __init__(self):
+        self.queries = []
+        self.metadata_queries = []
+
+    def fetch_custom(self, query):
+        self.queries.append(query)
+        body_ids = ast.literal_eval(re.search(r"IN (\[[^\]]*\])", query).group(1))
+        if "c.weight" in query:
+            return pd.concat([CONNECTIONS[body_id] for body_id in body_ids])
+        self.metadata_queries.append(body_ids)
+        return METADATA[METADATA["bodyId"].isin(body_ids)]
+
+
+def _connector():
+    with patch("neuview.neuprint_connector.Client") as mock_client_class:
+        mock_client_class.return_value = Mock()
+        connector = NeuPrintConnector(Config.create_minimal_for_testing())
+    connector.client = _Client()
+    connector.get_dataset_uuid = lambda: "dataset-uuid"
+    return connector
+
+
+@pytest.mark.unit
+class TestPartnerMetadata:
+    """Test cases for PartnerMetadataTable and its use by the connector."""
+
+    @pytest.mark.unit
+    def test_table_joins_connections_and_persists(self, tmp_path):
+        """Connections are joined with the metadata of their partner bodies."""
+        table = PartnerMetadataTable(METADATA.head(2))
+        assert table.missing([4, 2, 3, 4]) == [3, 4]
+        assert table.add(METADATA.tail(3)) == 2
+        assert len(table) == 4 and table.missing([1, 4]) == []
+
+        records = table.records([3, 1, 3], [7, 6, 2])
+        assert list(records.columns) == PARTNER_RECORD_COLUMNS
+        assert records["partner_type"].tolist() == ["Tm3", "Mi1", "Tm3"]
+        assert records["soma_side"].tolist() == ["R", "L", "R"]
+        assert records["weight"].tolist() == [7, 6, 2]
+
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        assert cache_manager.load_partner_metadata("uuid") is None
+        assert cache_manager.save_partner_metadata("uuid", table.to_frame())
+        loaded = PartnerMetadataTable(cache_manager.load_partner_metadata("uuid"))
+        pd.testing.assert_frame_equal(
+            loaded.records([4, 2], [1, 1]), table.records([4, 2], [1, 1])
+        )
+
+    @pytest.mark.unit
+    def test_connector_fetches_each_partner_once(self, tmp_path, monkeypatch):
+        """Partner metadata is fetched once per body and reused across runs."""
+        monkeypatch.chdir(tmp_path)
+        connector = _connector()
+
+        upstream = connector._fetch_partner_records([10], "upstream")
+        query = connector.client.queries[0]
+        assert "RETURN partner.bodyId as partner_bodyId, c.weight as weight" in query
+        assert upstream[["partner_type", "soma_side", "weight"]].values.tolist() == [
+            ["Mi1", "R", 9],
+            ["Mi1", "L", 5],
+            ["Mi1", "R", 3],
+        ]
+        partners = connector._aggregate_partner_records(upstream, [10])
+        assert [(p["type"], p["soma_side"], p["weight"]) for p in partners] == [
+            ("Mi1", "R", 12),
+            ("Mi1", "L", 5),
+        ]
+
+        connector._fetch_partner_records([20], "downstream")
+        assert connector.client.metadata_queries == [[1, 2], [3, 4]]
+        assert connector.get_cache_stats()["cached_partner_bodies"] == 4
+
+        # A new run loads the persisted table instead of querying partners
+        connector = _connector()
+        records = connector._fetch_partner_records([10, 20], "upstream")
+        partner_types = ["Mi1", "Mi1", "Mi1", "Tm3", "Mi1", "T4a"]
+        assert records["partner_type"].tolist() == partner_types
+        assert connector.client.metadata_queries == []
+
+    @pytest.mark.unit
+    def test_new_bodies_are_appended_as_segments(self, tmp_path, monkeypatch):
+        """Each fetch writes only its new bodies; a later load compacts them."""
+        monkeypatch.chdir(tmp_path)
+        connector = _connector()
+        fetch = connector._fetch_partner_metadata
+
+        def fetch_unlocked(body_ids):
+            assert not connector._partner_metadata_lock.locked()
+            return fetch(body_ids)
+
+        connector._fetch_partner_metadata = fetch_unlocked
+        connector._fetch_partner_records([10], "upstream")
+        connector._fetch_partner_records([20], "downstream")
+
+        segment_dir = tmp_path / "output/.cache/partner_metadata/dataset-uuid"
+        segments = sorted(segment_dir.glob("*.parquet"))
+        assert [len(pd.read_parquet(path)) for path in segments] == [2, 2]
+
+        connector = _connector()
+        connector._fetch_partner_records([10, 20], "upstream")
+        assert connector.client.metadata_queries == []
+        assert len(list(segment_dir.glob("*.parquet"))) == 1
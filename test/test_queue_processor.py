@@ -0,0 +1,69 @@
+"""Unit tests for cache warming batches of concurrent queue pops."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from neuview.commands import PopCommand
+from neuview.result import Ok
+from neuview.services.queue_processor import QueueProcessor
+
+
+def _queue(tmp_path, neuron_types):
+    queue_dir = tmp_path / ".queue"
+    queue_dir.mkdir()
+    for neuron_type in neuron_types:
+        (queue_dir / f"{neuron_type}.yaml").write_text(
+            yaml.safe_dump(
+                {"config_file": "config.yaml", "options": {"neuron-type": neuron_type}}
+            )
+        )
+    return queue_dir
+
+
+def _processor(tmp_path):
+    return QueueProcessor(SimpleNamespace(output=SimpleNamespace(directory=tmp_path)))
+
+
+@pytest.mark.unit
+class TestQueueWarming:
+    """Test cases for the warming batches of QueueProcessor."""
+
+    @pytest.mark.unit
+    def test_concurrent_pops_reserve_disjoint_batches(self, tmp_path):
+        """Each unclaimed queue file is warmed by one process only."""
+        queue_dir = _queue(tmp_path, ["A", "B", "C", "D", "E"])
+
+        first = _processor(tmp_path)._reserve_pending_queue_types(
+            queue_dir, "config.yaml", 3
+        )
+        second = _processor(tmp_path)._reserve_pending_queue_types(
+            queue_dir, "config.yaml", 3
+        )
+
+        assert first == ["A", "B", "C"]
+        assert second == ["D", "E"]
+        assert not _processor(tmp_path)._reserve_for_warming(queue_dir / "A.yaml")
+
+    @pytest.mark.unit
+    def test_pop_skips_reserved_types_and_clears_its_marker(self, tmp_path):
+        """A claimed type reserved by another pop is not warmed again."""
+        queue_dir = _queue(tmp_path, ["A", "B"])
+        processor = _processor(tmp_path)
+        assert processor._reserve_for_warming(queue_dir / "A.yaml")
+        warmed = []
+
+        async def process(generate_command, stored_config_file, warm_types):
+            warmed.append(warm_types)
+            return Ok("A.html")
+
+        processor._process_generate_command = process
+        result = asyncio.run(processor.pop_and_process_queue(PopCommand()))
+
+        # Whichever file was claimed, only B is warmed, and only once
+        assert result.is_ok()
+        assert warmed == [["B"]]
+        claimed = "A" if (queue_dir / "B.yaml").exists() else "B"
+        assert not (queue_dir / f"{claimed}.warming").exists()
@@ -0,0 +1,103 @@
+"""Unit tests for interned ROI names and the ROI attribute side table."""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from neuview.roi_attributes import intern_roi_names, parse_roi_name, roi_attributes
+from neuview.services.data_processing_service import DataProcessingService
+from neuview.services.layer_analysis_service import LayerAnalysisService
+
+
+@pytest.mark.unit
+class TestRoiAttributes:
+    """Test cases for ROI name parsing and attribute lookup."""
+
+    @pytest.mark.unit
+    def test_parse_roi_name(self):
+        """Column and layer ROIs are parsed; other names carry no attributes."""
+        assert parse_roi_name("ME_R_col_12_07") == (True, False, "ME", "R", 12, 7, None)
+        assert parse_roi_name("LOP_L_col_1f_0a")[4:6] == (31, 10)
+        assert parse_roi_name("LO_L_layer_3") == (False, True, "LO", "L", None, None, 3)
+        assert parse_roi_name("ME_R_col_zz_01")[0] is False
+        assert parse_roi_name("ME(R)")[:2] == (False, False)
+
+    @pytest.mark.unit
+    def test_attributes_follow_rows(self):
+        """Attributes are broadcast to rows, including missing ROI names."""
+        roi_df = intern_roi_names(
+            pd.DataFrame(
+                {
+                    "bodyId": [1, 1, 2, 2],
+                    "roi": ["ME_R_col_01_02", "ME(R)", None, "ME_R_layer_05"],
+                },
+                index=[10, 11, 12, 13],
+            )
+        )
+        assert isinstance(roi_df["roi"].dtype, pd.CategoricalDtype)
+
+        attributes = roi_attributes(roi_df["roi"], primary_rois=["ME(R)"])
+        assert attributes.index.tolist() == [10, 11, 12, 13]
+        assert attributes["is_column"].tolist() == [True, False, False, False]
+        assert attributes["is_layer"].tolist() == [False, False, False, True]
+        assert attributes["is_primary"].tolist() == [False, True, False, False]
+        assert attributes.loc[10, "hex2"] == 2
+        assert attributes.loc[13, "layer"] == 5
+
+    @pytest.mark.unit
+    def test_layer_information_from_interned_rois(self):
+        """Layer extraction gives the same records for interned ROI names."""
+        roi_df = pd.DataFrame(
+            {
+                "bodyId": [1, 2, 2],
+                "roi": ["LO_L_layer_2", "LO_L_layer_2", "LO(L)"],
+                "pre": [1, 2, 3],
+                "post": [4, 5, 6],
+            }
+        )
+        service = LayerAnalysisService()
+        records = {}
+        for frame in (roi_df, intern_roi_names(roi_df)):
+            layer_rois = frame[roi_attributes(frame["roi"])["is_layer"].to_numpy()]
+            records[str(frame["roi"].dtype)] = service._extract_layer_information(
+                layer_rois, roi_attributes(layer_rois["roi"])
+            )
+
+        plain, interned = records.values()
+        assert plain == interned
+        assert interned[1] == {
+            "roi": "LO_L_layer_2",
+            "region": "LO",
+            "side": "L",
+            "layer": 2,
+            "bodyId": 2,
+            "pre": 2,
+            "post": 5,
+            "total": 7,
+        }
+
+    @pytest.mark.unit
+    def test_roi_summary_keeps_primary_rois(self):
+        """The ROI summary aggregates only rows flagged as primary ROIs."""
+        roi_df = intern_roi_names(
+            pd.DataFrame(
+                {
+                    "bodyId": [1, 1, 2, 2],
+                    "roi": ["ME(R)", "ME_R_layer_01", "ME(R)", "LO(R)"],
+                    "pre": [1, 2, 3, 4],
+                    "post": [5, 6, 7, 8],
+                    "downstream": [0, 0, 0, 0],
+                    "upstream": [0, 0, 0, 0],
+                }
+            )
+        )
+        page_generator = SimpleNamespace(
+            config=None, _get_primary_rois=lambda connector: ["ME(R)", "LO(R)"]
+        )
+        service = DataProcessingService(page_generator)
+        summary = service.aggregate_roi_data(
+            roi_df, pd.DataFrame({"bodyId": [1, 2]}), "combined"
+        )
+
+        assert {roi["name"]: roi["pre"] for roi in summary} == {"ME(R)": 4, "LO(R)": 4}
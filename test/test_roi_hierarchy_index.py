@@ -0,0 +1,88 @@
+"""Unit tests for the flattened ROI hierarchy index."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from neuview.cache import NeuronTypeCacheManager
+from neuview.roi_hierarchy_index import RoiHierarchyIndex, get_roi_hierarchy_index
+from neuview.services.cache_service import CacheService
+from neuview.services.layer_analysis_service import LayerAnalysisService
+from neuview.services.roi_hierarchy_service import ROIHierarchyService
+
+HIERARCHY = {
+    "OL(R)": {
+        "ME(R)*": {"ME_R_layer_01": {}, "ME_R_layer_02": {}, "ME_R_col_01_02": {}},
+        "LO(R)*": {"LO_R_layer_1": {}},
+    },
+    "OL(L)": {"ME(L)*": {"ME_L_layer_01": {}}},
+    "CB": {"AOTU(R)*": {}, "ME(R)": {}},
+}
+
+
+@pytest.mark.unit
+class TestRoiHierarchyIndex:
+    """Test cases for RoiHierarchyIndex."""
+
+    @pytest.mark.unit
+    def test_lookups_match_hierarchy(self):
+        """Parents, top-level ancestors and pattern lists come from one walk."""
+        index = RoiHierarchyIndex.from_hierarchy(HIERARCHY)
+
+        assert index.parent("ME") == "OL"
+        assert index.parent("ME_R_layer_01") == "ME"
+        assert index.parent("OL") == ""
+        assert index.parent("unknown") == ""
+        assert index.top_level_roi("ME_R_layer_02") == "OL"
+        assert index.top_level_roi("AOTU") == "CB"
+        assert index.clean_name("ME(R)") == "ME"
+        assert index.clean_name("OL_L") == "OL"
+        assert index.column_rois == ["ME_R_col_01_02"]
+        assert index.dataset_layers() == [
+            ("LO", "R", 1),
+            ("ME", "L", 1),
+            ("ME", "R", 1),
+            ("ME", "R", 2),
+        ]
+        assert RoiHierarchyIndex.from_dict(index.to_dict()).parents == index.parents
+        assert RoiHierarchyIndex.from_dict({"version": 0}) is None
+
+    @pytest.mark.unit
+    def test_services_share_the_cached_index(self, tmp_path):
+        """The index is stored with the hierarchy and shared by the services."""
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        assert cache_manager.load_roi_hierarchy() is None
+        assert cache_manager.save_roi_hierarchy(HIERARCHY)
+
+        hierarchy = cache_manager.load_roi_hierarchy()
+        assert cache_manager.load_roi_hierarchy() is hierarchy
+        index = get_roi_hierarchy_index(hierarchy)
+        assert get_roi_hierarchy_index(hierarchy) is index
+        assert index.layer_rois[0] == "ME_R_layer_01"
+
+        service = ROIHierarchyService(SimpleNamespace(), cache_manager)
+        connector = SimpleNamespace(_get_roi_hierarchy=lambda: HIERARCHY)
+        assert service.get_roi_hierarchy_parent("ME(L)", connector) == "OL"
+        assert service.get_roi_hierarchy_index(connector) is index
+
+        layers = LayerAnalysisService(None)._get_all_dataset_layers(connector)
+        assert layers == index.dataset_layers()
+
+    @pytest.mark.unit
+    def test_cache_service_returns_cleaned_parents(self, tmp_path):
+        """CacheService resolves parents to cleaned names like the ROI service."""
+        cache_manager = NeuronTypeCacheManager(tmp_path)
+        cache_manager.save_roi_hierarchy(HIERARCHY)
+        service = CacheService(cache_manager)
+
+        assert service._get_roi_hierarchy_parent("ME(L)") == "OL"
+        assert service._get_roi_hierarchy_parent("ME_R_layer_01") == "ME"
+        assert service._get_roi_hierarchy_parent("AOTU(R)") == "CB"
+        assert service._get_roi_hierarchy_parent("OL(R)") == ""
+
+        roi_service = ROIHierarchyService(SimpleNamespace(), cache_manager)
+        connector = SimpleNamespace(_get_roi_hierarchy=lambda: HIERARCHY)
+        for roi in ("ME(L)", "ME_R_layer_01", "AOTU(R)", "OL(R)"):
+            assert service._get_roi_hierarchy_parent(roi) == (
+                roi_service.get_roi_hierarchy_parent(roi, connector)
+            )
@@ -0,0 +1,147 @@
+"""Tests for the dataset snapshot and the snapshot-backed connector."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.config import Config
+from neuview.snapshot import DatasetSnapshot, sorted_key_positions
+from neuview.snapshot_connector import SnapshotConnector, create_connector
+
+
+def _snapshot_tables():
+    neurons = pd.DataFrame(
+        {
+            "bodyId": [1, 2, 3, 4],
+            "type": ["A", "A", "B", "C"],
+            "instance": ["A_L", "A_R", "B_L", "C_R"],
+            "somaSide": ["L", "R", "L", None],
+            "rootSide": [None, None, None, "R"],
+            "pre": [10, 20, 30, 40],
+            "post": [5, 6, 7, 8],
+            "consensusNt": ["acetylcholine", "acetylcholine", "gaba", "glutamate"],
+            "extra": [{"a": 1}, "text", None, 3],
+        }
+    )
+    rois = pd.DataFrame(
+        {
+            "bodyId": [3, 1, 1, 2, 4],
+            "roi": ["ME_R_col_01_02", "ME_L_col_0a_01", "LO(L)", "ME_L_col_0a_01", "X"],
+            "pre": [1, 2, 3, 4, 0],
+            "post": [0, 1, 0, 0, 0],
+        }
+    )
+    partners = neurons[["bodyId", "type"]].assign(
+        soma_side=["L", "R", "L", "R"],
+        neurotransmitter=neurons["consensusNt"],
+    )
+    edges = pd.DataFrame(
+        {
+            "source": [3, 3, 1, 4, 2],
+            "target": [1, 2, 3, 1, 3],
+            "weight": [5, 7, 2, 1, 4],
+        }
+    )
+    return {"neurons": neurons, "rois": rois, "partners": partners, "edges": edges}
+
+
+@pytest.fixture
+def snapshot_config(tmp_path):
+    config = Config.create_minimal_for_testing()
+    config.neuprint.snapshot_dir = str(tmp_path / "snapshot")
+    DatasetSnapshot(config.neuprint.snapshot_dir).write(
+        _snapshot_tables(),
+        {"ME(R)": {}},
+        {"server": config.neuprint.server, "dataset": config.neuprint.dataset},
+    )
+    return config
+
+
+@pytest.fixture
+def snapshot_connector(snapshot_config):
+    with patch("neuview.neuprint_connector.Client") as mock_client_class:
+        mock_client_class.return_value = Mock()
+        yield SnapshotConnector(snapshot_config)
+
+
+@pytest.mark.unit
+class TestDatasetSnapshot:
+    """Test cases for DatasetSnapshot."""
+
+    @pytest.mark.unit
+    def test_sorted_key_positions(self):
+        """Positions of all matching keys are returned, grouped by key."""
+        keys = np.array([1, 1, 2, 4, 4, 4, 7])
+        positions = sorted_key_positions(keys, [4, 1, 5])
+        assert positions.tolist() == [0, 1, 3, 4, 5]
+        assert sorted_key_positions(keys, [3]).tolist() == []
+
+    @pytest.mark.unit
+    def test_round_trip_restores_mixed_columns(self, snapshot_config):
+        """Columns Arrow cannot store natively come back decoded."""
+        snapshot = DatasetSnapshot(snapshot_config.neuprint.snapshot_dir)
+        neurons = snapshot.table("neurons")
+        assert snapshot.manifest["tables"]["neurons"]["json_columns"] == ["extra"]
+        assert neurons["extra"].tolist() == [{"a": 1}, "text", None, 3]
+        assert snapshot.roi_hierarchy == {"ME(R)": {}}
+
+    @pytest.mark.unit
+    def test_neurons_for_type(self, snapshot_config):
+        """Neuron and ROI rows are selected per type."""
+        snapshot = DatasetSnapshot(snapshot_config.neuprint.snapshot_dir)
+        neurons_df, roi_df = snapshot.neurons_for_type("A")
+        assert neurons_df["bodyId"].tolist() == [1, 2]
+        assert sorted(roi_df["bodyId"].tolist()) == [1, 1, 2]
+        empty_neurons, empty_rois = snapshot.neurons_for_type("missing")
+        assert empty_neurons.empty and empty_rois.empty
+
+    @pytest.mark.unit
+    def test_validate_rejects_other_dataset(self, snapshot_config):
+        """A snapshot of another dataset is refused."""
+        snapshot = DatasetSnapshot(snapshot_config.neuprint.snapshot_dir)
+        with pytest.raises(ValueError):
+            snapshot.validate(snapshot_config.neuprint.server, "other:v1")
+
+
+@pytest.mark.unit
+class TestSnapshotConnector:
+    """Test cases for SnapshotConnector."""
+
+    @pytest.mark.unit
+    def test_create_connector_uses_snapshot(self, snapshot_config):
+        """create_connector returns a SnapshotConnector when a snapshot exists."""
+        with patch("neuview.neuprint_connector.Client") as mock_client_class:
+            mock_client_class.return_value = Mock()
+            assert isinstance(create_connector(snapshot_config), SnapshotConnector)
+
+    @pytest.mark.unit
+    def test_connectivity_from_edges(self, snapshot_connector):
+        """Connectivity is aggregated from snapshot edges without querying the server."""
+        data = snapshot_connector.get_neuron_data("A", "combined")
+        upstream = data["connectivity"]["upstream"]
+        downstream = data["connectivity"]["downstream"]
+
+        assert [(p["type"], p["weight"]) for p in upstream] == [("B", 12), ("C", 1)]
+        assert upstream[0]["partner_neuron_count"] == 1
+        assert upstream[0]["connections_per_neuron"] == 6
+        assert upstream[0]["neurotransmitter"] == "gaba"
+        assert [(p["type"], p["weight"]) for p in downstream] == [("B", 6)]
+        snapshot_connector._original_fetch_custom.assert_not_called()
+
+    @pytest.mark.unit
+    def test_soma_sides_prefer_root_side(self, snapshot_connector):
+        """rootSide takes precedence over somaSide like the live query."""
+        assert snapshot_connector.get_soma_sides_for_type("A") == ["L", "R"]
+        assert snapshot_connector.get_soma_sides_for_type("C") == ["R"]
+        assert snapshot_connector.get_available_types() == ["A", "B", "C"]
+
+    @pytest.mark.unit
+    def test_column_roi_totals(self, snapshot_connector):
+        """Column ROI totals are summed from the snapshot ROI table."""
+        totals = snapshot_connector.fetch_column_roi_totals()
+        assert totals["roi"].tolist() == ["ME_L_col_0a_01", "ME_R_col_01_02"]
+        assert totals["pre"].tolist() == [6, 1]
+
+        type_totals = snapshot_connector.fetch_column_roi_totals("B")
+        assert type_totals["roi"].tolist() == ["ME_R_col_01_02"]
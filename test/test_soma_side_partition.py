@@ -0,0 +1,73 @@
+"""Unit tests for the soma side partition of raw neuron data."""
+
+import pandas as pd
+import pytest
+
+from neuview.soma_side_partition import SomaSidePartition, roi_rows_for_neurons
+
+
+def _raw_data():
+    neurons = pd.DataFrame(
+        {
+            "bodyId": [1, 2, 3, 4, 5],
+            "somaSide": ["R", "L", "R", None, "L"],
+            "pre": [10, 20, 30, 40, 50],
+        }
+    )
+    rois = pd.DataFrame(
+        {
+            "bodyId": [1, 1, 2, 3, 5, 9],
+            "roi": ["ME(R)", "LO(R)", "ME(L)", "ME(R)", "LO(L)", "ME(R)"],
+            "pre": [1, 2, 3, 4, 5, 6],
+        }
+    )
+    return neurons, rois
+
+
+@pytest.mark.unit
+class TestSomaSidePartition:
+    """Test cases for SomaSidePartition."""
+
+    @pytest.mark.unit
+    def test_side_slices_match_boolean_filters(self):
+        """Each side slice holds the same rows, in the same order, as a mask."""
+        neurons, rois = _raw_data()
+        partition = SomaSidePartition(neurons, rois)
+
+        assert partition.sides == ["L", "R", "U"]
+        for side in ["L", "R", "U"]:
+            expected = neurons[neurons["somaSide"].fillna("U") == side]
+            pd.testing.assert_frame_equal(partition.neurons(side), expected)
+            expected_rois = rois[rois["bodyId"].isin(expected["bodyId"])]
+            actual_rois = partition.roi_counts(side)
+            if expected_rois.empty:
+                assert actual_rois.empty
+            else:
+                pd.testing.assert_frame_equal(actual_rois, expected_rois)
+
+    @pytest.mark.unit
+    def test_combined_and_missing_sides(self):
+        """Combined keeps all neurons; ROI rows of unknown bodies are dropped."""
+        neurons, rois = _raw_data()
+        partition = SomaSidePartition(neurons, rois)
+
+        assert partition.neurons(None) is neurons
+        assert sorted(partition.roi_counts(None)["bodyId"]) == [1, 1, 2, 3, 5]
+        assert partition.neurons("M").empty
+        assert partition.roi_counts("M").empty
+        assert partition.neurons("L") is partition.neurons("L")
+
+    @pytest.mark.unit
+    def test_roi_rows_for_neurons(self):
+        """Matched pairs skip the bodyId filter; other frames are filtered."""
+        neurons, rois = _raw_data()
+        partition = SomaSidePartition(neurons, rois)
+        left_neurons = partition.neurons("L")
+        left_rois = partition.roi_counts("L")
+
+        assert roi_rows_for_neurons(left_rois, left_neurons, matched=True) is left_rois
+        unmatched = roi_rows_for_neurons(rois.copy(), left_neurons.copy())
+        assert unmatched["bodyId"].tolist() == [2, 5]
+        subset = left_neurons[left_neurons["bodyId"] == 2]
+        assert roi_rows_for_neurons(left_rois, subset)["bodyId"].tolist() == [2]
+        assert roi_rows_for_neurons(rois, left_neurons)["bodyId"].tolist() == [2, 5]
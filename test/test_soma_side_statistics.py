@@ -0,0 +1,80 @@
+"""Unit tests for the soma side statistics of raw neuron data."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.config import Config
+from neuview.neuprint_connector import NeuPrintConnector
+from neuview.soma_side_statistics import SomaSideStatistics
+
+
+def _neurons():
+    return pd.DataFrame(
+        {
+            "bodyId": [1, 2, 3, 4, 5, 6],
+            "somaSide": ["R", "L", "R", None, "L", "M"],
+            "pre": [10, 20, 30, 40, 50, 60],
+            "post": [1, 2, 3, 4, 5, 6],
+            "consensusNt": ["glu", "ach", None, "ach", "", "glu"],
+            "celltypePredictedNtConfidence": [0.5, 0.9, 0.3, np.nan, 0.2, 0.7],
+        }
+    )
+
+
+@pytest.mark.unit
+class TestSomaSideStatistics:
+    """Test cases for SomaSideStatistics."""
+
+    @pytest.mark.unit
+    def test_aggregates_by_soma_side(self):
+        """Counts, synapse sums and NT tallies are combined per side."""
+        statistics = SomaSideStatistics(
+            _neurons(), "pre", "post", "consensusNt", "celltypePredictedNtConfidence"
+        )
+
+        assert statistics.count() == 6
+        assert statistics.count("L") == 2
+        assert statistics.count("U") == 0
+        assert statistics.synapse_counts() == (210, 21)
+        assert statistics.synapse_counts("R") == (40, 4)
+
+        assert statistics.nt_analysis() == [
+            {"nt_type": "glu", "count": 2, "mean_confidence": pytest.approx(0.6)},
+            {"nt_type": "ach", "count": 2, "mean_confidence": pytest.approx(0.9)},
+            {"nt_type": "Unknown", "count": 2, "mean_confidence": None},
+        ]
+        assert statistics.nt_analysis("L") == [
+            {"nt_type": "ach", "count": 1, "mean_confidence": pytest.approx(0.9)},
+            {"nt_type": "Unknown", "count": 1, "mean_confidence": None},
+        ]
+        assert statistics.nt_analysis("U") == []
+        assert SomaSideStatistics(_neurons(), "pre", "post").nt_analysis() == []
+
+    @pytest.mark.unit
+    def test_connector_summaries_use_cached_statistics(self):
+        """Soma side summaries from the cached statistics match the views."""
+        config = Config.create_minimal_for_testing()
+        with patch("neuview.neuprint_connector.Client") as mock_client_class:
+            mock_client_class.return_value = Mock()
+            connector = NeuPrintConnector(config)
+
+        connector._cache_raw_neuron_data("Tm3", _neurons(), pd.DataFrame())
+        statistics = connector._get_soma_side_statistics("Tm3")
+        assert connector._get_soma_side_statistics("Tm3") is statistics
+
+        partition = connector._get_soma_side_partition("Tm3")
+        for soma_side, side in [("all", None), ("left", "L"), ("middle", "M")]:
+            neurons_df = partition.neurons(side)
+            summary = connector._calculate_summary(
+                neurons_df, "Tm3", soma_side, statistics, side
+            )
+            assert summary == connector._calculate_summary(neurons_df, "Tm3", soma_side)
+
+        summary = connector._calculate_summary(
+            partition.neurons_df, "Tm3", "all", statistics
+        )
+        assert (summary["left_count"], summary["right_count"]) == (2, 2)
+        assert summary["right_pre_synapses"] == 40
+        assert summary["nt_analysis"][0]["nt_type"] == "glu"
@@ -0,0 +1,72 @@
+"""Unit tests for the content-hashed static JavaScript bundles."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from neuview.services.jinja_template_service import JinjaTemplateService
+from neuview.services.static_bundle_service import (
+    StaticBundleService,
+    get_static_bundles,
+)
+from neuview.utils import get_templates_dir
+
+
+@pytest.mark.unit
+class TestStaticBundles:
+    """Test cases for StaticBundleService and the templates using it."""
+
+    @pytest.mark.unit
+    def test_hashed_name_follows_content(self, tmp_path):
+        """Names are stable for the same content and change with it."""
+        (tmp_path / "app.js").write_text("var a = 1;")
+        name = StaticBundleService(tmp_path).hashed_name("app.js")
+        assert name.startswith("app.") and name.endswith(".js")
+        assert StaticBundleService(tmp_path).hashed_name("app.js") == name
+        assert StaticBundleService(tmp_path).url("app.js", "../") == (
+            f"../static/js/{name}"
+        )
+
+        (tmp_path / "app.js").write_text("var a = 2;")
+        assert StaticBundleService(tmp_path).hashed_name("app.js") != name
+
+    @pytest.mark.unit
+    def test_write_bundles_replaces_outdated_versions(self, tmp_path):
+        """Publishing writes missing bundles and removes older versions."""
+        source_dir = tmp_path / "bundles"
+        js_dir = tmp_path / "js"
+        source_dir.mkdir()
+        js_dir.mkdir()
+        (source_dir / "app.js").write_text("var a = 1;")
+        outdated = js_dir / "app.0123456789.js"
+        outdated.write_text("old")
+        unrelated = js_dir / "app.min.js"
+        unrelated.write_text("keep")
+
+        bundles = StaticBundleService(source_dir)
+        written = bundles.write_bundles(js_dir)
+        assert written == [js_dir / bundles.hashed_name("app.js")]
+        assert written[0].read_text() == "var a = 1;"
+        assert not outdated.exists()
+        assert unrelated.exists()
+        assert bundles.write_bundles(js_dir) == []
+
+    @pytest.mark.unit
+    def test_pages_reference_bundles(self):
+        """Pages load the shared bundle and only inline their own values."""
+        env = JinjaTemplateService(get_templates_dir()).setup_jinja_env({})
+        config = SimpleNamespace(
+            html=SimpleNamespace(github_repo="https://github.com/org/repo"),
+            neuprint=SimpleNamespace(dataset="optic-lobe:v1.1"),
+        )
+        html = env.get_template("sections/global_scripts.html.jinja").render(
+            config=config,
+            git_version="1.0.0",
+            generation_time=datetime(2025, 1, 2, 3, 4),
+            is_neuron_page=True,
+        )
+
+        assert get_static_bundles().url("global.js", "../") in html
+        assert '"dataset": "optic-lobe:v1.1"' in html
+        assert "addEventListener" not in html
@@ -0,0 +1,179 @@
+"""Unit tests for the table data of lazily loaded neuron page tables."""
+
+import json
+from html.parser import HTMLParser
+
+import pytest
+
+from neuview.services.brain_region_service import BrainRegionService
+from neuview.services.jinja_template_service import JinjaTemplateService
+from neuview.services.partner_analysis_service import PartnerAnalysisService
+from neuview.services.table_data_service import TableDataService
+from neuview.utils import get_templates_dir
+from neuview.utils.formatters import (
+    MathematicalFormatter,
+    NeurotransmitterFormatter,
+    NumberFormatter,
+    PercentageFormatter,
+    SynapseFormatter,
+)
+from neuview.utils.html_utils import HTMLUtils
+
+
+class _CellParser(HTMLParser):
+    """Collects the attributes and text of every table cell."""
+
+    def __init__(self):
+        super().__init__()
+        self.cells = []
+        self._text = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "td":
+            self.cells.append([dict(attrs), ""])
+            self._text = True
+
+    def handle_endtag(self, tag):
+        if tag == "td":
+            self.cells[-1][1] = self.cells[-1][1].strip()
+            self._text = None
+
+    def handle_data(self, data):
+        if self._text:
+            self.cells[-1][1] += data
+
+
+def _cells(html):
+    parser = _CellParser()
+    parser.feed(html)
+    return parser.cells
+
+
+def _lazy_cells(rows):
+    html = ""
+    for row in rows:
+        for cell in row:
+            content, attributes = (cell, {}) if isinstance(cell, str) else cell
+            attrs = "".join(
+                f' {name}="{value.replace(chr(34), "&quot;")}"'
+                for name, value in attributes.items()
+            )
+            html += f"<td{attrs}>{content}</td>"
+    return _cells(html)
+
+
+@pytest.fixture
+def env():
+    partner_analysis = PartnerAnalysisService()
+    return JinjaTemplateService(get_templates_dir()).setup_jinja_env(
+        {
+            "number_formatter": NumberFormatter(),
+            "percentage_formatter": PercentageFormatter(),
+            "synapse_formatter": SynapseFormatter(),
+            "neurotransmitter_formatter": NeurotransmitterFormatter(),
+            "mathematical_formatter": MathematicalFormatter(),
+            "html_utils": HTMLUtils(),
+            "roi_abbr_filter": BrainRegionService().roi_abbr_filter,
+            "get_partner_body_ids": partner_analysis.get_partner_body_ids,
+        }
+    )
+
+
+@pytest.fixture
+def page_context():
+    partner = {
+        "type": "Tm3",
+        "soma_side": "L",
+        "partner_neuron_count": 12,
+        "neurotransmitter": "acetylcholine",
+        "weight": 240,
+        "connections_per_neuron": 20.25,
+        "percentage": 12.345678,
+        "coefficient_of_variation": 0.5,
+    }
+    return {
+        "neuron_data": {"type": "Mi1"},
+        "roi_summary": [
+            {
+                "name": "ME(R)",
+                "post": 1200,
+                "pre": 300.5,
+                "post_percentage": 80.123456,
+                "pre_percentage": 20.5,
+            }
+        ],
+        "connectivity": {
+            "upstream": [partner],
+            "downstream": [dict(partner, type="Dm4", coefficient_of_variation=2)],
+        },
+        "connected_bids": {"upstream": {"Tm3_L": [1, 2]}, "downstream": {}},
+    }
+
+
+@pytest.mark.unit
+class TestTableData:
+    """Test cases for TableDataService and the lazy table templates."""
+
+    @pytest.mark.unit
+    def test_cells_match_server_rendered_tables(self, env, page_context):
+        """Lazy rows produce the same cells as the rendered tables."""
+        table_data = TableDataService(env).build_table_data(page_context)
+
+        roi_html = env.get_template("sections/roi_innervation.html.jinja").render(
+            **page_context
+        )
+        assert _lazy_cells(table_data["roiRows"]) == _cells(roi_html)
+
+        connectivity_html = env.get_template("sections/connectivity.html.jinja").render(
+            **page_context
+        )
+        assert _lazy_cells(
+            table_data["upstreamRows"] + table_data["downstreamRows"]
+        ) == _cells(connectivity_html)
+        assert table_data["upstreamPreciseData"] == [12.34568]
+
+    @pytest.mark.unit
+    def test_cells_keep_rendered_markup(self, env, page_context):
+        """Lazy cell contents are the markup of the shared row macros."""
+        table_data = TableDataService(env).build_table_data(page_context)
+        html = env.get_template("sections/connectivity.html.jinja").render(
+            **page_context
+        ) + env.get_template("sections/roi_innervation.html.jinja").render(
+            **page_context
+        )
+
+        rows = (
+            table_data["roiRows"]
+            + table_data["upstreamRows"]
+            + table_data["downstreamRows"]
+        )
+        for row in rows:
+            for cell in row:
+                content = cell if isinstance(cell, str) else cell[0]
+                assert f">{content}</td>" in html
+        assert table_data["upstreamRows"][0][0] == [
+            '<a href="Tm3_L.html#s-c">Tm3 (L)</a>',
+            {"class": "p-c", "data-body-ids": "[1, 2]"},
+        ]
+        assert table_data["upstreamRows"][0][3][1] == {"title": "∑ connections: 240"}
+
+    @pytest.mark.unit
+    def test_lazy_templates_skip_rows(self, env, page_context):
+        """With a tables_url the tables are rendered without rows."""
+        page_context["tables_url"] = "Mi1_L.tables.json"
+        html = env.get_template("sections/connectivity.html.jinja").render(
+            **page_context
+        ) + env.get_template("sections/roi_innervation.html.jinja").render(
+            **page_context
+        )
+
+        assert 'id="upstream-table"' in html
+        assert "<td" not in html
+        assert TableDataService.table_data_filename("Mi1_L.html") == (
+            "Mi1_L.tables.json"
+        )
+
+        table_data = TableDataService(env).build_table_data(page_context)
+        serialized = TableDataService.serialize(table_data)
+        assert ": " not in serialized.split('"roiRows"')[0]
+        assert json.loads(serialized)["roiOutputPreciseData"] == [20.5]
@@ -0,0 +1,108 @@
+"""Unit tests for per-run performance tracing."""
+
+import json
+
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+
+from neuview.config import Config
+from neuview.neuprint_connector import NeuPrintConnector
+from neuview.tracing import (
+    Span,
+    Tracer,
+    normalize_query,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+    tracing_enabled,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Active tracer, stopped after the test."""
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Test cases for span recording and trace export."""
+
+    @pytest.mark.unit
+    def test_disabled_spans_record_nothing(self):
+        """Without an active tracer spans are no-ops."""
+        assert not tracing_enabled()
+        with trace_span("query", "cypher") as span:
+            span.set(rows=3)
+        assert span.enabled is False
+
+    @pytest.mark.unit
+    def test_normalize_query(self):
+        """Literals are replaced so same-shaped queries share a name."""
+        query = """
+            MATCH (n:Neuron) WHERE n.type = 'Dm4' AND n.bodyId IN [1, 2, 3]
+            AND n.pre > 10.5 RETURN n.ME_R_layer_1
+        """
+        assert normalize_query(query) == (
+            "MATCH (n:Neuron) WHERE n.type = ? AND n.bodyId IN [?] "
+            "AND n.pre > ? RETURN n.ME_R_layer_1"
+        )
+
+    @pytest.mark.unit
+    def test_spans_export_and_summary(self, tracer, tmp_path):
+        """Recorded spans export to Chrome and speedscope and are summarized."""
+        with trace_span("page", "page"):
+            for _ in range(2):
+                with trace_span("MATCH ?", "cypher") as span:
+                    span.set(rows=5, bytes=100)
+
+        chrome = json.loads(tracer.write(tmp_path / "trace.json").read_text())
+        assert [event["name"] for event in chrome["traceEvents"]] == [
+            "page",
+            "MATCH ?",
+            "MATCH ?",
+        ]
+        assert chrome["traceEvents"][1]["args"] == {"rows": 5, "bytes": 100}
+
+        speedscope = json.loads(
+            tracer.write(tmp_path / "trace.speedscope.json", "speedscope").read_text()
+        )
+        events = speedscope["profiles"][0]["events"]
+        assert [event["type"] for event in events] == ["O", "O", "C", "O", "C", "C"]
+
+        query_row = next(row for row in tracer.summary() if row["name"] == "MATCH ?")
+        assert query_row["count"] == 2
+        assert query_row["rows"] == 10
+        assert "MATCH ?" in tracer.format_summary()
+
+    @pytest.mark.unit
+    def test_speedscope_clips_overlapping_spans(self):
+        """A span outliving its parent is cut at the parent's end."""
+        tracer = Tracer()
+        tracer.origin = 0.0
+        tracer.record(Span("parent", "page", start=0.0, end=0.002))
+        tracer.record(Span("child", "cypher", start=0.001, end=0.003))
+
+        events = tracer.to_speedscope()["profiles"][0]["events"]
+        closes = [event["at"] for event in events if event["type"] == "C"]
+        assert closes == [2.0, 2.0]
+        with pytest.raises(ValueError):
+            tracer.write("unused.json", "flamegraph")
+
+    @pytest.mark.unit
+    def test_connector_records_query_spans(self, tracer):
+        """Cypher queries executed by the connector are recorded with rows."""
+        with patch("neuview.neuprint_connector.Client") as mock_client_class:
+            mock_client = Mock()
+            mock_client.fetch_custom.return_value = pd.DataFrame({"a": [1, 2]})
+            mock_client_class.return_value = mock_client
+            connector = NeuPrintConnector(Config.create_minimal_for_testing())
+            connector.client.fetch_custom("MATCH (n) WHERE n.bodyId = 12 RETURN n")
+
+        span = tracer.spans[-1]
+        assert span.category == "cypher"
+        assert span.name == "MATCH (n) WHERE n.bodyId = ? RETURN n"
+        assert span.args["rows"] == 2
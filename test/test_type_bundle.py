@@ -0,0 +1,83 @@
+"""Unit tests for the per-type bundle of neuron data."""
+
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from neuview.commands import GeneratePageCommand
+from neuview.models.domain_models import NeuronTypeName, SomaSide
+from neuview.services.neuron_statistics_service import NeuronStatisticsService
+from neuview.services.soma_detection_service import SomaDetectionService
+from neuview.type_bundle import TypeBundle
+
+NEURONS = pd.DataFrame({"bodyId": [1, 2, 3, 4], "somaSide": ["L", "R", "R", "L"]})
+
+
+class _Connector:
+    """Connector stub counting get_neuron_data calls per soma side."""
+
+    def __init__(self):
+        self.calls = Counter()
+
+    def get_neuron_data(self, neuron_type, soma_side):
+        self.calls[soma_side] += 1
+        side = {"left": "L", "right": "R"}.get(soma_side)
+        neurons = NEURONS if side is None else NEURONS[NEURONS["somaSide"] == side]
+        return {"neurons": neurons, "type": neuron_type, "soma_side": soma_side}
+
+    def get_type_bundle(self, neuron_type):
+        return TypeBundle(self, neuron_type)
+
+    def _get_soma_side_partition(self, neuron_type):
+        return ("partition", neuron_type)
+
+    def log_cache_performance(self):
+        pass
+
+
+@pytest.mark.unit
+class TestTypeBundle:
+    """Test cases for TypeBundle and its use by page generation."""
+
+    @pytest.mark.unit
+    def test_neuron_data_is_computed_once_per_side(self):
+        """Each soma side is fetched once, whatever spelling is used."""
+        connector = _Connector()
+        bundle = connector.get_type_bundle("Tm3")
+
+        combined = bundle.neuron_data()
+        assert bundle.neuron_data("all") is combined
+        assert bundle.neuron_data(SomaSide.COMBINED) is combined
+        assert len(bundle.neuron_data("left")["neurons"]) == 2
+        bundle.neuron_data("left")
+
+        assert connector.calls == {"combined": 1, "left": 1}
+        assert bundle.partition == ("partition", "Tm3")
+
+    @pytest.mark.unit
+    def test_page_generation_computes_combined_data_once(self):
+        """Statistics, pages and the cache save share the bundle's data."""
+        connector = _Connector()
+        cache_service = Mock(save_neuron_data_to_cache=AsyncMock())
+        page_generator = Mock()
+        page_generator.generate_page_unified = lambda request: SimpleNamespace(
+            success=True, output_path=request.soma_side
+        )
+        service = SomaDetectionService(
+            connector,
+            page_generator,
+            cache_service,
+            NeuronStatisticsService(connector),
+        )
+
+        command = GeneratePageCommand(neuron_type=NeuronTypeName("Tm3"))
+        result = asyncio.run(service.generate_pages_with_auto_detection(command))
+
+        assert result.unwrap() == "combined, left, right"
+        assert connector.calls == {"combined": 1, "left": 1, "right": 1}
+        saved_data = cache_service.save_neuron_data_to_cache.await_args.args[1]
+        assert saved_data["soma_side"] == "combined"
@@ -0,0 +1,179 @@
+"""Unit tests for eyemap planning and fingerprint-based reuse."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from neuview.visualization import EyemapGenerator
+from neuview.visualization.config_manager import ConfigurationManager
+from neuview.visualization.constants import EYEMAP_FINGERPRINT_SUBDIRECTORY
+from neuview.visualization.data_processing import DataAdapter
+from neuview.visualization.data_processing.data_structures import SomaSide
+from neuview.visualization.data_transfer_objects import (
+    create_grid_generation_request,
+)
+
+
+def _grid_request(total_synapses, soma_side=SomaSide.LEFT, **kwargs):
+    column_data = DataAdapter.normalize_input(
+        [
+            {
+                "region": "ME",
+                "side": "L",
+                "hex1": 1,
+                "hex2": 2,
+                "total_synapses": total_synapses,
+                "neuron_count": 3,
+                "layers": [],
+            }
+        ]
+    )
+    return create_grid_generation_request(
+        column_data=column_data,
+        thresholds_all={
+            "total_synapses": {"all": [0, 10, 20]},
+            "neuron_count": {"all": [0, 2, 4]},
+        },
+        all_possible_columns=[{"hex1": 1, "hex2": 2}],
+        region_columns_map={"ME_L": {(1, 2)}, "LO_L": set(), "LOP_L": set()},
+        neuron_type="Dm4",
+        soma_side=soma_side,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Eyemap generator writing into a temporary output directory."""
+    config = ConfigurationManager.create_for_generation(
+        output_dir=tmp_path, eyemaps_dir=tmp_path / "eyemaps"
+    )
+    return EyemapGenerator(config)
+
+
+@pytest.mark.unit
+class TestEyemapFingerprints:
+    """Test cases for planning eyemap outputs before rendering."""
+
+    @pytest.mark.unit
+    def test_fingerprint_follows_column_data(self, generator):
+        """Plans get stable fingerprints that change with the column data."""
+        processor = generator.region_processor
+        settings = {"hex_size": 6}
+
+        def fingerprints(request):
+            data_maps = generator._organize_data_by_side(request)
+            plans = processor.plan_all_regions_and_sides(request, data_maps, settings)
+            return {key: plan["fingerprint"] for key, plan in plans.items()}
+
+        first = fingerprints(_grid_request(10))
+        assert set(first) == {"ME_L", "LO_L", "LOP_L"}
+        assert first == fingerprints(_grid_request(10))
+        assert first["ME_L"] != fingerprints(_grid_request(20))["ME_L"]
+
+    @pytest.mark.unit
+    def test_up_to_date_grids_skip_rendering(self, generator, tmp_path):
+        """Saved grids are reused until their inputs or files change."""
+        with patch.object(
+            generator,
+            "generate_comprehensive_single_region_grid",
+            return_value="<svg></svg>",
+        ) as render:
+            first = generator.generate_comprehensive_region_hexagonal_grids(
+                _grid_request(10)
+            )
+            assert first.success
+            assert render.call_count == 6
+            assert first.region_grids["ME_L"]["cell_count"] == (
+                "../eyemaps/ME_Dm4_left_L_cell_count.svg"
+            )
+            assert (
+                tmp_path
+                / EYEMAP_FINGERPRINT_SUBDIRECTORY
+                / "ME_Dm4_left_L_cell_count.svg.txt"
+            ).exists()
+
+            again = generator.generate_comprehensive_region_hexagonal_grids(
+                _grid_request(10)
+            )
+            assert render.call_count == 6
+            assert again.region_grids == first.region_grids
+
+            # Changed column data re-renders only the affected region
+            generator.generate_comprehensive_region_hexagonal_grids(_grid_request(20))
+            assert render.call_count == 8
+
+            # A missing file is regenerated even with a matching fingerprint
+            (tmp_path / "eyemaps" / "LO_Dm4_left_L_synapse_density.svg").unlink()
+            generator.generate_comprehensive_region_hexagonal_grids(_grid_request(20))
+            assert render.call_count == 10
+
+    @pytest.mark.unit
+    def test_combined_and_side_pages_keep_their_own_grids(self, generator, tmp_path):
+        """Pages of one type write separate files and reuse them across runs."""
+        with patch.object(
+            generator,
+            "generate_comprehensive_single_region_grid",
+            return_value="<svg></svg>",
+        ) as render:
+            for _ in range(2):
+                combined = generator.generate_comprehensive_region_hexagonal_grids(
+                    _grid_request(10, SomaSide.COMBINED)
+                )
+                left = generator.generate_comprehensive_region_hexagonal_grids(
+                    _grid_request(10, SomaSide.LEFT)
+                )
+
+            # The combined page has grids for both sides; the second run
+            # reuses every grid of both pages
+            assert render.call_count == 12 + 6
+            assert combined.region_grids["ME_L"]["cell_count"] == (
+                "../eyemaps/ME_Dm4_combined_L_cell_count.svg"
+            )
+            assert left.region_grids["ME_L"]["cell_count"] == (
+                "../eyemaps/ME_Dm4_left_L_cell_count.svg"
+            )
+            fingerprints = tmp_path / EYEMAP_FINGERPRINT_SUBDIRECTORY
+            assert (
+                fingerprints / "ME_Dm4_combined_L_cell_count.svg.txt"
+            ).read_text() != (
+                fingerprints / "ME_Dm4_left_L_cell_count.svg.txt"
+            ).read_text()
+
+    @pytest.mark.unit
+    def test_concurrent_pages_share_the_generator(self, generator):
+        """Pages generated on threads keep their grids and leave no state behind."""
+        sides = [SomaSide.COMBINED, SomaSide.LEFT, SomaSide.RIGHT]
+
+        def generate_all():
+            with ThreadPoolExecutor(max_workers=len(sides)) as pool:
+                return list(
+                    pool.map(
+                        lambda side: generator.generate_comprehensive_region_hexagonal_grids(
+                            _grid_request(10, side)
+                        ),
+                        sides,
+                    )
+                )
+
+        with patch.object(
+            generator,
+            "generate_comprehensive_single_region_grid",
+            return_value="<svg></svg>",
+        ) as render:
+            first = generate_all()
+            rendered = render.call_count
+            again = generate_all()
+            assert [r.region_grids for r in again] == [r.region_grids for r in first]
+            assert render.call_count == rendered
+
+            # An embedded page does not switch the shared generator to embedding
+            embedded = generator.generate_comprehensive_region_hexagonal_grids(
+                _grid_request(10, save_to_files=False)
+            )
+
+        assert all(result.success for result in first)
+        assert embedded.region_grids["ME_L"]["cell_count"].startswith("<svg")
+        assert not generator.config.embed_mode
+        assert generator.config.save_to_files